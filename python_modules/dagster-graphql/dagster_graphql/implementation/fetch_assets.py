@@ -13,8 +13,14 @@ def get_assets(graphene_info, prefix_path):
         )
 
     asset_keys = instance.all_asset_keys(prefix_path=prefix_path)
+    latest_materializations = instance.get_latest_materializations(asset_keys)
     return graphene_info.schema.type_named("AssetConnection")(
-        nodes=[graphene_info.schema.type_named("Asset")(key=asset_key) for asset_key in asset_keys]
+        nodes=[
+            graphene_info.schema.type_named("Asset")(
+                key=asset_key, latest_materialization=latest_materializations.get(asset_key)
+            )
+            for asset_key in asset_keys
+        ]
     )
 
 
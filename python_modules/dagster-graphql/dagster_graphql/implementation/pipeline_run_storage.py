@@ -1,18 +1,34 @@
+# The backlog of events already stored for a run is sent to the subscriber in chunks of at most
+# this many events, so that a run with a very large event log is never held in memory all at once
+LOG_CHUNK_SIZE = 1000
+
+
 class PipelineRunObservableSubscribe:
-    def __init__(self, instance, run_id, after_cursor=None):
+    def __init__(self, instance, run_id, after_cursor=None, chunk_size=LOG_CHUNK_SIZE):
         self.instance = instance
         self.run_id = run_id
         self.observer = None
         self.after_cursor = after_cursor if after_cursor is not None else -1
+        self.chunk_size = chunk_size
 
     def __call__(self, observer):
         self.observer = observer
 
-        events = self.instance.logs_after(self.run_id, self.after_cursor)
-        if events:
-            self.observer.on_next(events)
+        # the first chunk starts at the subscriber's offset cursor, and later chunks seek past the
+        # last record sent, so that each chunk does not rescan the records before it
+        cursor = int(self.after_cursor)
+        after_record_id = None
+        while True:
+            records = self.instance.event_records_after(
+                self.run_id, cursor=cursor, after_record_id=after_record_id, limit=self.chunk_size,
+            )
+            if records:
+                self.observer.on_next([event for _, event in records])
+                after_record_id = records[-1][0]
+            cursor += len(records)
+            if len(records) < self.chunk_size:
+                break
 
-        cursor = len(events) + int(self.after_cursor)
         self.instance.watch_event_logs(self.run_id, cursor, self.handle_new_event)
 
     def handle_new_event(self, new_event):
@@ -30,7 +30,22 @@ class Meta:
         dauphin.non_null_list("PipelineRun"), cursor=dauphin.String(), limit=dauphin.Int(),
     )
 
+    def __init__(self, key, latest_materialization=None):
+        # the latest materialization of the asset, when fetched in bulk along with those of the
+        # other assets being resolved
+        self._latest_materialization = check.opt_inst_param(
+            latest_materialization, "latest_materialization", EventRecord
+        )
+        super(DauphinAsset, self).__init__(key=key)
+
     def resolve_assetMaterializations(self, graphene_info, **kwargs):
+        if self._latest_materialization and kwargs.get("limit") == 1 and not kwargs.get("cursor"):
+            return [
+                graphene_info.schema.type_named("AssetMaterialization")(
+                    event=self._latest_materialization
+                )
+            ]
+
         return [
             graphene_info.schema.type_named("AssetMaterialization")(event=event)
             for event in get_asset_events(
@@ -74,13 +74,17 @@ def resolve_sensors(self, graphene_info):
         )
 
     def resolve_pipelines(self, graphene_info):
-        return sorted(
-            [
-                graphene_info.schema.type_named("Pipeline")(pipeline)
-                for pipeline in self._repository.get_all_external_pipelines()
-            ],
-            key=lambda pipeline: pipeline.name,
-        )
+        # the pipelines are listed from the summaries of the repository, and each one is only
+        # loaded if a field that needs its snapshot is queried
+        return [
+            graphene_info.schema.type_named("Pipeline")(
+                external_repository=self._repository,
+                external_pipeline_summary_data=external_pipeline_summary_data,
+            )
+            for external_pipeline_summary_data in sorted(
+                self._repository.get_external_pipeline_summaries(), key=lambda summary: summary.name
+            )
+        ]
 
     def resolve_usedSolid(self, _graphene_info, name):
         return get_solid(self._repository, name)
@@ -4,7 +4,10 @@
 from dagster import check
 from dagster.core.host_representation import (
     ExternalPipeline,
+    ExternalPipelineSummaryData,
     ExternalPresetData,
+    ExternalRepository,
+    PipelineHandle,
     RepresentedPipeline,
 )
 from dagster.core.snap import ConfigSchemaSnapshot, LoggerDefSnap, ModeDefSnap, ResourceDefSnap
@@ -219,21 +222,68 @@ class Meta:
     presets = dauphin.non_null_list("PipelinePreset")
     runs = dauphin.non_null_list("PipelineRun")
 
-    def __init__(self, external_pipeline):
-        self._external_pipeline = check.inst_param(
+    def __init__(
+        self, external_pipeline=None, external_repository=None, external_pipeline_summary_data=None
+    ):
+        """Takes either an external pipeline, or the summary of a pipeline in an external
+        repository, in which case the pipeline is only loaded once a field that needs more than its
+        name, description or snapshot id is resolved."""
+        self._external_pipeline = check.opt_inst_param(
             external_pipeline, "external_pipeline", ExternalPipeline
         )
+        self._external_repository = check.opt_inst_param(
+            external_repository, "external_repository", ExternalRepository
+        )
+        self._external_pipeline_summary_data = check.opt_inst_param(
+            external_pipeline_summary_data,
+            "external_pipeline_summary_data",
+            ExternalPipelineSummaryData,
+        )
+        check.invariant(
+            (external_pipeline is None)
+            != (external_repository is None or external_pipeline_summary_data is None),
+            "Must provide either an external pipeline, or an external repository and the summary "
+            "of one of its pipelines",
+        )
 
     def resolve_id(self, _graphene_info):
+        if self._external_pipeline_summary_data:
+            return (
+                PipelineHandle(
+                    self._external_pipeline_summary_data.name, self._external_repository.handle
+                )
+                .get_external_origin()
+                .get_id()
+            )
         return self._external_pipeline.get_external_origin_id()
 
+    def resolve_name(self, _graphene_info):
+        if self._external_pipeline_summary_data:
+            return self._external_pipeline_summary_data.name
+        return self._external_pipeline.name
+
+    def resolve_description(self, _graphene_info):
+        if self._external_pipeline_summary_data:
+            return self._external_pipeline_summary_data.description
+        return self._external_pipeline.description
+
+    def resolve_pipeline_snapshot_id(self, _graphene_info):
+        if self._external_pipeline_summary_data:
+            return self._external_pipeline_summary_data.pipeline_snapshot_id
+        return self._external_pipeline.identifying_pipeline_snapshot_id
+
     def get_represented_pipeline(self):
+        if self._external_pipeline is None:
+            self._external_pipeline = self._external_repository.get_full_external_pipeline(
+                self._external_pipeline_summary_data.name
+            )
         return self._external_pipeline
 
     def resolve_presets(self, _graphene_info):
+        external_pipeline = self.get_represented_pipeline()
         return [
-            DauphinPipelinePreset(preset, self._external_pipeline.name)
-            for preset in sorted(self._external_pipeline.active_presets, key=lambda item: item.name)
+            DauphinPipelinePreset(preset, external_pipeline.name)
+            for preset in sorted(external_pipeline.active_presets, key=lambda item: item.name)
         ]
 
 
@@ -1,9 +1,13 @@
 import uuid
 
+import mock
+from dagster import execute_pipeline, pipeline, solid
 from dagster.core.storage.pipeline_run import PipelineRunsFilter
+from dagster.core.test_utils import instance_for_test
 from dagster.utils import file_relative_path, merge_dicts
 from dagster.utils.test import get_temp_file_name
 from dagster_graphql.client.query import LAUNCH_PIPELINE_EXECUTION_MUTATION, SUBSCRIPTION_QUERY
+from dagster_graphql.implementation.pipeline_run_storage import PipelineRunObservableSubscribe
 from dagster_graphql.test.utils import execute_dagster_graphql, infer_pipeline_selector
 from graphql import parse
 
@@ -429,6 +433,40 @@ def test_basic_start_pipeline_execution_with_materialization(self, graphql_conte
             assert step_mat_event["materialization"]["metadataEntries"][0]["path"] == out_csv_path
 
 
+def test_pipeline_run_observable_subscribe_chunks_backlog():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(noop_pipeline, instance=instance)
+        all_logs = instance.all_logs(result.run_id)
+
+        chunks = []
+        observer = mock.MagicMock()
+        observer.on_next.side_effect = chunks.append
+        PipelineRunObservableSubscribe(instance, result.run_id, chunk_size=3)(observer)
+
+        # the backlog is streamed in chunks bounded by the chunk size, in order
+        assert len(chunks) == (len(all_logs) + 2) // 3
+        assert all(len(chunk) <= 3 for chunk in chunks)
+        assert [event.message for chunk in chunks for event in chunk] == [
+            event.message for event in all_logs
+        ]
+
+        del chunks[:]
+        PipelineRunObservableSubscribe(instance, result.run_id, after_cursor=3, chunk_size=3)(
+            observer
+        )
+        assert [event.message for chunk in chunks for event in chunk] == [
+            event.message for event in all_logs[4:]
+        ]
+
+
 def _get_step_run_log_entry(pipeline_run_logs, step_key, typename):
     for message_data in pipeline_run_logs["messages"]:
         if message_data["__typename"] == typename:
@@ -45,7 +45,7 @@ def test_out_of_process_reload_location(self, graphql_context):
                 # note it where the function is *used* that needs to mocked, not
                 # where it is defined.
                 # see https://docs.python.org/3/library/unittest.mock.html#where-to-patch
-                "dagster.core.host_representation.repository_location.sync_get_streaming_external_repositories_grpc"
+                "dagster.core.host_representation.repository_location.sync_get_external_repository_indices_grpc"
             ) as external_repository_mock:
 
                 @repository
@@ -43,6 +43,7 @@
     TextMetadataEntryData,
     TypeCheck,
     UrlMetadataEntryData,
+    asyncio_executor,
     composite_solid,
     daily_schedule,
     default_executors,
@@ -55,6 +56,7 @@
     logger,
     monthly_schedule,
     multiprocess_executor,
+    multithread_executor,
     pipeline,
     reconstructable,
     repository,
@@ -229,6 +231,7 @@
     "TypeCheckContext",
     "AssetStoreContext",
     "PipelineRun",
+    "asyncio_executor",
     "default_executors",
     "default_intermediate_storage_defs",
     "default_system_storage_defs",
@@ -241,6 +244,7 @@
     "mem_intermediate_storage",
     "mem_system_storage",
     "multiprocess_executor",
+    "multithread_executor",
     "reconstructable",
     "reexecute_pipeline_iterator",
     "reexecute_pipeline",
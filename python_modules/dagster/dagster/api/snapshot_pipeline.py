@@ -1,7 +1,11 @@
 from dagster import check
 from dagster.core.host_representation import ExternalPipelineOrigin
-from dagster.core.host_representation.external_data import ExternalPipelineSubsetResult
+from dagster.core.host_representation.external_data import (
+    ExternalPipelineData,
+    ExternalPipelineSubsetResult,
+)
 from dagster.grpc.types import PipelineSubsetSnapshotArgs
+from dagster.serdes import deserialize_json_to_dagster_namedtuple
 
 
 def sync_get_external_pipeline_subset_grpc(api_client, pipeline_origin, solid_selection=None):
@@ -19,3 +23,24 @@ def sync_get_external_pipeline_subset_grpc(api_client, pipeline_origin, solid_se
         ),
         ExternalPipelineSubsetResult,
     )
+
+
+def sync_get_streaming_external_pipeline_data_grpc(api_client, pipeline_origin):
+    from dagster.grpc.client import DagsterGrpcClient
+
+    check.inst_param(api_client, "api_client", DagsterGrpcClient)
+    check.inst_param(pipeline_origin, "pipeline_origin", ExternalPipelineOrigin)
+
+    return check.inst(
+        deserialize_json_to_dagster_namedtuple(
+            "".join(
+                [
+                    chunk["serialized_external_pipeline_data_chunk"]
+                    for chunk in api_client.streaming_external_pipeline_snapshot(
+                        external_pipeline_origin=pipeline_origin
+                    )
+                ]
+            )
+        ),
+        ExternalPipelineData,
+    )
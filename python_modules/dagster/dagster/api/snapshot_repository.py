@@ -1,13 +1,59 @@
+import threading
+from collections import OrderedDict
+
 from dagster import check
 from dagster.core.host_representation import (
+    ExternalPipelineOrigin,
     ExternalRepository,
     ExternalRepositoryData,
+    ExternalRepositoryIndexData,
     ExternalRepositoryOrigin,
     RepositoryHandle,
     RepositoryLocationHandle,
 )
 from dagster.serdes import deserialize_json_to_dagster_namedtuple
 
+from .snapshot_pipeline import sync_get_streaming_external_pipeline_data_grpc
+
+# The external repository data last fetched for each repository origin is kept with the snapshot id
+# that the server computed for it. The snapshot id is sent with the next fetch, and the server
+# replies that the repository was not modified instead of sending the data again if it did not
+# change.
+EXTERNAL_REPOSITORY_DATA_CACHE_SIZE = 32
+
+
+class _ExternalRepositoryDataCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()  # ExternalRepositoryOrigin -> (str, Any)
+
+    def get(self, external_repository_origin):
+        with self._lock:
+            if external_repository_origin not in self._cache:
+                return None, None
+
+            self._cache.move_to_end(external_repository_origin)
+            return self._cache[external_repository_origin]
+
+    def set(self, external_repository_origin, snapshot_id, value):
+        # servers that predate snapshot ids do not send them
+        if not snapshot_id:
+            return
+
+        with self._lock:
+            self._cache[external_repository_origin] = (snapshot_id, value)
+            self._cache.move_to_end(external_repository_origin)
+            if len(self._cache) > EXTERNAL_REPOSITORY_DATA_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+
+# ExternalRepositoryData
+_external_repository_data_cache = _ExternalRepositoryDataCache()
+
+# (ExternalRepositoryIndexData, Dict[str, ExternalPipelineData]), where the pipeline data is filled
+# in as pipelines are used, and shared by the external repositories that are loaded from the index
+_external_repository_index_data_cache = _ExternalRepositoryDataCache()
+
 
 def sync_get_external_repositories_grpc(api_client, repository_location_handle):
     check.inst_param(
@@ -16,14 +62,28 @@ def sync_get_external_repositories_grpc(api_client, repository_location_handle):
 
     repos = []
     for repository_name in repository_location_handle.repository_names:
-        external_repository_data = check.inst(
-            api_client.external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    repository_location_handle.origin, repository_name,
-                )
-            ),
-            ExternalRepositoryData,
+        external_repository_origin = ExternalRepositoryOrigin(
+            repository_location_handle.origin, repository_name,
+        )
+        known_snapshot_id, known_external_repository_data = _external_repository_data_cache.get(
+            external_repository_origin
         )
+
+        result = api_client.external_repository(
+            external_repository_origin=external_repository_origin,
+            known_snapshot_id=known_snapshot_id,
+        )
+
+        if result["not_modified"]:
+            external_repository_data = known_external_repository_data
+        else:
+            external_repository_data = check.inst(
+                result["external_repository_data"], ExternalRepositoryData
+            )
+            _external_repository_data_cache.set(
+                external_repository_origin, result["snapshot_id"], external_repository_data
+            )
+
         repos.append(
             ExternalRepository(
                 external_repository_data,
@@ -43,22 +103,36 @@ def sync_get_streaming_external_repositories_grpc(api_client, repository_locatio
 
     repos = []
     for repository_name in repository_location_handle.repository_names:
+        external_repository_origin = ExternalRepositoryOrigin(
+            repository_location_handle.origin, repository_name,
+        )
+        known_snapshot_id, known_external_repository_data = _external_repository_data_cache.get(
+            external_repository_origin
+        )
+
         external_repository_chunks = list(
             api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    repository_location_handle.origin, repository_name,
-                )
+                external_repository_origin=external_repository_origin,
+                known_snapshot_id=known_snapshot_id,
             )
         )
 
-        external_repository_data = deserialize_json_to_dagster_namedtuple(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
+        if external_repository_chunks[0]["not_modified"]:
+            external_repository_data = known_external_repository_data
+        else:
+            external_repository_data = deserialize_json_to_dagster_namedtuple(
+                "".join(
+                    [
+                        chunk["serialized_external_repository_chunk"]
+                        for chunk in external_repository_chunks
+                    ]
+                )
+            )
+            _external_repository_data_cache.set(
+                external_repository_origin,
+                external_repository_chunks[0]["snapshot_id"],
+                external_repository_data,
             )
-        )
 
         repos.append(
             ExternalRepository(
@@ -70,3 +144,63 @@ def sync_get_streaming_external_repositories_grpc(api_client, repository_locatio
             )
         )
     return repos
+
+
+def sync_get_external_repository_indices_grpc(api_client, repository_location_handle):
+    """Fetches the index of each repository of a location, and returns external repositories that
+    fetch the data of each of their pipelines from the server when it is first used."""
+    check.inst_param(
+        repository_location_handle, "repository_location_handle", RepositoryLocationHandle
+    )
+
+    repos = []
+    for repository_name in repository_location_handle.repository_names:
+        external_repository_origin = ExternalRepositoryOrigin(
+            repository_location_handle.origin, repository_name,
+        )
+        known_snapshot_id, known_index = _external_repository_index_data_cache.get(
+            external_repository_origin
+        )
+
+        result = api_client.external_repository_index(
+            external_repository_origin=external_repository_origin,
+            known_snapshot_id=known_snapshot_id,
+        )
+
+        if result["not_modified"]:
+            external_repository_index_data, external_pipeline_datas = known_index
+        else:
+            external_repository_index_data = check.inst(
+                result["external_repository_index_data"], ExternalRepositoryIndexData
+            )
+            external_pipeline_datas = {}
+            _external_repository_index_data_cache.set(
+                external_repository_origin,
+                result["snapshot_id"],
+                (external_repository_index_data, external_pipeline_datas),
+            )
+
+        repos.append(
+            ExternalRepository(
+                external_repository_index_data,
+                RepositoryHandle(
+                    repository_name=external_repository_index_data.name,
+                    repository_location_handle=repository_location_handle,
+                ),
+                external_pipeline_data_loader=_external_pipeline_data_loader(
+                    api_client, external_repository_origin, external_pipeline_datas
+                ),
+            )
+        )
+    return repos
+
+
+def _external_pipeline_data_loader(api_client, external_repository_origin, external_pipeline_datas):
+    def _load_external_pipeline_data(pipeline_name):
+        if pipeline_name not in external_pipeline_datas:
+            external_pipeline_datas[pipeline_name] = sync_get_streaming_external_pipeline_data_grpc(
+                api_client, ExternalPipelineOrigin(external_repository_origin, pipeline_name)
+            )
+        return external_pipeline_datas[pipeline_name]
+
+    return _load_external_pipeline_data
@@ -23,7 +23,7 @@ def sync_get_external_schedule_execution_data_ephemeral_grpc(
 
 
 def sync_get_external_schedule_execution_data_grpc(
-    api_client, instance, repository_handle, schedule_name, scheduled_execution_time,
+    api_client, instance, repository_handle, schedule_name, scheduled_execution_time, timeout=None,
 ):
     check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
     check.str_param(schedule_name, "schedule_name")
@@ -43,7 +43,8 @@ def sync_get_external_schedule_execution_data_grpc(
                 scheduled_execution_timezone=scheduled_execution_time.timezone.name
                 if scheduled_execution_time
                 else None,
-            )
+            ),
+            timeout=timeout,
         ),
         (ExternalScheduleExecutionData, ExternalScheduleExecutionErrorData),
     )
@@ -22,7 +22,7 @@ def sync_get_external_sensor_execution_data_ephemeral_grpc(
 
 
 def sync_get_external_sensor_execution_data_grpc(
-    api_client, instance, repository_handle, sensor_name, last_completion_time
+    api_client, instance, repository_handle, sensor_name, last_completion_time, timeout=None
 ):
     check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
     check.str_param(sensor_name, "sensor_name")
@@ -37,7 +37,8 @@ def sync_get_external_sensor_execution_data_grpc(
                 instance_ref=instance.get_ref(),
                 sensor_name=sensor_name,
                 last_completion_time=last_completion_time,
-            )
+            ),
+            timeout=timeout,
         ),
         (ExternalSensorExecutionData, ExternalSensorExecutionErrorData),
     )
@@ -337,6 +337,28 @@ def _schedule_tick_state(instance, stream, tick_data):
     "waiting to load them when the server is launched. Useful for surfacing errors when the server "
     "is managed directly from Dagit",
 )
+@click.option(
+    "--run-worker-pool-size",
+    type=click.INT,
+    required=False,
+    default=0,
+    help="Number of warm run worker processes, that have already imported the user code, to keep "
+    "ready to start runs in. By default, each run is started in a new process.",
+)
+@click.option(
+    "--max-runs-per-run-worker",
+    type=click.INT,
+    required=False,
+    help="Number of runs after which a run worker process is replaced by a new one if "
+    "--run-worker-pool-size is set. Defaults to 100.",
+)
+@click.option(
+    "--run-worker-max-memory-mb",
+    type=click.INT,
+    required=False,
+    help="Peak memory use, in megabytes, past which a run worker process is replaced by a new one "
+    "once its run is done if --run-worker-pool-size is set.",
+)
 @python_origin_target_argument
 @click.option(
     "--ipc-output-file",
@@ -362,6 +384,9 @@ def grpc_command(
     lazy_load_user_code=False,
     ipc_output_file=None,
     fixed_server_id=None,
+    run_worker_pool_size=0,
+    max_runs_per_run_worker=None,
+    run_worker_max_memory_mb=None,
     **kwargs,
 ):
     if seven.IS_WINDOWS and port is None:
@@ -403,6 +428,9 @@ def grpc_command(
         lazy_load_user_code=lazy_load_user_code,
         ipc_output_file=ipc_output_file,
         fixed_server_id=fixed_server_id,
+        run_worker_pool_size=run_worker_pool_size,
+        max_runs_per_run_worker=max_runs_per_run_worker,
+        run_worker_max_memory_mb=run_worker_max_memory_mb,
     )
 
     server.serve()
@@ -654,24 +654,25 @@ def get_external_pipeline_from_external_repo(external_repo, provided_pipeline_na
     check.inst_param(external_repo, "external_repo", ExternalRepository)
     check.opt_str_param(provided_pipeline_name, "provided_pipeline_name")
 
-    external_pipelines = {ep.name: ep for ep in external_repo.get_all_external_pipelines()}
+    pipeline_names = [
+        external_pipeline_summary_data.name
+        for external_pipeline_summary_data in external_repo.get_external_pipeline_summaries()
+    ]
 
-    check.invariant(external_pipelines)
+    check.invariant(pipeline_names)
 
-    if provided_pipeline_name is None and len(external_pipelines) == 1:
-        return next(iter(external_pipelines.values()))
+    if provided_pipeline_name is None and len(pipeline_names) == 1:
+        return external_repo.get_full_external_pipeline(pipeline_names[0])
 
     if provided_pipeline_name is None:
         raise click.UsageError(
             (
                 "Must provide --pipeline as there is more than one pipeline "
                 "in {repository}. Options are: {pipelines}."
-            ).format(
-                repository=external_repo.name, pipelines=_sorted_quoted(external_pipelines.keys())
-            )
+            ).format(repository=external_repo.name, pipelines=_sorted_quoted(pipeline_names))
         )
 
-    if not provided_pipeline_name in external_pipelines:
+    if not provided_pipeline_name in pipeline_names:
         raise click.UsageError(
             (
                 'Pipeline "{provided_pipeline_name}" not found in repository "{repository_name}". '
@@ -679,11 +680,11 @@ def get_external_pipeline_from_external_repo(external_repo, provided_pipeline_na
             ).format(
                 provided_pipeline_name=provided_pipeline_name,
                 repository_name=external_repo.name,
-                found_names=_sorted_quoted(external_pipelines.keys()),
+                found_names=_sorted_quoted(pipeline_names),
             )
         )
 
-    return external_pipelines[provided_pipeline_name]
+    return external_repo.get_full_external_pipeline(provided_pipeline_name)
 
 
 @contextmanager
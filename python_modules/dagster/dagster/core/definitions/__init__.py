@@ -44,10 +44,12 @@
 )
 from .executor import (
     ExecutorDefinition,
+    asyncio_executor,
     default_executors,
     executor,
     in_process_executor,
     multiprocess_executor,
+    multithread_executor,
 )
 from .graph import GraphDefinition
 from .hook import HookDefinition
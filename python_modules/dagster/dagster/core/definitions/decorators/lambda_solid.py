@@ -1,6 +1,8 @@
+import inspect
 from functools import update_wrapper, wraps
 
 from dagster import check
+from dagster.core.execution.async_compute import run_awaitable
 from dagster.core.types.dagster_type import DagsterTypeKind
 
 from ..events import Output
@@ -126,6 +128,8 @@ def compute(_context, input_defs):
             kwargs[input_name] = input_defs[input_name]
 
         result = fn(**kwargs)
+        if inspect.iscoroutine(result):
+            result = run_awaitable(result)
         yield Output(value=result, output_name=output_def.name)
 
     return compute
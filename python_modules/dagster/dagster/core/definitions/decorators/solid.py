@@ -3,6 +3,7 @@
 
 from dagster import check
 from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
+from dagster.core.execution.async_compute import iterate_async_generator, run_awaitable
 from dagster.core.types.dagster_type import DagsterTypeKind
 
 from ...decorator_utils import (
@@ -113,6 +114,10 @@ def solid(
     to decorate a function that yields events, it must also wrap its eventual output in an
     :py:class:`Output` and yield it.
 
+    The decorated function may also be defined with ``async def``, either returning as in 1) and 2)
+    or yielding as in 3). Use the :py:func:`asyncio_executor` to run the async solids of a pipeline
+    concurrently.
+
     Args:
         name (Optional[str]): Name of solid. Must be unique within any :py:class:`PipelineDefinition`
             using the solid.
@@ -226,6 +231,13 @@ def compute(context, input_defs):
 
         result = fn(context, **kwargs)
 
+        if inspect.isasyncgen(result):
+            yield from iterate_async_generator(result)
+            return
+
+        if inspect.iscoroutine(result):
+            result = run_awaitable(result)
+
         if inspect.isgenerator(result):
             yield from result
         else:
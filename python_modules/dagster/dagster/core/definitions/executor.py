@@ -1,7 +1,7 @@
 from functools import update_wrapper
 
 from dagster import check
-from dagster.builtins import Int
+from dagster.builtins import Bool, Float, Int
 from dagster.config.field import Field
 from dagster.core.definitions.configurable import ConfigurableDefinition
 from dagster.core.definitions.reconstructable import ReconstructablePipeline
@@ -118,11 +118,29 @@ def __call__(self, fn):
         return executor_def
 
 
+def get_critical_path_config():
+    return Field(
+        {
+            "num_runs": Field(
+                Int,
+                is_required=False,
+                default_value=10,
+                description="The number of most recent successful runs of the pipeline to take "
+                "the durations of the steps from.",
+            )
+        },
+        is_required=False,
+        description="Start the steps with the longest path of historical durations to the end of "
+        "the plan first.",
+    )
+
+
 @executor(
     name="in_process",
     config_schema={
         "retries": get_retries_config(),
         "marker_to_close": Field(str, is_required=False),
+        "release_intermediates": Field(Bool, is_required=False, default_value=False),
     },
 )
 def in_process_executor(init_context):
@@ -140,6 +158,12 @@ def in_process_executor(init_context):
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    Setting ``release_intermediates`` to ``true`` removes each intermediate from the intermediate
+    storage as soon as every step consuming it has succeeded, which bounds the memory or disk the
+    run holds on to. Intermediates consumed by a step that fails, or by a step not executed in the
+    run, are kept for re-execution, as are outputs no step consumes and outputs handled by an asset
+    store. Released intermediates are no longer available to the result of the run once it ends.
     """
     from dagster.core.executor.init import InitExecutorContext
     from dagster.core.executor.in_process import InProcessExecutor
@@ -150,6 +174,7 @@ def in_process_executor(init_context):
         # shouldn't need to .get() here - issue with defaults in config setup
         retries=Retries.from_config(init_context.executor_config.get("retries", {"enabled": {}})),
         marker_to_close=init_context.executor_config.get("marker_to_close"),
+        release_intermediates=init_context.executor_config.get("release_intermediates", False),
     )
 
 
@@ -158,6 +183,15 @@ def in_process_executor(init_context):
     config_schema={
         "max_concurrent": Field(Int, is_required=False, default_value=0),
         "retries": get_retries_config(),
+        "worker_pool": Field(Bool, is_required=False, default_value=False),
+        "reuse_resources": Field(Bool, is_required=False, default_value=False),
+        "capacity": Field(
+            {"cpu": Field(Float, is_required=False), "memory": Field(Float, is_required=False)},
+            is_required=False,
+        ),
+        "fuse_steps": Field(Bool, is_required=False, default_value=False),
+        "release_intermediates": Field(Bool, is_required=False, default_value=False),
+        "critical_path": get_critical_path_config(),
     },
 )
 def multiprocess_executor(init_context):
@@ -181,6 +215,54 @@ def multiprocess_executor(init_context):
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    By default each step is executed in a fresh process. Setting ``worker_pool`` to ``true``
+    instead starts up to ``max_concurrent`` long-lived worker processes, each of which loads the
+    pipeline and the instance once and then executes steps as they are handed to it. Setting
+    ``reuse_resources`` to ``true`` additionally keeps the resources of a worker initialized
+    across the steps it executes; only use it with resources that are safe to share between steps.
+
+    The steps running at once can also be limited by the cores and memory they need. Tag solids
+    with ``dagster/cpu``, a number of cores which defaults to 1, and ``dagster/memory``, a number
+    of megabytes which defaults to 0, and set the total available to the executor:
+
+    .. code-block:: yaml
+
+        execution:
+          multiprocess:
+            config:
+              max_concurrent: 32
+              capacity:
+                cpu: 8
+                memory: 16000
+
+    Ready steps are then started in priority order as long as they fit in the free capacity, a step
+    that does not fit being passed over for smaller ones that do. A step needing more than the whole
+    capacity is started once no other step is running. ``max_concurrent`` still applies.
+
+    Setting ``fuse_steps`` to ``true`` executes each linear chain of steps -- where a step is the only
+    step depending on the one before it, and depends on no other step -- in a single child process,
+    rather than starting a process for every step of the chain. The outputs passed along the chain
+    are handed over in memory, while still being written to the intermediate storage. Every step
+    still reports its own events. Tagging a solid with ``dagster/fuse`` set to ``"false"`` keeps its
+    steps out of fused chains.
+
+    Setting ``release_intermediates`` to ``true`` removes each intermediate from the intermediate
+    storage as soon as every step consuming it has succeeded, as for the in-process executor.
+
+    Setting ``critical_path`` starts the ready steps with the longest critical path first: the
+    longest sum of step durations along any chain of steps to the end of the plan, taking the mean
+    duration of each step over the last ``num_runs`` (by default 10) successful runs of the
+    pipeline. This keeps the long tail of a wide pipeline from being started last. The
+    ``dagster/priority`` tag still takes precedence.
+
+    .. code-block:: yaml
+
+        execution:
+          multiprocess:
+            config:
+              critical_path:
+                num_runs: 20
     """
     from dagster.core.executor.init import InitExecutorContext
     from dagster.core.executor.multiprocess import MultiprocessExecutor
@@ -193,6 +275,103 @@ def multiprocess_executor(init_context):
         pipeline=init_context.pipeline,
         max_concurrent=init_context.executor_config["max_concurrent"],
         retries=Retries.from_config(init_context.executor_config["retries"]),
+        worker_pool=init_context.executor_config["worker_pool"],
+        reuse_resources=init_context.executor_config["reuse_resources"],
+        capacity=init_context.executor_config.get("capacity"),
+        fuse_steps=init_context.executor_config["fuse_steps"],
+        release_intermediates=init_context.executor_config["release_intermediates"],
+        critical_path=init_context.executor_config.get("critical_path"),
+    )
+
+
+@executor(
+    name="multithread",
+    config_schema={
+        "max_concurrent": Field(Int, is_required=False, default_value=0),
+        "retries": get_retries_config(),
+    },
+)
+def multithread_executor(init_context):
+    """An executor that runs the steps of a pipeline on a pool of threads in the current process.
+
+    It suits pipelines whose solids spend most of their time waiting on I/O, such as network
+    requests or warehouse queries. The steps share the resources of the run, and their outputs are
+    passed in memory, so no persistent storage is needed. To select the multithread executor, add
+    it to the executor defs of a :py:class:`ModeDefinition` and include a fragment such as the
+    following in your config:
+
+    .. code-block:: yaml
+
+        execution:
+          multithread:
+            config:
+              max_concurrent: 16
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many steps may run
+    concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the number of CPUs
+    plus 4, up to 32, as for :py:class:`python:concurrent.futures.ThreadPoolExecutor`.
+
+    Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
+    where the higher the number the higher the priority. 0 is the default and both positive
+    and negative numbers can be used.
+
+    Solids whose compute functions or resources are not thread safe can be tagged with
+    ``dagster/thread_safe: "false"``: their steps are executed on the main thread, once no other
+    step is running. Their compute logs are captured, while those of the steps executed on the pool
+    are not, since capturing redirects the stdout and stderr of the whole process.
+    """
+    from dagster.core.executor.init import InitExecutorContext
+    from dagster.core.executor.multithread import MultithreadExecutor
+
+    check.inst_param(init_context, "init_context", InitExecutorContext)
+
+    return MultithreadExecutor(
+        max_concurrent=init_context.executor_config["max_concurrent"],
+        retries=Retries.from_config(init_context.executor_config["retries"]),
+    )
+
+
+@executor(
+    name="asyncio",
+    config_schema={
+        "max_concurrent": Field(Int, is_required=False, default_value=0),
+        "retries": get_retries_config(),
+    },
+)
+def asyncio_executor(init_context):
+    """An executor that runs many I/O bound steps concurrently from an asyncio event loop.
+
+    Solids may define their compute functions with ``async def``, as coroutines or as async
+    generators. Whichever executor runs them, their awaitables are run to completion before the
+    step moves on; this executor instead runs the awaitables of all its steps on one event loop, on
+    the main thread, so that their waits overlap. The rest of the work of executing a step,
+    including the compute functions of synchronous solids, is offloaded to a thread pool. As with
+    the :py:func:`multithread_executor`, the steps share the resources of the run and their outputs
+    are passed in memory. To select the asyncio executor, add it to the executor defs of a
+    :py:class:`ModeDefinition` and include a fragment such as the following in your config:
+
+    .. code-block:: yaml
+
+        execution:
+          asyncio:
+            config:
+              max_concurrent: 500
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many steps may run
+    concurrently. By default, or if you set ``max_concurrent`` to be 0, this is 100.
+
+    Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
+    and solids that are not thread safe can be tagged with ``dagster/thread_safe: "false"``, as
+    for the :py:func:`multithread_executor`.
+    """
+    from dagster.core.executor.init import InitExecutorContext
+    from dagster.core.executor.event_loop import AsyncioExecutor
+
+    check.inst_param(init_context, "init_context", InitExecutorContext)
+
+    return AsyncioExecutor(
+        max_concurrent=init_context.executor_config["max_concurrent"],
+        retries=Retries.from_config(init_context.executor_config["retries"]),
     )
 
 
@@ -348,6 +348,10 @@ def __init__(self, *args, **kwargs):
         super(DagsterUserCodeProcessError, self).__init__(*args, **kwargs)
 
 
+class DagsterUserCodeTimeoutError(DagsterError):
+    """A request to a user code process did not complete within its timeout."""
+
+
 class DagsterLaunchFailedError(DagsterError):
     """Indicates an error while attempting to launch a pipeline run.
     """
@@ -8,7 +8,10 @@
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
-from dagster.core.execution.plan.execute_plan import inner_plan_execution_iterator
+from dagster.core.execution.plan.execute_plan import (
+    fused_plan_execution_iterator,
+    inner_plan_execution_iterator,
+)
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import Retries
 from dagster.core.instance import DagsterInstance, is_memoized_run
@@ -575,6 +578,23 @@ def reexecute_pipeline_iterator(
 def execute_plan_iterator(
     execution_plan, pipeline_run, instance, retries=None, run_config=None,
 ):
+    return _execute_plan_iterator(
+        inner_plan_execution_iterator, execution_plan, pipeline_run, instance, retries, run_config
+    )
+
+
+def execute_fused_plan_iterator(
+    execution_plan, pipeline_run, instance, retries=None, run_config=None,
+):
+    """Like execute_plan_iterator, for a plan of steps that an executor fused in to one unit of
+    execution: the outputs passed from step to step are handed over in memory.
+    """
+    return _execute_plan_iterator(
+        fused_plan_execution_iterator, execution_plan, pipeline_run, instance, retries, run_config
+    )
+
+
+def _execute_plan_iterator(iterator, execution_plan, pipeline_run, instance, retries, run_config):
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
     check.inst_param(instance, "instance", DagsterInstance)
@@ -584,7 +604,7 @@ def execute_plan_iterator(
     return iter(
         _ExecuteRunWithPlanIterable(
             execution_plan=execution_plan,
-            iterator=inner_plan_execution_iterator,
+            iterator=iterator,
             execution_context_manager=PlanExecutionContextManager(
                 retries=retries,
                 execution_plan=execution_plan,
@@ -735,6 +755,8 @@ def __iter__(self):
                 for event in self.execution_context_manager.shutdown_context():
                     if not generator_closed:
                         yield event
+                if self.pipeline_context:
+                    self.pipeline_context.instance.flush_event_buffer()
 
 
 def _check_execute_pipeline_args(pipeline, run_config, mode, preset, tags, solid_selection=None):
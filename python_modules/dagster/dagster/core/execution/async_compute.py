@@ -0,0 +1,76 @@
+"""Running the coroutines and async generators returned by the compute functions of async solids.
+
+The machinery that executes a step is synchronous, so the awaitables of a compute function are run to
+completion from it. By default each compute function runs on an event loop of its own. A thread
+bound to an event loop with :py:func:`bind_event_loop`, as the asyncio executor does for the threads
+executing its steps, instead schedules them on that loop, where they run concurrently with the
+awaitables of the other steps.
+"""
+import asyncio
+import threading
+from contextlib import contextmanager
+from types import AsyncGeneratorType
+
+from dagster import check
+
+_bound_loops = threading.local()
+
+
+@contextmanager
+def bind_event_loop(loop):
+    """Run the awaitables of the compute functions called from the current thread on ``loop``,
+    which must be running in another thread."""
+    check.inst_param(loop, "loop", asyncio.AbstractEventLoop)
+
+    prev_loop = getattr(_bound_loops, "loop", None)
+    _bound_loops.loop = loop
+    try:
+        yield
+    finally:
+        _bound_loops.loop = prev_loop
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+@contextmanager
+def _awaitable_runner():
+    """Yields a function running an awaitable to completion and returning its result."""
+    bound_loop = getattr(_bound_loops, "loop", None)
+    if bound_loop:
+        yield lambda awaitable: asyncio.run_coroutine_threadsafe(
+            _await(awaitable), bound_loop
+        ).result()
+        return
+
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop.run_until_complete
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+def run_awaitable(awaitable):
+    """Run an awaitable returned by a compute function to completion, returning its result."""
+    with _awaitable_runner() as run:
+        return run(awaitable)
+
+
+def iterate_async_generator(async_gen):
+    """Iterate an async generator returned by a compute function, as a generator."""
+    check.inst_param(async_gen, "async_gen", AsyncGeneratorType)
+
+    with _awaitable_runner() as run:
+        try:
+            while True:
+                try:
+                    item = run(async_gen.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            run(async_gen.aclose())
@@ -202,6 +202,16 @@ def for_step(self, step):
     def for_type(self, dagster_type):
         return TypeCheckContext(self._execution_context_data, self.log, dagster_type)
 
+    def for_intermediate_storage(self, intermediate_storage):
+        from dagster.core.storage.intermediate_storage import IntermediateStorage
+
+        check.inst_param(intermediate_storage, "intermediate_storage", IntermediateStorage)
+
+        return SystemExecutionContext(
+            self._execution_context_data._replace(intermediate_storage=intermediate_storage),
+            self._log_manager,
+        )
+
 
 class SystemPipelineExecutionContext(SystemExecutionContext):
     __slots__ = ["_executor"]
@@ -1,4 +1,6 @@
+import heapq
 import time
+from collections import OrderedDict
 
 from dagster import check
 from dagster.core.errors import DagsterIncompleteExecutionPlanError, DagsterUnknownStepStateError
@@ -7,6 +9,8 @@
 from dagster.core.execution.retries import Retries
 from dagster.utils import pop_delayed_interrupts
 
+from .capacity import StepCapacity, StepRequirements
+from .fusion import StepFusion
 from .plan import ExecutionPlan
 
 
@@ -18,18 +22,43 @@ class ActiveExecution:
     """State machine used to track progress through execution of an ExecutionPlan
     """
 
-    def __init__(self, execution_plan, retries, sort_key_fn=None):
+    def __init__(self, execution_plan, retries, sort_key_fn=None, capacity=None, fusion=None):
         self._plan = check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
         self._retries = check.inst_param(retries, "retries", Retries)
         self._sort_key_fn = check.opt_callable_param(sort_key_fn, "sort_key_fn", _default_sort_key)
 
         self._context_guard = False  # Prevent accidental direct use
 
-        # All steps to be executed start out here in _pending
-        self._pending = self._plan.execution_deps()
+        # The dependencies of each step, and the reverse edges: the steps depending on each step
+        self._deps = self._plan.execution_deps()
+        self._dependents = OrderedDict((key, []) for key in self._deps)
+        for key, deps in self._deps.items():
+            for dep_key in deps:
+                self._dependents[dep_key].append(key)
+
+        # when set, steps in flight hold their share of the capacity, see get_steps_to_execute
+        self._capacity = check.opt_inst_param(capacity, "capacity", StepCapacity)
+        self._step_requirements = (
+            {key: StepRequirements.for_step(self._plan.get_step_by_key(key)) for key in self._deps}
+            if self._capacity
+            else {}
+        )
+        self._smallest_requirements = StepRequirements(
+            cpu=min([req.cpu for req in self._step_requirements.values()], default=0),
+            memory=min([req.memory for req in self._step_requirements.values()], default=0),
+        )
+
+        # when set, the steps continuing a fused chain are executed by whoever executes its first
+        # step, see _continue_unit
+        self._fusion = check.opt_inst_param(fusion, "fusion", StepFusion)
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable = []
+        # All steps to be executed start out here in _pending, mapped to the number of their deps
+        # that have not completed yet
+        self._pending = OrderedDict((key, len(deps)) for key, deps in self._deps.items())
+
+        # steps move in to these buckets as their deps complete, see _resolve_dependents
+        self._executable = []  # heap of (sort key, sequence number, step key)
+        self._executable_sequence = 0
         self._pending_skip = []
         self._pending_retry = []
         self._pending_abandon = []
@@ -49,7 +78,10 @@ def __init__(self, execution_plan, retries, sort_key_fn=None):
         self._interrupted = set()
 
         # Start the show by loading _executable with the set of _pending steps that have no deps
-        self._update()
+        for key, num_remaining_deps in list(self._pending.items()):
+            if num_remaining_deps == 0:
+                del self._pending[key]
+                self._push_executable(key)
 
     def __enter__(self):
         self._context_guard = True
@@ -65,7 +97,10 @@ def __exit__(self, exc_type, exc_value, traceback):
         # Requested termination is the only time we should be exiting incomplete without an exception
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                [key for _, _, key in sorted(self._executable)]
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             raise DagsterIncompleteExecutionPlanError(
                 "Execution of pipeline finished without completing the execution plan, "
@@ -96,61 +131,92 @@ def __exit__(self, exc_type, exc_value, traceback):
                 )
             )
 
-    def _update(self):
-        """Moves steps from _pending to _executable / _pending_skip / _pending_retry
-           as a function of what has been _completed
-        """
-        new_steps_to_execute = []
-        new_steps_to_skip = []
-        new_steps_to_abandon = []
+    def _push_executable(self, step_key):
+        # ties between steps of the same priority are broken by the order they became executable in
+        heapq.heappush(
+            self._executable,
+            (
+                self._sort_key_fn(self.get_step_by_key(step_key)),
+                self._executable_sequence,
+                step_key,
+            ),
+        )
+        self._executable_sequence += 1
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
+    def _resolve_dependents(self, step_key):
+        """Moves the steps depending on a step that just reached a terminal state from _pending to
+        _executable / _pending_skip / _pending_abandon, once the outcome of their deps allows it.
 
-        for step_key, requirements in self._pending.items():
-            # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
-                new_steps_to_abandon.append(step_key)
+        Only the steps depending on step_key are visited, so that the cost of tracking progress
+        through a plan does not grow with the number of steps still pending.
+        """
+        dep_failed = step_key in self._failed or step_key in self._abandoned
 
-            # If all upstream deps are good - this is executable
-            elif requirements.issubset(self._success):
-                new_steps_to_execute.append(step_key)
+        for dependent_key in self._dependents.get(step_key, []):
+            if dependent_key not in self._pending:
+                # already abandoned as a result of another failed dep
+                continue
 
-            # If some upstream deps skipped...
-            elif requirements.issubset(successful_or_skipped_steps):
-                step = self.get_step_by_key(step_key)
+            # If any upstream deps failed - this is not executable
+            if dep_failed:
+                del self._pending[dependent_key]
+                self._pending_abandon.append(dependent_key)
+                continue
 
-                # The base case is downstream step will skip
-                should_skip = True
+            self._pending[dependent_key] -= 1
+            if self._pending[dependent_key] > 0:
+                continue
 
-                # Unless a fan-in input has any successful inputs
-                for inp in step.step_inputs:
-                    if isinstance(inp.source, FromMultipleSources):
-                        if any([key in self._success for key in inp.dependency_keys]):
-                            should_skip = False
+            del self._pending[dependent_key]
 
-                # but no missing regular inputs
-                for inp in step.step_inputs:
-                    if isinstance(inp.source, FromStepOutput):
-                        if any([key not in self._success for key in inp.dependency_keys]):
-                            should_skip = True
+            if self._fusion and self._fusion.is_continuation(dependent_key):
+                self._continue_unit(dependent_key)
+                continue
 
-                if should_skip:
-                    new_steps_to_skip.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
+            requirements = self._deps[dependent_key]
 
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+            # If all upstream deps are good - this is executable
+            if requirements.issubset(self._success):
+                self._push_executable(dependent_key)
+                continue
+
+            # Otherwise some upstream deps skipped...
+            step = self.get_step_by_key(dependent_key)
+
+            # The base case is downstream step will skip
+            should_skip = True
+
+            # Unless a fan-in input has any successful inputs
+            for inp in step.step_inputs:
+                if isinstance(inp.source, FromMultipleSources):
+                    if any([key in self._success for key in inp.dependency_keys]):
+                        should_skip = False
+
+            # but no missing regular inputs
+            for inp in step.step_inputs:
+                if isinstance(inp.source, FromStepOutput):
+                    if any([key not in self._success for key in inp.dependency_keys]):
+                        should_skip = True
+
+            if should_skip:
+                self._pending_skip.append(dependent_key)
+            else:
+                self._push_executable(dependent_key)
 
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+    def _continue_unit(self, step_key):
+        # The step is executed next in the unit of execution of the step it depends on, which also
+        # decides whether it executes or skips: it is in flight as soon as that step succeeded or
+        # skipped.
+        self._in_flight.add(step_key)
+        if self._capacity:
+            # the unit hands its share of the capacity over from step to step
+            self._capacity.acquire(step_key, self._step_requirements[step_key])
 
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+    def _update(self):
+        """Moves steps waiting to retry to _executable once their retry delay has elapsed
+        """
+        if not self._waiting_to_retry:
+            return
 
         ready_to_retry = []
         tick_time = time.time()
@@ -159,7 +225,7 @@ def _update(self):
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._waiting_to_retry[key]
 
     def sleep_til_ready(self):
@@ -193,39 +259,64 @@ def get_steps_to_execute(self, limit=None):
         check.opt_int_param(limit, "limit")
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable], key=self._sort_key_fn
-        )
-
-        if limit:
-            steps = steps[:limit]
+        if self._capacity:
+            return self._get_steps_within_capacity(limit)
 
-        for step in steps:
-            self._in_flight.add(step.key)
-            self._executable.remove(step.key)
+        steps = []
+        while self._executable and (not limit or len(steps) < limit):
+            _, _, key = heapq.heappop(self._executable)
+            self._in_flight.add(key)
+            steps.append(self.get_step_by_key(key))
         return steps
 
-    def get_steps_to_skip(self):
-        self._update()
-
+    def _get_steps_within_capacity(self, limit):
+        """Packs executable steps in to the free capacity first-fit, in priority order: a step that
+        does not fit is passed over for the lower priority steps that do."""
         steps = []
-        steps_to_skip = list(self._pending_skip)
-        for key in steps_to_skip:
-            steps.append(self.get_step_by_key(key))
+        passed_over = []
+        while self._executable and (not limit or len(steps) < limit):
+            if not self._capacity.fits(self._smallest_requirements):
+                # no step can fit any more
+                break
+
+            entry = heapq.heappop(self._executable)
+            key = entry[2]
+            requirements = self._step_requirements[key]
+            if not self._capacity.fits(requirements):
+                passed_over.append(entry)
+                continue
+
+            self._capacity.acquire(key, requirements)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
+            steps.append(self.get_step_by_key(key))
+
+        for entry in passed_over:
+            heapq.heappush(self._executable, entry)
+
+        return steps
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def unit_for(self, step):
+        """The keys of the steps to execute as one unit, starting with a step returned by
+        get_steps_to_execute: the step and, when steps are fused, the steps continuing it."""
+        if not self._fusion:
+            return [step.key]
+        return self._fusion.unit_for(step.key)
+
+    def get_steps_to_skip(self):
+        steps = [self.get_step_by_key(key) for key in self._pending_skip]
+        self._in_flight.update(self._pending_skip)
+        self._pending_skip = []
 
         return sorted(steps, key=self._sort_key_fn)
 
     def get_steps_to_abandon(self):
-        self._update()
-
-        steps = []
-        steps_to_abandon = list(self._pending_abandon)
-        for key in steps_to_abandon:
-            steps.append(self.get_step_by_key(key))
-            self._in_flight.add(key)
-            self._pending_abandon.remove(key)
+        steps = [self.get_step_by_key(key) for key in self._pending_abandon]
+        self._in_flight.update(self._pending_abandon)
+        self._pending_abandon = []
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -282,18 +373,25 @@ def plan_events_iterator(self, pipeline_context):
     def mark_failed(self, step_key):
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._resolve_dependents(step_key)
 
     def mark_success(self, step_key):
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._resolve_dependents(step_key)
 
     def mark_skipped(self, step_key):
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._resolve_dependents(step_key)
 
     def mark_abandoned(self, step_key):
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._resolve_dependents(step_key)
+
+    def is_in_flight(self, step_key):
+        return step_key in self._in_flight
 
     def mark_interrupted(self, step_key):
         self._interrupted.add(step_key)
@@ -313,7 +411,8 @@ def mark_up_for_retry(self, step_key, at_time=None):
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.execution_deps()[step_key]
+                # its deps all succeeded for it to have been executed in the first place
+                self._push_executable(step_key)
 
         elif self._retries.deferred:
             # do not attempt to execute again
@@ -323,6 +422,9 @@ def mark_up_for_retry(self, step_key, at_time=None):
 
         self._mark_complete(step_key)
 
+        if self._retries.deferred:
+            self._resolve_dependents(step_key)
+
     def _mark_complete(self, step_key):
         check.invariant(
             step_key in self._in_flight,
@@ -331,6 +433,8 @@ def _mark_complete(self, step_key):
             ),
         )
         self._in_flight.remove(step_key)
+        if self._capacity:
+            self._capacity.release(step_key)
 
     def handle_event(self, dagster_event):
         check.inst_param(dagster_event, "dagster_event", DagsterEvent)
@@ -0,0 +1,129 @@
+from collections import namedtuple
+
+from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
+
+CPU_TAG = "dagster/cpu"
+MEMORY_TAG = "dagster/memory"
+
+DEFAULT_STEP_CPU = 1.0
+DEFAULT_STEP_MEMORY = 0.0
+
+
+def _requirement_from_tag(step, tag, default):
+    value = step.tags.get(tag)
+    if value is None:
+        return default
+
+    try:
+        requirement = float(value)
+    except (TypeError, ValueError):
+        requirement = -1
+
+    if requirement < 0:
+        raise DagsterInvariantViolationError(
+            'Invalid value "{value}" for tag {tag} of step {key}: expected a non-negative '
+            "number.".format(value=value, tag=tag, key=step.key)
+        )
+    return requirement
+
+
+class StepRequirements(namedtuple("_StepRequirements", "cpu memory")):
+    """The share of the capacity of an executor that a step occupies while it executes.
+
+    Args:
+        cpu (float): The number of cores, from the ``dagster/cpu`` tag. Defaults to 1.
+        memory (float): The megabytes of memory, from the ``dagster/memory`` tag. Defaults to 0.
+    """
+
+    @staticmethod
+    def for_step(step):
+        return StepRequirements(
+            cpu=_requirement_from_tag(step, CPU_TAG, DEFAULT_STEP_CPU),
+            memory=_requirement_from_tag(step, MEMORY_TAG, DEFAULT_STEP_MEMORY),
+        )
+
+
+class StepCapacity:
+    """The cores and memory available to the steps an executor runs at once.
+
+    Steps are only started while the sum of their requirements fits the capacity. A step requiring
+    more than the whole capacity is started once no other step is running, so that it can not hold
+    up the rest of the plan forever.
+
+    Args:
+        cpu (Optional[float]): The total cores. Unlimited if not set.
+        memory (Optional[float]): The total megabytes of memory. Unlimited if not set.
+    """
+
+    def __init__(self, cpu=None, memory=None):
+        self.cpu = check.opt_numeric_param(cpu, "cpu")
+        self.memory = check.opt_numeric_param(memory, "memory")
+
+        self._in_use = {}  # step key -> StepRequirements
+        self._cpu_in_use = 0.0
+        self._memory_in_use = 0.0
+
+    @staticmethod
+    def from_config(config):
+        check.opt_dict_param(config, "config")
+        if not config:
+            return None
+        return StepCapacity(cpu=config.get("cpu"), memory=config.get("memory"))
+
+    @property
+    def cpu_in_use(self):
+        return self._cpu_in_use
+
+    @property
+    def memory_in_use(self):
+        return self._memory_in_use
+
+    @property
+    def num_steps(self):
+        return len(self._in_use)
+
+    def fits(self, requirements):
+        check.inst_param(requirements, "requirements", StepRequirements)
+
+        if not self._in_use:
+            return True
+
+        return (self.cpu is None or self._cpu_in_use + requirements.cpu <= self.cpu) and (
+            self.memory is None or self._memory_in_use + requirements.memory <= self.memory
+        )
+
+    def acquire(self, step_key, requirements):
+        check.str_param(step_key, "step_key")
+        check.inst_param(requirements, "requirements", StepRequirements)
+        check.invariant(
+            step_key not in self._in_use, "Step {} already holds capacity".format(step_key),
+        )
+
+        self._in_use[step_key] = requirements
+        self._cpu_in_use += requirements.cpu
+        self._memory_in_use += requirements.memory
+
+    def release(self, step_key):
+        requirements = self._in_use.pop(step_key, None)
+        if requirements:
+            self._cpu_in_use -= requirements.cpu
+            self._memory_in_use -= requirements.memory
+
+    def describe_utilization(self):
+        def _describe(name, in_use, total, unit=""):
+            if total is None:
+                return "{name} {in_use:g}{unit}".format(name=name, in_use=in_use, unit=unit)
+            return "{name} {in_use:g}/{total:g}{unit} ({percent:.0f}%)".format(
+                name=name,
+                in_use=in_use,
+                total=total,
+                unit=unit,
+                percent=100.0 * in_use / total if total else 0.0,
+            )
+
+        return "{cpu}, {memory} in use by {num_steps} step(s)".format(
+            cpu=_describe("cpu", self._cpu_in_use, self.cpu),
+            memory=_describe("memory", self._memory_in_use, self.memory, unit="MB"),
+            num_steps=self.num_steps,
+        )
@@ -0,0 +1,126 @@
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.execution.stats import StepEventStatus
+
+from .active import _default_sort_key
+from .plan import ExecutionPlan
+
+
+def historical_step_durations(instance, pipeline_name, num_runs):
+    """The mean duration in seconds of each step key of a pipeline, over the successful executions
+    of the step in the most recent successful runs of the pipeline.
+
+    Args:
+        instance (DagsterInstance): The instance to read the runs and their step stats from.
+        pipeline_name (str): The name of the pipeline.
+        num_runs (int): The number of most recent successful runs to read.
+
+    Returns:
+        Dict[str, float]: The mean duration of each step key found in the runs.
+    """
+    from dagster.core.instance import DagsterInstance
+    from dagster.core.storage.pipeline_run import PipelineRunStatus, PipelineRunsFilter
+
+    check.inst_param(instance, "instance", DagsterInstance)
+    check.str_param(pipeline_name, "pipeline_name")
+    check.int_param(num_runs, "num_runs")
+
+    runs = instance.get_runs(
+        filters=PipelineRunsFilter(
+            pipeline_name=pipeline_name, statuses=[PipelineRunStatus.SUCCESS]
+        ),
+        limit=num_runs,
+    )
+
+    durations = defaultdict(list)
+    for run in runs:
+        for step_stats in instance.get_run_step_stats(run.run_id):
+            if (
+                step_stats.status == StepEventStatus.SUCCESS
+                and step_stats.start_time is not None
+                and step_stats.end_time is not None
+            ):
+                durations[step_stats.step_key].append(step_stats.end_time - step_stats.start_time)
+
+    return {
+        step_key: sum(step_durations) / len(step_durations)
+        for step_key, step_durations in durations.items()
+    }
+
+
+class CriticalPathPriority:
+    """Prioritizes the steps of an execution plan by the length of their critical path: the longest
+    sum of expected step durations along any chain of steps from the step to the end of the plan.
+
+    Starting the steps on the longest paths first keeps the long tail of a wide plan from being
+    started last, which would otherwise leave the run waiting on it once everything else is done.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan to prioritize the steps of.
+        step_durations (Dict[str, float]): The expected duration in seconds of each step key. A step
+            without one is expected to take the mean of the durations of the steps of the plan that
+            have one.
+    """
+
+    def __init__(self, execution_plan, step_durations):
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+        step_durations = check.dict_param(
+            step_durations, "step_durations", key_type=str, value_type=(int, float)
+        )
+
+        deps = execution_plan.execution_deps()
+        known_durations = [step_durations[key] for key in deps if key in step_durations]
+        self._num_steps_with_history = len(known_durations)
+        default_duration = sum(known_durations) / len(known_durations) if known_durations else 0.0
+
+        dependents = {key: [] for key in deps}
+        for key, dep_keys in deps.items():
+            for dep_key in dep_keys:
+                dependents[dep_key].append(key)
+
+        self._lengths = {}  # step key -> length of its critical path, in seconds
+        for step_level in reversed(execution_plan.execution_step_levels()):
+            for step in step_level:
+                self._lengths[step.key] = step_durations.get(step.key, default_duration) + max(
+                    [self._lengths[key] for key in dependents[step.key]], default=0.0
+                )
+
+    @staticmethod
+    def from_config(pipeline_context, execution_plan, config):
+        """The priority of the steps from the durations of the recent runs of the pipeline, or None
+        if the executor is not configured to prioritize steps by their critical path."""
+        check.opt_dict_param(config, "config")
+        if not config:
+            return None
+
+        num_runs = config["num_runs"]
+        priority = CriticalPathPriority(
+            execution_plan,
+            historical_step_durations(
+                pipeline_context.instance, pipeline_context.pipeline_def.name, num_runs
+            ),
+        )
+        pipeline_context.log.debug(
+            "Prioritizing steps by critical path, from the durations of {num_steps} step(s) in the "
+            "last {num_runs} successful run(s) of the pipeline.".format(
+                num_steps=priority.num_steps_with_history, num_runs=num_runs
+            )
+        )
+        return priority
+
+    @property
+    def num_steps_with_history(self):
+        return self._num_steps_with_history
+
+    def critical_path_length(self, step_key):
+        check.str_param(step_key, "step_key")
+        return self._lengths.get(step_key, 0.0)
+
+    def sort_key_fn(self, base_sort_key_fn=None):
+        """A sort key for :py:class:`ActiveExecution` ordering steps by a base sort key, by default
+        the ``dagster/priority`` tag, and then by the longest critical path first."""
+        base_sort_key_fn = check.opt_callable_param(
+            base_sort_key_fn, "base_sort_key_fn", _default_sort_key
+        )
+        return lambda step: (base_sort_key_fn(step), -self.critical_path_length(step.key))
@@ -23,6 +23,7 @@
 from dagster.core.execution.plan.objects import StepFailureData, StepRetryData, UserFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import Retries
+from dagster.core.storage.intermediate_storage import InMemoryHandoffIntermediateStorage
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 
@@ -35,59 +36,21 @@ def inner_plan_execution_iterator(pipeline_context, execution_plan):
     yield from copy_required_intermediates_for_execution(pipeline_context, execution_plan)
 
     with execution_plan.start(retries=retries) as active_execution:
-
-        # It would be good to implement a reference tracking algorithm here to
-        # garbage collect results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
         while not active_execution.is_complete:
             step = active_execution.get_next_step()
             step_context = pipeline_context.for_step(step)
             step_event_list = []
 
-            missing_resources = [
-                resource_key
-                for resource_key in step_context.required_resource_keys
-                if not hasattr(step_context.resources, resource_key)
-            ]
-            check.invariant(
-                len(missing_resources) == 0,
-                (
-                    "Expected step context for solid {solid_name} to have all required resources, but "
-                    "missing {missing_resources}."
-                ).format(solid_name=step_context.solid.name, missing_resources=missing_resources),
-            )
-
             # capture all of the logs for this step
             with pipeline_context.instance.compute_log_manager.watch(
                 step_context.pipeline_run, step_context.step.key
             ):
-                missing_input_sources = pipeline_context.intermediate_storage.get_missing_input_sources(
-                    step_context, step
-                )
-                if missing_input_sources:
-                    # In partial pipeline execution, we may end up here without having validated the
-                    # missing dependent outputs were optional
-                    _assert_missing_sources_from_optional_outputs(
-                        missing_input_sources, execution_plan, step.key
-                    )
-
-                    step_context.log.info(
-                        (
-                            "Not all inputs covered for {step}. Not executing. Sources missing: {missing_input_sources}"
-                        ).format(missing_input_sources=missing_input_sources, step=step.key)
-                    )
-                    step_event = DagsterEvent.step_skipped_event(step_context)
+                for step_event in inner_step_execution_iterator(
+                    step_context, execution_plan, retries
+                ):
                     step_event_list.append(step_event)
                     yield step_event
-                    active_execution.mark_skipped(step.key)
-                else:
-                    for step_event in check.generator(
-                        _dagster_event_sequence_for_step(step_context, retries)
-                    ):
-                        check.inst(step_event, DagsterEvent)
-                        step_event_list.append(step_event)
-                        yield step_event
-                        active_execution.handle_event(step_event)
+                    active_execution.handle_event(step_event)
 
                 active_execution.verify_complete(pipeline_context, step.key)
 
@@ -97,12 +60,89 @@ def inner_plan_execution_iterator(pipeline_context, execution_plan):
                 yield event
 
             # pass a list of step events to hooks
-            for hook_event in _trigger_hook(step_context, step_event_list):
+            for hook_event in trigger_hook(step_context, step_event_list):
                 yield hook_event
 
 
-def _trigger_hook(step_context, step_event_list):
-    """Trigger hooks and record hook's operatonal events"""
+def fused_plan_execution_iterator(pipeline_context, execution_plan):
+    """Executes the steps of a plan that are fused in to one unit of execution, see StepFusion, in
+    the current process. The outputs passed from step to step are handed over in memory, rather than
+    read back from the intermediate storage of the run.
+    """
+    check.inst_param(pipeline_context, "pipeline_context", SystemExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+    step_keys = set(execution_plan.step_keys_to_execute)
+    handoff_handles = [
+        step_output_handle
+        for step_key in execution_plan.step_keys_to_execute
+        for step_input in execution_plan.get_step_by_key(step_key).step_inputs
+        for step_output_handle in step_input.source.step_output_handle_dependencies
+        if step_output_handle.step_key in step_keys
+    ]
+
+    yield from inner_plan_execution_iterator(
+        pipeline_context.for_intermediate_storage(
+            InMemoryHandoffIntermediateStorage(
+                pipeline_context.intermediate_storage, handoff_handles
+            )
+        ),
+        execution_plan,
+    )
+
+
+def inner_step_execution_iterator(step_context, execution_plan, retries):
+    """Yield the events of executing a single step of the plan, whose dependencies have completed.
+
+    The step is skipped if not all of its inputs were produced upstream. Marking the step complete
+    on the active execution, running its hooks and capturing its compute logs are left to the
+    caller.
+    """
+    check.inst_param(step_context, "step_context", SystemStepExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.inst_param(retries, "retries", Retries)
+
+    step = step_context.step
+
+    missing_resources = [
+        resource_key
+        for resource_key in step_context.required_resource_keys
+        if not hasattr(step_context.resources, resource_key)
+    ]
+    check.invariant(
+        len(missing_resources) == 0,
+        (
+            "Expected step context for solid {solid_name} to have all required resources, but "
+            "missing {missing_resources}."
+        ).format(solid_name=step_context.solid.name, missing_resources=missing_resources),
+    )
+
+    missing_input_sources = step_context.intermediate_storage.get_missing_input_sources(
+        step_context, step
+    )
+    if missing_input_sources:
+        # In partial pipeline execution, we may end up here without having validated the
+        # missing dependent outputs were optional
+        _assert_missing_sources_from_optional_outputs(
+            missing_input_sources, execution_plan, step.key
+        )
+
+        step_context.log.info(
+            (
+                "Not all inputs covered for {step}. Not executing. Sources missing: {missing_input_sources}"
+            ).format(missing_input_sources=missing_input_sources, step=step.key)
+        )
+        yield DagsterEvent.step_skipped_event(step_context)
+        return
+
+    for step_event in check.generator(_dagster_event_sequence_for_step(step_context, retries)):
+        check.inst(step_event, DagsterEvent)
+        yield step_event
+
+
+def trigger_hook(step_context, step_event_list):
+    """Triggers the hooks of a step on its events, yielding an event for each hook recording
+    whether it completed, was skipped or errored."""
     hook_defs = step_context.pipeline_def.get_all_hooks_for_handle(step_context.solid_handle)
     # when the solid doesn't have a hook configured
     if hook_defs is None:
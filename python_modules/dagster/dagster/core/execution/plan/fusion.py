@@ -0,0 +1,88 @@
+from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
+
+from .plan import ExecutionPlan
+
+FUSE_TAG = "dagster/fuse"
+
+
+def _fusion_enabled_for_step(step, enabled):
+    # the tag only opts steps out of fusion: steps are only fused by an executor that is configured
+    # to fuse them, and so executes its fused units
+    value = step.tags.get(FUSE_TAG)
+    if value is None:
+        return enabled
+
+    if str(value).lower() not in ("true", "false"):
+        raise DagsterInvariantViolationError(
+            'Invalid value "{value}" for tag {tag} of step {key}: expected "true" or '
+            '"false".'.format(value=value, tag=FUSE_TAG, key=step.key)
+        )
+    return enabled and str(value).lower() == "true"
+
+
+class StepFusion:
+    """Fuses the linear chains of steps of an execution plan in to single units of execution.
+
+    A step is fused with the next step when the next step is the only step depending on it and
+    depends on no other step, so that an executor can dispatch the whole chain at once and hand the
+    outputs along it over in memory. Each step of a unit still reports its own events.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan to fuse the steps of.
+        enabled (bool): Whether steps are fused. A step tagged ``dagster/fuse`` with ``"false"`` is
+            not fused even when this is set, while a ``"true"`` tag does not fuse steps unless it is.
+        group_fn (Optional[Callable[[ExecutionStep], Any]]): If set, a step is only fused with the
+            next step when this returns the same value for both, e.g. the queue they execute on.
+    """
+
+    def __init__(self, execution_plan, enabled=False, group_fn=None):
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+        check.bool_param(enabled, "enabled")
+        check.opt_callable_param(group_fn, "group_fn")
+
+        deps = execution_plan.execution_deps()
+        dependents = {key: [] for key in deps}
+        for key, dep_keys in deps.items():
+            for dep_key in dep_keys:
+                dependents[dep_key].append(key)
+
+        fusion_enabled = {
+            key: _fusion_enabled_for_step(execution_plan.get_step_by_key(key), enabled)
+            for key in deps
+        }
+
+        self._previous = {}  # step key -> key of the step it continues
+        self._next = {}  # step key -> key of the step continuing it
+        for key, dep_keys in deps.items():
+            if len(dep_keys) != 1:
+                continue
+
+            dep_key = next(iter(dep_keys))
+            if (
+                len(dependents[dep_key]) == 1
+                and fusion_enabled[key]
+                and fusion_enabled[dep_key]
+                and (
+                    group_fn is None
+                    or group_fn(execution_plan.get_step_by_key(key))
+                    == group_fn(execution_plan.get_step_by_key(dep_key))
+                )
+            ):
+                self._previous[key] = dep_key
+                self._next[dep_key] = key
+
+    def is_continuation(self, step_key):
+        """Whether the step is executed as part of the unit of the step it depends on."""
+        check.str_param(step_key, "step_key")
+        return step_key in self._previous
+
+    def unit_for(self, step_key):
+        """The keys of the steps executed as one unit starting at a step: the step, and the chain of
+        steps continuing it, in order."""
+        check.str_param(step_key, "step_key")
+
+        step_keys = [step_key]
+        while step_keys[-1] in self._next:
+            step_keys.append(self._next[step_keys[-1]])
+        return step_keys
@@ -0,0 +1,155 @@
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.definitions.events import EventMetadataEntry
+from dagster.core.events import DagsterEvent, EngineEventData
+
+from .objects import StepOutputHandle
+from .plan import ExecutionPlan
+
+
+class IntermediateGarbageCollector:
+    """Releases the intermediates of a run from its intermediate storage as soon as every step
+    consuming them has succeeded, rather than keeping them until the end of the run.
+
+    The steps still to consume each output are counted down as the events of the run are handled.
+    An intermediate is kept when a step consuming it fails, so that the run can be re-executed from
+    the failure, when it is consumed by a step that is not executed in this run, when no step
+    consumes it, and when its output is handled by an asset store.
+
+    Args:
+        pipeline_context (SystemPipelineExecutionContext): The context of the run.
+        execution_plan (ExecutionPlan): The plan being executed.
+    """
+
+    def __init__(self, pipeline_context, execution_plan):
+        from dagster.core.execution.context.system import SystemPipelineExecutionContext
+
+        self._pipeline_context = check.inst_param(
+            pipeline_context, "pipeline_context", SystemPipelineExecutionContext
+        )
+        self._execution_plan = check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+        step_keys_to_execute = set(execution_plan.step_keys_to_execute)
+        consumers = defaultdict(set)  # step output handle -> keys of the steps consuming it
+        for step in execution_plan.steps:
+            for step_input in step.step_inputs:
+                for handle in step_input.source.step_output_handle_dependencies:
+                    consumers[handle].add(step.key)
+
+        self._remaining_consumers = {
+            handle: step_keys
+            for handle, step_keys in consumers.items()
+            if handle.step_key in step_keys_to_execute
+            and step_keys <= step_keys_to_execute
+            and not self._uses_asset_store(handle)
+        }
+
+        self._inputs = defaultdict(list)  # step key -> handles of the collected outputs it consumes
+        for handle, step_keys in self._remaining_consumers.items():
+            for step_key in step_keys:
+                self._inputs[step_key].append(handle)
+
+        self._sizes = {}  # step output handle -> size in bytes of the stored intermediate
+        self._live_size = 0
+        self._peak_size = 0
+        self._total_size = 0
+        self._num_released = 0
+        self._released_size = 0
+
+    def _uses_asset_store(self, step_output_handle):
+        step = self._execution_plan.get_step_by_key(step_output_handle.step_key)
+        return self._pipeline_context.for_step(step).using_asset_store(step_output_handle)
+
+    @property
+    def num_released(self):
+        return self._num_released
+
+    @property
+    def released_size(self):
+        return self._released_size
+
+    @property
+    def peak_size(self):
+        return self._peak_size
+
+    @property
+    def total_size(self):
+        return self._total_size
+
+    def handle_event(self, dagster_event):
+        check.inst_param(dagster_event, "dagster_event", DagsterEvent)
+
+        if dagster_event.is_step_success:
+            self._track_outputs(dagster_event.step_key)
+            self._release_inputs(dagster_event.step_key)
+        elif dagster_event.is_step_skipped:
+            self._release_inputs(dagster_event.step_key)
+
+    def _track_outputs(self, step_key):
+        step = self._execution_plan.get_step_by_key(step_key)
+        intermediate_storage = self._pipeline_context.intermediate_storage
+
+        for step_output in step.step_outputs:
+            handle = StepOutputHandle(step_key, step_output.name)
+            if not intermediate_storage.has_intermediate(self._pipeline_context, handle):
+                continue
+
+            size = intermediate_storage.get_intermediate_size(self._pipeline_context, handle)
+            if size is None:
+                continue
+
+            self._total_size += size
+            self._live_size += size
+            self._peak_size = max(self._peak_size, self._live_size)
+            if handle in self._remaining_consumers:
+                self._sizes[handle] = size
+
+    def _release_inputs(self, step_key):
+        for handle in self._inputs.pop(step_key, []):
+            remaining = self._remaining_consumers[handle]
+            remaining.discard(step_key)
+            if not remaining:
+                self._release(handle)
+
+    def _release(self, step_output_handle):
+        del self._remaining_consumers[step_output_handle]
+
+        intermediate_storage = self._pipeline_context.intermediate_storage
+        if not intermediate_storage.has_intermediate(self._pipeline_context, step_output_handle):
+            return
+
+        intermediate_storage.rm_intermediate(self._pipeline_context, step_output_handle)
+        size = self._sizes.pop(step_output_handle, 0)
+        self._live_size -= size
+        self._released_size += size
+        self._num_released += 1
+
+        self._pipeline_context.log.debug(
+            "Released intermediate for output {output} of step {step} after all the steps "
+            "consuming it completed.".format(
+                output=step_output_handle.output_name, step=step_output_handle.step_key
+            )
+        )
+
+    def summary_event(self):
+        """An engine event reporting the intermediates released and the peak size of the
+        intermediates held at once, against the size held without releasing any."""
+        return DagsterEvent.engine_event(
+            self._pipeline_context,
+            "Released {num_released} intermediate(s) of {released_size} bytes once consumed: peak "
+            "intermediate storage of {peak_size} bytes rather than {total_size} bytes.".format(
+                num_released=self._num_released,
+                released_size=self._released_size,
+                peak_size=self._peak_size,
+                total_size=self._total_size,
+            ),
+            event_specific_data=EngineEventData(
+                metadata_entries=[
+                    EventMetadataEntry.int(self._num_released, "Intermediates released"),
+                    EventMetadataEntry.int(self._released_size, "Bytes released"),
+                    EventMetadataEntry.int(self._peak_size, "Peak bytes held"),
+                    EventMetadataEntry.int(self._total_size, "Peak bytes held without releasing"),
+                ]
+            ),
+        )
@@ -376,6 +376,7 @@ def execution_deps(self):
                 only steps that are included in step_keys_to_execute.
         """
         deps = OrderedDict()
+        step_keys_to_execute = set(self.step_keys_to_execute)
 
         for key in self.step_keys_to_execute:
             deps[key] = set()
@@ -383,9 +384,7 @@ def execution_deps(self):
         for key in self.step_keys_to_execute:
             step = self.step_dict[key]
             for step_input in step.step_inputs:
-                deps[step.key].update(
-                    step_input.dependency_keys.intersection(self.step_keys_to_execute)
-                )
+                deps[step.key].update(step_input.dependency_keys.intersection(step_keys_to_execute))
         return deps
 
     def build_subset_plan(self, step_keys_to_execute):
@@ -416,11 +415,11 @@ def construct_asset_store_context(self, step_output_handle, asset_store_handle):
         )
 
     def start(
-        self, retries, sort_key_fn=None,
+        self, retries, sort_key_fn=None, capacity=None, fusion=None,
     ):
         from .active import ActiveExecution
 
-        return ActiveExecution(self, retries, sort_key_fn)
+        return ActiveExecution(self, retries, sort_key_fn, capacity, fusion)
 
     def step_key_for_single_step_plans(self):
         # Temporary hack to isolate single-step plans, which are often the representation of
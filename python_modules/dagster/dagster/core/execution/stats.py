@@ -63,6 +63,7 @@ def build_run_stats_from_events(run_id, records):
     )
 
 
+@whitelist_for_serdes
 class StepEventStatus(Enum):
     SKIPPED = "SKIPPED"
     SUCCESS = "SUCCESS"
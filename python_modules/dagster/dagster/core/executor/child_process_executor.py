@@ -1,10 +1,11 @@
 """Facilities for running arbitrary commands in child processes."""
 
 import os
-import queue
 import sys
+import time
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
+from multiprocessing.connection import wait as wait_for_connections
 
 import six
 from dagster import check
@@ -31,6 +32,12 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessTaskDoneEvent(
+    namedtuple("ChildProcessTaskDoneEvent", "pid task"), ChildProcessEvent
+):
+    pass
+
+
 class ChildProcessCommand(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     """Inherit from this class in order to use this library.
 
@@ -43,6 +50,19 @@ def execute(self):
         Yields a sequence of events to be handled by _execute_command_in_child_process."""
 
 
+class ChildProcessWorkerCommand(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
+    """Inherit from this class in order to execute a sequence of tasks in a long-lived child process.
+
+    The object must be picklable; instantiate it and pass it to ChildProcessWorker."""
+
+    @abstractmethod
+    def execute(self, tasks):
+        """ This method is invoked in the child process, with an iterator over the tasks submitted
+        to the worker. Requesting the next task signals that the previous one is done.
+
+        Yields a sequence of events to be handled by the ChildProcessWorker."""
+
+
 class ChildProcessCrashException(Exception):
     """Thrown when the child process crashes."""
 
@@ -50,59 +70,127 @@ def __init__(self, exit_code=None):
         self.exit_code = exit_code
 
 
-def _execute_command_in_child_process(event_queue, command):
+def _execute_command_in_child_process(event_connection, command):
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process."""
+    Handles errors and communicates across a pipe with the parent process."""
 
     check.inst_param(command, "command", ChildProcessCommand)
 
     with delay_interrupts():
         pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
+        event_connection.send(ChildProcessStartEvent(pid=pid))
         try:
             for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
+                event_connection.send(step_event)
+            event_connection.send(ChildProcessDoneEvent(pid=pid))
+        except (Exception, KeyboardInterrupt):  # pylint: disable=broad-except
+            event_connection.send(
+                ChildProcessSystemErrorEvent(
+                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                )
+            )
+        finally:
+            event_connection.close()
+
+
+def _worker_tasks(task_queue, event_connection, pid):
+    while True:
+        task = task_queue.get()
+        if task is None:
+            return
+
+        yield task
+        event_connection.send(ChildProcessTaskDoneEvent(pid=pid, task=task))
+
+
+def _execute_worker_command_in_child_process(event_connection, task_queue, command):
+    """Wraps the execution of a ChildProcessWorkerCommand.
+
+    Handles errors and communicates across a pipe and a queue with the parent process."""
+
+    check.inst_param(command, "command", ChildProcessWorkerCommand)
+
+    with delay_interrupts():
+        pid = os.getpid()
+        event_connection.send(ChildProcessStartEvent(pid=pid))
+        try:
+            for event in command.execute(_worker_tasks(task_queue, event_connection, pid)):
+                event_connection.send(event)
+            event_connection.send(ChildProcessDoneEvent(pid=pid))
         except (Exception, KeyboardInterrupt):  # pylint: disable=broad-except
-            event_queue.put(
+            event_connection.send(
                 ChildProcessSystemErrorEvent(
                     pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
                 )
             )
+        finally:
+            event_connection.close()
 
 
 TICK = 20.0 * 1.0 / 1000.0
-"""The minimum interval at which to check for child process liveness -- default 20ms."""
+"""The interval at which execute_child_process_command yields None while the child process is
+quiet -- default 20ms."""
 
 PROCESS_DEAD_AND_QUEUE_EMPTY = "PROCESS_DEAD_AND_QUEUE_EMPTY"
 """Sentinel value."""
 
 
-def _poll_for_event(process, event_queue):
+def _start_child_process(target, args):
+    """Starts a child process running target, passing it the writing end of a pipe over which it
+    sends its events, followed by args. Returns the process and the reading end of the pipe.
+
+    The parent process closes its copy of the writing end, so that once the child process exits --
+    whether it completed, raised or crashed -- reading from the pipe raises EOFError instead of
+    blocking. This lets the parent wait on the pipe alone to be woken up by either an event or the
+    exit of the child process."""
+    read_connection, write_connection = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=target, args=(write_connection,) + tuple(args))
+    process.start()
+    write_connection.close()
+    return process, read_connection
+
+
+def _read_events(event_connection):
+    """Reads the events available on the pipe without blocking. The last event is
+    PROCESS_DEAD_AND_QUEUE_EMPTY if the child process has exited and all of its events have been
+    read."""
+    events = []
     try:
-        return event_queue.get(block=True, timeout=TICK)
-    except queue.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
-            try:
-                return event_queue.get(block=False)
-            except queue.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
-
-    return None
+        while event_connection.poll():
+            events.append(event_connection.recv())
+    except EOFError:
+        events.append(PROCESS_DEAD_AND_QUEUE_EMPTY)
+    return events
+
+
+def wait_for_child_processes(children, timeout=None):
+    """Blocks until at least one of the children has events to read or has exited, or until the
+    timeout elapses.
+
+    Args:
+        children (List[Union[ChildProcess, ChildProcessWorker]]): The children to wait on.
+        timeout (Optional[float]): The maximum number of seconds to block for.
+
+    Returns:
+        List[Union[ChildProcess, ChildProcessWorker]]: The children ready to be read from.
+    """
+    children_by_connection = {child.connection: child for child in children}
+    if not children_by_connection:
+        if timeout:
+            time.sleep(timeout)
+        return []
+
+    ready = wait_for_connections(list(children_by_connection.keys()), timeout)
+    return [children_by_connection[connection] for connection in ready]
 
 
 def execute_child_process_command(command):
     """Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; reads the events sent by the child process until the
+    process dies and all of its events have been read.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -117,6 +205,10 @@ def execute_child_process_command(command):
 
         * The actual values yielded by the child process command
 
+    Callers executing many commands at once should prefer ChildProcess and
+    wait_for_child_processes, which wake up as soon as any of the children has an event, over
+    polling one iterator per child.
+
     Args:
         command (ChildProcessCommand): The command to execute in the child process.
 
@@ -126,30 +218,156 @@ def execute_child_process_command(command):
 
     check.inst_param(command, "command", ChildProcessCommand)
 
-    event_queue = multiprocessing.Queue()
+    process, event_connection = _start_child_process(_execute_command_in_child_process, (command,))
     try:
-        process = multiprocessing.Process(
-            target=_execute_command_in_child_process, args=(event_queue, command)
-        )
-        process.start()
-
         completed_properly = False
+        process_dead = False
+
+        while not completed_properly and not process_dead:
+            if not wait_for_connections([event_connection], TICK):
+                yield None
+                continue
 
-        while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            for event in _read_events(event_connection):
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    process_dead = True
+                    break
 
-            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
-                break
+                yield event
 
-            yield event
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    completed_properly = True
 
-            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
-                completed_properly = True
+        process.join()
 
         if not completed_properly:
             # TODO Figure out what to do about stderr/stdout
             raise ChildProcessCrashException(exit_code=process.exitcode)
-
-        process.join()
     finally:
-        event_queue.close()
+        event_connection.close()
+
+
+class ChildProcess:
+    """A child process executing a ChildProcessCommand, which sends its events back over a pipe.
+
+    Many children can be waited on at once with wait_for_child_processes, so that a parent process
+    driving them is woken up as soon as any of them has an event or exits.
+
+    Args:
+        command (ChildProcessCommand): The command to execute in the child process.
+    """
+
+    def __init__(self, command):
+        check.inst_param(command, "command", ChildProcessCommand)
+
+        self._process, self._connection = _start_child_process(
+            _execute_command_in_child_process, (command,)
+        )
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    @property
+    def exit_code(self):
+        return self._process.exitcode
+
+    @property
+    def connection(self):
+        return self._connection
+
+    def read_events(self):
+        """Reads the events sent by the child process so far, without blocking.
+
+        The events are ChildProcessEvents or events yielded by the command. The last event is
+        PROCESS_DEAD_AND_QUEUE_EMPTY once the child process has exited and all of its events have
+        been read.
+        """
+        return _read_events(self._connection)
+
+    def terminate(self):
+        self._process.terminate()
+
+    def join(self, timeout=None):
+        """Waits for the child process to exit. Once its events have been read, the child process
+        may still take a while to tear its interpreter down, so avoid joining it while other
+        children are waiting to be serviced."""
+        self._process.join(timeout)
+
+    def close(self):
+        """Closes the pipe to the child process; its events should all have been read."""
+        self._connection.close()
+
+
+class ChildProcessWorker:
+    """A long-lived child process, executing the tasks submitted to it one at a time with a
+    ChildProcessWorkerCommand.
+
+    Unlike ChildProcess, which pays for starting a new process for each command, a worker is
+    started once and then reused for as many tasks as are submitted to it.
+
+    Args:
+        command (ChildProcessWorkerCommand): The command to execute in the child process.
+    """
+
+    def __init__(self, command):
+        check.inst_param(command, "command", ChildProcessWorkerCommand)
+
+        self._task_queue = multiprocessing.Queue()
+        self._process, self._connection = _start_child_process(
+            _execute_worker_command_in_child_process, (self._task_queue, command)
+        )
+        self._task = None
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    @property
+    def exit_code(self):
+        return self._process.exitcode
+
+    @property
+    def connection(self):
+        return self._connection
+
+    @property
+    def task(self):
+        """The task the worker is executing, or None if it is idle."""
+        return self._task
+
+    def submit(self, task):
+        check.invariant(task is not None, "Cannot submit a None task")
+        check.invariant(
+            self._task is None, "Cannot submit a task to a worker that is still executing one"
+        )
+        self._task = task
+        self._task_queue.put(task)
+
+    def read_events(self):
+        """Reads the events sent by the worker so far, without blocking.
+
+        The events are ChildProcessEvents or events yielded by the command. The last event is
+        PROCESS_DEAD_AND_QUEUE_EMPTY once the worker has exited and all of its events have been
+        read.
+        """
+        events = _read_events(self._connection)
+        if any(isinstance(event, ChildProcessTaskDoneEvent) for event in events):
+            self._task = None
+        return events
+
+    def shutdown(self):
+        """Signals the worker to exit once it is done with its current task."""
+        self._task_queue.put(None)
+
+    def terminate(self):
+        self._process.terminate()
+
+    def join(self, timeout=None):
+        """Waits for the worker to exit. See ChildProcess.join."""
+        self._process.join(timeout)
+
+    def close(self):
+        """Closes the channels to the worker; its events should all have been read."""
+        self._connection.close()
+        self._task_queue.close()
@@ -0,0 +1,88 @@
+import asyncio
+from contextlib import contextmanager
+
+from dagster import check
+from dagster.core.execution.async_compute import bind_event_loop
+
+from .multithread import MultithreadExecutor, StepEventQueue
+
+DEFAULT_MAX_CONCURRENT = 100
+"""The threads of the steps of async solids spend their time waiting on the event loop, so many more
+steps can run at once than with the multithread executor."""
+
+
+class EventLoopStepEventQueue(StepEventQueue):
+    """Carries the events of the steps to the main thread, which runs the event loop while it waits
+    for them. The threads executing the steps are bound to the loop, so that the awaitables of async
+    compute functions run on it, concurrently."""
+
+    def __init__(self, loop):
+        super(EventLoopStepEventQueue, self).__init__()
+        self._loop = check.inst_param(loop, "loop", asyncio.AbstractEventLoop)
+        # created on the loop, which it is bound to
+        self._async_queue = loop.run_until_complete(_new_async_queue())
+
+    def put(self, item):
+        self._loop.call_soon_threadsafe(self._async_queue.put_nowait, item)
+
+    def get_items(self, timeout):
+        return self._loop.run_until_complete(self._get_items(timeout))
+
+    async def _get_items(self, timeout):
+        try:
+            items = [await asyncio.wait_for(self._async_queue.get(), timeout)]
+        except asyncio.TimeoutError:
+            return []
+
+        while not self._async_queue.empty():
+            items.append(self._async_queue.get_nowait())
+        return items
+
+    @contextmanager
+    def step_thread_scope(self):
+        with bind_event_loop(self._loop):
+            yield
+
+
+class AsyncioExecutor(MultithreadExecutor):
+    """Drives the execution plan from an asyncio event loop on the main thread.
+
+    The awaitables of async compute functions run on the loop, so many I/O bound steps run
+    concurrently on the one thread. The rest of the work of executing a step, including the compute
+    functions of synchronous solids, is offloaded to a thread pool.
+    """
+
+    executor_name = "asyncio"
+
+    def __init__(self, retries, max_concurrent=None):
+        super(AsyncioExecutor, self).__init__(
+            retries=retries, max_concurrent=max_concurrent or DEFAULT_MAX_CONCURRENT
+        )
+
+    @contextmanager
+    def _step_event_queue(self):
+        loop = asyncio.new_event_loop()
+        try:
+            yield EventLoopStepEventQueue(loop)
+        finally:
+            # Steps still running when execution is cut short are waiting on the loop: cancelling
+            # their awaitables unblocks their threads, so that the thread pool can shut down
+            try:
+                _cancel_remaining_tasks(loop)
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+
+
+async def _new_async_queue():
+    return asyncio.Queue()
+
+
+def _cancel_remaining_tasks(loop):
+    # asyncio.all_tasks was added in python 3.7
+    all_tasks = getattr(asyncio, "all_tasks", None) or asyncio.Task.all_tasks
+    tasks = [task for task in all_tasks(loop) if not task.done()]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
@@ -4,6 +4,7 @@
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.execute_plan import inner_plan_execution_iterator
+from dagster.core.execution.plan.intermediate_gc import IntermediateGarbageCollector
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import Retries
 from dagster.utils.timing import format_duration, time_execution_scope
@@ -12,9 +13,12 @@
 
 
 class InProcessExecutor(Executor):
-    def __init__(self, retries, marker_to_close):
+    def __init__(self, retries, marker_to_close, release_intermediates=False):
         self._retries = check.inst_param(retries, "retries", Retries)
         self.marker_to_close = check.opt_str_param(marker_to_close, "marker_to_close")
+        self.release_intermediates = check.bool_param(
+            release_intermediates, "release_intermediates"
+        )
 
     @property
     def retries(self):
@@ -32,8 +36,20 @@ def execute(self, pipeline_context, execution_plan):
             event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
         )
 
+        garbage_collector = (
+            IntermediateGarbageCollector(pipeline_context, execution_plan)
+            if self.release_intermediates
+            else None
+        )
+
         with time_execution_scope() as timer_result:
-            yield from inner_plan_execution_iterator(pipeline_context, execution_plan)
+            for event in inner_plan_execution_iterator(pipeline_context, execution_plan):
+                yield event
+                if garbage_collector:
+                    garbage_collector.handle_event(event)
+
+        if garbage_collector:
+            yield garbage_collector.summary_event()
 
         yield DagsterEvent.engine_event(
             pipeline_context,
@@ -5,8 +5,21 @@
 from dagster.core.definitions.reconstructable import ReconstructablePipeline
 from dagster.core.errors import DagsterSubprocessError
 from dagster.core.events import DagsterEvent, EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.api import (
+    create_execution_plan,
+    execute_fused_plan_iterator,
+    execute_plan_iterator,
+)
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.context_creation_pipeline import PlanExecutionContextManager
+from dagster.core.execution.plan.capacity import StepCapacity
+from dagster.core.execution.plan.critical_path import CriticalPathPriority
+from dagster.core.execution.plan.execute_plan import (
+    fused_plan_execution_iterator,
+    inner_plan_execution_iterator,
+)
+from dagster.core.execution.plan.fusion import StepFusion
+from dagster.core.execution.plan.intermediate_gc import IntermediateGarbageCollector
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import Retries
@@ -18,23 +31,40 @@
 from dagster.utils.timing import format_duration, time_execution_scope
 
 from .child_process_executor import (
+    PROCESS_DEAD_AND_QUEUE_EMPTY,
+    ChildProcess,
     ChildProcessCommand,
     ChildProcessCrashException,
+    ChildProcessDoneEvent,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
-    execute_child_process_command,
+    ChildProcessTaskDoneEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerCommand,
+    wait_for_child_processes,
 )
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+PARENT_WAKE_INTERVAL = 0.1
+"""The longest the parent process blocks waiting on its children before checking for interrupts and
+for steps that became ready to retry -- events and exits of the children wake it up immediately."""
+
 
 class InProcessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
-        self, run_config, pipeline_run, step_key, instance_ref, term_event, recon_pipeline, retries,
+        self,
+        run_config,
+        pipeline_run,
+        step_keys,
+        instance_ref,
+        term_event,
+        recon_pipeline,
+        retries,
     ):
         self.run_config = run_config
         self.pipeline_run = pipeline_run
-        self.step_key = step_key
+        self.step_keys = step_keys
         self.instance_ref = instance_ref
         self.term_event = term_event
         self.recon_pipeline = recon_pipeline
@@ -50,23 +80,24 @@ def execute(self):
                 run_config=self.run_config,
                 mode=self.pipeline_run.mode,
                 step_keys_to_execute=self.pipeline_run.step_keys_to_execute,
-            ).build_subset_plan([self.step_key])
+            ).build_subset_plan(self.step_keys)
 
+            step_key = self.step_keys[0]
             yield instance.report_engine_event(
-                "Executing step {} in subprocess".format(self.step_key),
+                "Executing {} in subprocess".format(_describe_steps(self.step_keys)),
                 self.pipeline_run,
                 EngineEventData(
                     [
                         EventMetadataEntry.text(str(os.getpid()), "pid"),
-                        EventMetadataEntry.text(self.step_key, "step_key"),
+                        EventMetadataEntry.text(step_key, "step_key"),
                     ],
                     marker_end=DELEGATE_MARKER,
                 ),
                 MultiprocessExecutor,
-                self.step_key,
+                step_key,
             )
 
-            yield from execute_plan_iterator(
+            yield from _plan_iterator_for_unit(self.step_keys)(
                 execution_plan,
                 self.pipeline_run,
                 run_config=self.run_config,
@@ -75,13 +106,129 @@ def execute(self):
             )
 
 
+class InProcessExecutorWorkerCommand(ChildProcessWorkerCommand):
+    def __init__(
+        self,
+        run_config,
+        pipeline_run,
+        instance_ref,
+        term_event,
+        recon_pipeline,
+        retries,
+        reuse_resources,
+    ):
+        self.run_config = run_config
+        self.pipeline_run = pipeline_run
+        self.instance_ref = instance_ref
+        self.term_event = term_event
+        self.recon_pipeline = recon_pipeline
+        self.retries = retries
+        self.reuse_resources = reuse_resources
+
+    def execute(self, tasks):
+        pipeline = self.recon_pipeline
+        with DagsterInstance.from_ref(self.instance_ref) as instance:
+            start_termination_thread(self.term_event)
+
+            # the plan is built once for the worker, rather than once per step
+            execution_plan = create_execution_plan(
+                pipeline=pipeline,
+                run_config=self.run_config,
+                mode=self.pipeline_run.mode,
+                step_keys_to_execute=self.pipeline_run.step_keys_to_execute,
+            )
+
+            if self.reuse_resources:
+                yield from self._execute_steps_in_shared_context(instance, execution_plan, tasks)
+                return
+
+            for step_keys in tasks:
+                yield self._report_step_start(instance, step_keys)
+                yield from _plan_iterator_for_unit(step_keys)(
+                    execution_plan.build_subset_plan(step_keys),
+                    self.pipeline_run,
+                    run_config=self.run_config,
+                    retries=self.retries.for_inner_plan(),
+                    instance=instance,
+                )
+
+    def _execute_steps_in_shared_context(self, instance, execution_plan, tasks):
+        # The resources of the pipeline are initialized once, for the whole plan, and shared by every
+        # step the worker executes
+        context_manager = PlanExecutionContextManager(
+            retries=self.retries.for_inner_plan(),
+            execution_plan=execution_plan,
+            run_config=self.run_config,
+            pipeline_run=self.pipeline_run,
+            instance=instance,
+            raise_on_error=False,
+        )
+        yield from context_manager.prepare_context()
+        pipeline_context = context_manager.get_context()
+        try:
+            for step_keys in tasks:
+                yield self._report_step_start(instance, step_keys)
+                if pipeline_context:  # None if the resources failed to initialize
+                    iterator = (
+                        fused_plan_execution_iterator
+                        if len(step_keys) > 1
+                        else inner_plan_execution_iterator
+                    )
+                    yield from iterator(
+                        pipeline_context, execution_plan.build_subset_plan(step_keys)
+                    )
+                    instance.flush_event_buffer()
+        finally:
+            yield from context_manager.shutdown_context()
+            instance.flush_event_buffer()
+
+    def _report_step_start(self, instance, step_keys):
+        step_key = step_keys[0]
+        return instance.report_engine_event(
+            "Executing {} in worker process".format(_describe_steps(step_keys)),
+            self.pipeline_run,
+            EngineEventData(
+                [
+                    EventMetadataEntry.text(str(os.getpid()), "pid"),
+                    EventMetadataEntry.text(step_key, "step_key"),
+                ],
+                marker_end=DELEGATE_MARKER,
+            ),
+            MultiprocessExecutor,
+            step_key,
+        )
+
+
 class MultiprocessExecutor(Executor):
-    def __init__(self, pipeline, retries, max_concurrent=None):
+    def __init__(
+        self,
+        pipeline,
+        retries,
+        max_concurrent=None,
+        worker_pool=False,
+        reuse_resources=False,
+        capacity=None,
+        fuse_steps=False,
+        release_intermediates=False,
+        critical_path=None,
+    ):
 
         self.pipeline = check.inst_param(pipeline, "pipeline", ReconstructablePipeline)
         self._retries = check.inst_param(retries, "retries", Retries)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, "max_concurrent")
+        self.worker_pool = check.bool_param(worker_pool, "worker_pool")
+        self.reuse_resources = check.bool_param(reuse_resources, "reuse_resources")
+        check.invariant(
+            worker_pool or not reuse_resources,
+            "reuse_resources can only be set when executing steps in a worker_pool",
+        )
+        self.capacity_config = check.opt_dict_param(capacity, "capacity")
+        self.fuse_steps = check.bool_param(fuse_steps, "fuse_steps")
+        self.release_intermediates = check.bool_param(
+            release_intermediates, "release_intermediates"
+        )
+        self.critical_path_config = check.opt_dict_param(critical_path, "critical_path")
 
     @property
     def retries(self):
@@ -91,8 +238,6 @@ def execute(self, pipeline_context, execution_plan):
         check.inst_param(pipeline_context, "pipeline_context", SystemPipelineExecutionContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
-        limit = self.max_concurrent
-
         yield DagsterEvent.engine_event(
             pipeline_context,
             "Executing steps using multiprocess executor: parent process (pid: {pid})".format(
@@ -103,91 +248,41 @@ def execute(self, pipeline_context, execution_plan):
             ),
         )
 
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collect results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
-        with time_execution_scope() as timer_result:
-            with execution_plan.start(retries=self.retries) as active_execution:
-                active_iters = {}
-                errors = {}
-                term_events = {}
-                stopping = False
+        garbage_collector = (
+            IntermediateGarbageCollector(pipeline_context, execution_plan)
+            if self.release_intermediates
+            else None
+        )
 
-                while (not stopping and not active_execution.is_complete) or active_iters:
-                    if active_execution.check_for_interrupts():
-                        yield DagsterEvent.engine_event(
-                            pipeline_context,
-                            "Multiprocess executor: received termination signal - "
-                            "forwarding to active child processes",
-                            EngineEventData.interrupted(list(term_events.keys())),
-                        )
-                        stopping = True
-                        for key, event in term_events.items():
-                            event.set()
-                            active_execution.mark_interrupted(key)
-
-                    # start iterators
-                    while len(active_iters) < limit and not stopping:
-                        steps = active_execution.get_steps_to_execute(
-                            limit=(limit - len(active_iters))
-                        )
+        critical_path = CriticalPathPriority.from_config(
+            pipeline_context, execution_plan, self.critical_path_config
+        )
 
-                        if not steps:
-                            break
+        with time_execution_scope() as timer_result:
+            with execution_plan.start(
+                retries=self.retries,
+                sort_key_fn=critical_path.sort_key_fn() if critical_path else None,
+                capacity=StepCapacity.from_config(self.capacity_config),
+                fusion=StepFusion(execution_plan, enabled=self.fuse_steps),
+            ) as active_execution:
+                errors = {}
 
-                        for step in steps:
-                            step_context = pipeline_context.for_step(step)
-                            term_events[step.key] = multiprocessing.Event()
-                            active_iters[step.key] = self.execute_step_out_of_process(
-                                step_context, step, errors, term_events
-                            )
+                if self.worker_pool:
+                    events = self._execute_in_worker_pool(
+                        pipeline_context, active_execution, errors
+                    )
+                else:
+                    events = self._execute_in_child_processes(
+                        pipeline_context, active_execution, errors
+                    )
 
-                    # process active iterators
-                    empty_iters = []
-                    for key, step_iter in active_iters.items():
-                        try:
-                            event_or_none = next(step_iter)
-                            if event_or_none is None:
-                                continue
-                            else:
-                                yield event_or_none
-                                active_execution.handle_event(event_or_none)
-
-                        except ChildProcessCrashException as crash:
-                            serializable_error = serializable_error_info_from_exc_info(
-                                sys.exc_info()
-                            )
-                            yield DagsterEvent.engine_event(
-                                pipeline_context,
-                                (
-                                    "Multiprocess executor: child process for step {step_key} "
-                                    "unexpectedly exited with code {exit_code}"
-                                ).format(step_key=key, exit_code=crash.exit_code),
-                                EngineEventData.engine_error(serializable_error),
-                                step_key=key,
-                            )
-                            step_failure_event = DagsterEvent.step_failure_event(
-                                step_context=pipeline_context.for_step(
-                                    active_execution.get_step_by_key(key)
-                                ),
-                                step_failure_data=StepFailureData(
-                                    error=serializable_error, user_failure_data=None
-                                ),
-                            )
-                            active_execution.handle_event(step_failure_event)
-                            yield step_failure_event
-                            empty_iters.append(key)
-                        except StopIteration:
-                            empty_iters.append(key)
-
-                    # clear and mark complete finished iterators
-                    for key in empty_iters:
-                        del active_iters[key]
-                        del term_events[key]
-                        active_execution.verify_complete(pipeline_context, key)
+                for event in events:
+                    yield event
+                    if garbage_collector:
+                        garbage_collector.handle_event(event)
 
-                    # process skipped and abandoned steps
-                    yield from active_execution.plan_events_iterator(pipeline_context)
+                if garbage_collector:
+                    yield garbage_collector.summary_event()
 
                 errs = {pid: err for pid, err in errors.items() if err}
                 if errs:
@@ -211,29 +306,320 @@ def execute(self, pipeline_context, execution_plan):
             event_specific_data=EngineEventData.multiprocess(os.getpid()),
         )
 
-    def execute_step_out_of_process(self, step_context, step, errors, term_events):
-        command = InProcessExecutorChildProcessCommand(
+    def _execute_in_child_processes(self, pipeline_context, active_execution, errors):
+        """Executes each unit of steps in a new child process."""
+        limit = self.max_concurrent
+        active_children = {}  # step key -> child process
+        units = {}  # step key -> keys of the steps the child process executes, starting with it
+        exiting_children = []
+        term_events = {}
+        stopping = False
+
+        while (not stopping and not active_execution.is_complete) or active_children:
+            if active_execution.check_for_interrupts():
+                yield DagsterEvent.engine_event(
+                    pipeline_context,
+                    "Multiprocess executor: received termination signal - "
+                    "forwarding to active child processes",
+                    EngineEventData.interrupted(list(term_events.keys())),
+                )
+                stopping = True
+                for key, event in term_events.items():
+                    event.set()
+                    for unit_key in units[key]:
+                        active_execution.mark_interrupted(unit_key)
+
+            # start child processes
+            while len(active_children) < limit and not stopping:
+                steps = active_execution.get_steps_to_execute(limit=(limit - len(active_children)))
+
+                if not steps:
+                    break
+
+                for step in steps:
+                    step_context = pipeline_context.for_step(step)
+                    units[step.key] = active_execution.unit_for(step)
+                    term_events[step.key] = multiprocessing.Event()
+                    yield DagsterEvent.engine_event(
+                        step_context,
+                        "Launching subprocess for {}".format(", ".join(units[step.key])),
+                        EngineEventData(marker_start=DELEGATE_MARKER),
+                        step_key=step.key,
+                    )
+                    active_children[step.key] = ChildProcess(
+                        self._step_command(step_context, units[step.key], term_events[step.key])
+                    )
+
+                yield from _capacity_utilization_events(pipeline_context, active_execution)
+
+            # block until any child process has events or exits
+            keys_by_pid = {child.pid: key for key, child in active_children.items()}
+            finished = []
+            for child in wait_for_child_processes(
+                list(active_children.values()), timeout=PARENT_WAKE_INTERVAL
+            ):
+                key = keys_by_pid[child.pid]
+                for event in child.read_events():
+                    if isinstance(event, DagsterEvent):
+                        yield event
+                        active_execution.handle_event(event)
+                    elif isinstance(event, ChildProcessSystemErrorEvent):
+                        errors[event.pid] = event.error_info
+                        finished.append(key)
+                        break
+                    elif isinstance(event, ChildProcessDoneEvent):
+                        finished.append(key)
+                        break
+                    elif event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                        # the process has exited without reporting it was done: it crashed
+                        child.join()
+                        child.close()
+                        yield from self._handle_unit_crash(
+                            pipeline_context, active_execution, units[key], child.exit_code
+                        )
+                        del active_children[key]
+                        del term_events[key]
+                        _verify_unit_complete(pipeline_context, active_execution, units.pop(key))
+                    elif not isinstance(event, ChildProcessEvent):
+                        check.failed(
+                            "Unexpected return value from child process {}".format(type(event))
+                        )
+
+            # clear and mark complete finished child processes
+            for key in finished:
+                child = active_children.pop(key)
+                child.close()
+                exiting_children.append(child)
+                del term_events[key]
+                _verify_unit_complete(pipeline_context, active_execution, units.pop(key))
+
+            # process skipped and abandoned steps
+            yield from active_execution.plan_events_iterator(pipeline_context)
+
+        # the child processes that reported they were done are joined once all the steps are, so
+        # that their teardown does not hold up the events of the others
+        for child in exiting_children:
+            child.join()
+
+    def _execute_in_worker_pool(self, pipeline_context, active_execution, errors):
+        """Executes the steps in a pool of long-lived worker processes, each of which loads the
+        pipeline, the instance and the execution plan once and then executes the steps it is sent
+        one at a time."""
+        limit = self.max_concurrent
+        idle_workers = []
+        busy_workers = {}  # step key -> worker
+        units = {}  # step key -> keys of the steps the worker executes, starting with it
+        term_events = {}  # worker pid -> termination event
+        all_workers = []
+        exiting_workers = []
+        stopping = False
+
+        def _remove_worker(worker):
+            all_workers.remove(worker)
+            if worker in idle_workers:
+                idle_workers.remove(worker)
+            worker.close()
+            exiting_workers.append(worker)
+
+        try:
+            while (not stopping and not active_execution.is_complete) or busy_workers:
+                if active_execution.check_for_interrupts():
+                    yield DagsterEvent.engine_event(
+                        pipeline_context,
+                        "Multiprocess executor: received termination signal - "
+                        "forwarding to active worker processes",
+                        EngineEventData.interrupted(list(busy_workers.keys())),
+                    )
+                    stopping = True
+                    for key, worker in busy_workers.items():
+                        term_events[worker.pid].set()
+                        for unit_key in units[key]:
+                            active_execution.mark_interrupted(unit_key)
+
+                # submit steps to idle workers, starting new ones up to the limit
+                while len(busy_workers) < limit and not stopping:
+                    steps = active_execution.get_steps_to_execute(limit=(limit - len(busy_workers)))
+
+                    if not steps:
+                        break
+
+                    for step in steps:
+                        if idle_workers:
+                            worker = idle_workers.pop()
+                        else:
+                            term_event = multiprocessing.Event()
+                            worker = ChildProcessWorker(
+                                self._worker_command(pipeline_context, term_event)
+                            )
+                            term_events[worker.pid] = term_event
+                            all_workers.append(worker)
+
+                        units[step.key] = active_execution.unit_for(step)
+                        yield DagsterEvent.engine_event(
+                            pipeline_context.for_step(step),
+                            "Submitting {steps} to worker process (pid: {pid})".format(
+                                steps=_describe_steps(units[step.key]), pid=worker.pid
+                            ),
+                            EngineEventData(marker_start=DELEGATE_MARKER),
+                            step_key=step.key,
+                        )
+                        worker.submit(units[step.key])
+                        busy_workers[step.key] = worker
+
+                    yield from _capacity_utilization_events(pipeline_context, active_execution)
+
+                # block until any worker has events or exits; idle workers are waited on too, so
+                # that a worker dying between steps is noticed and not handed another step
+                keys_by_pid = {worker.pid: key for key, worker in busy_workers.items()}
+                for worker in wait_for_child_processes(
+                    list(all_workers), timeout=PARENT_WAKE_INTERVAL
+                ):
+                    key = keys_by_pid.get(worker.pid)
+                    for event in worker.read_events():
+                        if isinstance(event, DagsterEvent):
+                            yield event
+                            active_execution.handle_event(event)
+                        elif isinstance(event, ChildProcessTaskDoneEvent):
+                            idle_workers.append(worker)
+                            del busy_workers[key]
+                            _verify_unit_complete(
+                                pipeline_context, active_execution, units.pop(key)
+                            )
+                            key = None
+                        elif event == PROCESS_DEAD_AND_QUEUE_EMPTY or isinstance(
+                            event, (ChildProcessSystemErrorEvent, ChildProcessDoneEvent)
+                        ):
+                            if isinstance(event, ChildProcessSystemErrorEvent):
+                                errors[event.pid] = event.error_info
+                            _remove_worker(worker)
+                            if key is not None:
+                                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                                    worker.join()
+                                    yield from self._handle_unit_crash(
+                                        pipeline_context,
+                                        active_execution,
+                                        units[key],
+                                        worker.exit_code,
+                                    )
+                                del busy_workers[key]
+                                _verify_unit_complete(
+                                    pipeline_context, active_execution, units.pop(key)
+                                )
+                            break
+
+                # process skipped and abandoned steps
+                yield from active_execution.plan_events_iterator(pipeline_context)
+
+            # let the idle workers exit, tearing down any resources they have initialized
+            for worker in all_workers:
+                worker.shutdown()
+            while all_workers:
+                for worker in wait_for_child_processes(
+                    list(all_workers), timeout=PARENT_WAKE_INTERVAL
+                ):
+                    for event in worker.read_events():
+                        if isinstance(event, DagsterEvent):
+                            yield event
+                        elif event == PROCESS_DEAD_AND_QUEUE_EMPTY or isinstance(
+                            event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)
+                        ):
+                            if isinstance(event, ChildProcessSystemErrorEvent):
+                                errors[event.pid] = event.error_info
+                            _remove_worker(worker)
+                            break
+        finally:
+            for worker in all_workers:
+                worker.terminate()
+            for worker in all_workers + exiting_workers:
+                worker.join()
+
+    def _worker_command(self, pipeline_context, term_event):
+        return InProcessExecutorWorkerCommand(
+            run_config=pipeline_context.run_config,
+            pipeline_run=pipeline_context.pipeline_run,
+            instance_ref=pipeline_context.instance.get_ref(),
+            term_event=term_event,
+            recon_pipeline=self.pipeline,
+            retries=self.retries,
+            reuse_resources=self.reuse_resources,
+        )
+
+    def _handle_unit_crash(self, pipeline_context, active_execution, step_keys, exit_code):
+        # the steps of a unit execute one after the other, so only one of them can be in flight
+        for key in step_keys:
+            if active_execution.is_in_flight(key):
+                yield from self._handle_step_crash(
+                    pipeline_context, active_execution, key, exit_code
+                )
+
+    def _handle_step_crash(self, pipeline_context, active_execution, key, exit_code):
+        try:
+            raise ChildProcessCrashException(exit_code=exit_code)
+        except ChildProcessCrashException:
+            serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
+
+        yield DagsterEvent.engine_event(
+            pipeline_context,
+            (
+                "Multiprocess executor: child process for step {step_key} "
+                "unexpectedly exited with code {exit_code}"
+            ).format(step_key=key, exit_code=exit_code),
+            EngineEventData.engine_error(serializable_error),
+            step_key=key,
+        )
+        step_failure_event = DagsterEvent.step_failure_event(
+            step_context=pipeline_context.for_step(active_execution.get_step_by_key(key)),
+            step_failure_data=StepFailureData(error=serializable_error, user_failure_data=None),
+        )
+        active_execution.handle_event(step_failure_event)
+        yield step_failure_event
+
+    def _step_command(self, step_context, step_keys, term_event):
+        return InProcessExecutorChildProcessCommand(
             run_config=step_context.run_config,
             pipeline_run=step_context.pipeline_run,
-            step_key=step.key,
+            step_keys=step_keys,
             instance_ref=step_context.instance.get_ref(),
-            term_event=term_events[step.key],
+            term_event=term_event,
             recon_pipeline=self.pipeline,
             retries=self.retries,
         )
 
-        yield DagsterEvent.engine_event(
-            step_context,
-            "Launching subprocess for {}".format(step.key),
-            EngineEventData(marker_start=DELEGATE_MARKER),
-            step_key=step.key,
-        )
 
-        for ret in execute_child_process_command(command):
-            if ret is None or isinstance(ret, DagsterEvent):
-                yield ret
-            elif isinstance(ret, ChildProcessEvent):
-                if isinstance(ret, ChildProcessSystemErrorEvent):
-                    errors[ret.pid] = ret.error_info
-            else:
-                check.failed("Unexpected return value from child process {}".format(type(ret)))
+def _describe_steps(step_keys):
+    if len(step_keys) == 1:
+        return "step {}".format(step_keys[0])
+    return "fused steps {}".format(", ".join(step_keys))
+
+
+def _plan_iterator_for_unit(step_keys):
+    return execute_fused_plan_iterator if len(step_keys) > 1 else execute_plan_iterator
+
+
+def _verify_unit_complete(pipeline_context, active_execution, step_keys):
+    for key in step_keys:
+        active_execution.verify_complete(pipeline_context, key)
+
+
+def _capacity_utilization_events(pipeline_context, active_execution):
+    capacity = active_execution.capacity
+    if not capacity:
+        return
+
+    yield DagsterEvent.engine_event(
+        pipeline_context,
+        "Multiprocess executor: {}".format(capacity.describe_utilization()),
+        EngineEventData(
+            [
+                EventMetadataEntry.float(float(capacity.cpu_in_use), "cpu_in_use"),
+                EventMetadataEntry.float(float(capacity.memory_in_use), "memory_in_use"),
+                EventMetadataEntry.int(capacity.num_steps, "steps_in_flight"),
+            ]
+            + ([EventMetadataEntry.float(float(capacity.cpu), "cpu")] if capacity.cpu else [])
+            + (
+                [EventMetadataEntry.float(float(capacity.memory), "memory")]
+                if capacity.memory
+                else []
+            )
+        ),
+    )
@@ -0,0 +1,246 @@
+import os
+import queue
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from dagster import check
+from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.memoization import copy_required_intermediates_for_execution
+from dagster.core.execution.plan.execute_plan import inner_step_execution_iterator, trigger_hook
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.retries import Retries
+from dagster.utils.timing import format_duration, time_execution_scope
+
+from .base import Executor
+
+THREAD_SAFE_TAG = "dagster/thread_safe"
+"""Tagging a solid with ``dagster/thread_safe: "false"`` makes the multithread executor run its steps
+one at a time on the main thread, while no other step is running."""
+
+MAIN_THREAD_WAKE_INTERVAL = 0.1
+"""The longest the main thread blocks waiting on step events before checking for interrupts and for
+steps that became ready to retry -- events and completions of the steps wake it up immediately."""
+
+
+def default_max_concurrent():
+    # the default of concurrent.futures.ThreadPoolExecutor, as the steps are expected to be I/O bound
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class _StepThreadDone(namedtuple("_StepThreadDone", "step_key exc_info")):
+    """Sent to the main thread once a step thread has finished, along with the exc_info of the
+    framework error that terminated it, if any."""
+
+
+def is_thread_safe_step(step):
+    return str(step.tags.get(THREAD_SAFE_TAG, "true")).lower() != "false"
+
+
+class StepEventQueue:
+    """Carries the events of the steps executing on the thread pool to the main thread."""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+
+    def put(self, item):
+        self._queue.put(item)
+
+    def get_items(self, timeout):
+        """Blocks until an item is available or the timeout passes, then returns all the items
+        available."""
+        try:
+            items = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    @contextmanager
+    def step_thread_scope(self):
+        """Entered by each thread of the pool for the duration of the step it executes."""
+        yield
+
+
+class MultithreadExecutor(Executor):
+    executor_name = "multithread"
+
+    def __init__(self, retries, max_concurrent=None):
+        self._retries = check.inst_param(retries, "retries", Retries)
+        max_concurrent = max_concurrent if max_concurrent else default_max_concurrent()
+        self.max_concurrent = check.int_param(max_concurrent, "max_concurrent")
+
+    @property
+    def retries(self):
+        return self._retries
+
+    def execute(self, pipeline_context, execution_plan):
+        check.inst_param(pipeline_context, "pipeline_context", SystemPipelineExecutionContext)
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+        step_keys_to_execute = execution_plan.step_keys_to_execute
+
+        yield DagsterEvent.engine_event(
+            pipeline_context,
+            "Executing steps using {name} executor (pid: {pid}, max_concurrent: "
+            "{max_concurrent})".format(
+                name=self.executor_name, pid=os.getpid(), max_concurrent=self.max_concurrent
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+        with time_execution_scope() as timer_result:
+            yield from copy_required_intermediates_for_execution(pipeline_context, execution_plan)
+
+            with execution_plan.start(retries=self.retries) as active_execution:
+                with ThreadPoolExecutor(
+                    max_workers=self.max_concurrent, thread_name_prefix="dagster-step"
+                ) as thread_pool:
+                    with self._step_event_queue() as event_queue:
+                        yield from self._execute_steps(
+                            pipeline_context,
+                            execution_plan,
+                            active_execution,
+                            thread_pool,
+                            event_queue,
+                        )
+
+        yield DagsterEvent.engine_event(
+            pipeline_context,
+            "{name} executor: finished steps in {duration} (pid: {pid})".format(
+                name=self.executor_name.capitalize(),
+                duration=format_duration(timer_result.millis),
+                pid=os.getpid(),
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+    @contextmanager
+    def _step_event_queue(self):
+        yield StepEventQueue()
+
+    def _execute_steps(
+        self, pipeline_context, execution_plan, active_execution, thread_pool, event_queue
+    ):
+        limit = self.max_concurrent
+        running = set()  # keys of the steps executing in the thread pool
+        exclusive_step = None  # a step that is not thread safe, waiting for the running ones
+        error_exc_info = None
+        stopping = False
+
+        while (not stopping and not active_execution.is_complete) or running:
+            if active_execution.check_for_interrupts():
+                # threads can not be interrupted, so the running steps are left to complete
+                yield DagsterEvent.engine_event(
+                    pipeline_context,
+                    "{name} executor: received termination signal - "
+                    "waiting for running steps to complete".format(
+                        name=self.executor_name.capitalize()
+                    ),
+                    EngineEventData.interrupted(list(running)),
+                )
+                stopping = True
+
+            # submit steps to the thread pool, up to the first one that is not thread safe
+            while not stopping and exclusive_step is None and len(running) < limit:
+                steps = active_execution.get_steps_to_execute(limit=1)
+                if not steps:
+                    break
+
+                step = steps[0]
+                if not is_thread_safe_step(step):
+                    exclusive_step = step
+                    break
+
+                running.add(step.key)
+                thread_pool.submit(
+                    _execute_step_in_thread,
+                    pipeline_context.for_step(step),
+                    execution_plan,
+                    self.retries,
+                    event_queue,
+                )
+
+            if exclusive_step is not None and not running and not stopping:
+                yield from _execute_step_in_main_thread(
+                    pipeline_context,
+                    pipeline_context.for_step(exclusive_step),
+                    execution_plan,
+                    active_execution,
+                    self.retries,
+                )
+                exclusive_step = None
+                yield from active_execution.plan_events_iterator(pipeline_context)
+                continue
+
+            if not running:
+                if active_execution.is_complete or stopping:
+                    break
+                # only steps waiting to retry are left
+                active_execution.sleep_til_ready()
+                continue
+
+            # block until a step thread has events or finishes
+            for item in event_queue.get_items(timeout=MAIN_THREAD_WAKE_INTERVAL):
+                if isinstance(item, DagsterEvent):
+                    yield item
+                    active_execution.handle_event(item)
+                else:
+                    check.inst(item, _StepThreadDone)
+                    running.remove(item.step_key)
+                    active_execution.verify_complete(pipeline_context, item.step_key)
+                    if item.exc_info and not error_exc_info:
+                        # stop submitting steps, and re-raise once the running ones are done
+                        error_exc_info = item.exc_info
+                        stopping = True
+
+            # process skipped and abandoned steps
+            yield from active_execution.plan_events_iterator(pipeline_context)
+
+        if error_exc_info:
+            raise error_exc_info[1].with_traceback(error_exc_info[2])
+
+
+def _execute_step_in_thread(step_context, execution_plan, retries, event_queue):
+    # The compute logs of the steps executed in the thread pool are not captured: capturing
+    # redirects the stdout and stderr of the whole process, which the steps share
+    exc_info = None
+    try:
+        with event_queue.step_thread_scope():
+            step_event_list = []
+            for step_event in inner_step_execution_iterator(step_context, execution_plan, retries):
+                step_event_list.append(step_event)
+                event_queue.put(step_event)
+
+            for hook_event in trigger_hook(step_context, step_event_list):
+                event_queue.put(hook_event)
+    except (Exception, KeyboardInterrupt):  # pylint: disable=broad-except
+        exc_info = sys.exc_info()
+    finally:
+        event_queue.put(_StepThreadDone(step_context.step.key, exc_info))
+
+
+def _execute_step_in_main_thread(
+    pipeline_context, step_context, execution_plan, active_execution, retries
+):
+    step_event_list = []
+
+    # nothing else is running, so the logs of this step can be captured
+    with step_context.instance.compute_log_manager.watch(
+        step_context.pipeline_run, step_context.step.key
+    ):
+        for step_event in inner_step_execution_iterator(step_context, execution_plan, retries):
+            step_event_list.append(step_event)
+            yield step_event
+            active_execution.handle_event(step_event)
+
+        active_execution.verify_complete(pipeline_context, step_context.step.key)
+
+    for hook_event in trigger_hook(step_context, step_event_list):
+        yield hook_event
@@ -25,8 +25,10 @@
     ExternalPartitionTagsData,
     ExternalPipelineData,
     ExternalPipelineSubsetResult,
+    ExternalPipelineSummaryData,
     ExternalPresetData,
     ExternalRepositoryData,
+    ExternalRepositoryIndexData,
     ExternalScheduleData,
     ExternalScheduleExecutionData,
     ExternalScheduleExecutionErrorData,
@@ -60,3 +62,7 @@
 )
 from .represented import RepresentedPipeline
 from .selector import PipelineSelector, RepositorySelector, ScheduleSelector, SensorSelector
+from .location_cache import (  # isort:skip
+    RepositoryLocationCache,
+    repository_location_from_origin,
+)
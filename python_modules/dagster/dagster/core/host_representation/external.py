@@ -1,4 +1,5 @@
 import datetime
+import threading
 import warnings
 from collections import OrderedDict
 
@@ -14,7 +15,9 @@
     ExternalJobData,
     ExternalPartitionSetData,
     ExternalPipelineData,
+    ExternalPipelineSummaryData,
     ExternalRepositoryData,
+    ExternalRepositoryIndexData,
     ExternalScheduleData,
 )
 from .handle import JobHandle, PartitionSetHandle, PipelineHandle, RepositoryHandle
@@ -29,42 +32,144 @@ class ExternalRepository:
     objects such as these to interact with user-defined artifacts.
     """
 
-    def __init__(self, external_repository_data, repository_handle):
+    def __init__(
+        self, external_repository_data, repository_handle, external_pipeline_data_loader=None
+    ):
         self.external_repository_data = check.inst_param(
-            external_repository_data, "external_repository_data", ExternalRepositoryData
+            external_repository_data,
+            "external_repository_data",
+            (ExternalRepositoryData, ExternalRepositoryIndexData),
         )
-        self._pipeline_index_map = OrderedDict(
-            (
-                external_pipeline_data.pipeline_snapshot.name,
-                PipelineIndex(
+        self._handle = check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+
+        # guards the loaded pipelines below, and is never held while a pipeline is fetched
+        self._lock = threading.Lock()
+        self._pipeline_load_locks = {}
+
+        if isinstance(external_repository_data, ExternalRepositoryIndexData):
+            # the data of each pipeline is loaded when it is first used
+            self._external_pipeline_data_loader = check.callable_param(
+                external_pipeline_data_loader, "external_pipeline_data_loader"
+            )
+            self._external_pipeline_summary_datas = OrderedDict(
+                (external_pipeline_summary_data.name, external_pipeline_summary_data)
+                for external_pipeline_summary_data in external_repository_data.external_pipeline_summary_datas
+            )
+            self._external_pipeline_datas = {}
+            self._pipeline_index_map = {}
+        else:
+            check.invariant(
+                external_pipeline_data_loader is None,
+                "external_pipeline_data_loader is only used with an ExternalRepositoryIndexData",
+            )
+            self._external_pipeline_data_loader = None
+            self._external_pipeline_datas = {
+                external_pipeline_data.name: external_pipeline_data
+                for external_pipeline_data in external_repository_data.external_pipeline_datas
+            }
+            self._pipeline_index_map = {
+                external_pipeline_data.name: PipelineIndex(
                     external_pipeline_data.pipeline_snapshot,
                     external_pipeline_data.parent_pipeline_snapshot,
-                ),
+                )
+                for external_pipeline_data in external_repository_data.external_pipeline_datas
+            }
+            self._external_pipeline_summary_datas = OrderedDict(
+                (
+                    external_pipeline_data.name,
+                    ExternalPipelineSummaryData(
+                        name=external_pipeline_data.name,
+                        description=external_pipeline_data.pipeline_snapshot.description,
+                        pipeline_snapshot_id=self._pipeline_index_map[
+                            external_pipeline_data.name
+                        ].pipeline_snapshot_id,
+                    ),
+                )
+                for external_pipeline_data in external_repository_data.external_pipeline_datas
             )
-            for external_pipeline_data in external_repository_data.external_pipeline_datas
-        )
-        self._handle = check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
 
         self._job_map = OrderedDict(
             (external_job_data.name, external_job_data)
             for external_job_data in external_repository_data.external_job_datas
         )
 
+    def _get_loaded_pipeline(self, pipeline_name):
+        with self._lock:
+            if pipeline_name not in self._pipeline_index_map:
+                return None
+            return (
+                self._external_pipeline_datas[pipeline_name],
+                self._pipeline_index_map[pipeline_name],
+            )
+
+    def _get_external_pipeline_data_and_index(self, pipeline_name):
+        check.invariant(
+            self.has_pipeline(pipeline_name),
+            "Could not find pipeline named {pipeline_name}".format(pipeline_name=pipeline_name),
+        )
+
+        loaded_pipeline = self._get_loaded_pipeline(pipeline_name)
+        if loaded_pipeline:
+            return loaded_pipeline
+
+        # pipelines are fetched concurrently, but each pipeline is only fetched once
+        with self._lock:
+            load_lock = self._pipeline_load_locks.setdefault(pipeline_name, threading.Lock())
+
+        with load_lock:
+            loaded_pipeline = self._get_loaded_pipeline(pipeline_name)
+            if loaded_pipeline:
+                return loaded_pipeline
+
+            external_pipeline_data = check.inst(
+                self._external_pipeline_data_loader(pipeline_name), ExternalPipelineData
+            )
+            pipeline_index = PipelineIndex(
+                external_pipeline_data.pipeline_snapshot,
+                external_pipeline_data.parent_pipeline_snapshot,
+            )
+
+            # the server may have changed its code since the index was fetched, e.g. by
+            # restarting, in which case the pipeline is not cached under the stale index, and is
+            # fetched again until the repository is reloaded
+            if (
+                pipeline_index.pipeline_snapshot_id
+                == self._external_pipeline_summary_datas[pipeline_name].pipeline_snapshot_id
+            ):
+                with self._lock:
+                    self._external_pipeline_datas[pipeline_name] = external_pipeline_data
+                    self._pipeline_index_map[pipeline_name] = pipeline_index
+
+            return external_pipeline_data, pipeline_index
+
     @property
     def name(self):
         return self.external_repository_data.name
 
     def get_pipeline_index(self, pipeline_name):
-        return self._pipeline_index_map[pipeline_name]
+        _, pipeline_index = self._get_external_pipeline_data_and_index(pipeline_name)
+        return pipeline_index
 
     def has_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return pipeline_name in self._external_pipeline_summary_datas
 
     def get_pipeline_indices(self):
-        return self._pipeline_index_map.values()
+        return [
+            self.get_pipeline_index(pipeline_name)
+            for pipeline_name in self._external_pipeline_summary_datas
+        ]
 
     def has_external_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return pipeline_name in self._external_pipeline_summary_datas
+
+    def get_external_pipeline_summaries(self):
+        """The names, descriptions and snapshot ids of the pipelines in the repository, which are
+        available without loading the pipelines.
+
+        Returns:
+            List[ExternalPipelineSummaryData]
+        """
+        return list(self._external_pipeline_summary_datas.values())
 
     def get_external_schedule(self, schedule_name):
         return ExternalSchedule(
@@ -125,14 +230,18 @@ def get_external_partition_sets(self):
 
     def get_full_external_pipeline(self, pipeline_name):
         check.str_param(pipeline_name, "pipeline_name")
+        external_pipeline_data, pipeline_index = self._get_external_pipeline_data_and_index(
+            pipeline_name
+        )
         return ExternalPipeline(
-            self.external_repository_data.get_external_pipeline_data(pipeline_name),
-            repository_handle=self.handle,
-            pipeline_index=self.get_pipeline_index(pipeline_name),
+            external_pipeline_data, repository_handle=self.handle, pipeline_index=pipeline_index,
         )
 
     def get_all_external_pipelines(self):
-        return [self.get_full_external_pipeline(pn) for pn in self._pipeline_index_map]
+        return [
+            self.get_full_external_pipeline(pipeline_name)
+            for pipeline_name in self._external_pipeline_summary_datas
+        ]
 
     @property
     def handle(self):
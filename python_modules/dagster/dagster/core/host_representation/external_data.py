@@ -19,7 +19,7 @@
 )
 from dagster.core.definitions.partition import PartitionScheduleDefinition
 from dagster.core.definitions.sensor import RunRequest
-from dagster.core.snap import PipelineSnapshot
+from dagster.core.snap import PipelineSnapshot, create_pipeline_snapshot_id
 from dagster.serdes import whitelist_for_serdes
 from dagster.utils.error import SerializableErrorInfo
 
@@ -108,6 +108,86 @@ def get_external_job_data(self, name):
         check.failed("Could not find job data named " + name)
 
 
+@whitelist_for_serdes
+class ExternalRepositoryIndexData(
+    namedtuple(
+        "_ExternalRepositoryIndexData",
+        "name external_pipeline_summary_datas external_schedule_datas external_partition_set_datas external_job_datas",
+    )
+):
+    """The data of an external repository without the snapshots and presets of its pipelines, which
+    are fetched separately when they are used."""
+
+    def __new__(
+        cls,
+        name,
+        external_pipeline_summary_datas,
+        external_schedule_datas,
+        external_partition_set_datas,
+        external_job_datas,
+    ):
+        return super(ExternalRepositoryIndexData, cls).__new__(
+            cls,
+            name=check.str_param(name, "name"),
+            external_pipeline_summary_datas=check.list_param(
+                external_pipeline_summary_datas,
+                "external_pipeline_summary_datas",
+                of_type=ExternalPipelineSummaryData,
+            ),
+            external_schedule_datas=check.list_param(
+                external_schedule_datas, "external_schedule_datas", of_type=ExternalScheduleData
+            ),
+            external_partition_set_datas=check.list_param(
+                external_partition_set_datas,
+                "external_partition_set_datas",
+                of_type=ExternalPartitionSetData,
+            ),
+            external_job_datas=check.list_param(
+                external_job_datas, "external_job_datas", of_type=ExternalJobData,
+            ),
+        )
+
+    def get_external_schedule_data(self, name):
+        check.str_param(name, "name")
+
+        for external_schedule_data in self.external_schedule_datas:
+            if external_schedule_data.name == name:
+                return external_schedule_data
+
+        check.failed("Could not find external schedule data named " + name)
+
+    def get_external_partition_set_data(self, name):
+        check.str_param(name, "name")
+
+        for external_partition_set_data in self.external_partition_set_datas:
+            if external_partition_set_data.name == name:
+                return external_partition_set_data
+
+        check.failed("Could not find external partition set data named " + name)
+
+    def get_external_job_data(self, name):
+        check.str_param(name, "name")
+
+        for external_job_data in self.external_job_datas:
+            if external_job_data.name == name:
+                return external_job_data
+
+        check.failed("Could not find job data named " + name)
+
+
+@whitelist_for_serdes
+class ExternalPipelineSummaryData(
+    namedtuple("_ExternalPipelineSummaryData", "name description pipeline_snapshot_id")
+):
+    def __new__(cls, name, description, pipeline_snapshot_id):
+        return super(ExternalPipelineSummaryData, cls).__new__(
+            cls,
+            name=check.str_param(name, "name"),
+            description=check.opt_str_param(description, "description"),
+            pipeline_snapshot_id=check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id"),
+        )
+
+
 @whitelist_for_serdes
 class ExternalPipelineSubsetResult(
     namedtuple("_ExternalPipelineSubsetResult", "success error external_pipeline_data")
@@ -373,6 +453,27 @@ def external_repository_data_from_def(repository_def):
     )
 
 
+def external_repository_index_data_from_repository_data(external_repository_data):
+    check.inst_param(external_repository_data, "external_repository_data", ExternalRepositoryData)
+
+    return ExternalRepositoryIndexData(
+        name=external_repository_data.name,
+        external_pipeline_summary_datas=[
+            ExternalPipelineSummaryData(
+                name=external_pipeline_data.name,
+                description=external_pipeline_data.pipeline_snapshot.description,
+                pipeline_snapshot_id=create_pipeline_snapshot_id(
+                    external_pipeline_data.pipeline_snapshot
+                ),
+            )
+            for external_pipeline_data in external_repository_data.external_pipeline_datas
+        ],
+        external_schedule_datas=external_repository_data.external_schedule_datas,
+        external_partition_set_datas=external_repository_data.external_partition_set_datas,
+        external_job_datas=external_repository_data.external_job_datas,
+    )
+
+
 def external_pipeline_data_from_def(pipeline_def):
     check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
     return ExternalPipelineData(
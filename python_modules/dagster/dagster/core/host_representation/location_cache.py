@@ -0,0 +1,221 @@
+import threading
+from contextlib import contextmanager
+
+import pendulum
+from dagster import check
+from dagster.api.get_server_id import sync_get_server_id
+
+from .handle import (
+    GrpcServerRepositoryLocationHandle,
+    ManagedGrpcPythonEnvRepositoryLocationHandle,
+    RepositoryLocationHandle,
+)
+from .origin import RepositoryLocationOrigin
+from .repository_location import RepositoryLocation
+
+DEFAULT_LOCATION_IDLE_TIMEOUT_SECONDS = 300
+DEFAULT_LOCATION_MAX_AGE_SECONDS = 60
+DEFAULT_MANAGED_LOCATION_MAX_AGE_SECONDS = 600
+
+
+class _CachedLocation:
+    def __init__(self, handle, location, created_at):
+        self.handle = handle
+        self.location = location
+        self.created_at = created_at
+        self.last_used_at = created_at
+        self.num_users = 0
+
+
+class RepositoryLocationCache:
+    """Keeps the repository locations loaded by a long-running process, like the daemon, so that
+    their handles, and the gRPC servers they may have started, and the external repository data they
+    fetched are reused across iterations rather than loaded again for every schedule, sensor and
+    run.
+
+    A location served by a gRPC server that Dagster does not manage is reloaded once the id of the
+    server changes. Any other location only loads its code when its handle is created, so it is
+    reloaded once it is older than ``max_age_seconds`` to pick up changes to the code. Reloading a
+    location served by a gRPC server that Dagster manages starts a new server process, so these are
+    only reloaded once they are older than ``managed_max_age_seconds``. A location whose server can
+    no longer be reached is reloaded.
+
+    The cache may be shared by threads: a location is not shut down while it is in use through
+    :py:meth:`use_location`, even once it has been reloaded. Loading a location, and checking that
+    a cached location is still current, only holds a lock for its origin, so that a slow or
+    unreachable location does not hold up the threads using the other locations.
+
+    Args:
+        idle_timeout_seconds (float): Locations that have not been used for this long are shut down
+            by :py:meth:`cleanup_idle`.
+        max_age_seconds (float): The age at which a location that loads its code in process is
+            reloaded.
+        managed_max_age_seconds (float): The age at which a location served by a gRPC server that
+            Dagster manages is reloaded.
+    """
+
+    def __init__(
+        self,
+        idle_timeout_seconds=DEFAULT_LOCATION_IDLE_TIMEOUT_SECONDS,
+        max_age_seconds=DEFAULT_LOCATION_MAX_AGE_SECONDS,
+        managed_max_age_seconds=DEFAULT_MANAGED_LOCATION_MAX_AGE_SECONDS,
+    ):
+        self._idle_timeout_seconds = check.numeric_param(
+            idle_timeout_seconds, "idle_timeout_seconds"
+        )
+        self._max_age_seconds = check.numeric_param(max_age_seconds, "max_age_seconds")
+        self._managed_max_age_seconds = check.numeric_param(
+            managed_max_age_seconds, "managed_max_age_seconds"
+        )
+
+        # guards the bookkeeping below, and is never held while a location is loaded or checked
+        self._lock = threading.Lock()
+        self._cached_locations = {}  # origin -> _CachedLocation
+        self._origin_locks = {}  # origin -> threading.Lock
+
+        # locations that were reloaded, which are shut down once they are no longer in use
+        self._replaced_locations = []
+
+    def get_location(self, origin):
+        """The repository location of an origin, loaded when it is not cached or no longer
+        current."""
+        check.inst_param(origin, "origin", RepositoryLocationOrigin)
+
+        cached_location = self._acquire_cached_location(origin)
+        self._release_cached_location(cached_location)
+        return cached_location.location
+
+    @contextmanager
+    def use_location(self, origin):
+        """Yields the repository location of an origin, which is not shut down until the context
+        exits."""
+        check.inst_param(origin, "origin", RepositoryLocationOrigin)
+
+        cached_location = self._acquire_cached_location(origin)
+        try:
+            yield cached_location.location
+        finally:
+            self._release_cached_location(cached_location)
+
+    def _origin_lock(self, origin):
+        with self._lock:
+            if origin not in self._origin_locks:
+                self._origin_locks[origin] = threading.Lock()
+            return self._origin_locks[origin]
+
+    def _acquire_cached_location(self, origin):
+        """The cached location of an origin, marked as in use so that it is not shut down until it
+        is released."""
+        now = pendulum.now("UTC").timestamp()
+
+        with self._origin_lock(origin):
+            with self._lock:
+                cached_location = self._cached_locations.get(origin)
+                if cached_location:
+                    cached_location.num_users += 1
+                    cached_location.last_used_at = now
+
+            if cached_location and not self._is_current(cached_location, now):
+                with self._lock:
+                    cached_location.num_users -= 1
+                    if self._cached_locations.get(origin) is cached_location:
+                        del self._cached_locations[origin]
+                        self._replaced_locations.append(cached_location)
+                cached_location = None
+
+            if not cached_location:
+                handle = RepositoryLocationHandle.create_from_repository_location_origin(origin)
+                try:
+                    location = RepositoryLocation.from_handle(handle)
+                except:
+                    handle.cleanup()
+                    raise
+
+                cached_location = _CachedLocation(handle, location, now)
+                cached_location.num_users = 1
+                with self._lock:
+                    self._cached_locations[origin] = cached_location
+
+            return cached_location
+
+    def _release_cached_location(self, cached_location):
+        with self._lock:
+            cached_location.num_users -= 1
+
+    def _is_current(self, cached_location, now):
+        handle = cached_location.handle
+
+        if isinstance(
+            handle,
+            (GrpcServerRepositoryLocationHandle, ManagedGrpcPythonEnvRepositoryLocationHandle),
+        ):
+            try:
+                server_id = sync_get_server_id(handle.client)
+            except Exception:  # pylint: disable=broad-except
+                return False
+
+            if isinstance(handle, GrpcServerRepositoryLocationHandle):
+                return server_id == handle.server_id
+
+            # the managed server serves the code it loaded when it started for as long as it runs,
+            # so only a new server picks up changes to the code
+            return now - cached_location.created_at < self._managed_max_age_seconds
+
+        return now - cached_location.created_at < self._max_age_seconds
+
+    def cleanup_idle(self):
+        """Shuts down the locations that have not been used for ``idle_timeout_seconds``, and the
+        locations that have since been reloaded, unless they are in use."""
+        with self._lock:
+            now = pendulum.now("UTC").timestamp()
+
+            idle_origins = [
+                origin
+                for origin, cached_location in self._cached_locations.items()
+                if not cached_location.num_users
+                and now - cached_location.last_used_at >= self._idle_timeout_seconds
+            ]
+            to_cleanup = [self._cached_locations.pop(origin) for origin in idle_origins] + [
+                cached_location
+                for cached_location in self._replaced_locations
+                if not cached_location.num_users
+            ]
+            self._replaced_locations = [
+                cached_location
+                for cached_location in self._replaced_locations
+                if cached_location.num_users
+            ]
+
+        for cached_location in to_cleanup:
+            cached_location.handle.cleanup()
+
+    def cleanup(self):
+        with self._lock:
+            to_cleanup = self._replaced_locations + list(self._cached_locations.values())
+            self._cached_locations = {}
+            self._origin_locks = {}
+            self._replaced_locations = []
+
+        for cached_location in to_cleanup:
+            cached_location.handle.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.cleanup()
+
+
+@contextmanager
+def repository_location_from_origin(origin, location_cache=None):
+    """Yields the repository location of an origin, from a location cache if one is given, or else
+    from a handle that is cleaned up when the context exits."""
+    check.inst_param(origin, "origin", RepositoryLocationOrigin)
+    check.opt_inst_param(location_cache, "location_cache", RepositoryLocationCache)
+
+    if location_cache:
+        with location_cache.use_location(origin) as location:
+            yield location
+    else:
+        with RepositoryLocationHandle.create_from_repository_location_origin(origin) as handle:
+            yield RepositoryLocation.from_handle(handle)
@@ -1,6 +1,7 @@
 import datetime
 from abc import ABCMeta, abstractmethod, abstractproperty
 
+import grpc
 import pendulum
 import six
 from dagster import check
@@ -12,7 +13,10 @@
     sync_get_external_partition_tags_grpc,
 )
 from dagster.api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
-from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_grpc
+from dagster.api.snapshot_repository import (
+    sync_get_external_repository_indices_grpc,
+    sync_get_streaming_external_repositories_grpc,
+)
 from dagster.api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
 from dagster.api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
 from dagster.core.execution.api import create_execution_plan
@@ -117,13 +121,13 @@ def get_external_partition_set_execution_param_data(
 
     @abstractmethod
     def get_external_schedule_execution_data(
-        self, instance, repository_handle, schedule_name, scheduled_execution_time,
+        self, instance, repository_handle, schedule_name, scheduled_execution_time, timeout=None,
     ):
         pass
 
     @abstractmethod
     def get_external_sensor_execution_data(
-        self, instance, repository_handle, name, last_completion_time
+        self, instance, repository_handle, name, last_completion_time, timeout=None
     ):
         pass
 
@@ -261,8 +265,9 @@ def get_external_partition_names(self, repository_handle, partition_set_name):
         )
 
     def get_external_schedule_execution_data(
-        self, instance, repository_handle, schedule_name, scheduled_execution_time,
+        self, instance, repository_handle, schedule_name, scheduled_execution_time, timeout=None,
     ):
+        # the schedule is evaluated in this process, where the timeout cannot be enforced
         check.inst_param(instance, "instance", DagsterInstance)
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(schedule_name, "schedule_name")
@@ -283,8 +288,9 @@ def get_external_schedule_execution_data(
         )
 
     def get_external_sensor_execution_data(
-        self, instance, repository_handle, name, last_completion_time
+        self, instance, repository_handle, name, last_completion_time, timeout=None
     ):
+        # the sensor is evaluated in this process, where the timeout cannot be enforced
         return get_external_sensor_execution(
             self._recon_repo, instance.get_ref(), name, last_completion_time
         )
@@ -313,9 +319,18 @@ def __init__(self, repository_location_handle):
 
         self._handle = repository_location_handle
 
-        external_repositories_list = sync_get_streaming_external_repositories_grpc(
-            self._handle.client, self._handle,
-        )
+        # only the index of each repository is fetched, and the data of each pipeline when it is
+        # first used, unless the server predates repository indices
+        try:
+            external_repositories_list = sync_get_external_repository_indices_grpc(
+                self._handle.client, self._handle,
+            )
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.UNIMPLEMENTED:  # pylint: disable=no-member
+                raise
+            external_repositories_list = sync_get_streaming_external_repositories_grpc(
+                self._handle.client, self._handle,
+            )
 
         self.external_repositories = {repo.name: repo for repo in external_repositories_list}
 
@@ -409,7 +424,7 @@ def get_external_partition_names(self, repository_handle, partition_set_name):
         )
 
     def get_external_schedule_execution_data(
-        self, instance, repository_handle, schedule_name, scheduled_execution_time,
+        self, instance, repository_handle, schedule_name, scheduled_execution_time, timeout=None,
     ):
         check.inst_param(instance, "instance", DagsterInstance)
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
@@ -424,13 +439,19 @@ def get_external_schedule_execution_data(
             repository_handle,
             schedule_name,
             scheduled_execution_time,
+            timeout=timeout,
         )
 
     def get_external_sensor_execution_data(
-        self, instance, repository_handle, name, last_completion_time
+        self, instance, repository_handle, name, last_completion_time, timeout=None
     ):
         return sync_get_external_sensor_execution_data_grpc(
-            self._handle.client, instance, repository_handle, name, last_completion_time
+            self._handle.client,
+            instance,
+            repository_handle,
+            name,
+            last_completion_time,
+            timeout=timeout,
         )
 
     def get_external_partition_set_execution_param_data(
@@ -1,6 +1,7 @@
 import logging
 import os
 import sys
+import threading
 import time
 import warnings
 from collections import defaultdict
@@ -115,6 +116,17 @@ def _format_field_diff(field_diff):
     )
 
 
+def _is_buffer_flushing_event(dagster_event):
+    return (
+        dagster_event.is_pipeline_event
+        or dagster_event.is_pipeline_init_failure
+        or dagster_event.is_step_success
+        or dagster_event.is_step_failure
+        or dagster_event.is_step_skipped
+        or dagster_event.is_step_up_for_retry
+    )
+
+
 class _EventListenerLogHandler(logging.Handler):
     def __init__(self, instance):
         self._instance = instance
@@ -216,6 +228,11 @@ def __init__(
         from dagster.core.storage.event_log import EventLogStorage
         from dagster.core.storage.root import LocalArtifactStorage
         from dagster.core.storage.runs import RunStorage
+        from dagster.core.storage.runs.cached_run_storage import (
+            CachedRunStorage,
+            DEFAULT_RUN_STORAGE_CACHE_MAX_ENTRIES,
+            DEFAULT_RUN_STORAGE_CACHE_TTL_SECONDS,
+        )
         from dagster.core.storage.schedules import ScheduleStorage
         from dagster.core.scheduler import Scheduler
         from dagster.core.run_coordinator import RunCoordinator
@@ -226,7 +243,6 @@ def __init__(
             local_artifact_storage, "local_artifact_storage", LocalArtifactStorage
         )
         self._event_storage = check.inst_param(event_storage, "event_storage", EventLogStorage)
-        self._run_storage = check.inst_param(run_storage, "run_storage", RunStorage)
         self._compute_log_manager = check.inst_param(
             compute_log_manager, "compute_log_manager", ComputeLogManager
         )
@@ -241,10 +257,35 @@ def __init__(
 
         self._settings = check.opt_dict_param(settings, "settings")
 
+        self._run_storage = check.inst_param(run_storage, "run_storage", RunStorage)
+        run_storage_cache_settings = self.get_settings("run_storage_cache") or {}
+        if run_storage_cache_settings.get("enabled"):
+            self._run_storage = CachedRunStorage(
+                self._run_storage,
+                max_entries=run_storage_cache_settings.get(
+                    "max_entries", DEFAULT_RUN_STORAGE_CACHE_MAX_ENTRIES
+                ),
+                ttl_seconds=run_storage_cache_settings.get(
+                    "ttl_seconds", DEFAULT_RUN_STORAGE_CACHE_TTL_SECONDS
+                ),
+            )
+
         self._ref = check.opt_inst_param(ref, "ref", InstanceRef)
 
         self._subscribers = defaultdict(list)
 
+        event_log_buffer_settings = self.get_settings("event_log_buffer") or {}
+        self._event_buffer_max_events = check.int_param(
+            event_log_buffer_settings.get("max_events", 1), "max_events"
+        )
+        self._event_buffer_flush_interval = check.numeric_param(
+            event_log_buffer_settings.get("flush_interval_seconds", 0.0), "flush_interval_seconds"
+        )
+        self._event_buffer = []
+        self._event_buffer_start_time = None
+        self._event_buffer_timer = None
+        self._event_buffer_lock = threading.RLock()
+
     # ctors
 
     @staticmethod
@@ -458,6 +499,22 @@ def telemetry_enabled(self):
         else:
             return dagster_telemetry_enabled_default
 
+    @property
+    def event_log_retention_policy(self):
+        """Optional[EventLogRetentionPolicy]: The events which the event log retention daemon
+        deletes, if the ``event_log_retention`` setting is configured."""
+        from dagster.core.storage.event_log import EventLogRetentionPolicy
+
+        retention_settings = self.get_settings("event_log_retention")
+        if not retention_settings:
+            return None
+
+        max_age_days = retention_settings.get("max_age_days")
+        return EventLogRetentionPolicy(
+            max_age_seconds=max_age_days * 24 * 60 * 60 if max_age_days is not None else None,
+            max_log_messages_per_run=retention_settings.get("max_log_messages_per_run"),
+        )
+
     def upgrade(self, print_fn=lambda _: None):
         with upgrading_instance(self):
 
@@ -479,9 +536,11 @@ def optimize_for_dagit(self, statement_timeout):
     def reindex(self, print_fn=lambda _: None):
         print_fn("Checking for reindexing...")
         self._event_storage.reindex(print_fn)
+        self._run_storage.reindex(self._event_storage, print_fn)
         print_fn("Done.")
 
     def dispose(self):
+        self.flush_event_buffer()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
         self._run_launcher.dispose()
@@ -519,9 +578,11 @@ def get_execution_plan_snapshot(self, snapshot_id):
         return self._run_storage.get_execution_plan_snapshot(snapshot_id)
 
     def get_run_stats(self, run_id):
+        self.flush_event_buffer()
         return self._event_storage.get_stats_for_run(run_id)
 
     def get_run_step_stats(self, run_id, step_keys=None):
+        self.flush_event_buffer()
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
     def get_run_tags(self):
@@ -906,8 +967,8 @@ def get_run():
     def add_run(self, pipeline_run):
         return self._run_storage.add_run(pipeline_run)
 
-    def handle_run_event(self, run_id, event):
-        return self._run_storage.handle_run_event(run_id, event)
+    def handle_run_event(self, run_id, event, timestamp=None):
+        return self._run_storage.handle_run_event(run_id, event, timestamp)
 
     def add_run_tags(self, run_id, new_tags):
         return self._run_storage.add_run_tags(run_id, new_tags)
@@ -934,15 +995,38 @@ def delete_run(self, run_id):
 
     # event storage
 
-    def logs_after(self, run_id, cursor):
-        return self._event_storage.get_logs_for_run(run_id, cursor=cursor)
+    def logs_after(self, run_id, cursor, of_type=None, step_key=None, limit=None):
+        self.flush_event_buffer()
+        return self._event_storage.get_logs_for_run(
+            run_id, cursor=cursor, of_type=of_type, step_key=step_key, limit=limit
+        )
+
+    def event_records_after(
+        self, run_id, cursor=-1, after_record_id=None, of_type=None, step_key=None, limit=None
+    ):
+        self.flush_event_buffer()
+        return self._event_storage.get_event_records_for_run(
+            run_id,
+            cursor=cursor,
+            after_record_id=after_record_id,
+            of_type=of_type,
+            step_key=step_key,
+            limit=limit,
+        )
 
-    def all_logs(self, run_id):
-        return self._event_storage.get_logs_for_run(run_id)
+    def all_logs(self, run_id, of_type=None):
+        self.flush_event_buffer()
+        return self._event_storage.get_logs_for_run(run_id, of_type=of_type)
 
     def watch_event_logs(self, run_id, cursor, cb):
         return self._event_storage.watch(run_id, cursor, cb)
 
+    def delete_expired_events(self, retention_policy, limit):
+        return self._event_storage.delete_expired_events(retention_policy, limit)
+
+    def compact_event_log(self):
+        self._event_storage.compact()
+
     # asset storage
 
     @property
@@ -972,6 +1056,11 @@ def events_for_asset_key(self, asset_key, cursor=None, limit=None):
         self.check_asset_aware()
         return self._event_storage.get_asset_events(asset_key, cursor, limit)
 
+    def get_latest_materializations(self, asset_keys):
+        check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
+        self.check_asset_aware()
+        return self._event_storage.get_latest_materializations(asset_keys)
+
     def run_ids_for_asset_key(self, asset_key):
         check.inst_param(asset_key, "asset_key", AssetKey)
         self.check_asset_aware()
@@ -992,15 +1081,73 @@ def get_logger(self):
         return logger
 
     def handle_new_event(self, event):
-        run_id = event.run_id
+        """Store a new event and dispatch it to the run storage and any subscribers.
+
+        If the ``event_log_buffer`` setting is configured, events are buffered and written to the
+        event log storage in batches, flushing once ``max_events`` events are buffered or once the
+        oldest buffered event is more than ``flush_interval_seconds`` old. A timer enforces the
+        flush interval even if no further events arrive, so buffered events become visible to
+        other processes after at most ``flush_interval_seconds`` (and are lost if the process
+        crashes before then). Pipeline events (e.g. start, success and failure) always flush the
+        buffer, so that the run status is never updated ahead of the events that precede it, and
+        step terminal events always flush the buffer, so that executors watching the event log
+        see a step complete as soon as it does.
+        """
+        with self._event_buffer_lock:
+            if not self._event_buffer:
+                self._event_buffer_start_time = time.time()
+                self._start_event_buffer_timer()
+
+            self._event_buffer.append(event)
+
+            if (
+                len(self._event_buffer) >= self._event_buffer_max_events
+                or time.time() - self._event_buffer_start_time >= self._event_buffer_flush_interval
+                or (event.is_dagster_event and _is_buffer_flushing_event(event.dagster_event))
+            ):
+                self.flush_event_buffer()
 
-        self._event_storage.store_event(event)
+    def _start_event_buffer_timer(self):
+        if self._event_buffer_max_events <= 1 or self._event_buffer_flush_interval <= 0:
+            return
 
-        if event.is_dagster_event and event.dagster_event.is_pipeline_event:
-            self._run_storage.handle_run_event(run_id, event.dagster_event)
+        self._event_buffer_timer = threading.Timer(
+            self._event_buffer_flush_interval, self.flush_event_buffer
+        )
+        self._event_buffer_timer.daemon = True
+        self._event_buffer_timer.start()
+
+    def _cancel_event_buffer_timer(self):
+        if self._event_buffer_timer is not None:
+            self._event_buffer_timer.cancel()
+            self._event_buffer_timer = None
+
+    def flush_event_buffer(self):
+        """Write any buffered events to the event log storage and dispatch them to the run storage
+        and any subscribers, in the order in which they were received."""
+        with self._event_buffer_lock:
+            self._cancel_event_buffer_timer()
+
+            if not self._event_buffer:
+                return
+
+            events = self._event_buffer
+            self._event_buffer = []
+            self._event_buffer_start_time = None
+
+            if len(events) == 1:
+                self._event_storage.store_event(events[0])
+            else:
+                self._event_storage.store_events(events)
+
+            for event in events:
+                if event.is_dagster_event and event.dagster_event.is_pipeline_event:
+                    self._run_storage.handle_run_event(
+                        event.run_id, event.dagster_event, event.timestamp
+                    )
 
-        for sub in self._subscribers[run_id]:
-            sub(event)
+                for sub in self._subscribers[event.run_id]:
+                    sub(event)
 
     def add_event_listener(self, run_id, cb):
         self._subscribers[run_id].append(cb)
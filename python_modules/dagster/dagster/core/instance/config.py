@@ -1,7 +1,7 @@
 import os
 import warnings
 
-from dagster import Bool, check
+from dagster import Bool, Float, Int, check
 from dagster.config import Field, Permissive
 from dagster.config.validate import validate_config
 from dagster.core.errors import DagsterInvalidConfigError
@@ -55,4 +55,52 @@ def dagster_instance_config_schema():
         "run_coordinator": config_field_for_configurable_class(),
         "run_launcher": config_field_for_configurable_class(),
         "telemetry": Field({"enabled": Field(Bool, is_required=False)}),
+        "event_log_buffer": Field(
+            {
+                "max_events": Field(
+                    Int,
+                    is_required=False,
+                    description="Flush the buffer once this many events are buffered.",
+                ),
+                "flush_interval_seconds": Field(
+                    Float,
+                    is_required=False,
+                    description=(
+                        "Flush the buffer once its oldest event is this many seconds old. A "
+                        "background timer enforces this even when no further events arrive, so "
+                        "buffered events are visible to other processes after at most this delay, "
+                        "and are lost if the process crashes before then. Pipeline events and "
+                        "step terminal events (success, failure, skip, retry) always flush."
+                    ),
+                ),
+            },
+            is_required=False,
+        ),
+        "event_log_retention": Field(
+            {
+                "max_age_days": Field(Float, is_required=False),
+                "max_log_messages_per_run": Field(Int, is_required=False),
+                "batch_size": Field(Int, is_required=False),
+                "max_batches_per_iteration": Field(Int, is_required=False),
+                "interval_seconds": Field(Int, is_required=False),
+                "compact_min_rows": Field(Int, is_required=False),
+                "compact_interval_seconds": Field(Int, is_required=False),
+            },
+            is_required=False,
+        ),
+        "daemon_evaluation": Field(
+            {
+                "max_concurrent": Field(Int, is_required=False),
+                "timeout_seconds": Field(Float, is_required=False),
+            },
+            is_required=False,
+        ),
+        "run_storage_cache": Field(
+            {
+                "enabled": Field(Bool, is_required=False),
+                "max_entries": Field(Int, is_required=False),
+                "ttl_seconds": Field(Float, is_required=False),
+            },
+            is_required=False,
+        ),
     }
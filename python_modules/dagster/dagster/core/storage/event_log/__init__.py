@@ -1,5 +1,12 @@
-from .base import AssetAwareEventLogStorage, EventLogStorage
+from .base import AssetAwareEventLogStorage, EventLogRetentionPolicy, EventLogStorage
 from .in_memory import InMemoryEventLogStorage
-from .schema import AssetKeyTable, SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from .schema import (
+    AssetKeyTable,
+    AssetMaterializationSummaryTable,
+    RunStatsTable,
+    SqlEventLogStorageMetadata,
+    SqlEventLogStorageTable,
+    StepStatsTable,
+)
 from .sql_event_log import AssetAwareSqlEventLogStorage, SqlEventLogStorage
 from .sqlite import ConsolidatedSqliteEventLogStorage, SqliteEventLogStorage
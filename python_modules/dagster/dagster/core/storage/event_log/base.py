@@ -1,7 +1,10 @@
 from abc import ABCMeta, abstractmethod, abstractproperty
+from collections import OrderedDict, namedtuple
 
 import pyrsistent
 import six
+from dagster import check
+from dagster.core.definitions.events import AssetKey
 from dagster.core.events.log import EventRecord
 from dagster.core.execution.stats import (
     build_run_stats_from_events,
@@ -13,6 +16,36 @@ class EventLogSequence(pyrsistent.CheckedPVector):
     __type__ = EventRecord
 
 
+class EventLogRetentionPolicy(
+    namedtuple("_EventLogRetentionPolicy", "max_age_seconds max_log_messages_per_run")
+):
+    """Describes the events which an event log storage may delete to bound its size.
+
+    Args:
+        max_age_seconds (Optional[float]): Events older than this are deleted.
+        max_log_messages_per_run (Optional[int]): Finished runs keep at most this many log messages,
+            i.e. events which are not dagster events, losing their oldest log messages first.
+    """
+
+    def __new__(cls, max_age_seconds=None, max_log_messages_per_run=None):
+        return super(EventLogRetentionPolicy, cls).__new__(
+            cls,
+            max_age_seconds=check.opt_numeric_param(max_age_seconds, "max_age_seconds"),
+            max_log_messages_per_run=check.opt_int_param(
+                max_log_messages_per_run, "max_log_messages_per_run"
+            ),
+        )
+
+
+def group_events_by_run_id(events):
+    """Splits a list of events into (run_id, events) pairs, preserving the order in which each
+    run id first appears and the order of the events within each run."""
+    events_by_run_id = OrderedDict()
+    for event in events:
+        events_by_run_id.setdefault(event.run_id, []).append(event)
+    return list(events_by_run_id.items())
+
+
 class EventLogStorage(six.with_metaclass(ABCMeta)):
     """Abstract base class for storing structured event logs from pipeline runs.
 
@@ -26,15 +59,66 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
     """
 
     @abstractmethod
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def get_logs_for_run(self, run_id, cursor=-1, of_type=None, step_key=None, limit=None):
         """Get all of the logs corresponding to a run.
 
         Args:
             run_id (str): The id of the run for which to fetch logs.
             cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
+            of_type (Optional[DagsterEventType]): If set, only return the logs of dagster events of
+                this type. The cursor indexes into the filtered logs.
+            step_key (Optional[str]): If set, only return the logs for this step. The cursor
+                indexes into the filtered logs.
+            limit (Optional[int]): The maximum number of logs to return.
         """
 
+    def get_event_records_for_run(
+        self, run_id, cursor=-1, after_record_id=None, of_type=None, step_key=None, limit=None
+    ):
+        """Get the logs corresponding to a run, along with their storage record ids, so that
+        callers paging through a large event log can resume after the last record they have seen
+        without re-reading the records before it.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1.
+                Ignored if after_record_id is set. A fallback for callers without a record id: the
+                storage reads past every earlier log, and positions shift when earlier logs are
+                deleted. (default: -1)
+            after_record_id (Optional[int]): If set, only return the logs stored after the record
+                with this id. Prefer this to the cursor when paging.
+            of_type (Optional[DagsterEventType]): If set, only return the logs of dagster events of
+                this type.
+            step_key (Optional[str]): If set, only return the logs for this step.
+            limit (Optional[int]): The maximum number of logs to return.
+
+        Returns:
+            List[Tuple[int, EventRecord]]: The record ids and logs, in the order they were stored.
+        """
+        check.opt_int_param(after_record_id, "after_record_id")
+
+        # storages without record ids use the position of each event in the run's full log
+        records = [
+            (record_id, event)
+            for record_id, event in enumerate(self.get_logs_for_run(run_id))
+            if (
+                not of_type
+                or (event.is_dagster_event and event.dagster_event.event_type == of_type)
+            )
+            and (
+                not step_key
+                or (event.dagster_event.step_key if event.is_dagster_event else event.step_key)
+                == step_key
+            )
+        ]
+        if after_record_id is not None:
+            records = [record for record in records if record[0] > after_record_id]
+        else:
+            records = records[cursor + 1 :]
+
+        return records[:limit] if limit is not None else records
+
     def get_stats_for_run(self, run_id):
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -60,10 +144,42 @@ def store_event(self, event):
             event (EventRecord): The event to store.
         """
 
+    def store_events(self, events):
+        """Store a batch of events, possibly spanning several pipeline runs.
+
+        Storages which can write several events in a single round-trip or transaction should
+        override this method; the default implementation stores each event in turn.
+
+        Args:
+            events (List[EventRecord]): The events to store, in the order they were emitted.
+        """
+        check.list_param(events, "events", of_type=EventRecord)
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id):
         """Remove events for a given run id"""
 
+    def delete_expired_events(self, retention_policy, limit):
+        """Delete at most ``limit`` of the events that a retention policy expires, so that the
+        policy can be enforced in bounded batches. Storages which do not support retention delete
+        nothing.
+
+        Args:
+            retention_policy (EventLogRetentionPolicy): The events to delete.
+            limit (int): The maximum number of events to delete.
+
+        Returns:
+            int: The number of events deleted.
+        """
+        check.inst_param(retention_policy, "retention_policy", EventLogRetentionPolicy)
+        check.int_param(limit, "limit")
+        return 0
+
+    def compact(self):
+        """Reclaim the space freed by deleted events and refresh any query planner statistics."""
+
     @abstractmethod
     def upgrade(self):
         """This method should perform any schema migrations necessary to bring an
@@ -137,6 +253,26 @@ def get_all_asset_keys(self, prefix_path=None):
     def get_asset_events(self, asset_key, cursor=None, limit=None):
         pass
 
+    def get_latest_materializations(self, asset_keys):
+        """Get the latest materialization event of each of a list of assets.
+
+        Storages that keep track of the latest materialization of each asset should override this
+        to fetch them in bulk, rather than with a query per asset.
+
+        Args:
+            asset_keys (List[AssetKey]): The assets.
+
+        Returns:
+            Dict[AssetKey, Optional[EventRecord]]: The latest materialization event of each asset,
+                or None for the assets that have no materializations.
+        """
+        check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
+        latest_materializations = {}
+        for asset_key in asset_keys:
+            events = self.get_asset_events(asset_key, limit=1)
+            latest_materializations[asset_key] = events[0] if events else None
+        return latest_materializations
+
     @abstractmethod
     def get_asset_run_ids(self, asset_key):
         pass
@@ -6,7 +6,12 @@
 from dagster.core.events.log import EventRecord
 from dagster.serdes import ConfigurableClass
 
-from .base import AssetAwareEventLogStorage, EventLogSequence, EventLogStorage
+from .base import (
+    AssetAwareEventLogStorage,
+    EventLogSequence,
+    EventLogStorage,
+    group_events_by_run_id,
+)
 from .version_addresses import get_addresses_for_step_output_versions_helper
 
 
@@ -37,16 +42,35 @@ def config_type(cls):
     def from_config_value(cls, inst_data, config_value):
         return cls(inst_data)
 
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def get_logs_for_run(self, run_id, cursor=-1, of_type=None, step_key=None, limit=None):
         check.str_param(run_id, "run_id")
         check.int_param(cursor, "cursor")
         check.invariant(
             cursor >= -1,
             "Don't know what to do with negative cursor {cursor}".format(cursor=cursor),
         )
+        check.opt_inst_param(of_type, "of_type", DagsterEventType)
+        check.opt_str_param(step_key, "step_key")
+        check.opt_int_param(limit, "limit")
+
+        logs = self._logs[run_id]
+        if of_type:
+            logs = [
+                event
+                for event in logs
+                if event.is_dagster_event and event.dagster_event.event_type == of_type
+            ]
+        if step_key:
+            logs = [
+                event
+                for event in logs
+                if (event.dagster_event.step_key if event.is_dagster_event else event.step_key)
+                == step_key
+            ]
 
         cursor = cursor + 1
-        return self._logs[run_id][cursor:]
+        end = cursor + limit if limit is not None else None
+        return logs[cursor:end]
 
     def store_event(self, event):
         check.inst_param(event, "event", EventRecord)
@@ -55,6 +79,14 @@ def store_event(self, event):
         for handler in self._handlers[run_id]:
             handler(event)
 
+    def store_events(self, events):
+        check.list_param(events, "events", of_type=EventRecord)
+        for run_id, run_events in group_events_by_run_id(events):
+            self._logs[run_id] = self._logs[run_id].extend(run_events)
+            for event in run_events:
+                for handler in self._handlers[run_id]:
+                    handler(event)
+
     def delete_events(self, run_id):
         del self._logs[run_id]
 
@@ -54,3 +54,45 @@ def migrate_asset_key_data(event_log_storage, print_fn=lambda _: None):
             except db.exc.IntegrityError:
                 # asset key already present
                 pass
+
+
+def migrate_asset_key_last_materialization_data(event_log_storage, print_fn=lambda _: None):
+    """
+    Utility method to fill in the latest materialization of each asset in the asset key index from
+    the data in existing event log records.  Takes in event_log_storage, and a print_fn to keep
+    track of progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import AssetAwareSqlEventLogStorage
+
+    if not isinstance(event_log_storage, AssetAwareSqlEventLogStorage):
+        return
+
+    print_fn("Querying event logs.")
+    event_log_storage.rebuild_asset_key_last_materializations()
+
+
+def migrate_run_stats_data(event_log_storage, print_fn=lambda _: None):
+    """
+    Utility method to build the run and step stats summary tables from the data in existing event
+    log records.  Takes in event_log_storage, and a print_fn to keep track of progress.
+
+    Only finished runs are rebuilt, since a run that is still storing events could have its stats
+    updated while they are being rebuilt.
+    """
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    query = db.select([SqlEventLogStorageTable.c.run_id]).distinct()
+    with event_log_storage.connect() as conn:
+        print_fn("Querying event logs.")
+        run_ids = [run_id for (run_id,) in conn.execute(query).fetchall() if run_id]
+
+    print_fn("Found {} runs to index".format(len(run_ids)))
+    n_unfinished = 0
+    for run_id in tqdm(run_ids):
+        if not event_log_storage.rebuild_run_stats(run_id):
+            n_unfinished += 1
+    if n_unfinished:
+        print_fn("Skipped {} runs that have not finished".format(n_unfinished))
@@ -29,8 +29,58 @@
     db.Column("id", db.Integer, primary_key=True, autoincrement=True),
     db.Column("asset_key", db.String, unique=True),
     db.Column("create_timestamp", db.DateTime, server_default=db.text("CURRENT_TIMESTAMP")),
+    # the latest materialization of the asset, kept up to date as events are stored so that the
+    # latest materializations of many assets can be read without scanning the event log
+    db.Column("last_materialization", db.Text),
+    db.Column("last_materialization_timestamp", db.types.TIMESTAMP),
+    db.Column("last_run_id", db.String(255)),
+)
+
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), unique=True, nullable=False),
+    db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+    db.Column("steps_failed", db.Integer, nullable=False, default=0),
+    db.Column("materializations", db.Integer, nullable=False, default=0),
+    db.Column("expectations", db.Integer, nullable=False, default=0),
+    db.Column("start_time", db.types.TIMESTAMP),
+    db.Column("end_time", db.types.TIMESTAMP),
+)
+
+StepStatsTable = db.Table(
+    "step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.String(255), nullable=False),
+    db.Column("status", db.String(63)),
+    db.Column("start_time", db.types.TIMESTAMP),
+    db.Column("end_time", db.types.TIMESTAMP),
+    db.Column("attempts", db.Integer),
+    db.UniqueConstraint("run_id", "step_key", name="uq_step_stats_run_id_step_key"),
+)
+
+# Rolls up the materializations deleted from the event log by retention, so that the history of an
+# asset outlives its events
+AssetMaterializationSummaryTable = db.Table(
+    "asset_materialization_summary",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("asset_key", db.String, unique=True, nullable=False),
+    db.Column("materialization_count", db.Integer, nullable=False, default=0),
+    db.Column("first_timestamp", db.types.TIMESTAMP),
+    db.Column("last_timestamp", db.types.TIMESTAMP),
+    db.Column("last_materialization", db.Text),
 )
 
 db.Index("idx_run_id", SqlEventLogStorageTable.c.run_id)
 db.Index("idx_step_key", SqlEventLogStorageTable.c.step_key)
+db.Index(
+    "idx_run_id_event_type",
+    SqlEventLogStorageTable.c.run_id,
+    SqlEventLogStorageTable.c.dagster_event_type,
+    SqlEventLogStorageTable.c.id,
+)
 db.Index("idx_asset_key", SqlEventLogStorageTable.c.asset_key)
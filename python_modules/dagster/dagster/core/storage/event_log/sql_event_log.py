@@ -1,6 +1,7 @@
 import logging
+import time
 from abc import abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, namedtuple
 from datetime import datetime
 
 import six
@@ -12,21 +13,101 @@
 from dagster.core.events.log import EventRecord
 from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
-from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.serdes import (
+    deserialize_dagster_namedtuple,
+    serialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_compressed,
+)
 from dagster.utils import datetime_as_float, utc_datetime_from_timestamp
 
 from ..pipeline_run import PipelineRunStatsSnapshot
-from .base import AssetAwareEventLogStorage, EventLogStorage
-from .migration import migrate_asset_key_data
-from .schema import AssetKeyTable, SecondaryIndexMigrationTable, SqlEventLogStorageTable
+from .base import (
+    AssetAwareEventLogStorage,
+    EventLogRetentionPolicy,
+    EventLogStorage,
+    group_events_by_run_id,
+)
+from .migration import (
+    migrate_asset_key_data,
+    migrate_asset_key_last_materialization_data,
+    migrate_run_stats_data,
+)
+from .schema import (
+    AssetKeyTable,
+    AssetMaterializationSummaryTable,
+    RunStatsTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+    StepStatsTable,
+)
 from .version_addresses import get_addresses_for_step_output_versions_helper
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"
-
-REINDEX_DATA_MIGRATIONS = {
-    SECONDARY_INDEX_ASSET_KEY: migrate_asset_key_data,
+SECONDARY_INDEX_RUN_STATS = "run_stats_tables"
+SECONDARY_INDEX_ASSET_LAST_MATERIALIZATION = "asset_key_last_materialization"
+
+REINDEX_DATA_MIGRATIONS = OrderedDict(
+    [
+        (SECONDARY_INDEX_ASSET_KEY, migrate_asset_key_data),
+        (SECONDARY_INDEX_RUN_STATS, migrate_run_stats_data),
+        # depends on the asset key index, so must run after it
+        (SECONDARY_INDEX_ASSET_LAST_MATERIALIZATION, migrate_asset_key_last_materialization_data),
+    ]
+)
+
+# keeps the number of bound parameters in the asset key IN clauses well below sqlite's limit
+ASSET_KEY_QUERY_BATCH_SIZE = 200
+
+RUN_STATS_COUNTER_COLUMNS = {
+    DagsterEventType.STEP_SUCCESS.value: "steps_succeeded",
+    DagsterEventType.STEP_FAILURE.value: "steps_failed",
+    DagsterEventType.STEP_MATERIALIZATION.value: "materializations",
+    DagsterEventType.STEP_EXPECTATION_RESULT.value: "expectations",
 }
 
+RUN_STATS_EVENT_TYPES = list(RUN_STATS_COUNTER_COLUMNS) + [
+    DagsterEventType.PIPELINE_START.value,
+    DagsterEventType.PIPELINE_SUCCESS.value,
+    DagsterEventType.PIPELINE_FAILURE.value,
+]
+
+STEP_STATS_EVENT_TYPES = [
+    DagsterEventType.STEP_START.value,
+    DagsterEventType.STEP_SUCCESS.value,
+    DagsterEventType.STEP_SKIPPED.value,
+    DagsterEventType.STEP_FAILURE.value,
+    DagsterEventType.STEP_RESTARTED.value,
+]
+
+STEP_STATS_DETAIL_EVENT_TYPES = [
+    DagsterEventType.STEP_MATERIALIZATION.value,
+    DagsterEventType.STEP_EXPECTATION_RESULT.value,
+]
+
+
+RUN_END_EVENT_TYPES = [
+    DagsterEventType.PIPELINE_SUCCESS.value,
+    DagsterEventType.PIPELINE_FAILURE.value,
+    DagsterEventType.PIPELINE_INIT_FAILURE.value,
+]
+
+
+class AssetMaterializationSummary(
+    namedtuple(
+        "_AssetMaterializationSummary",
+        "asset_key materialization_count first_timestamp last_timestamp last_materialization",
+    )
+):
+    """The materializations of an asset that retention has deleted from the event log.
+
+    Args:
+        asset_key (AssetKey): The asset.
+        materialization_count (int): The number of materialization events deleted.
+        first_timestamp (float): The time of the earliest materialization deleted.
+        last_timestamp (float): The time of the latest materialization deleted.
+        last_materialization (EventRecord): The latest materialization event deleted.
+    """
+
 
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
@@ -59,6 +140,18 @@ def reindex(self, print_fn=lambda _: None, force=False):
             self.enable_secondary_index(migration_name)
             print_fn("Finished reindexing: {}".format(migration_name))
 
+    @property
+    def compress_events(self):
+        """bool: Whether events are written to the event log table with the compressed encoding.
+        Rows written with either encoding are read back transparently."""
+        return False
+
+    def serialize_event(self, event):
+        check.inst_param(event, "event", EventRecord)
+        if self.compress_events:
+            return serialize_dagster_namedtuple_compressed(event)
+        return serialize_dagster_namedtuple(event)
+
     def prepare_insert_event(self, event):
         """ Helper method for preparing the event log SQL insertion statement.  Abstracted away to
         have a single place for the logical table representation of the event, while having a way
@@ -67,6 +160,15 @@ def prepare_insert_event(self, event):
         `store_event`.
         """
 
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self.prepare_event_row(event)
+        )
+
+    def prepare_event_row(self, event):
+        """ Helper method returning the column values of the event log row for an event, shared by
+        the single-event and the batched insertion paths.
+        """
         dagster_event_type = None
         asset_key_str = None
         step_key = event.step_key
@@ -78,10 +180,9 @@ def prepare_insert_event(self, event):
                 check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
                 asset_key_str = event.dagster_event.asset_key.to_string()
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
-            event=serialize_dagster_namedtuple(event),
+            event=self.serialize_event(event),
             dagster_event_type=dagster_event_type,
             timestamp=utc_datetime_from_timestamp(event.timestamp),
             step_key=step_key,
@@ -102,6 +203,107 @@ def store_asset_key(self, conn, event):
         except db.exc.IntegrityError:
             pass
 
+    def store_run_stats(self, conn, event):
+        """Incrementally maintains the run_stats and step_stats summary tables as an event is
+        stored, so that run and step stats can be read without aggregating the event log.
+
+        Only scalar columns are updated, in place, so the cost of storing an event does not grow
+        with the number of events already stored for the run. The materializations and expectation
+        results of each step are read from the event log when the step stats are read.
+        """
+        check.inst_param(event, "event", EventRecord)
+        self.store_run_stats_for_events(conn, [event])
+
+    def store_run_stats_for_events(self, conn, events):
+        """Maintains the run_stats and step_stats summary tables for a batch of stored events.
+
+        Only the events which change the stats issue statements. The changes that a batch makes to
+        the stats of each run are combined into a single upsert of the run's row, while the step
+        stats are upserted per event, in order.
+        """
+        check.list_param(events, "events", of_type=EventRecord)
+
+        run_stats_changes = OrderedDict()
+        for event in events:
+            if not _changes_run_stats(event):
+                continue
+
+            run_id = event.run_id
+            event_type_value = event.dagster_event.event_type_value
+            timestamp = utc_datetime_from_timestamp(event.timestamp)
+
+            if event_type_value in RUN_STATS_EVENT_TYPES:
+                increments, times = run_stats_changes.setdefault(run_id, (defaultdict(int), {}))
+                if event_type_value in RUN_STATS_COUNTER_COLUMNS:
+                    increments[RUN_STATS_COUNTER_COLUMNS[event_type_value]] += 1
+                elif event_type_value == DagsterEventType.PIPELINE_START.value:
+                    times["start_time"] = timestamp
+                else:
+                    times["end_time"] = timestamp
+
+            step_key = event.dagster_event.step_key
+            if step_key and event_type_value in STEP_STATS_EVENT_TYPES:
+                _upsert_summary_row(
+                    conn,
+                    StepStatsTable,
+                    [StepStatsTable.c.run_id == run_id, StepStatsTable.c.step_key == step_key],
+                    {"run_id": run_id, "step_key": step_key},
+                    _step_stats_values_for_event(event_type_value, timestamp),
+                )
+
+        for run_id, (increments, times) in run_stats_changes.items():
+            run_stats_values = dict(times)
+            for column_name, increment in increments.items():
+                run_stats_values[column_name] = RunStatsTable.c[column_name] + increment
+
+            _upsert_summary_row(
+                conn,
+                RunStatsTable,
+                [RunStatsTable.c.run_id == run_id],
+                {"run_id": run_id},
+                run_stats_values,
+            )
+
+    def rebuild_run_stats(self, run_id):
+        """Rebuilds the run_stats and step_stats summary rows for a finished run from its event
+        log. Used to backfill the summary tables for runs stored before they were maintained.
+
+        A run that has not finished may still be storing events, whose updates to the summary rows
+        could be lost or counted twice while the rows are rebuilt, so it is not rebuilt.
+
+        Returns:
+            bool: Whether the run had finished, and its summary rows were rebuilt.
+        """
+        check.str_param(run_id, "run_id")
+
+        with self.connect(run_id) as conn:
+            is_finished = conn.execute(
+                db.select([SqlEventLogStorageTable.c.id])
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .where(SqlEventLogStorageTable.c.dagster_event_type.in_(RUN_END_EVENT_TYPES))
+                .limit(1)
+            ).fetchone()
+        if not is_finished:
+            return False
+
+        events = self.get_logs_for_run(run_id)
+
+        with self.connect(run_id) as conn:
+            with conn.begin():
+                conn.execute(
+                    RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        RunStatsTable.c.run_id == run_id
+                    )
+                )
+                conn.execute(
+                    StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        StepStatsTable.c.run_id == run_id
+                    )
+                )
+                self.store_run_stats_for_events(conn, list(events))
+
+        return True
+
     def store_event(self, event):
         """Store an event corresponding to a pipeline run.
 
@@ -116,24 +318,88 @@ def store_event(self, event):
             conn.execute(insert_event_statement)
             if event.is_dagster_event and event.dagster_event.asset_key:
                 self.store_asset_key(conn, event)
+            self.store_run_stats(conn, event)
+
+    def store_events(self, events):
+        """Store a batch of events.
+
+        Events are grouped by run id, and the events for each run are written with a single
+        multi-row insert inside one transaction, rather than one round-trip and commit per event.
 
-    def get_logs_for_run_by_log_id(self, run_id, cursor=-1):
+        Args:
+            events (List[EventRecord]): The events to store, in the order they were emitted.
+        """
+        check.list_param(events, "events", of_type=EventRecord)
+
+        for run_id, run_events in group_events_by_run_id(events):
+            with self.connect(run_id) as conn:
+                with conn.begin():
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [self.prepare_event_row(event) for event in run_events],
+                    )
+                    for event in run_events:
+                        if event.is_dagster_event and event.dagster_event.asset_key:
+                            self.store_asset_key(conn, event)
+                    self.store_run_stats_for_events(conn, run_events)
+
+    def get_logs_for_run_by_log_id(
+        self, run_id, cursor=-1, of_type=None, step_key=None, limit=None, after_record_id=None
+    ):
+        """Get the logs corresponding to a run, keyed by their storage record ids.
+
+        Callers paging through the logs should pass the id of the last record they have seen as
+        after_record_id, which seeks straight to the following records. The cursor is a fallback
+        for callers that only know the position of the last log they have seen: the storage still
+        reads and discards every log before the cursor, so each page costs O(n) in the position,
+        and the position of a log shifts when earlier logs of the run are deleted, e.g. by the
+        event log retention policy, so that logs are skipped.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1.
+                Ignored if after_record_id is set. (default: -1)
+            of_type (Optional[DagsterEventType]): If set, only return the logs of dagster events of
+                this type. The cursor indexes into the filtered logs.
+            step_key (Optional[str]): If set, only return the logs for this step. The cursor
+                indexes into the filtered logs.
+            limit (Optional[int]): The maximum number of logs to return.
+            after_record_id (Optional[int]): If set, only return the logs stored after the record
+                with this id.
+
+        Returns:
+            Dict[int, EventRecord]: The logs, by record id.
+        """
         check.str_param(run_id, "run_id")
         check.int_param(cursor, "cursor")
         check.invariant(
             cursor >= -1,
             "Don't know what to do with negative cursor {cursor}".format(cursor=cursor),
         )
+        check.opt_inst_param(of_type, "of_type", DagsterEventType)
+        check.opt_str_param(step_key, "step_key")
+        check.opt_int_param(limit, "limit")
+        check.opt_int_param(after_record_id, "after_record_id")
 
-        # cursor starts at 0 & auto-increment column starts at 1 so adjust
-        cursor = cursor + 1
-
-        query = (
-            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.id > cursor)
-            .order_by(SqlEventLogStorageTable.c.id.asc())
+        query = db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]).where(
+            SqlEventLogStorageTable.c.run_id == run_id
         )
+        if of_type:
+            query = query.where(SqlEventLogStorageTable.c.dagster_event_type == of_type.value)
+        if step_key:
+            query = query.where(SqlEventLogStorageTable.c.step_key == step_key)
+
+        query = query.order_by(SqlEventLogStorageTable.c.id.asc())
+        if after_record_id is not None:
+            # seek past the last record seen using the run id indexes, rather than scanning and
+            # discarding every earlier record of the run
+            query = query.where(SqlEventLogStorageTable.c.id > after_record_id)
+        else:
+            # the zero-indexed cursor is an offset into the run's (filtered) logs, since record ids
+            # are only contiguous within a run for storages that keep a separate table per run
+            query = query.offset(cursor + 1)
+        if limit is not None:
+            query = query.limit(limit)
 
         with self.connect(run_id) as conn:
             results = conn.execute(query).fetchall()
@@ -142,34 +408,50 @@ def get_logs_for_run_by_log_id(self, run_id, cursor=-1):
         try:
             for (record_id, json_str,) in results:
                 events[record_id] = check.inst_param(
-                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventRecord
+                    deserialize_dagster_namedtuple(json_str), "event", EventRecord
                 )
         except (seven.JSONDecodeError, check.CheckError) as err:
             six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
 
         return events
 
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def get_logs_for_run(self, run_id, cursor=-1, of_type=None, step_key=None, limit=None):
         """Get all of the logs corresponding to a run.
 
         Args:
             run_id (str): The id of the run for which to fetch logs.
             cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
+            of_type (Optional[DagsterEventType]): If set, only return the logs of dagster events of
+                this type. The cursor indexes into the filtered logs.
+            step_key (Optional[str]): If set, only return the logs for this step. The cursor
+                indexes into the filtered logs.
+            limit (Optional[int]): The maximum number of logs to return.
         """
-        check.str_param(run_id, "run_id")
-        check.int_param(cursor, "cursor")
-        check.invariant(
-            cursor >= -1,
-            "Don't know what to do with negative cursor {cursor}".format(cursor=cursor),
+        events_by_id = self.get_logs_for_run_by_log_id(
+            run_id, cursor=cursor, of_type=of_type, step_key=step_key, limit=limit
         )
-
-        events_by_id = self.get_logs_for_run_by_log_id(run_id, cursor)
         return [event for id, event in sorted(events_by_id.items(), key=lambda x: x[0])]
 
+    def get_event_records_for_run(
+        self, run_id, cursor=-1, after_record_id=None, of_type=None, step_key=None, limit=None
+    ):
+        events_by_id = self.get_logs_for_run_by_log_id(
+            run_id,
+            cursor=cursor,
+            of_type=of_type,
+            step_key=step_key,
+            limit=limit,
+            after_record_id=after_record_id,
+        )
+        return sorted(events_by_id.items(), key=lambda x: x[0])
+
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, "run_id")
 
+        if self.has_secondary_index(SECONDARY_INDEX_RUN_STATS, run_id):
+            return self._get_stats_for_run_from_summary(run_id)
+
         query = (
             db.select(
                 [
@@ -212,17 +494,48 @@ def get_stats_for_run(self, run_id):
         except (seven.JSONDecodeError, check.CheckError) as err:
             six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
 
+    def _get_stats_for_run_from_summary(self, run_id):
+        query = db.select(
+            [
+                RunStatsTable.c.steps_succeeded,
+                RunStatsTable.c.steps_failed,
+                RunStatsTable.c.materializations,
+                RunStatsTable.c.expectations,
+                RunStatsTable.c.start_time,
+                RunStatsTable.c.end_time,
+            ]
+        ).where(RunStatsTable.c.run_id == run_id)
+
+        with self.connect(run_id) as conn:
+            row = conn.execute(query).fetchone()
+
+        if not row:
+            return PipelineRunStatsSnapshot(
+                run_id=run_id,
+                steps_succeeded=0,
+                steps_failed=0,
+                materializations=0,
+                expectations=0,
+                start_time=None,
+                end_time=None,
+            )
+
+        return PipelineRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=row.steps_succeeded,
+            steps_failed=row.steps_failed,
+            materializations=row.materializations,
+            expectations=row.expectations,
+            start_time=datetime_as_float(row.start_time) if row.start_time else None,
+            end_time=datetime_as_float(row.end_time) if row.end_time else None,
+        )
+
     def get_step_stats_for_run(self, run_id, step_keys=None):
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
-        STEP_STATS_EVENT_TYPES = [
-            DagsterEventType.STEP_START.value,
-            DagsterEventType.STEP_SUCCESS.value,
-            DagsterEventType.STEP_SKIPPED.value,
-            DagsterEventType.STEP_FAILURE.value,
-            DagsterEventType.STEP_RESTARTED.value,
-        ]
+        if self.has_secondary_index(SECONDARY_INDEX_RUN_STATS, run_id):
+            return self._get_step_stats_for_run_from_summary(run_id, step_keys)
 
         by_step_query = (
             db.select(
@@ -280,20 +593,89 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
                 )
                 by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
 
+        materializations, expectation_results = self._get_step_details_for_run(run_id, step_keys)
+
+        return [
+            RunStepKeyStatsSnapshot(
+                run_id=run_id,
+                step_key=step_key,
+                status=value.get("status"),
+                start_time=value.get("start_time"),
+                end_time=value.get("end_time"),
+                materializations=materializations.get(step_key),
+                expectation_results=expectation_results.get(step_key),
+                attempts=value.get("attempts"),
+            )
+            for step_key, value in by_step_key.items()
+        ]
+
+    def _get_step_stats_for_run_from_summary(self, run_id, step_keys=None):
+        query = (
+            db.select(
+                [
+                    StepStatsTable.c.step_key,
+                    StepStatsTable.c.status,
+                    StepStatsTable.c.start_time,
+                    StepStatsTable.c.end_time,
+                    StepStatsTable.c.attempts,
+                ]
+            )
+            .where(StepStatsTable.c.run_id == run_id)
+            .order_by(StepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            query = query.where(StepStatsTable.c.step_key.in_(step_keys))
+
+        with self.connect(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        materializations, expectation_results = self._get_step_details_for_run(run_id, step_keys)
+
+        step_stats = [
+            RunStepKeyStatsSnapshot(
+                run_id=run_id,
+                step_key=row.step_key,
+                status=StepEventStatus(row.status) if row.status else None,
+                start_time=datetime_as_float(row.start_time) if row.start_time else None,
+                end_time=datetime_as_float(row.end_time) if row.end_time else None,
+                materializations=materializations.get(row.step_key),
+                expectation_results=expectation_results.get(row.step_key),
+                attempts=row.attempts,
+            )
+            for row in results
+        ]
+
+        # steps that have only yielded materializations or expectation results have no summary row
+        summarized_step_keys = {row.step_key for row in results}
+        for step_key in list(materializations.keys()) + list(expectation_results.keys()):
+            if step_key not in summarized_step_keys:
+                summarized_step_keys.add(step_key)
+                step_stats.append(
+                    RunStepKeyStatsSnapshot(
+                        run_id=run_id,
+                        step_key=step_key,
+                        materializations=materializations.get(step_key),
+                        expectation_results=expectation_results.get(step_key),
+                    )
+                )
+
+        return step_stats
+
+    def _get_step_details_for_run(self, run_id, step_keys=None):
+        """Reads the materializations and expectation results yielded by the steps of a run from
+        the event log, using the run id / event type index.
+
+        Returns:
+            Tuple[Dict[str, List[Materialization]], Dict[str, List[ExpectationResult]]]: The
+            materializations and expectation results of each step, by step key.
+        """
         materializations = defaultdict(list)
         expectation_results = defaultdict(list)
         raw_event_query = (
             db.select([SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .where(SqlEventLogStorageTable.c.step_key != None)
-            .where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                    ]
-                )
-            )
+            .where(SqlEventLogStorageTable.c.dagster_event_type.in_(STEP_STATS_DETAIL_EVENT_TYPES))
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
 
@@ -308,7 +690,7 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         try:
             for (json_str,) in results:
                 event = check.inst_param(
-                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventRecord
+                    deserialize_dagster_namedtuple(json_str), "event", EventRecord
                 )
                 if event.dagster_event.event_type == DagsterEventType.STEP_MATERIALIZATION:
                     materializations[event.step_key].append(
@@ -321,19 +703,7 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         except (seven.JSONDecodeError, check.CheckError) as err:
             six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
 
-        return [
-            RunStepKeyStatsSnapshot(
-                run_id=run_id,
-                step_key=step_key,
-                status=value.get("status"),
-                start_time=value.get("start_time"),
-                end_time=value.get("end_time"),
-                materializations=materializations.get(step_key),
-                expectation_results=expectation_results.get(step_key),
-                attempts=value.get("attempts"),
-            )
-            for step_key, value in by_step_key.items()
-        ]
+        return materializations, expectation_results
 
     def wipe(self):
         """Clears the event log storage."""
@@ -343,6 +713,11 @@ def wipe(self):
         with self.connect() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(RunStatsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(StepStatsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(
+                AssetMaterializationSummaryTable.delete()  # pylint: disable=no-value-for-parameter
+            )
 
     def delete_events(self, run_id):
         check.str_param(run_id, "run_id")
@@ -363,6 +738,16 @@ def delete_events(self, run_id):
                 for row in conn.execute(removed_asset_key_query).fetchall()
             ]
             conn.execute(delete_statement)
+            conn.execute(
+                RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    RunStatsTable.c.run_id == run_id
+                )
+            )
+            conn.execute(
+                StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    StepStatsTable.c.run_id == run_id
+                )
+            )
             if len(removed_asset_keys) > 0:
                 keys_to_check = []
                 keys_to_check.extend([key.to_string() for key in removed_asset_keys])
@@ -386,6 +771,170 @@ def delete_events(self, run_id):
                         )
                     )
 
+    def delete_expired_events(self, retention_policy, limit):
+        check.inst_param(retention_policy, "retention_policy", EventLogRetentionPolicy)
+        check.int_param(limit, "limit")
+        return self._delete_expired_events(retention_policy, limit)
+
+    def _delete_expired_events(self, retention_policy, limit, run_id=None):
+        """Deletes a batch of expired events, optionally from a single run's events, for storages
+        that shard based on run_id."""
+        deleted = 0
+
+        if retention_policy.max_age_seconds is not None:
+            deleted += self._delete_events_before(
+                utc_datetime_from_timestamp(time.time() - retention_policy.max_age_seconds),
+                limit,
+                run_id=run_id,
+            )
+
+        if retention_policy.max_log_messages_per_run is not None and deleted < limit:
+            deleted += self._delete_excess_log_messages(
+                retention_policy.max_log_messages_per_run, limit - deleted, run_id=run_id
+            )
+
+        return deleted
+
+    def _finished_runs_clause(self, run_id=None):
+        # Retention only deletes the events of finished runs, since cursors into the logs of a run
+        # may index into its events, and would skip events if earlier ones were deleted while the
+        # run is watched. A run is finished once it has a run end event, or once its run stats
+        # have an end time, which outlives the run end event when that event is deleted.
+        ended_run_ids = db.select([SqlEventLogStorageTable.c.run_id]).where(
+            SqlEventLogStorageTable.c.dagster_event_type.in_(RUN_END_EVENT_TYPES)
+        )
+        run_stats_ended_run_ids = db.select([RunStatsTable.c.run_id]).where(
+            RunStatsTable.c.end_time != None
+        )
+        if run_id:
+            ended_run_ids = ended_run_ids.where(SqlEventLogStorageTable.c.run_id == run_id)
+            run_stats_ended_run_ids = run_stats_ended_run_ids.where(
+                RunStatsTable.c.run_id == run_id
+            )
+        return db.or_(
+            SqlEventLogStorageTable.c.run_id.in_(ended_run_ids),
+            SqlEventLogStorageTable.c.run_id.in_(run_stats_ended_run_ids),
+        )
+
+    def _delete_events_before(self, before, limit, run_id=None):
+        expired = db.and_(
+            SqlEventLogStorageTable.c.timestamp < before, self._finished_runs_clause(run_id),
+        )
+        if run_id:
+            expired = db.and_(expired, SqlEventLogStorageTable.c.run_id == run_id)
+
+        # Record ids increase with time, so walking the primary key finds the oldest events first,
+        # without an index on the timestamp
+        last_id_query = (
+            db.select([SqlEventLogStorageTable.c.id])
+            .where(expired)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .offset(limit - 1)
+            .limit(1)
+        )
+
+        with self.connect(run_id) as conn:
+            with conn.begin():
+                last_id = conn.execute(last_id_query).scalar()
+                if last_id is not None:
+                    expired = db.and_(expired, SqlEventLogStorageTable.c.id <= last_id)
+
+                self._summarize_materializations(conn, expired)
+                result = conn.execute(
+                    SqlEventLogStorageTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        expired
+                    )
+                )
+
+        return result.rowcount
+
+    def _delete_excess_log_messages(self, max_log_messages_per_run, limit, run_id=None):
+        log_message_counts_query = (
+            db.select([SqlEventLogStorageTable.c.run_id, db.func.count()])
+            .where(SqlEventLogStorageTable.c.dagster_event_type == None)
+            .where(self._finished_runs_clause(run_id))
+            .group_by(SqlEventLogStorageTable.c.run_id)
+            .having(db.func.count() > max_log_messages_per_run)
+        )
+
+        deleted = 0
+        with self.connect(run_id) as conn:
+            # the batch is trimmed atomically, so that an error never leaves a run partly trimmed
+            with conn.begin():
+                for log_run_id, n_log_messages in conn.execute(log_message_counts_query).fetchall():
+                    if deleted >= limit:
+                        break
+
+                    n_to_delete = min(n_log_messages - max_log_messages_per_run, limit - deleted)
+                    run_log_messages = db.and_(
+                        SqlEventLogStorageTable.c.run_id == log_run_id,
+                        SqlEventLogStorageTable.c.dagster_event_type == None,
+                    )
+                    last_id = conn.execute(
+                        db.select([SqlEventLogStorageTable.c.id])
+                        .where(run_log_messages)
+                        .order_by(SqlEventLogStorageTable.c.id.asc())
+                        .offset(n_to_delete - 1)
+                        .limit(1)
+                    ).scalar()
+                    result = conn.execute(
+                        SqlEventLogStorageTable.delete().where(  # pylint: disable=no-value-for-parameter
+                            db.and_(run_log_messages, SqlEventLogStorageTable.c.id <= last_id)
+                        )
+                    )
+                    deleted += result.rowcount
+
+        return deleted
+
+    def _summarize_materializations(self, conn, where_clause):
+        """Rolls the materializations matching a clause into the materialization summary table,
+        ahead of their deletion from the event log."""
+        rows = conn.execute(
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.timestamp,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(where_clause)
+            .where(SqlEventLogStorageTable.c.asset_key != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type
+                == DagsterEventType.STEP_MATERIALIZATION.value
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        ).fetchall()
+
+        summaries = OrderedDict()
+        for asset_key, timestamp, event in rows:
+            count, first_timestamp, _last_timestamp, _last_event = summaries.get(
+                asset_key, (0, timestamp, None, None)
+            )
+            summaries[asset_key] = (count + 1, first_timestamp, timestamp, event)
+
+        for asset_key, (count, first_timestamp, last_timestamp, event) in summaries.items():
+            update_result = conn.execute(
+                AssetMaterializationSummaryTable.update()  # pylint: disable=no-value-for-parameter
+                .where(AssetMaterializationSummaryTable.c.asset_key == asset_key)
+                .values(
+                    materialization_count=AssetMaterializationSummaryTable.c.materialization_count
+                    + count,
+                    last_timestamp=last_timestamp,
+                    last_materialization=event,
+                )
+            )
+            if update_result.rowcount == 0:
+                conn.execute(
+                    AssetMaterializationSummaryTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        asset_key=asset_key,
+                        materialization_count=count,
+                        first_timestamp=first_timestamp,
+                        last_timestamp=last_timestamp,
+                        last_materialization=event,
+                    )
+                )
+
     @property
     def is_persistent(self):
         return True
@@ -407,7 +956,7 @@ def update_event_log_record(self, record_id, event):
                 SqlEventLogStorageTable.update()  # pylint: disable=no-value-for-parameter
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_dagster_namedtuple(event),
+                    event=self.serialize_event(event),
                     dagster_event_type=dagster_event_type,
                     timestamp=utc_datetime_from_timestamp(event.timestamp),
                     step_key=event.step_key,
@@ -491,7 +1040,7 @@ def get_addresses_for_step_output_versions(self, step_output_versions):
             [
                 (
                     (record.timestamp - datetime(1970, 1, 1)).total_seconds(),
-                    deserialize_json_to_dagster_namedtuple(record.event).dagster_event,
+                    deserialize_dagster_namedtuple(record.event).dagster_event,
                 )
                 for record in step_output_records
             ],
@@ -507,6 +1056,146 @@ def connect(self, run_id=None):
     def upgrade(self):
         pass
 
+    def store_asset_key(self, conn, event):
+        check.inst_param(event, "event", EventRecord)
+        if not event.is_dagster_event or not event.dagster_event.asset_key:
+            return
+
+        if not self.has_asset_key_last_materialization_columns(conn):
+            # the latest materializations are tracked once the asset key table has been migrated
+            super(AssetAwareSqlEventLogStorage, self).store_asset_key(conn, event)
+            return
+
+        asset_key_str = event.dagster_event.asset_key.to_string()
+        values = self.prepare_asset_key_row(event)
+        if conn.execute(_update_asset_key_if_newer(asset_key_str, values)).rowcount:
+            return
+
+        try:
+            conn.execute(
+                AssetKeyTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    asset_key=asset_key_str, **values
+                )
+            )
+        except db.exc.IntegrityError:
+            # the asset key is already indexed, with a more recent materialization
+            pass
+
+    def has_asset_key_last_materialization_columns(self, conn):
+        """Whether the asset key table has been migrated to track the latest materialization of
+        each asset. Writers keep these columns up to date as soon as they exist, whether or not
+        they have been backfilled, so that no materialization is missed while they are. Only their
+        presence is remembered, since a migration may add them while the storage is in use.
+        """
+        if not getattr(self, "_has_asset_key_last_materialization_columns", False):
+            column_names = {
+                column["name"] for column in db.inspect(conn).get_columns(AssetKeyTable.name)
+            }
+            # pylint: disable=attribute-defined-outside-init
+            self._has_asset_key_last_materialization_columns = (
+                AssetKeyTable.c.last_materialization.name in column_names
+            )
+        return self._has_asset_key_last_materialization_columns
+
+    def prepare_asset_key_row(self, event):
+        """ Helper method returning the column values of the asset key row tracking the latest
+        materialization of an asset, for a materialization event.
+        """
+        return dict(
+            last_materialization=self.serialize_event(event),
+            last_materialization_timestamp=utc_datetime_from_timestamp(event.timestamp),
+            last_run_id=event.run_id,
+        )
+
+    def _get_latest_materializations_from_event_log(self, conn, asset_key_strs=None):
+        """Reads the latest materialization event of each asset out of the event log, optionally
+        only for the given asset key strings. Returns a dict keyed by the asset key string in its
+        current format."""
+        latest_ids = db.select([db.func.max(SqlEventLogStorageTable.c.id)])
+        if asset_key_strs is None:
+            latest_ids = latest_ids.where(SqlEventLogStorageTable.c.asset_key != None)
+        else:
+            latest_ids = latest_ids.where(SqlEventLogStorageTable.c.asset_key.in_(asset_key_strs))
+        latest_ids = latest_ids.group_by(SqlEventLogStorageTable.c.asset_key)
+
+        query = db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]).where(
+            SqlEventLogStorageTable.c.id.in_(latest_ids)
+        )
+
+        latest_materializations = {}
+        for row_id, json_str in conn.execute(query).fetchall():
+            _add_latest_materialization(
+                latest_materializations, _deserialize_asset_event_record(row_id, json_str)
+            )
+        return latest_materializations
+
+    def rebuild_asset_key_last_materializations(self, asset_keys=None):
+        """Rebuilds the latest materializations tracked in the asset key table from the event log.
+
+        When rebuilding all of the assets, e.g. to backfill the table while events are being
+        stored, a row is only replaced by an older materialization than the one it holds when
+        rebuilding the given assets, e.g. after their latest materialization was deleted.
+
+        Args:
+            asset_keys (Optional[List[AssetKey]]): The assets to rebuild. Defaults to all of the
+                assets in the event log.
+        """
+        check.opt_list_param(asset_keys, "asset_keys", of_type=AssetKey)
+
+        with self.connect() as conn:
+            if asset_keys is None:
+                latest_materializations = self._get_latest_materializations_from_event_log(conn)
+            else:
+                latest_materializations = {}
+                for chunk in _chunks(asset_keys, ASSET_KEY_QUERY_BATCH_SIZE):
+                    latest_materializations.update(
+                        self._get_latest_materializations_from_event_log(
+                            conn, _asset_key_strs(chunk)
+                        )
+                    )
+
+                # the assets with no materializations left in the event log are no longer tracked
+                stale_asset_key_strs = [
+                    asset_key.to_string()
+                    for asset_key in asset_keys
+                    if asset_key.to_string() not in latest_materializations
+                ]
+                for chunk in _chunks(stale_asset_key_strs, ASSET_KEY_QUERY_BATCH_SIZE):
+                    conn.execute(
+                        AssetKeyTable.update()  # pylint: disable=no-value-for-parameter
+                        .where(AssetKeyTable.c.asset_key.in_(chunk))
+                        .values(
+                            last_materialization=None,
+                            last_materialization_timestamp=None,
+                            last_run_id=None,
+                        )
+                    )
+
+            for asset_key_str, event in latest_materializations.items():
+                values = self.prepare_asset_key_row(event)
+                if asset_keys is None:
+                    # a concurrent writer may have stored a more recent materialization since the
+                    # event log was read
+                    update_statement = _update_asset_key_if_newer(asset_key_str, values)
+                else:
+                    update_statement = (
+                        AssetKeyTable.update()  # pylint: disable=no-value-for-parameter
+                        .where(AssetKeyTable.c.asset_key == asset_key_str)
+                        .values(**values)
+                    )
+                if conn.execute(update_statement).rowcount:
+                    continue
+
+                try:
+                    conn.execute(
+                        AssetKeyTable.insert().values(  # pylint: disable=no-value-for-parameter
+                            asset_key=asset_key_str, **values
+                        )
+                    )
+                except db.exc.IntegrityError:
+                    # the asset key is already indexed, with a more recent materialization
+                    pass
+
     def _add_cursor_limit_to_query(self, query, cursor, limit):
         """ Helper function to deal with cursor/limit pagination args """
 
@@ -608,7 +1297,7 @@ def get_asset_events(self, asset_key, cursor=None, limit=None):
         events = []
         for row_id, json_str in results:
             try:
-                event_record = deserialize_json_to_dagster_namedtuple(json_str)
+                event_record = deserialize_dagster_namedtuple(json_str)
                 if not isinstance(event_record, EventRecord):
                     logging.warning(
                         "Could not resolve asset event record as EventRecord for id `{}`.".format(
@@ -621,6 +1310,82 @@ def get_asset_events(self, asset_key, cursor=None, limit=None):
                 logging.warning("Could not parse asset event record id `{}`.".format(row_id))
         return events
 
+    def get_latest_materializations(self, asset_keys):
+        check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
+
+        # until the asset key table has been backfilled, read the latest materializations out of
+        # the event log
+        use_asset_key_table = self.has_secondary_index(SECONDARY_INDEX_ASSET_LAST_MATERIALIZATION)
+
+        latest_materializations = {}
+        with self.connect() as conn:
+            for chunk in _chunks(asset_keys, ASSET_KEY_QUERY_BATCH_SIZE):
+                if not use_asset_key_table:
+                    latest_materializations.update(
+                        self._get_latest_materializations_from_event_log(
+                            conn, _asset_key_strs(chunk)
+                        )
+                    )
+                    continue
+
+                query = db.select([AssetKeyTable.c.id, AssetKeyTable.c.last_materialization]).where(
+                    db.and_(
+                        AssetKeyTable.c.asset_key.in_(_asset_key_strs(chunk)),
+                        AssetKeyTable.c.last_materialization != None,
+                    )
+                )
+                for row_id, json_str in conn.execute(query).fetchall():
+                    _add_latest_materialization(
+                        latest_materializations, _deserialize_asset_event_record(row_id, json_str)
+                    )
+
+        return {
+            asset_key: latest_materializations.get(asset_key.to_string())
+            for asset_key in asset_keys
+        }
+
+    def get_asset_materialization_summary(self, asset_key):
+        """Get the summary of the materializations of an asset that retention has deleted from the
+        event log.
+
+        Args:
+            asset_key (AssetKey): The asset.
+
+        Returns:
+            Optional[AssetMaterializationSummary]: None if none of the asset's materializations
+                have been deleted.
+        """
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        query = db.select(
+            [
+                AssetMaterializationSummaryTable.c.materialization_count,
+                AssetMaterializationSummaryTable.c.first_timestamp,
+                AssetMaterializationSummaryTable.c.last_timestamp,
+                AssetMaterializationSummaryTable.c.last_materialization,
+            ]
+        ).where(
+            db.or_(
+                AssetMaterializationSummaryTable.c.asset_key == asset_key.to_string(),
+                AssetMaterializationSummaryTable.c.asset_key == asset_key.to_string(legacy=True),
+            )
+        )
+        with self.connect() as conn:
+            row = conn.execute(query).fetchone()
+
+        if not row:
+            return None
+
+        materialization_count, first_timestamp, last_timestamp, last_materialization = row
+        return AssetMaterializationSummary(
+            asset_key=asset_key,
+            materialization_count=materialization_count,
+            first_timestamp=datetime_as_float(first_timestamp) if first_timestamp else None,
+            last_timestamp=datetime_as_float(last_timestamp) if last_timestamp else None,
+            last_materialization=deserialize_dagster_namedtuple(last_materialization)
+            if last_materialization
+            else None,
+        )
+
     def get_asset_run_ids(self, asset_key):
         check.inst_param(asset_key, "asset_key", AssetKey)
         query = (
@@ -642,6 +1407,30 @@ def get_asset_run_ids(self, asset_key):
 
         return [run_id for (run_id, _timestamp) in results]
 
+    def delete_events(self, run_id):
+        check.str_param(run_id, "run_id")
+
+        if not self.has_secondary_index(SECONDARY_INDEX_ASSET_LAST_MATERIALIZATION):
+            super(AssetAwareSqlEventLogStorage, self).delete_events(run_id)
+            return
+
+        with self.connect() as conn:
+            asset_keys = [
+                AssetKey.from_db_string(asset_key_str)
+                for (asset_key_str,) in conn.execute(
+                    db.select([AssetKeyTable.c.asset_key]).where(
+                        AssetKeyTable.c.last_run_id == run_id
+                    )
+                ).fetchall()
+            ]
+
+        super(AssetAwareSqlEventLogStorage, self).delete_events(run_id)
+
+        # the assets last materialized by the deleted run fall back to their previous
+        # materialization, if they still have one
+        if asset_keys:
+            self.rebuild_asset_key_last_materializations(asset_keys)
+
     def wipe_asset(self, asset_key):
         check.inst_param(asset_key, "asset_key", AssetKey)
         event_query = db.select(
@@ -659,13 +1448,21 @@ def wipe_asset(self, asset_key):
             )
         )
 
+        summary_delete = AssetMaterializationSummaryTable.delete().where(  # pylint: disable=no-value-for-parameter
+            db.or_(
+                AssetMaterializationSummaryTable.c.asset_key == asset_key.to_string(),
+                AssetMaterializationSummaryTable.c.asset_key == asset_key.to_string(legacy=True),
+            )
+        )
+
         with self.connect() as conn:
             conn.execute(asset_key_delete)
+            conn.execute(summary_delete)
             results = conn.execute(event_query).fetchall()
 
         for row_id, json_str in results:
             try:
-                event_record = deserialize_json_to_dagster_namedtuple(json_str)
+                event_record = deserialize_dagster_namedtuple(json_str)
                 if not isinstance(event_record, EventRecord):
                     continue
 
@@ -694,3 +1491,118 @@ def wipe_asset(self, asset_key):
 
             except seven.JSONDecodeError:
                 logging.warning("Could not parse asset event record id `{}`.".format(row_id))
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _asset_key_strs(asset_keys):
+    """The strings an asset key may have been stored as, in both the current and legacy formats."""
+    asset_key_strs = []
+    for asset_key in asset_keys:
+        asset_key_strs.extend([asset_key.to_string(), asset_key.to_string(legacy=True)])
+    return asset_key_strs
+
+
+def _deserialize_asset_event_record(row_id, json_str):
+    try:
+        event_record = deserialize_dagster_namedtuple(json_str)
+    except seven.JSONDecodeError:
+        logging.warning("Could not parse asset event record id `{}`.".format(row_id))
+        return None
+
+    if not isinstance(event_record, EventRecord):
+        logging.warning(
+            "Could not resolve asset event record as EventRecord for id `{}`.".format(row_id)
+        )
+        return None
+
+    return event_record
+
+
+def _add_latest_materialization(latest_materializations, event_record):
+    """Adds a materialization event to a dict of the latest materialization of each asset, keyed by
+    asset key string, unless a more recent materialization of the same asset is already there."""
+    if not event_record or not event_record.is_dagster_event:
+        return
+
+    asset_key = event_record.dagster_event.asset_key
+    if not asset_key:
+        return
+
+    existing = latest_materializations.get(asset_key.to_string())
+    if existing is None or existing.timestamp <= event_record.timestamp:
+        latest_materializations[asset_key.to_string()] = event_record
+
+
+def _update_asset_key_if_newer(asset_key_str, values):
+    """Updates the latest materialization of an asset in the asset key table, unless the table
+    already holds a more recent one."""
+    return (
+        AssetKeyTable.update()  # pylint: disable=no-value-for-parameter
+        .where(AssetKeyTable.c.asset_key == asset_key_str)
+        .where(
+            db.or_(
+                AssetKeyTable.c.last_materialization_timestamp == None,
+                AssetKeyTable.c.last_materialization_timestamp
+                <= values["last_materialization_timestamp"],
+            )
+        )
+        .values(**values)
+    )
+
+
+def _upsert_summary_row(conn, table, where_clauses, insert_values, values):
+    """Updates a summary row in place, creating it first if it does not exist yet."""
+    update_statement = table.update().values(**values)  # pylint: disable=no-value-for-parameter
+    for where_clause in where_clauses:
+        update_statement = update_statement.where(where_clause)
+
+    if conn.execute(update_statement).rowcount == 0:
+        try:
+            conn.execute(
+                table.insert().values(**insert_values)  # pylint: disable=no-value-for-parameter
+            )
+        except db.exc.IntegrityError:
+            # another writer created the row first
+            pass
+        conn.execute(update_statement)
+
+
+def _changes_run_stats(event):
+    """Whether storing an event changes the run or step stats of its run."""
+    if not event.is_dagster_event:
+        return False
+
+    event_type_value = event.dagster_event.event_type_value
+    return event_type_value in RUN_STATS_EVENT_TYPES or bool(
+        event.dagster_event.step_key and event_type_value in STEP_STATS_EVENT_TYPES
+    )
+
+
+def _step_stats_values_for_event(event_type_value, timestamp):
+    if event_type_value == DagsterEventType.STEP_START.value:
+        return {
+            "start_time": timestamp,
+            # the attempt count is the number of restarts, plus the initial start of the step
+            "attempts": db.case(
+                [
+                    (
+                        StepStatsTable.c.start_time == None,
+                        db.func.coalesce(StepStatsTable.c.attempts, 0) + 1,
+                    )
+                ],
+                else_=StepStatsTable.c.attempts,
+            ),
+        }
+    if event_type_value == DagsterEventType.STEP_RESTARTED.value:
+        return {"attempts": db.func.coalesce(StepStatsTable.c.attempts, 0) + 1}
+    if event_type_value == DagsterEventType.STEP_SUCCESS.value:
+        return {"end_time": timestamp, "status": StepEventStatus.SUCCESS.value}
+    if event_type_value == DagsterEventType.STEP_FAILURE.value:
+        return {"end_time": timestamp, "status": StepEventStatus.FAILURE.value}
+    if event_type_value == DagsterEventType.STEP_SKIPPED.value:
+        return {"end_time": timestamp, "status": StepEventStatus.SKIPPED.value}
+    check.failed("Unexpected step stats event type {}".format(event_type_value))
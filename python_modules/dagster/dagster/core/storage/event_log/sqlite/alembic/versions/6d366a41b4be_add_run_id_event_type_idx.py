@@ -0,0 +1,42 @@
+"""add run_id, dagster_event_type composite idx
+
+Revision ID: 6d366a41b4be
+Revises: fbf78758be44
+Create Date: 2026-10-18 11:02:13.601254
+
+"""
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = "6d366a41b4be"
+down_revision = "fbf78758be44"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+    if "event_logs" in has_tables:
+        indices = [x.get("name") for x in inspector.get_indexes("event_logs")]
+        if not "idx_run_id_event_type" in indices:
+            op.create_index(
+                "idx_run_id_event_type",
+                "event_logs",
+                ["run_id", "dagster_event_type", "id"],
+                unique=False,
+            )
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+    if "event_logs" in has_tables:
+        indices = [x.get("name") for x in inspector.get_indexes("event_logs")]
+        if "idx_run_id_event_type" in indices:
+            op.drop_index("idx_run_id_event_type", "event_logs")
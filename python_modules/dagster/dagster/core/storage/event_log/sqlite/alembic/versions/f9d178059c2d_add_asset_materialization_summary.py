@@ -0,0 +1,41 @@
+"""add asset materialization summary table
+
+Revision ID: f9d178059c2d
+Revises: 6d366a41b4be
+Create Date: 2026-10-18 15:02:17.406522
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from dagster.core.storage.migration.utils import has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = "f9d178059c2d"
+down_revision = "6d366a41b4be"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # the summary table lives alongside the event log
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("asset_materialization_summary"):
+        op.create_table(
+            "asset_materialization_summary",
+            sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column("asset_key", sa.String, unique=True, nullable=False),
+            sa.Column("materialization_count", sa.Integer, nullable=False),
+            sa.Column("first_timestamp", sa.types.TIMESTAMP),
+            sa.Column("last_timestamp", sa.types.TIMESTAMP),
+            sa.Column("last_materialization", sa.Text),
+        )
+
+
+def downgrade():
+    if has_table("asset_materialization_summary"):
+        op.drop_table("asset_materialization_summary")
@@ -2,7 +2,7 @@
 from collections import defaultdict
 from contextlib import contextmanager
 
-from dagster import StringSource, check
+from dagster import Field, StringSource, check
 from dagster.core.storage.pipeline_run import PipelineRunStatus
 from dagster.core.storage.sql import (
     check_alembic_revision,
@@ -20,7 +20,11 @@
 from watchdog.observers import Observer
 
 from ..schema import SqlEventLogStorageMetadata
-from ..sql_event_log import AssetAwareSqlEventLogStorage
+from ..sql_event_log import (
+    SECONDARY_INDEX_ASSET_LAST_MATERIALIZATION,
+    SECONDARY_INDEX_RUN_STATS,
+    AssetAwareSqlEventLogStorage,
+)
 
 SQLITE_EVENT_LOG_FILENAME = "event_log"
 
@@ -43,13 +47,15 @@ class ConsolidatedSqliteEventLogStorage(AssetAwareSqlEventLogStorage, Configurab
           config:
             base_dir: /path/to/dir
 
-    The ``base_dir`` param tells the event log storage where on disk to store the database.
+    The ``base_dir`` param tells the event log storage where on disk to store the database. Set the
+    optional ``compress_events`` param to store events in a compressed encoding.
     """
 
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(self, base_dir, inst_data=None, compress_events=False):
         self._base_dir = check.str_param(base_dir, "base_dir")
         self._conn_string = create_db_conn_string(base_dir, SQLITE_EVENT_LOG_FILENAME)
-        self._secondary_index_cache = {}
+        self._compress_events = check.bool_param(compress_events, "compress_events")
+        self._secondary_index_cache = set()
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self._watchdog = None
         self._watchers = defaultdict(dict)
@@ -58,14 +64,25 @@ def __init__(self, base_dir, inst_data=None):
 
         if not os.path.exists(self.get_db_path()):
             self._init_db()
+        else:
+            # create any summary tables added since the database was created
+            engine = create_engine(self._conn_string, poolclass=NullPool)
+            SqlEventLogStorageMetadata.create_all(engine)
 
     @property
     def inst_data(self):
         return self._inst_data
 
+    @property
+    def compress_events(self):
+        return self._compress_events
+
     @classmethod
     def config_type(cls):
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "compress_events": Field(bool, is_required=False, default_value=False),
+        }
 
     @staticmethod
     def from_config_value(inst_data, config_value):
@@ -82,6 +99,11 @@ def _init_db(self):
         if not (db_revision and head_revision):
             stamp_alembic_rev(alembic_config, engine)
 
+        # A new database has had its summary tables maintained from its first event, so there is
+        # nothing to backfill
+        self.enable_secondary_index(SECONDARY_INDEX_RUN_STATS)
+        self.enable_secondary_index(SECONDARY_INDEX_ASSET_LAST_MATERIALIZATION)
+
     @contextmanager
     def connect(self, run_id=None):
         engine = create_engine(self._conn_string, poolclass=NullPool)
@@ -104,17 +126,24 @@ def upgrade(self):
         with self.connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
 
+    def compact(self):
+        engine = create_engine(self._conn_string, poolclass=NullPool)
+        engine.execute("VACUUM")
+        engine.execute("ANALYZE")
+        engine.dispose()
+
     def has_secondary_index(self, name, run_id=None):
+        # an index is never disabled once enabled, but may be enabled by another process, so only
+        # enabled indexes are cached
         if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                ConsolidatedSqliteEventLogStorage, self
-            ).has_secondary_index(name, run_id)
-        return self._secondary_index_cache[name]
+            if not super(ConsolidatedSqliteEventLogStorage, self).has_secondary_index(name, run_id):
+                return False
+            self._secondary_index_cache.add(name)
+        return True
 
     def enable_secondary_index(self, name, run_id=None):
         super(ConsolidatedSqliteEventLogStorage, self).enable_secondary_index(name)
-        if name in self._secondary_index_cache:
-            del self._secondary_index_cache[name]
+        self._secondary_index_cache.add(name)
 
     def watch(self, run_id, start_cursor, callback):
         if not self._watchdog:
@@ -1,14 +1,16 @@
+import bisect
 import glob
 import logging
 import os
 import sqlite3
 import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
+from datetime import datetime
 
 import sqlalchemy as db
-from dagster import StringSource, check
+from dagster import Field, StringSource, check
 from dagster.core.storage.pipeline_run import PipelineRunStatus
 from dagster.core.storage.sql import (
     check_alembic_revision,
@@ -21,13 +23,24 @@
 from dagster.core.storage.sqlite import create_db_conn_string
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import mkdir_p
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 from tqdm import tqdm
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
-from ..schema import SqlEventLogStorageMetadata
-from ..sql_event_log import SqlEventLogStorage
+from ..base import EventLogRetentionPolicy
+from ..schema import SecondaryIndexMigrationTable, SqlEventLogStorageMetadata
+from ..sql_event_log import SECONDARY_INDEX_RUN_STATS, SqlEventLogStorage
+
+# The number of run databases this process holds an open connection to
+MAX_CACHED_RUN_ENGINES = 32
+
+# In WAL mode, synchronous=NORMAL is safe from corruption, and only syncs on checkpoints rather than
+# on every commit
+SQLITE_SYNCHRONOUS = "NORMAL"
+
+# How long a connection waits on the lock held by another writer to the same run database
+SQLITE_BUSY_TIMEOUT_MS = 10000
 
 
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
@@ -52,14 +65,16 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     The ``base_dir`` param tells the event log storage where on disk to store the databases. To
     improve concurrent performance, event logs are stored in a separate SQLite database for each
-    run.
+    run. Set the optional ``compress_events`` param to store events in a compressed encoding,
+    which takes a fraction of the disk space of the default JSON encoding.
     """
 
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(self, base_dir, inst_data=None, compress_events=False):
         """Note that idempotent initialization of the SQLite database is done on a per-run_id
         basis in the body of connect, since each run is stored in a separate database."""
         self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
         mkdir_p(self._base_dir)
+        self._compress_events = check.bool_param(compress_events, "compress_events")
 
         self._watchers = defaultdict(dict)
         self._obs = Observer()
@@ -70,8 +85,24 @@ def __init__(self, base_dir, inst_data=None):
         # ensuring that the database will be created if it doesn't exist
         self._initialized_dbs = set()
 
-        # Ensure that multiple threads (like the event log watcher) interact safely with each other
-        self._db_lock = threading.Lock()
+        # Engines for the most recently used run databases, each holding a single connection, along
+        # with a lock ensuring that multiple threads (like the event log watcher) take turns using
+        # it. Runs' databases are locked independently, so that runs can store events in parallel.
+        self._run_engines = OrderedDict()
+        self._run_engines_lock = threading.Lock()
+        self._run_engines_pid = os.getpid()
+
+        # Secondary indexes are tracked in each run's database; cache the (name, run_id) pairs
+        # known to be enabled, since an index is never disabled once enabled
+        self._secondary_index_cache = set()
+
+        # The run databases which retention has deleted events from since they were last compacted
+        self._run_ids_to_compact = set()
+
+        # The last run database that retention has finished with in its current pass over the runs,
+        # so that each batch resumes where the previous one stopped instead of opening every run
+        # database again from the first run
+        self._retention_cursor = None
 
     def upgrade(self):
         all_run_ids = self.get_all_run_ids()
@@ -91,9 +122,16 @@ def upgrade(self):
     def inst_data(self):
         return self._inst_data
 
+    @property
+    def compress_events(self):
+        return self._compress_events
+
     @classmethod
     def config_type(cls):
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "compress_events": Field(bool, is_required=False, default_value=False),
+        }
 
     @staticmethod
     def from_config_value(inst_data, config_value):
@@ -110,7 +148,7 @@ def conn_string_for_run_id(self, run_id):
         check.str_param(run_id, "run_id")
         return create_db_conn_string(self._base_dir, run_id)
 
-    def _initdb(self, engine):
+    def _initdb(self, engine, is_new_db=False):
         alembic_config = get_alembic_config(__file__)
 
         retry_limit = 10
@@ -126,6 +164,11 @@ def _initdb(self, engine):
                 if not (db_revision and head_revision):
                     stamp_alembic_rev(alembic_config, engine)
 
+                if is_new_db:
+                    # A new database has had its summary tables maintained from its first event,
+                    # so there is nothing to backfill
+                    self._enable_secondary_index_for_new_db(engine, SECONDARY_INDEX_RUN_STATS)
+
                 break
             except (db.exc.DatabaseError, sqlite3.DatabaseError, sqlite3.OperationalError) as exc:
                 # This is SQLite-specific handling for concurrency issues that can arise when
@@ -138,6 +181,9 @@ def _initdb(self, engine):
                     "table asset_keys already exists" in err_msg
                     or "table secondary_indexes already exists" in err_msg
                     or "table event_logs already exists" in err_msg
+                    or "table run_stats already exists" in err_msg
+                    or "table step_stats already exists" in err_msg
+                    or "table asset_materialization_summary already exists" in err_msg
                     or "database is locked" in err_msg
                     or "table alembic_version already exists" in err_msg
                     or "UNIQUE constraint failed: alembic_version.version_num" in err_msg
@@ -158,14 +204,13 @@ def _initdb(self, engine):
 
     @contextmanager
     def connect(self, run_id=None):
-        with self._db_lock:
-            check.str_param(run_id, "run_id")
-
-            conn_string = self.conn_string_for_run_id(run_id)
-            engine = create_engine(conn_string, poolclass=NullPool)
+        check.str_param(run_id, "run_id")
 
+        engine, lock = self._get_run_engine(run_id)
+        with lock:
             if not run_id in self._initialized_dbs:
-                self._initdb(engine)
+                is_new_db = not os.path.exists(self.path_for_run_id(run_id))
+                self._initdb(engine, is_new_db=is_new_db)
                 self._initialized_dbs.add(run_id)
 
             conn = engine.connect()
@@ -179,15 +224,138 @@ def connect(self, run_id=None):
                     yield conn
             finally:
                 conn.close()
-            engine.dispose()
+
+    def _get_run_engine(self, run_id):
+        with self._run_engines_lock:
+            if self._run_engines_pid != os.getpid():
+                # connections inherited from the parent process of a fork must not be reused
+                self._run_engines = OrderedDict()
+                self._run_engines_pid = os.getpid()
+
+            if run_id in self._run_engines:
+                self._run_engines.move_to_end(run_id)
+                return self._run_engines[run_id]
+
+            engine_and_lock = (
+                _create_run_engine(self.conn_string_for_run_id(run_id)),
+                threading.Lock(),
+            )
+            self._run_engines[run_id] = engine_and_lock
+
+            evicted = []
+            while len(self._run_engines) > MAX_CACHED_RUN_ENGINES:
+                evicted.append(self._run_engines.popitem(last=False)[1])
+
+        for engine, lock in evicted:
+            _dispose_run_engine(engine, lock)
+
+        return engine_and_lock
+
+    def _dispose_run_engines(self):
+        with self._run_engines_lock:
+            run_engines = list(self._run_engines.values())
+            self._run_engines = OrderedDict()
+
+        for engine, lock in run_engines:
+            _dispose_run_engine(engine, lock)
+
+    def _enable_secondary_index_for_new_db(self, engine, name):
+        try:
+            engine.execute(
+                SecondaryIndexMigrationTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    name=name, migration_completed=datetime.now(),
+                )
+            )
+        except db.exc.IntegrityError:
+            # another process initialized the database concurrently
+            pass
 
     def has_secondary_index(self, name, run_id=None):
-        return False
+        # Each run is stored in a separate database, so secondary indexes are tracked per run
+        if run_id is None:
+            return False
+
+        if (name, run_id) not in self._secondary_index_cache:
+            if not super(SqliteEventLogStorage, self).has_secondary_index(name, run_id):
+                return False
+            self._secondary_index_cache.add((name, run_id))
+
+        return True
 
     def enable_secondary_index(self, name, run_id=None):
-        pass
+        if run_id is None:
+            return
+
+        super(SqliteEventLogStorage, self).enable_secondary_index(name, run_id)
+
+    def reindex(self, print_fn=lambda _: None, force=False):
+        run_ids = [
+            run_id
+            for run_id in self.get_all_run_ids()
+            if force or not self.has_secondary_index(SECONDARY_INDEX_RUN_STATS, run_id)
+        ]
+        if not run_ids:
+            print_fn("Skipping already reindexed summary: {}".format(SECONDARY_INDEX_RUN_STATS))
+            return
+
+        print_fn(
+            "Starting reindex: {name} for {n_runs} runs".format(
+                name=SECONDARY_INDEX_RUN_STATS, n_runs=len(run_ids)
+            )
+        )
+        n_unfinished = 0
+        for run_id in tqdm(run_ids):
+            # runs that have not finished keep reading their stats from the event log, and are
+            # picked up by a later reindex
+            if self.rebuild_run_stats(run_id):
+                self.enable_secondary_index(SECONDARY_INDEX_RUN_STATS, run_id)
+            else:
+                n_unfinished += 1
+        if n_unfinished:
+            print_fn("Skipped {} runs that have not finished".format(n_unfinished))
+        print_fn("Finished reindexing: {}".format(SECONDARY_INDEX_RUN_STATS))
+
+    def delete_expired_events(self, retention_policy, limit):
+        check.inst_param(retention_policy, "retention_policy", EventLogRetentionPolicy)
+        check.int_param(limit, "limit")
+
+        run_ids = sorted(self.get_all_run_ids())
+        if self._retention_cursor is not None:
+            run_ids = run_ids[bisect.bisect_right(run_ids, self._retention_cursor) :]
+
+        deleted = 0
+        for run_id in run_ids:
+            deleted_for_run = self._delete_expired_events(
+                retention_policy, limit - deleted, run_id=run_id
+            )
+            if deleted_for_run:
+                self._run_ids_to_compact.add(run_id)
+            deleted += deleted_for_run
+
+            if deleted >= limit:
+                # the run may have more expired events, so the next batch starts from it
+                return deleted
+
+            self._retention_cursor = run_id
+
+        # the pass over the runs is complete, and the next one starts from the first run
+        self._retention_cursor = None
+        return deleted
+
+    def compact(self):
+        run_ids = self._run_ids_to_compact
+        self._run_ids_to_compact = set()
+        for run_id in run_ids:
+            if not os.path.exists(self.path_for_run_id(run_id)):
+                continue
+
+            with self.connect(run_id) as conn:
+                conn.execute("VACUUM")
+                conn.execute("ANALYZE")
 
     def wipe(self):
+        self._dispose_run_engines()
+
         for filename in (
             glob.glob(os.path.join(self._base_dir, "*.db"))
             + glob.glob(os.path.join(self._base_dir, "*.db-wal"))
@@ -196,6 +364,12 @@ def wipe(self):
             os.unlink(filename)
 
         self._initialized_dbs = set()
+        self._secondary_index_cache = set()
+        self._run_ids_to_compact = set()
+        self._retention_cursor = None
+
+    def dispose(self):
+        self._dispose_run_engines()
 
     def watch(self, run_id, start_cursor, callback):
         watchdog = SqliteEventLogStorageWatchdog(self, run_id, callback, start_cursor)
@@ -211,6 +385,32 @@ def end_watch(self, run_id, handler):
             del self._watchers[run_id][handler]
 
 
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous={};".format(SQLITE_SYNCHRONOUS))
+    cursor.execute("PRAGMA busy_timeout={};".format(SQLITE_BUSY_TIMEOUT_MS))
+    cursor.close()
+
+
+def _create_run_engine(conn_string):
+    # The single connection of the engine is only used by one thread at a time, guarded by the lock
+    # for the run's database, so may be shared between threads
+    engine = create_engine(
+        conn_string, poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    db.event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def _dispose_run_engine(engine, lock):
+    # an engine still in use is closed once it is garbage collected instead
+    if lock.acquire(False):
+        try:
+            engine.dispose()
+        finally:
+            lock.release()
+
+
 class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
     def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
         self._event_log_storage = check.inst_param(
@@ -219,8 +419,13 @@ def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
         self._run_id = check.str_param(run_id, "run_id")
         self._cb = check.callable_param(callback, "callback")
         self._log_path = event_log_storage.path_for_run_id(run_id)
+        # connections to the run database are held open, so new events are written to its
+        # write-ahead log until it is checkpointed
+        self._wal_path = self._log_path + "-wal"
         self._cursor = start_cursor if start_cursor is not None else -1
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
+        super(SqliteEventLogStorageWatchdog, self).__init__(
+            patterns=[self._log_path, self._wal_path], **kwargs
+        )
 
     def _process_log(self):
         events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
@@ -232,5 +437,5 @@ def _process_log(self):
                 self._event_log_storage.end_watch(self._run_id, self._cb)
 
     def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
+        check.invariant(event.src_path in (self._log_path, self._wal_path))
         self._process_log()
@@ -46,6 +46,15 @@ def copy_intermediate_from_run(self, context, run_id, step_output_handle):
     def is_persistent(self):
         pass
 
+    def rm_intermediate(self, context, step_output_handle):
+        check.not_implemented(
+            "{} does not support removing intermediates".format(self.__class__.__name__)
+        )
+
+    def get_intermediate_size(self, context, step_output_handle):
+        """The size in bytes of an intermediate, which may be approximate, or None if it is not known."""
+        return None
+
     def all_inputs_covered(self, context, step):
         return len(self.get_missing_input_sources(context, step)) == 0
 
@@ -235,6 +244,15 @@ def rm_intermediate(self, context, step_output_handle):
             object_store_name=self.object_store.name,
         )
 
+    def get_intermediate_size(self, context, step_output_handle):
+        check.opt_inst_param(context, "context", SystemExecutionContext)
+        check.inst_param(step_output_handle, "step_output_handle", StepOutputHandle)
+        paths = self._get_paths(step_output_handle)
+        check.param_invariant(len(paths) > 0, "paths")
+        key = self.object_store.key_for_paths([self.root] + paths)
+
+        return self.object_store.get_object_size(key)
+
     def copy_intermediate_from_run(self, context, run_id, step_output_handle):
         check.opt_inst_param(context, "context", SystemExecutionContext)
         check.str_param(run_id, "run_id")
@@ -357,6 +375,82 @@ def root(self):
         return self.root_for_run_id(self.run_id)
 
 
+class InMemoryHandoffIntermediateStorage(IntermediateStorage):
+    """Wraps the intermediate storage of a run to hand the values of some step outputs over to the
+    steps consuming them in memory, as when those steps execute in the same process.
+
+    The values are still written through to the wrapped storage, so that they remain available to
+    re-execution and to steps retried elsewhere, but they are never read back from it.
+
+    Args:
+        intermediate_storage (IntermediateStorage): The storage to write through to.
+        step_output_handles (List[StepOutputHandle]): The outputs to keep the values of in memory.
+    """
+
+    def __init__(self, intermediate_storage, step_output_handles):
+        self.intermediate_storage = check.inst_param(
+            intermediate_storage, "intermediate_storage", IntermediateStorage
+        )
+        self.step_output_handles = set(
+            check.list_param(step_output_handles, "step_output_handles", of_type=StepOutputHandle)
+        )
+        self._values = {}
+
+    def get_intermediate(self, context, dagster_type=None, step_output_handle=None):
+        if step_output_handle not in self._values:
+            return self.intermediate_storage.get_intermediate(
+                context, dagster_type=dagster_type, step_output_handle=step_output_handle
+            )
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.GET_OBJECT,
+            key="/".join(
+                ["intermediates", step_output_handle.step_key, step_output_handle.output_name]
+            ),
+            dest_key=None,
+            obj=self._values[step_output_handle],
+            object_store_name="memory",
+        )
+
+    def set_intermediate(
+        self, context, dagster_type=None, step_output_handle=None, value=None, version=None
+    ):
+        if step_output_handle in self.step_output_handles:
+            self._values[step_output_handle] = value
+
+        return self.intermediate_storage.set_intermediate(
+            context,
+            dagster_type=dagster_type,
+            step_output_handle=step_output_handle,
+            value=value,
+            version=version,
+        )
+
+    def has_intermediate(self, context, step_output_handle):
+        return step_output_handle in self._values or self.intermediate_storage.has_intermediate(
+            context, step_output_handle
+        )
+
+    def has_intermediate_at_address(self, address=None):
+        return self.intermediate_storage.has_intermediate_at_address(address)
+
+    def rm_intermediate(self, context, step_output_handle):
+        self._values.pop(step_output_handle, None)
+        return self.intermediate_storage.rm_intermediate(context, step_output_handle)
+
+    def get_intermediate_size(self, context, step_output_handle):
+        return self.intermediate_storage.get_intermediate_size(context, step_output_handle)
+
+    def copy_intermediate_from_run(self, context, run_id, step_output_handle):
+        return self.intermediate_storage.copy_intermediate_from_run(
+            context, run_id, step_output_handle
+        )
+
+    @property
+    def is_persistent(self):
+        return self.intermediate_storage.is_persistent
+
+
 def _object_store_operation_error_message(
     op, step_output_handle, object_store_name, serialization_strategy_name
 ):
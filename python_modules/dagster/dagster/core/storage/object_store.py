@@ -1,6 +1,8 @@
 import logging
 import os
 import shutil
+import sys
+import types
 from abc import ABCMeta, abstractmethod
 
 import six
@@ -70,9 +72,51 @@ def key_for_paths(self, path_fragments):
         """Joins path fragments into a key using the object-store specific path separator."""
         return self.sep.join(path_fragments)
 
+    def get_object_size(self, key):
+        """Override this method to report the size in bytes of an object in the object store, which
+        may be approximate, e.g. for objects held in memory rather than serialized.
+
+        Returns:
+            Optional[int]: The size of the object, or None if it is not known.
+        """
+        check.str_param(key, "key")
+        return None
+
 
 DEFAULT_SERIALIZATION_STRATEGY = PickleSerializationStrategy()
 
+# the most values that are walked to measure the size of an object held in memory
+MAX_SIZED_VALUES = 100000
+
+
+def _approximate_size(obj):
+    size = 0
+    seen = set()
+    to_visit = [obj]
+    while to_visit:
+        value = to_visit.pop()
+        if id(value) in seen:
+            continue
+        if len(seen) >= MAX_SIZED_VALUES:
+            return None
+        seen.add(id(value))
+
+        size += sys.getsizeof(value)
+        if isinstance(value, dict):
+            to_visit.extend(value.keys())
+            to_visit.extend(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            to_visit.extend(value)
+        elif (
+            hasattr(value, "__dict__")
+            and not isinstance(value, (type, types.ModuleType))
+            # values that report their own size, e.g. dataframes, already include their contents
+            and type(value).__sizeof__ is object.__sizeof__
+        ):
+            to_visit.append(vars(value))
+
+    return size
+
 
 class InMemoryObjectStore(ObjectStore):
     def __init__(self):
@@ -110,6 +154,20 @@ def cp_object(self, src, dst):
         self.values[dst] = self.values[src]
         return src, dst
 
+    def get_object_size(self, key):
+        """The approximate size in bytes of an object held in memory: the sizes of the object and of
+        the containers, attributes and values reachable from it, each counted once.
+
+        Returns:
+            Optional[int]: The approximate size of the object, or None if it is not present or is
+                made up of too many values to measure.
+        """
+        check.str_param(key, "key")
+        if not self.has_object(key):
+            return None
+
+        return _approximate_size(self.values[key])
+
     def uri_for_key(self, key, protocol=None):
         check.str_param(key, "key")
         return key
@@ -175,6 +233,19 @@ def cp_object(self, src, dst):
 
         return src, dst
 
+    def get_object_size(self, key):
+        check.str_param(key, "key")
+
+        if os.path.isfile(key):
+            return os.path.getsize(key)
+        elif os.path.isdir(key):
+            return sum(
+                os.path.getsize(os.path.join(dirpath, filename))
+                for dirpath, _, filenames in os.walk(key)
+                for filename in filenames
+            )
+        return None
+
     def uri_for_key(self, key, protocol=None):
         check.str_param(key, "key")
         protocol = check.opt_str_param(protocol, "protocol", default="file://")
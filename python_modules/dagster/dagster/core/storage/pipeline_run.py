@@ -324,9 +324,31 @@ def tags_for_partition_set(partition_set, partition):
 
 @whitelist_for_serdes
 class PipelineRunsFilter(
-    namedtuple("_PipelineRunsFilter", "run_ids pipeline_name statuses tags snapshot_id")
+    namedtuple(
+        "_PipelineRunsFilter",
+        "run_ids pipeline_name statuses tags snapshot_id "
+        "started_after started_before ended_after ended_before",
+    )
 ):
-    def __new__(cls, run_ids=None, pipeline_name=None, statuses=None, tags=None, snapshot_id=None):
+    """Filters for the runs returned from run storage.
+
+    The time range filters take unix timestamps, and match the times at which runs started and
+    ended, as recorded in run storage. Runs that have not started (or ended) never match a filter
+    on their start (or end) time.
+    """
+
+    def __new__(
+        cls,
+        run_ids=None,
+        pipeline_name=None,
+        statuses=None,
+        tags=None,
+        snapshot_id=None,
+        started_after=None,
+        started_before=None,
+        ended_after=None,
+        ended_before=None,
+    ):
         return super(PipelineRunsFilter, cls).__new__(
             cls,
             run_ids=check.opt_list_param(run_ids, "run_ids", of_type=str),
@@ -334,6 +356,10 @@ def __new__(cls, run_ids=None, pipeline_name=None, statuses=None, tags=None, sna
             statuses=check.opt_list_param(statuses, "statuses", of_type=PipelineRunStatus),
             tags=check.opt_dict_param(tags, "tags", key_type=str, value_type=str),
             snapshot_id=check.opt_str_param(snapshot_id, "snapshot_id"),
+            started_after=check.opt_numeric_param(started_after, "started_after"),
+            started_before=check.opt_numeric_param(started_before, "started_before"),
+            ended_after=check.opt_numeric_param(ended_after, "ended_after"),
+            ended_before=check.opt_numeric_param(ended_before, "ended_before"),
         )
 
     @staticmethod
@@ -1,4 +1,5 @@
 from .base import RunStorage
+from .cached_run_storage import CachedRunStorage, RunStorageCacheStats
 from .in_memory import InMemoryRunStorage
 from .schema import RunStorageSqlMetadata
 from .sql_run_storage import SqlRunStorage
@@ -27,12 +27,14 @@ def add_run(self, pipeline_run):
         """
 
     @abstractmethod
-    def handle_run_event(self, run_id, event):
+    def handle_run_event(self, run_id, event, timestamp=None):
         """Update run storage in accordance to a pipeline run related DagsterEvent
 
         Args:
             run_id (str)
             event (DagsterEvent)
+            timestamp (Optional[float]): The unix timestamp of the event, recorded as the start or
+                end time of the run. Defaults to the current time.
         """
 
     @abstractmethod
@@ -238,6 +240,14 @@ def wipe(self):
     def delete_run(self, run_id):
         """Remove a run from storage"""
 
+    def reindex(self, event_storage, print_fn=lambda _: None, force=False):
+        """Backfill any data that run storage denormalizes from the event log, such as the start
+        and end times of runs, for runs stored before run storage maintained it.
+
+        Args:
+            event_storage (EventLogStorage): The event log storage holding the events of the runs.
+        """
+
     def dispose(self):
         """Explicit lifecycle management."""
 
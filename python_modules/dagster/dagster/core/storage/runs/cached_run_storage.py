@@ -0,0 +1,402 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from dagster import check
+from dagster.core.events import DagsterEvent
+from dagster.serdes import serialize_dagster_namedtuple
+from dagster.utils import merge_dicts
+
+from ..pipeline_run import PipelineRun, PipelineRunsFilter
+from .base import RunStorage
+from .sql_run_storage import EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+
+DEFAULT_RUN_STORAGE_CACHE_MAX_ENTRIES = 1000
+DEFAULT_RUN_STORAGE_CACHE_TTL_SECONDS = 5.0
+
+
+class RunStorageCacheStats(namedtuple("_RunStorageCacheStats", "hits misses entries")):
+    """Counters describing the effectiveness of a :py:class:`CachedRunStorage`.
+
+    Args:
+        hits (int): The number of reads served from the cache.
+        misses (int): The number of reads that went to the wrapped run storage.
+        entries (int): The number of results currently held in the cache.
+    """
+
+
+class _CachedQuery(namedtuple("_CachedQuery", "filters result run_ids")):
+    """A cached run query result, along with its filters and the ids of the runs it contains, so
+    that it can be invalidated by writes to the runs it could include."""
+
+
+class _LruTtlCache(object):
+    """A thread-safe mapping bounded both in size, evicting the least recently used entries, and in
+    age, treating entries older than the ttl as missing.
+
+    A value fetched for a missing key is only stored if the key was not invalidated while it was
+    being fetched, since the fetch may have read the data from before the write that invalidated
+    it. Each key being fetched has a generation, bumped when the key is deleted, and the whole cache
+    has a generation, bumped when entries are deleted by predicate or cleared.
+    """
+
+    def __init__(self, max_entries, ttl_seconds):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._fetches = {}  # key -> [number of fetches in flight, generation of the key]
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns a (found, value) tuple."""
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+
+            expires_at, value = self._entries[key]
+            if expires_at <= time.time():
+                del self._entries[key]
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key, value):
+        with self._lock:
+            self._set(key, value)
+
+    def _set(self, key, value):
+        self._entries[key] = (time.time() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def begin_fetch(self, key):
+        """Record that the value of a key is being fetched. Returns the generation to pass to
+        end_fetch once the fetch is done."""
+        with self._lock:
+            fetch = self._fetches.setdefault(key, [0, 0])
+            fetch[0] += 1
+            return (self._generation, fetch[1])
+
+    def end_fetch(self, key, generation, value=None, fetched=True):
+        """Record that a fetch begun with begin_fetch is done, storing the fetched value unless the
+        key was invalidated since the fetch began."""
+        with self._lock:
+            fetch = self._fetches[key]
+            if fetched and generation == (self._generation, fetch[1]):
+                self._set(key, value)
+
+            fetch[0] -= 1
+            if not fetch[0]:
+                del self._fetches[key]
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+            if key in self._fetches:
+                self._fetches[key][1] += 1
+
+    def delete_where(self, predicate):
+        """Delete the entries for which predicate(key, value) is true."""
+        with self._lock:
+            for key in [key for key, (_, value) in self._entries.items() if predicate(key, value)]:
+                del self._entries[key]
+            # the values being fetched are not known yet, so they may match the predicate
+            self._generation += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CachedRunStorage(RunStorage):
+    """Run storage wrapping another run storage with an in-process cache of its reads.
+
+    Runs are cached by run id, and the results of the run list queries are cached by their
+    arguments, along with the ids of the runs they returned. Writes made through this storage
+    invalidate the cache: a change to a single run evicts that run, along with the cached query
+    results that contain it or that it enters or leaves. Writes made by other processes are only
+    picked up once the cached entries expire, so the ttl bounds how stale a read can be.
+
+    Enable it for an instance by adding a block such as the following to your ``dagster.yaml``:
+
+    .. code-block:: YAML
+
+        run_storage_cache:
+          enabled: true
+          max_entries: 1000
+          ttl_seconds: 5
+
+    Args:
+        storage (RunStorage): The run storage to wrap.
+        max_entries (Optional[int]): The maximum number of runs and query results cached.
+        ttl_seconds (Optional[float]): How long a cached result may be served for.
+    """
+
+    def __init__(
+        self,
+        storage,
+        max_entries=DEFAULT_RUN_STORAGE_CACHE_MAX_ENTRIES,
+        ttl_seconds=DEFAULT_RUN_STORAGE_CACHE_TTL_SECONDS,
+    ):
+        self._storage = check.inst_param(storage, "storage", RunStorage)
+        check.int_param(max_entries, "max_entries")
+        check.invariant(max_entries > 0, "max_entries must be positive")
+        check.numeric_param(ttl_seconds, "ttl_seconds")
+
+        self._runs_by_id = _LruTtlCache(max_entries, ttl_seconds)
+        self._queries = _LruTtlCache(max_entries, ttl_seconds)
+
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def storage(self):
+        return self._storage
+
+    def get_cache_stats(self):
+        """Get the hit and miss counters of the cache.
+
+        Returns:
+            RunStorageCacheStats
+        """
+        with self._stats_lock:
+            return RunStorageCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._runs_by_id) + len(self._queries),
+            )
+
+    def _cached(self, cache, key, fetch_fn):
+        found, value = cache.get(key)
+        with self._stats_lock:
+            if found:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if not found:
+            generation = cache.begin_fetch(key)
+            try:
+                value = fetch_fn()
+            except Exception:
+                cache.end_fetch(key, generation, fetched=False)
+                raise
+            cache.end_fetch(key, generation, value)
+
+        # hand out copies of cached lists so that callers cannot mutate the cache
+        return list(value) if isinstance(value, list) else value
+
+    def _cached_query(self, key, filters, fetch_fn, run_ids_fn=None):
+        def _fetch():
+            result = fetch_fn()
+            return _CachedQuery(
+                filters=filters, result=result, run_ids=run_ids_fn(result) if run_ids_fn else None,
+            )
+
+        result = self._cached(self._queries, key, _fetch).result
+        # hand out copies of cached lists so that callers cannot mutate the cache
+        return list(result) if isinstance(result, list) else result
+
+    def _get_cached_or_stored_run(self, run_id):
+        found, run = self._runs_by_id.get(run_id)
+        return run if found else self._storage.get_run_by_id(run_id)
+
+    def _invalidate_run(self, run_id, run_before, run_after):
+        """Evict a run, and the cached query results that a write to it may have changed.
+
+        Args:
+            run_id (str): The id of the written run.
+            run_before (Optional[PipelineRun]): The run before the write, if it existed.
+            run_after (Optional[PipelineRun]): The run after the write, if it still exists.
+        """
+        self._runs_by_id.delete(run_id)
+        self._queries.delete_where(
+            lambda _key, cached_query: _query_may_change(
+                cached_query, run_id, run_before, run_after
+            )
+        )
+
+    def _invalidate_all(self):
+        self._runs_by_id.clear()
+        self._queries.clear()
+
+    @staticmethod
+    def _filters_key(filters):
+        return serialize_dagster_namedtuple(filters) if filters else None
+
+    def add_run(self, pipeline_run):
+        check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+        try:
+            return self._storage.add_run(pipeline_run)
+        finally:
+            self._invalidate_run(pipeline_run.run_id, None, pipeline_run)
+
+    def handle_run_event(self, run_id, event, timestamp=None):
+        check.str_param(run_id, "run_id")
+        check.inst_param(event, "event", DagsterEvent)
+
+        # only the events that change the status of a run are persisted to run storage
+        if event.event_type not in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+            return self._storage.handle_run_event(run_id, event, timestamp)
+
+        run_before = self._get_cached_or_stored_run(run_id)
+        try:
+            return self._storage.handle_run_event(run_id, event, timestamp)
+        finally:
+            self._invalidate_run(
+                run_id,
+                run_before,
+                run_before._replace(status=EVENT_TYPE_TO_PIPELINE_RUN_STATUS[event.event_type])
+                if run_before
+                else None,
+            )
+
+    def get_runs(self, filters=None, cursor=None, limit=None):
+        check.opt_inst_param(filters, "filters", PipelineRunsFilter)
+        return self._cached_query(
+            ("get_runs", self._filters_key(filters), cursor, limit),
+            filters,
+            lambda: self._storage.get_runs(filters, cursor, limit),
+            lambda runs: frozenset(run.run_id for run in runs),
+        )
+
+    def get_runs_count(self, filters=None):
+        check.opt_inst_param(filters, "filters", PipelineRunsFilter)
+        return self._cached_query(
+            ("get_runs_count", self._filters_key(filters)),
+            filters,
+            lambda: self._storage.get_runs_count(filters),
+        )
+
+    def get_run_group(self, run_id):
+        return self._storage.get_run_group(run_id)
+
+    def get_run_groups(self, filters=None, cursor=None, limit=None):
+        check.opt_inst_param(filters, "filters", PipelineRunsFilter)
+        return self._cached_query(
+            ("get_run_groups", self._filters_key(filters), cursor, limit),
+            filters,
+            lambda: self._storage.get_run_groups(filters=filters, cursor=cursor, limit=limit),
+            lambda run_groups: frozenset(
+                [run.run_id for group in run_groups.values() for run in group["runs"]]
+                + list(run_groups.keys())
+            ),
+        )
+
+    def get_run_by_id(self, run_id):
+        check.str_param(run_id, "run_id")
+        return self._cached(self._runs_by_id, run_id, lambda: self._storage.get_run_by_id(run_id))
+
+    def get_run_tags(self):
+        return self._storage.get_run_tags()
+
+    def add_run_tags(self, run_id, new_tags):
+        run_before = self._get_cached_or_stored_run(run_id)
+        try:
+            return self._storage.add_run_tags(run_id, new_tags)
+        finally:
+            self._invalidate_run(
+                run_id,
+                run_before,
+                run_before.with_tags(merge_dicts(run_before.tags, new_tags))
+                if run_before
+                else None,
+            )
+
+    def has_run(self, run_id):
+        return self.get_run_by_id(run_id) is not None
+
+    def has_pipeline_snapshot(self, pipeline_snapshot_id):
+        return self._storage.has_pipeline_snapshot(pipeline_snapshot_id)
+
+    def add_pipeline_snapshot(self, pipeline_snapshot):
+        return self._storage.add_pipeline_snapshot(pipeline_snapshot)
+
+    def get_pipeline_snapshot(self, pipeline_snapshot_id):
+        return self._storage.get_pipeline_snapshot(pipeline_snapshot_id)
+
+    def has_execution_plan_snapshot(self, execution_plan_snapshot_id):
+        return self._storage.has_execution_plan_snapshot(execution_plan_snapshot_id)
+
+    def add_execution_plan_snapshot(self, execution_plan_snapshot):
+        return self._storage.add_execution_plan_snapshot(execution_plan_snapshot)
+
+    def get_execution_plan_snapshot(self, execution_plan_snapshot_id):
+        return self._storage.get_execution_plan_snapshot(execution_plan_snapshot_id)
+
+    def wipe(self):
+        try:
+            return self._storage.wipe()
+        finally:
+            self._invalidate_all()
+
+    def delete_run(self, run_id):
+        run_before = self._get_cached_or_stored_run(run_id)
+        try:
+            return self._storage.delete_run(run_id)
+        finally:
+            self._invalidate_run(run_id, run_before, None)
+
+    def reindex(self, event_storage, print_fn=lambda _: None, force=False):
+        try:
+            return self._storage.reindex(event_storage, print_fn, force)
+        finally:
+            self._invalidate_all()
+
+    def upgrade(self):
+        self._storage.upgrade()
+        self._invalidate_all()
+
+    def dispose(self):
+        self._storage.dispose()
+
+    def optimize_for_dagit(self, statement_timeout):
+        self._storage.optimize_for_dagit(statement_timeout)
+
+
+def _run_matches_filters(run, filters):
+    if not filters:
+        return True
+    if filters.run_ids and run.run_id not in filters.run_ids:
+        return False
+    if filters.pipeline_name and run.pipeline_name != filters.pipeline_name:
+        return False
+    if filters.statuses and run.status not in filters.statuses:
+        return False
+    if filters.snapshot_id and run.pipeline_snapshot_id != filters.snapshot_id:
+        return False
+    return all(run.tags.get(key) == value for key, value in filters.tags.items())
+
+
+def _query_may_change(cached_query, run_id, run_before, run_after):
+    filters = cached_query.filters
+    if filters and (
+        filters.started_after is not None
+        or filters.started_before is not None
+        or filters.ended_after is not None
+        or filters.ended_before is not None
+    ):
+        # the start and end times of a run are only recorded in run storage
+        return True
+
+    if cached_query.run_ids is not None:
+        if run_id in cached_query.run_ids:
+            return True
+        if run_after and run_after.get_root_run_id() in cached_query.run_ids:
+            # a new run joins the group of a run in the result
+            return True
+
+    matched_before = run_before is not None and _run_matches_filters(run_before, filters)
+    matched_after = run_after is not None and _run_matches_filters(run_after, filters)
+
+    # a run that matched the query both before and after the write, and is not in its result,
+    # fell outside the page that was cached, and stays outside it
+    return matched_before != matched_after
@@ -1,3 +1,4 @@
+import time
 from collections import OrderedDict, defaultdict
 
 from dagster import check
@@ -32,6 +33,8 @@ def __init__(self, preload=None):
     def _init_storage(self):
         self._runs = OrderedDict()
         self._run_tags = defaultdict(dict)
+        self._run_start_times = {}
+        self._run_end_times = {}
         self._pipeline_snapshots = OrderedDict()
         self._ep_snapshots = OrderedDict()
 
@@ -55,17 +58,22 @@ def add_run(self, pipeline_run):
 
         return pipeline_run
 
-    def handle_run_event(self, run_id, event):
+    def handle_run_event(self, run_id, event, timestamp=None):
         check.str_param(run_id, "run_id")
         check.inst_param(event, "event", DagsterEvent)
+        check.opt_numeric_param(timestamp, "timestamp")
         run = self._runs[run_id]
+        timestamp = timestamp if timestamp is not None else time.time()
 
         if event.event_type == DagsterEventType.PIPELINE_START:
             self._runs[run_id] = run.with_status(PipelineRunStatus.STARTED)
+            self._run_start_times[run_id] = timestamp
         elif event.event_type == DagsterEventType.PIPELINE_SUCCESS:
             self._runs[run_id] = run.with_status(PipelineRunStatus.SUCCESS)
+            self._run_end_times[run_id] = timestamp
         elif event.event_type == DagsterEventType.PIPELINE_FAILURE:
             self._runs[run_id] = self._runs[run_id].with_status(PipelineRunStatus.FAILURE)
+            self._run_end_times[run_id] = timestamp
         elif event.event_type == DagsterEventType.PIPELINE_ENQUEUED:
             self._runs[run_id] = self._runs[run_id].with_status(PipelineRunStatus.QUEUED)
         elif event.event_type == DagsterEventType.PIPELINE_DEQUEUED:
@@ -97,6 +105,18 @@ def run_filter(run):
             if filters.snapshot_id and filters.snapshot_id != run.pipeline_snapshot_id:
                 return False
 
+            if not _in_time_range(
+                self._run_start_times.get(run.run_id),
+                filters.started_after,
+                filters.started_before,
+            ):
+                return False
+
+            if not _in_time_range(
+                self._run_end_times.get(run.run_id), filters.ended_after, filters.ended_before
+            ):
+                return False
+
             return True
 
         matching_runs = list(filter(run_filter, reversed(self._runs.values())))
@@ -153,6 +173,8 @@ def delete_run(self, run_id):
         del self._runs[run_id]
         if run_id in self._run_tags:
             del self._run_tags[run_id]
+        self._run_start_times.pop(run_id, None)
+        self._run_end_times.pop(run_id, None)
 
     def has_pipeline_snapshot(self, pipeline_snapshot_id):
         check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
@@ -224,3 +246,13 @@ def get_run_groups(self, filters=None, cursor=None, limit=None):
                 run_groups[root_run_id]["count"] += 1
 
         return run_groups
+
+
+def _in_time_range(timestamp, after, before):
+    if after is None and before is None:
+        return True
+
+    if timestamp is None:
+        return False
+
+    return (after is None or timestamp > after) and (before is None or timestamp < before)
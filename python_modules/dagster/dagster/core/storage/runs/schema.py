@@ -17,6 +17,8 @@
     db.Column("run_body", db.String),
     db.Column("create_timestamp", db.DateTime, server_default=db.text("CURRENT_TIMESTAMP")),
     db.Column("update_timestamp", db.DateTime, server_default=db.text("CURRENT_TIMESTAMP")),
+    db.Column("start_time", db.Float),
+    db.Column("end_time", db.Float),
 )
 
 # Secondary Index migration table, used to track data migrations, both for event_logs and runs.
@@ -39,6 +41,11 @@
     db.Column("value", db.String),
 )
 
+db.Index("idx_run_status_id", RunsTable.c.status, RunsTable.c.id)
+db.Index("idx_run_start_time", RunsTable.c.start_time)
+db.Index("idx_run_end_time", RunsTable.c.end_time)
+db.Index("idx_run_update_timestamp", RunsTable.c.update_timestamp)
+
 SnapshotsTable = db.Table(
     "snapshots",
     RunStorageSqlMetadata,
@@ -1,4 +1,5 @@
 import logging
+import time
 import zlib
 from abc import abstractmethod
 from collections import defaultdict
@@ -23,7 +24,22 @@
 
 from ..pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
 from .base import RunStorage
-from .schema import RunTagsTable, RunsTable, SnapshotsTable
+from .schema import RunTagsTable, RunsTable, SecondaryIndexMigrationTable, SnapshotsTable
+
+# The events that change the status of a run, which are the only events persisted to run storage
+EVENT_TYPE_TO_PIPELINE_RUN_STATUS = {
+    DagsterEventType.PIPELINE_START: PipelineRunStatus.STARTED,
+    DagsterEventType.PIPELINE_SUCCESS: PipelineRunStatus.SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE: PipelineRunStatus.FAILURE,
+    DagsterEventType.PIPELINE_ENQUEUED: PipelineRunStatus.QUEUED,
+    DagsterEventType.PIPELINE_DEQUEUED: PipelineRunStatus.NOT_STARTED,
+}
+
+RUN_END_EVENT_TYPES = {DagsterEventType.PIPELINE_SUCCESS, DagsterEventType.PIPELINE_FAILURE}
+
+# Name of the secondary index marking that the start and end times of runs stored before those
+# columns were added have been backfilled from the event log
+SECONDARY_INDEX_RUN_START_END_TIMES = "run_start_end_times"
 
 
 class SnapshotType(Enum):
@@ -97,19 +113,12 @@ def add_run(self, pipeline_run):
 
         return pipeline_run
 
-    def handle_run_event(self, run_id, event):
+    def handle_run_event(self, run_id, event, timestamp=None):
         check.str_param(run_id, "run_id")
         check.inst_param(event, "event", DagsterEvent)
+        check.opt_numeric_param(timestamp, "timestamp")
 
-        lookup = {
-            DagsterEventType.PIPELINE_START: PipelineRunStatus.STARTED,
-            DagsterEventType.PIPELINE_SUCCESS: PipelineRunStatus.SUCCESS,
-            DagsterEventType.PIPELINE_FAILURE: PipelineRunStatus.FAILURE,
-            DagsterEventType.PIPELINE_ENQUEUED: PipelineRunStatus.QUEUED,
-            DagsterEventType.PIPELINE_DEQUEUED: PipelineRunStatus.NOT_STARTED,
-        }
-
-        if event.event_type not in lookup:
+        if event.event_type not in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
             return
 
         run = self.get_run_by_id(run_id)
@@ -117,17 +126,25 @@ def handle_run_event(self, run_id, event):
             # TODO log?
             return
 
-        new_pipeline_status = lookup[event.event_type]
+        new_pipeline_status = EVENT_TYPE_TO_PIPELINE_RUN_STATUS[event.event_type]
+
+        values = {
+            "status": new_pipeline_status.value,
+            "run_body": serialize_dagster_namedtuple(run.with_status(new_pipeline_status)),
+            "update_timestamp": datetime.now(),
+        }
+        # record the time of the event itself, as reindexing does from the event log, rather than
+        # the time at which it was written
+        if event.event_type == DagsterEventType.PIPELINE_START:
+            values["start_time"] = timestamp if timestamp is not None else time.time()
+        elif event.event_type in RUN_END_EVENT_TYPES:
+            values["end_time"] = timestamp if timestamp is not None else time.time()
 
         with self.connect() as conn:
             conn.execute(
                 RunsTable.update()  # pylint: disable=no-value-for-parameter
                 .where(RunsTable.c.run_id == run_id)
-                .values(
-                    status=new_pipeline_status.value,
-                    run_body=serialize_dagster_namedtuple(run.with_status(new_pipeline_status)),
-                    update_timestamp=datetime.now(),
-                )
+                .values(**values)
             )
 
     def _row_to_run(self, row):
@@ -179,6 +196,18 @@ def _add_filters_to_query(self, query, filters):
         if filters.snapshot_id:
             query = query.where(RunsTable.c.snapshot_id == filters.snapshot_id)
 
+        if filters.started_after is not None:
+            query = query.where(RunsTable.c.start_time > filters.started_after)
+
+        if filters.started_before is not None:
+            query = query.where(RunsTable.c.start_time < filters.started_before)
+
+        if filters.ended_after is not None:
+            query = query.where(RunsTable.c.end_time > filters.ended_after)
+
+        if filters.ended_before is not None:
+            query = query.where(RunsTable.c.end_time < filters.ended_before)
+
         return query
 
     def _runs_query(self, filters=None, cursor=None, limit=None, columns=None):
@@ -528,6 +557,63 @@ def _get_snapshot(self, snapshot_id):
 
         return defensively_unpack_pipeline_snapshot_query(logging, row) if row else None
 
+    def has_secondary_index(self, name):
+        """Whether the data migration named by ``name`` has been completed."""
+        query = (
+            db.select([1])
+            .where(SecondaryIndexMigrationTable.c.name == name)
+            .where(SecondaryIndexMigrationTable.c.migration_completed != None)
+            .limit(1)
+        )
+        return len(self.fetchall(query)) > 0
+
+    def enable_secondary_index(self, name):
+        """Mark the data migration named by ``name`` as completed."""
+        with self.connect() as conn:
+            try:
+                conn.execute(
+                    SecondaryIndexMigrationTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        name=name, migration_completed=datetime.now(),
+                    )
+                )
+            except db.exc.IntegrityError:
+                conn.execute(
+                    SecondaryIndexMigrationTable.update()  # pylint: disable=no-value-for-parameter
+                    .where(SecondaryIndexMigrationTable.c.name == name)
+                    .values(migration_completed=datetime.now())
+                )
+
+    def reindex(self, event_storage, print_fn=lambda _: None, force=False):
+        if self.has_secondary_index(SECONDARY_INDEX_RUN_START_END_TIMES) and not force:
+            print_fn(
+                "Skipping already reindexed summary: {}".format(SECONDARY_INDEX_RUN_START_END_TIMES)
+            )
+            return
+
+        print_fn("Starting reindex: {}".format(SECONDARY_INDEX_RUN_START_END_TIMES))
+        query = db.select([RunsTable.c.run_id]).where(
+            db.and_(
+                db.or_(RunsTable.c.start_time == None, RunsTable.c.end_time == None),
+                RunsTable.c.status.notin_(
+                    [PipelineRunStatus.NOT_STARTED.value, PipelineRunStatus.QUEUED.value]
+                ),
+            )
+        )
+        for (run_id,) in self.fetchall(query):
+            stats = event_storage.get_stats_for_run(run_id)
+            with self.connect() as conn:
+                conn.execute(
+                    RunsTable.update()  # pylint: disable=no-value-for-parameter
+                    .where(RunsTable.c.run_id == run_id)
+                    .values(
+                        start_time=db.func.coalesce(RunsTable.c.start_time, stats.start_time),
+                        end_time=db.func.coalesce(RunsTable.c.end_time, stats.end_time),
+                    )
+                )
+
+        self.enable_secondary_index(SECONDARY_INDEX_RUN_START_END_TIMES)
+        print_fn("Finished reindexing: {}".format(SECONDARY_INDEX_RUN_START_END_TIMES))
+
     def wipe(self):
         """Clears the run storage."""
         with self.connect() as conn:
@@ -0,0 +1,59 @@
+"""add run start_time, end_time columns and indexes
+
+Revision ID: 8088ffd18ecd
+Revises: c63a27054f08
+Create Date: 2026-10-18 14:20:41.225130
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from dagster.core.storage.migration.utils import get_inspector, has_column, has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = "8088ffd18ecd"
+down_revision = "c63a27054f08"
+branch_labels = None
+depends_on = None
+
+RUNS_INDEXES = {
+    "idx_run_status_id": ["status", "id"],
+    "idx_run_start_time": ["start_time"],
+    "idx_run_end_time": ["end_time"],
+    "idx_run_update_timestamp": ["update_timestamp"],
+}
+
+
+def upgrade():
+    if not has_table("runs"):
+        return
+
+    if not has_column("runs", "start_time"):
+        op.add_column("runs", sa.Column("start_time", sa.Float))
+
+    if not has_column("runs", "end_time"):
+        op.add_column("runs", sa.Column("end_time", sa.Float))
+
+    indices = [x.get("name") for x in get_inspector().get_indexes("runs")]
+    for index_name, columns in RUNS_INDEXES.items():
+        if not index_name in indices:
+            op.create_index(index_name, "runs", columns, unique=False)
+
+
+def downgrade():
+    if not has_table("runs"):
+        return
+
+    indices = [x.get("name") for x in get_inspector().get_indexes("runs")]
+    for index_name in RUNS_INDEXES:
+        if index_name in indices:
+            op.drop_index(index_name, "runs")
+
+    if has_column("runs", "start_time") or has_column("runs", "end_time"):
+        with op.batch_alter_table("runs") as batch_op:
+            if has_column("runs", "start_time"):
+                batch_op.drop_column("start_time")
+            if has_column("runs", "end_time"):
+                batch_op.drop_column("end_time")
@@ -1,3 +1,4 @@
 from .controller import DagsterDaemonController
 from .daemon import DagsterDaemon, SchedulerDaemon, get_default_daemon_logger
+from .event_log_retention import EventLogRetentionDaemon
 from .run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
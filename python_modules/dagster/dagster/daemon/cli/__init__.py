@@ -3,23 +3,23 @@
 import time
 
 import click
-import pendulum
 from dagster import __version__
 from dagster.core.instance import DagsterInstance
 from dagster.daemon import DagsterDaemonController
 
+LOCATION_CLEANUP_INTERVAL_SECONDS = 30
+
 
 @click.command(
     name="run", help="Run any daemons configured on the DagsterInstance.",
 )
 def run_command():
     with DagsterInstance.get() as instance:
-        controller = DagsterDaemonController(instance)
-
-        while True:
-            curr_time = pendulum.now("UTC")
-            controller.run_iteration(curr_time)
-            time.sleep(0.5)
+        with DagsterDaemonController(instance) as controller:
+            controller.start_daemon_threads()
+            while True:
+                time.sleep(LOCATION_CLEANUP_INTERVAL_SECONDS)
+                controller.cleanup_idle_locations()
 
 
 def create_dagster_daemon_cli():
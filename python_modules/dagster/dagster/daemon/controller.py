@@ -1,9 +1,27 @@
+import threading
+
+from dagster import check
+from dagster.core.host_representation import RepositoryLocationCache
 from dagster.core.run_coordinator import QueuedRunCoordinator
 from dagster.core.scheduler import DagsterDaemonScheduler
 from dagster.daemon.daemon import SchedulerDaemon, SensorDaemon, get_default_daemon_logger
+from dagster.daemon.event_log_retention import (
+    DEFAULT_RETENTION_BATCH_SIZE,
+    DEFAULT_RETENTION_COMPACT_INTERVAL_SECONDS,
+    DEFAULT_RETENTION_COMPACT_MIN_ROWS,
+    DEFAULT_RETENTION_INTERVAL_SECONDS,
+    DEFAULT_RETENTION_MAX_BATCHES_PER_ITERATION,
+    EventLogRetentionDaemon,
+)
 from dagster.daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
 
 
+DEFAULT_EVALUATION_MAX_CONCURRENT = 4
+DEFAULT_EVALUATION_TIMEOUT_SECONDS = 60
+
+DAEMON_THREAD_JOIN_TIMEOUT_SECONDS = 60
+
+
 def _sorted_quoted(strings):
     return "[" + ", ".join(["'{}'".format(s) for s in sorted(list(strings))]) + "]"
 
@@ -14,15 +32,45 @@ def __init__(self, instance):
 
         self._daemons = {}
 
+        # the repository locations of the schedules, sensors and queued runs, shared by the daemons
+        # and kept loaded across their iterations
+        self._location_cache = RepositoryLocationCache()
+
+        self._shutdown_event = threading.Event()
+        self._daemon_threads = []
+
         self._logger = get_default_daemon_logger("dagster-daemon")
 
+        evaluation_settings = instance.get_settings("daemon_evaluation") or {}
+        max_concurrent = evaluation_settings.get(
+            "max_concurrent", DEFAULT_EVALUATION_MAX_CONCURRENT
+        )
+        evaluation_timeout = evaluation_settings.get(
+            "timeout_seconds", DEFAULT_EVALUATION_TIMEOUT_SECONDS
+        )
+
         if isinstance(instance.scheduler, DagsterDaemonScheduler):
             max_catchup_runs = instance.scheduler.max_catchup_runs
             self._add_daemon(
-                SchedulerDaemon(instance, interval_seconds=30, max_catchup_runs=max_catchup_runs)
+                SchedulerDaemon(
+                    instance,
+                    interval_seconds=30,
+                    max_catchup_runs=max_catchup_runs,
+                    location_cache=self._location_cache,
+                    max_concurrent=max_concurrent,
+                    evaluation_timeout=evaluation_timeout,
+                )
             )
 
-        self._add_daemon(SensorDaemon(instance, interval_seconds=30))
+        self._add_daemon(
+            SensorDaemon(
+                instance,
+                interval_seconds=30,
+                location_cache=self._location_cache,
+                max_concurrent=max_concurrent,
+                evaluation_timeout=evaluation_timeout,
+            )
+        )
 
         if isinstance(instance.run_coordinator, QueuedRunCoordinator):
             max_concurrent_runs = instance.run_coordinator.max_concurrent_runs
@@ -32,6 +80,30 @@ def __init__(self, instance):
                     instance,
                     interval_seconds=dequeue_interval_seconds,
                     max_concurrent_runs=max_concurrent_runs,
+                    location_cache=self._location_cache,
+                )
+            )
+
+        retention_policy = instance.event_log_retention_policy
+        if retention_policy:
+            retention_settings = instance.get_settings("event_log_retention")
+            self._add_daemon(
+                EventLogRetentionDaemon(
+                    instance,
+                    interval_seconds=retention_settings.get(
+                        "interval_seconds", DEFAULT_RETENTION_INTERVAL_SECONDS
+                    ),
+                    retention_policy=retention_policy,
+                    batch_size=retention_settings.get("batch_size", DEFAULT_RETENTION_BATCH_SIZE),
+                    max_batches_per_iteration=retention_settings.get(
+                        "max_batches_per_iteration", DEFAULT_RETENTION_MAX_BATCHES_PER_ITERATION
+                    ),
+                    compact_min_rows=retention_settings.get(
+                        "compact_min_rows", DEFAULT_RETENTION_COMPACT_MIN_ROWS
+                    ),
+                    compact_interval_seconds=retention_settings.get(
+                        "compact_interval_seconds", DEFAULT_RETENTION_COMPACT_INTERVAL_SECONDS
+                    ),
                 )
             )
 
@@ -60,4 +132,48 @@ def run_iteration(self, curr_time):
                 (curr_time - daemon.last_iteration_time).total_seconds() >= daemon.interval_seconds
             ):
                 daemon.last_iteration_time = curr_time
-                daemon.run_iteration()
+                daemon.execute_iteration()
+
+        self._location_cache.cleanup_idle()
+
+    def start_daemon_threads(self):
+        """Runs each daemon in a loop on its own thread, so that a daemon with a slow iteration does
+        not hold up the others. The threads are stopped when the controller exits."""
+        check.invariant(not self._daemon_threads, "The daemon threads have already been started")
+
+        for daemon in self.daemons:
+            thread = threading.Thread(
+                target=daemon.run_loop,
+                args=(self._shutdown_event,),
+                name="dagster-daemon-{}".format(type(daemon).__name__),
+            )
+            thread.daemon = True
+            thread.start()
+            self._daemon_threads.append(thread)
+
+    def cleanup_idle_locations(self):
+        self._location_cache.cleanup_idle()
+
+    def daemon_metrics(self):
+        """The iteration count and the last, mean and max iteration durations in seconds of each
+        daemon, keyed by the name of the daemon."""
+        return {
+            name: {
+                "iteration_count": daemon.iteration_count,
+                "last_iteration_duration": daemon.last_iteration_duration,
+                "mean_iteration_duration": daemon.mean_iteration_duration,
+                "max_iteration_duration": daemon.max_iteration_duration,
+            }
+            for name, daemon in self._daemons.items()
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self._shutdown_event.set()
+        for thread in self._daemon_threads:
+            thread.join(timeout=DAEMON_THREAD_JOIN_TIMEOUT_SECONDS)
+        self._daemon_threads = []
+
+        self._location_cache.cleanup()
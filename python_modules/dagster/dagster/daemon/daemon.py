@@ -1,12 +1,16 @@
 import logging
 import sys
+import threading
 from abc import abstractmethod
 
 import pendulum
 from dagster import DagsterInstance, check
+from dagster.core.host_representation import RepositoryLocationCache
 from dagster.scheduler import execute_scheduler_iteration
 from dagster.scheduler.sensor import execute_sensor_iteration
+from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.log import default_format_string
+from dagster.utils.timing import format_duration, time_execution_scope
 
 
 def _mockable_localtime(_):
@@ -29,26 +33,130 @@ def get_default_daemon_logger(daemon_name):
 
 
 class DagsterDaemon:
-    def __init__(self, instance, interval_seconds):
+    def __init__(self, instance, interval_seconds, location_cache=None):
         self._instance = check.inst_param(instance, "instance", DagsterInstance)
         self._logger = get_default_daemon_logger(type(self).__name__)
         self.interval_seconds = check.int_param(interval_seconds, "interval_seconds")
+        self._location_cache = check.opt_inst_param(
+            location_cache, "location_cache", RepositoryLocationCache
+        )
         self.last_iteration_time = None
 
+        self._iteration_count = 0
+        self._last_iteration_duration = None
+        self._max_iteration_duration = None
+        self._total_iteration_duration = 0.0
+
     @abstractmethod
     def run_iteration(self):
         pass
 
+    @property
+    def iteration_count(self):
+        """int: The number of iterations the daemon has run."""
+        return self._iteration_count
+
+    @property
+    def last_iteration_duration(self):
+        """Optional[float]: How long the latest iteration took, in seconds."""
+        return self._last_iteration_duration
+
+    @property
+    def max_iteration_duration(self):
+        """Optional[float]: How long the slowest iteration took, in seconds."""
+        return self._max_iteration_duration
+
+    @property
+    def mean_iteration_duration(self):
+        """Optional[float]: How long the iterations took on average, in seconds."""
+        if not self._iteration_count:
+            return None
+        return self._total_iteration_duration / self._iteration_count
+
+    def execute_iteration(self):
+        """Runs an iteration of the daemon and records how long it took. An iteration that takes
+        longer than the interval of the daemon delays the next one, which is logged as lag."""
+        with time_execution_scope() as timer_result:
+            try:
+                self.run_iteration()
+            except Exception:  # pylint: disable=broad-except
+                self._logger.error(
+                    "Iteration failed: {error_info}".format(
+                        error_info=serializable_error_info_from_exc_info(sys.exc_info()).to_string()
+                    )
+                )
+
+        duration = timer_result.seconds
+        self._iteration_count += 1
+        self._last_iteration_duration = duration
+        self._max_iteration_duration = max(self._max_iteration_duration or 0.0, duration)
+        self._total_iteration_duration += duration
+
+        if duration > self.interval_seconds:
+            self._logger.warning(
+                "Iteration took {duration}, longer than the {interval_seconds} second interval "
+                "of the daemon: the next iteration is {lag} late.".format(
+                    duration=format_duration(duration * 1000),
+                    interval_seconds=self.interval_seconds,
+                    lag=format_duration((duration - self.interval_seconds) * 1000),
+                )
+            )
+
+    def run_loop(self, shutdown_event):
+        """Runs iterations of the daemon every ``interval_seconds``, or as soon as the previous
+        iteration is done if it took longer, until the shutdown event is set."""
+        check.inst_param(shutdown_event, "shutdown_event", threading.Event)
+
+        while not shutdown_event.is_set():
+            self.last_iteration_time = pendulum.now("UTC")
+            self.execute_iteration()
+            shutdown_event.wait(max(0, self.interval_seconds - self._last_iteration_duration))
+
 
 class SchedulerDaemon(DagsterDaemon):
-    def __init__(self, instance, interval_seconds, max_catchup_runs):
-        super(SchedulerDaemon, self).__init__(instance, interval_seconds)
+    def __init__(
+        self,
+        instance,
+        interval_seconds,
+        max_catchup_runs,
+        location_cache=None,
+        max_concurrent=None,
+        evaluation_timeout=None,
+    ):
+        super(SchedulerDaemon, self).__init__(instance, interval_seconds, location_cache)
         self._max_catchup_runs = max_catchup_runs
+        self._max_concurrent = check.opt_int_param(max_concurrent, "max_concurrent")
+        self._evaluation_timeout = check.opt_numeric_param(evaluation_timeout, "evaluation_timeout")
 
     def run_iteration(self):
-        execute_scheduler_iteration(self._instance, self._logger, self._max_catchup_runs)
+        execute_scheduler_iteration(
+            self._instance,
+            self._logger,
+            self._max_catchup_runs,
+            location_cache=self._location_cache,
+            max_concurrent=self._max_concurrent,
+            evaluation_timeout=self._evaluation_timeout,
+        )
 
 
 class SensorDaemon(DagsterDaemon):
+    def __init__(
+        self,
+        instance,
+        interval_seconds,
+        location_cache=None,
+        max_concurrent=None,
+        evaluation_timeout=None,
+    ):
+        super(SensorDaemon, self).__init__(instance, interval_seconds, location_cache)
+        self._max_concurrent = check.opt_int_param(max_concurrent, "max_concurrent")
+        self._evaluation_timeout = check.opt_numeric_param(evaluation_timeout, "evaluation_timeout")
+
     def run_iteration(self):
-        execute_sensor_iteration(self._instance, self._logger)
+        execute_sensor_iteration(
+            self._instance,
+            self._logger,
+            location_cache=self._location_cache,
+            max_concurrent=self._max_concurrent,
+            evaluation_timeout=self._evaluation_timeout,
+        )
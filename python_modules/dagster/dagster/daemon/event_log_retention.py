@@ -0,0 +1,100 @@
+import time
+
+from dagster import check
+from dagster.core.storage.event_log import EventLogRetentionPolicy
+from dagster.daemon.daemon import DagsterDaemon
+
+DEFAULT_RETENTION_BATCH_SIZE = 1000
+DEFAULT_RETENTION_MAX_BATCHES_PER_ITERATION = 100
+DEFAULT_RETENTION_INTERVAL_SECONDS = 3600
+
+# Compacting rewrites the storage (a VACUUM), so it only runs once enough rows have been deleted to
+# be worth reclaiming, or once a day for whatever has been deleted since the last compaction
+DEFAULT_RETENTION_COMPACT_MIN_ROWS = 100000
+DEFAULT_RETENTION_COMPACT_INTERVAL_SECONDS = 24 * 60 * 60
+
+
+class EventLogRetentionDaemon(DagsterDaemon):
+    """
+    Used with the event_log_retention setting on the instance. This process deletes the events
+    that the retention policy expires from the event log storage, in bounded batches so that no
+    single delete holds locks on the event log for long. The storage is compacted once
+    ``compact_min_rows`` rows have been deleted since it was last compacted, or once
+    ``compact_interval_seconds`` have passed since then if any rows have been deleted.
+    """
+
+    def __init__(
+        self,
+        instance,
+        interval_seconds,
+        retention_policy,
+        batch_size=DEFAULT_RETENTION_BATCH_SIZE,
+        max_batches_per_iteration=DEFAULT_RETENTION_MAX_BATCHES_PER_ITERATION,
+        compact_min_rows=DEFAULT_RETENTION_COMPACT_MIN_ROWS,
+        compact_interval_seconds=DEFAULT_RETENTION_COMPACT_INTERVAL_SECONDS,
+    ):
+        super(EventLogRetentionDaemon, self).__init__(instance, interval_seconds)
+        self._retention_policy = check.inst_param(
+            retention_policy, "retention_policy", EventLogRetentionPolicy
+        )
+        self._batch_size = check.int_param(batch_size, "batch_size")
+        self._max_batches_per_iteration = check.int_param(
+            max_batches_per_iteration, "max_batches_per_iteration"
+        )
+        self._compact_min_rows = check.int_param(compact_min_rows, "compact_min_rows")
+        self._compact_interval_seconds = check.numeric_param(
+            compact_interval_seconds, "compact_interval_seconds"
+        )
+        self._rows_reclaimed = 0
+        self._last_iteration_rows_reclaimed = 0
+        self._rows_reclaimed_since_compaction = 0
+        self._last_compaction_time = time.time()
+
+    @property
+    def rows_reclaimed(self):
+        """int: The number of event log rows deleted since the daemon started."""
+        return self._rows_reclaimed
+
+    @property
+    def last_iteration_rows_reclaimed(self):
+        """int: The number of event log rows deleted by the latest iteration."""
+        return self._last_iteration_rows_reclaimed
+
+    def _should_compact(self):
+        if not self._rows_reclaimed_since_compaction:
+            return False
+
+        return (
+            self._rows_reclaimed_since_compaction >= self._compact_min_rows
+            or time.time() - self._last_compaction_time >= self._compact_interval_seconds
+        )
+
+    def run_iteration(self):
+        reclaimed = 0
+        exhausted = True
+        for _ in range(self._max_batches_per_iteration):
+            deleted = self._instance.delete_expired_events(self._retention_policy, self._batch_size)
+            reclaimed += deleted
+            if deleted < self._batch_size:
+                exhausted = False
+                break
+
+        self._last_iteration_rows_reclaimed = reclaimed
+        self._rows_reclaimed += reclaimed
+        self._rows_reclaimed_since_compaction += reclaimed
+
+        if self._should_compact():
+            self._instance.compact_event_log()
+            self._rows_reclaimed_since_compaction = 0
+            self._last_compaction_time = time.time()
+
+        self._logger.info(
+            "Reclaimed {reclaimed} event log rows ({total} since the daemon started).".format(
+                reclaimed=reclaimed, total=self._rows_reclaimed
+            )
+        )
+        if exhausted:
+            self._logger.info(
+                "Stopped after {max_batches} batches with expired events remaining; continuing "
+                "in the next iteration.".format(max_batches=self._max_batches_per_iteration)
+            )
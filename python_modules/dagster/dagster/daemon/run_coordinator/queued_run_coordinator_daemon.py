@@ -21,8 +21,8 @@ class QueuedRunCoordinatorDaemon(DagsterDaemon):
     """
 
     @experimental
-    def __init__(self, instance, interval_seconds, max_concurrent_runs):
-        super(QueuedRunCoordinatorDaemon, self).__init__(instance, interval_seconds)
+    def __init__(self, instance, interval_seconds, max_concurrent_runs, location_cache=None):
+        super(QueuedRunCoordinatorDaemon, self).__init__(instance, interval_seconds, location_cache)
         self._max_concurrent_runs = check.int_param(max_concurrent_runs, "max_concurrent_runs")
 
     def run_iteration(self):
@@ -46,7 +46,9 @@ def run_iteration(self):
             self._logger.info("Retrieved {} queued runs to launch.".format(len(queued_runs)))
 
         for run in queued_runs:
-            with external_pipeline_from_run(run) as external_pipeline:
+            with external_pipeline_from_run(
+                run, location_cache=self._location_cache
+            ) as external_pipeline:
                 enqueued_event = DagsterEvent(
                     event_type_value=DagsterEventType.PIPELINE_DEQUEUED.value,
                     pipeline_name=run.pipeline_name,
@@ -87,6 +87,16 @@ def __init__(self, channel):
             request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
             response_deserializer=api__pb2.StreamingExternalRepositoryEvent.FromString,
         )
+        self.ExternalRepositoryIndex = channel.unary_unary(
+            "/api.DagsterApi/ExternalRepositoryIndex",
+            request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
+            response_deserializer=api__pb2.ExternalRepositoryIndexReply.FromString,
+        )
+        self.StreamingExternalPipelineSnapshot = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalPipelineSnapshot",
+            request_serializer=api__pb2.ExternalPipelineSnapshotRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingExternalPipelineSnapshotEvent.FromString,
+        )
         self.ExternalScheduleExecution = channel.unary_unary(
             "/api.DagsterApi/ExternalScheduleExecution",
             request_serializer=api__pb2.ExternalScheduleExecutionRequest.SerializeToString,
@@ -205,6 +215,18 @@ def StreamingExternalRepository(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ExternalRepositoryIndex(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def StreamingExternalPipelineSnapshot(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ExternalScheduleExecution(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -315,6 +337,16 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
             response_serializer=api__pb2.StreamingExternalRepositoryEvent.SerializeToString,
         ),
+        "ExternalRepositoryIndex": grpc.unary_unary_rpc_method_handler(
+            servicer.ExternalRepositoryIndex,
+            request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
+            response_serializer=api__pb2.ExternalRepositoryIndexReply.SerializeToString,
+        ),
+        "StreamingExternalPipelineSnapshot": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalPipelineSnapshot,
+            request_deserializer=api__pb2.ExternalPipelineSnapshotRequest.FromString,
+            response_serializer=api__pb2.StreamingExternalPipelineSnapshotEvent.SerializeToString,
+        ),
         "ExternalScheduleExecution": grpc.unary_unary_rpc_method_handler(
             servicer.ExternalScheduleExecution,
             request_deserializer=api__pb2.ExternalScheduleExecutionRequest.FromString,
@@ -736,6 +768,64 @@ def StreamingExternalRepository(
             metadata,
         )
 
+    @staticmethod
+    def ExternalRepositoryIndex(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/api.DagsterApi/ExternalRepositoryIndex",
+            api__pb2.ExternalRepositoryRequest.SerializeToString,
+            api__pb2.ExternalRepositoryIndexReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def StreamingExternalPipelineSnapshot(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalPipelineSnapshot",
+            api__pb2.ExternalPipelineSnapshotRequest.SerializeToString,
+            api__pb2.StreamingExternalPipelineSnapshotEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ExternalScheduleExecution(
         request,
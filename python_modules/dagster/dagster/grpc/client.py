@@ -6,8 +6,9 @@
 
 import grpc
 from dagster import check, seven
+from dagster.core.errors import DagsterUserCodeTimeoutError
 from dagster.core.events import EngineEventData
-from dagster.core.host_representation import ExternalRepositoryOrigin
+from dagster.core.host_representation import ExternalPipelineOrigin, ExternalRepositoryOrigin
 from dagster.core.instance import DagsterInstance
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
@@ -74,6 +75,18 @@ def _query(self, method, request_type, timeout=None, **kwargs):
         # TODO need error handling here
         return response
 
+    def _query_with_timeout(self, method, request_type, timeout, **kwargs):
+        try:
+            return self._query(method, request_type, timeout=timeout, **kwargs)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:  # pylint: disable=no-member
+                raise DagsterUserCodeTimeoutError(
+                    "{method} did not complete within {timeout} seconds".format(
+                        method=method, timeout=timeout
+                    )
+                )
+            raise
+
     def _streaming_query(self, method, request_type, **kwargs):
         with grpc.insecure_channel(self._server_address) as channel:
             stub = DagsterApiStub(channel)
@@ -207,10 +220,11 @@ def external_pipeline_subset(self, pipeline_subset_snapshot_args):
             res.serialized_external_pipeline_subset_result
         )
 
-    def external_repository(self, external_repository_origin):
+    def external_repository(self, external_repository_origin, known_snapshot_id=None):
         check.inst_param(
             external_repository_origin, "external_repository_origin", ExternalRepositoryOrigin,
         )
+        check.opt_str_param(known_snapshot_id, "known_snapshot_id")
 
         res = self._query(
             "ExternalRepository",
@@ -219,11 +233,20 @@ def external_repository(self, external_repository_origin):
             serialized_repository_python_origin=serialize_dagster_namedtuple(
                 external_repository_origin
             ),
+            known_snapshot_id=known_snapshot_id,
         )
 
-        return deserialize_json_to_dagster_namedtuple(res.serialized_external_repository_data)
+        return {
+            "snapshot_id": res.snapshot_id,
+            "not_modified": res.not_modified,
+            "external_repository_data": None
+            if res.not_modified
+            else deserialize_json_to_dagster_namedtuple(res.serialized_external_repository_data),
+        }
+
+    def streaming_external_repository(self, external_repository_origin, known_snapshot_id=None):
+        check.opt_str_param(known_snapshot_id, "known_snapshot_id")
 
-    def streaming_external_repository(self, external_repository_origin):
         for res in self._streaming_query(
             "StreamingExternalRepository",
             api_pb2.ExternalRepositoryRequest,
@@ -231,22 +254,69 @@ def streaming_external_repository(self, external_repository_origin):
             serialized_repository_python_origin=serialize_dagster_namedtuple(
                 external_repository_origin
             ),
+            known_snapshot_id=known_snapshot_id,
         ):
             yield {
                 "sequence_number": res.sequence_number,
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
+                "snapshot_id": res.snapshot_id,
+                "not_modified": res.not_modified,
+            }
+
+    def external_repository_index(self, external_repository_origin, known_snapshot_id=None):
+        check.inst_param(
+            external_repository_origin, "external_repository_origin", ExternalRepositoryOrigin,
+        )
+        check.opt_str_param(known_snapshot_id, "known_snapshot_id")
+
+        res = self._query(
+            "ExternalRepositoryIndex",
+            api_pb2.ExternalRepositoryRequest,
+            serialized_repository_python_origin=serialize_dagster_namedtuple(
+                external_repository_origin
+            ),
+            known_snapshot_id=known_snapshot_id,
+        )
+
+        return {
+            "snapshot_id": res.snapshot_id,
+            "not_modified": res.not_modified,
+            "external_repository_index_data": None
+            if res.not_modified
+            else deserialize_json_to_dagster_namedtuple(
+                res.serialized_external_repository_index_data
+            ),
+        }
+
+    def streaming_external_pipeline_snapshot(self, external_pipeline_origin):
+        check.inst_param(
+            external_pipeline_origin, "external_pipeline_origin", ExternalPipelineOrigin
+        )
+
+        for res in self._streaming_query(
+            "StreamingExternalPipelineSnapshot",
+            api_pb2.ExternalPipelineSnapshotRequest,
+            serialized_external_pipeline_origin=serialize_dagster_namedtuple(
+                external_pipeline_origin
+            ),
+        ):
+            yield {
+                "sequence_number": res.sequence_number,
+                "serialized_external_pipeline_data_chunk": res.serialized_external_pipeline_data_chunk,
             }
 
-    def external_schedule_execution(self, external_schedule_execution_args):
+    def external_schedule_execution(self, external_schedule_execution_args, timeout=None):
         check.inst_param(
             external_schedule_execution_args,
             "external_schedule_execution_args",
             ExternalScheduleExecutionArgs,
         )
+        check.opt_numeric_param(timeout, "timeout")
 
-        res = self._query(
+        res = self._query_with_timeout(
             "ExternalScheduleExecution",
             api_pb2.ExternalScheduleExecutionRequest,
+            timeout,
             serialized_external_schedule_execution_args=serialize_dagster_namedtuple(
                 external_schedule_execution_args
             ),
@@ -256,14 +326,16 @@ def external_schedule_execution(self, external_schedule_execution_args):
             res.serialized_external_schedule_execution_data_or_external_schedule_execution_error
         )
 
-    def external_sensor_execution(self, sensor_execution_args):
+    def external_sensor_execution(self, sensor_execution_args, timeout=None):
         check.inst_param(
             sensor_execution_args, "sensor_execution_args", SensorExecutionArgs,
         )
+        check.opt_numeric_param(timeout, "timeout")
 
-        res = self._query(
+        res = self._query_with_timeout(
             "ExternalSensorExecution",
             api_pb2.ExternalSensorExecutionRequest,
+            timeout,
             serialized_external_sensor_execution_args=serialize_dagster_namedtuple(
                 sensor_execution_args
             ),
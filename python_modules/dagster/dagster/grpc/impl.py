@@ -2,10 +2,11 @@
 
 import os
 import sys
+import time
 
 import pendulum
 from dagster import check
-from dagster.core.definitions import ScheduleExecutionContext
+from dagster.core.definitions import EventMetadataEntry, ScheduleExecutionContext
 from dagster.core.definitions.reconstructable import (
     ReconstructablePipeline,
     ReconstructableRepository,
@@ -90,12 +91,10 @@ def _core_execute_run(recon_pipeline, pipeline_run, instance):
 def _run_in_subprocess(
     serialized_execute_run_args,
     recon_pipeline,
-    termination_event,
     subprocess_status_handler,
     run_event_handler,
+    run_start_time=None,
 ):
-
-    start_termination_thread(termination_event)
     try:
         execute_run_args = deserialize_json_to_dagster_namedtuple(serialized_execute_run_args)
         check.inst_param(execute_run_args, "execute_run_args", ExecuteExternalPipelineArgs)
@@ -129,11 +128,20 @@ def _run_in_subprocess(
 
     subprocess_status_handler(StartRunInSubprocessSuccessful())
 
+    engine_event_data = EngineEventData.in_process(pid, marker_end="cli_api_subprocess_init")
+    if run_start_time is not None:
+        # how long it took from the server receiving the run to the run starting to execute
+        engine_event_data = EngineEventData(
+            metadata_entries=engine_event_data.metadata_entries
+            + [EventMetadataEntry.float(time.time() - run_start_time, "run_start_latency")],
+            marker_end=engine_event_data.marker_end,
+        )
+
     run_event_handler(
         instance.report_engine_event(
             "Started process for pipeline (pid: {pid}).".format(pid=pid),
             pipeline_run,
-            EngineEventData.in_process(pid, marker_end="cli_api_subprocess_init"),
+            engine_event_data,
         )
     )
 
@@ -165,15 +173,16 @@ def _run_in_subprocess(
 
 
 def start_run_in_subprocess(
-    serialized_execute_run_args, recon_pipeline, event_queue, termination_event
+    serialized_execute_run_args, recon_pipeline, event_queue, termination_event, run_start_time=None
 ):
+    start_termination_thread(termination_event)
     with delay_interrupts():
         _run_in_subprocess(
             serialized_execute_run_args,
             recon_pipeline,
-            termination_event,
             subprocess_status_handler=event_queue.put,
             run_event_handler=lambda x: None,
+            run_start_time=run_start_time,
         )
 
 
@@ -0,0 +1,354 @@
+"""A pool of warm processes that the gRPC server starts runs in.
+
+Starting a process for each run means that each run waits for a new interpreter to start and to
+import the user code before it does any work. Run workers are started ahead of time and import the
+user code while they are idle, so that starting a run only hands it to a waiting worker. A worker
+executes one run at a time, and is retired after a number of runs, after a run that was terminated,
+or once its memory use grows past a limit, so that the state that runs leave behind in a process
+stays bounded.
+"""
+
+import os
+import queue
+import sys
+import threading
+from collections import deque
+
+from dagster import check
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.seven import multiprocessing
+from dagster.utils import delay_interrupts, start_termination_thread
+
+from .impl import _run_in_subprocess
+from .utils import get_loadable_targets
+
+DEFAULT_MAX_RUNS_PER_RUN_WORKER = 100
+
+# How often an idle run worker checks that the server that started it is still running
+RUN_WORKER_IDLE_POLL_INTERVAL = 1
+
+RUN_WORKER_SHUTDOWN_TIMEOUT = 5
+
+
+def _get_max_memory_mb():
+    try:
+        import resource
+    except ImportError:
+        # not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, and in kilobytes elsewhere
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def _warm_up_run_worker(loadable_target_origin):
+    if not loadable_target_origin:
+        return
+
+    try:
+        get_loadable_targets(
+            loadable_target_origin.python_file,
+            loadable_target_origin.module_name,
+            loadable_target_origin.package_name,
+            loadable_target_origin.working_directory,
+            loadable_target_origin.attribute,
+        )
+    except Exception:  # pylint: disable=broad-except
+        # errors loading the user code are reported by the runs that use it
+        pass
+
+
+def run_worker_process(
+    loadable_target_origin,
+    task_queue,
+    status_queue,
+    termination_event,
+    run_done_event,
+    parent_pid,
+    max_runs,
+    max_memory_mb,
+):
+    _warm_up_run_worker(loadable_target_origin)
+
+    start_termination_thread(termination_event)
+
+    run_count = 0
+    try:
+        while True:
+            try:
+                task = task_queue.get(timeout=RUN_WORKER_IDLE_POLL_INTERVAL)
+            except queue.Empty:
+                if os.getppid() != parent_pid:
+                    return
+                continue
+
+            if task is None:
+                return
+
+            serialized_execute_run_args, recon_pipeline, run_start_time = task
+            with delay_interrupts():
+                _run_in_subprocess(
+                    serialized_execute_run_args,
+                    recon_pipeline,
+                    subprocess_status_handler=status_queue.put,
+                    run_event_handler=lambda x: None,
+                    run_start_time=run_start_time,
+                )
+            run_count += 1
+
+            if termination_event.is_set() or run_count >= max_runs:
+                return
+
+            if max_memory_mb is not None:
+                memory_mb = _get_max_memory_mb()
+                if memory_mb is not None and memory_mb > max_memory_mb:
+                    return
+
+            # A worker that retires exits without setting the event, and the server sees that the
+            # run is done once the process has exited
+            run_done_event.set()
+    except KeyboardInterrupt:
+        pass
+
+
+class RunWorker:
+    def __init__(self, loadable_target_origin, max_runs, max_memory_mb):
+        self.task_queue = multiprocessing.Queue()
+        self.status_queue = multiprocessing.Queue()
+        self.termination_event = multiprocessing.Event()
+        self.run_done_event = multiprocessing.Event()
+        self.run_count = 0
+        self.max_runs = max_runs
+
+        # the run that the worker was last handed, which the events above refer to
+        self.run_id = None
+        self._lock = threading.Lock()
+
+        self.process = multiprocessing.Process(
+            target=run_worker_process,
+            args=[
+                loadable_target_origin,
+                self.task_queue,
+                self.status_queue,
+                self.termination_event,
+                self.run_done_event,
+                os.getpid(),
+                max_runs,
+                max_memory_mb,
+            ],
+        )
+        self.process.start()
+
+    @property
+    def can_start_run(self):
+        return (
+            self.process.is_alive()
+            and self.run_done_event.is_set()
+            and not self.termination_event.is_set()
+            and self.run_count < self.max_runs
+        )
+
+    def start_run(self, run_id, serialized_execute_run_args, recon_pipeline, run_start_time):
+        with self._lock:
+            self.run_id = run_id
+            self.run_done_event.clear()
+            self.run_count += 1
+            self.task_queue.put((serialized_execute_run_args, recon_pipeline, run_start_time))
+
+    def is_running(self, run_id):
+        with self._lock:
+            return (
+                self.run_id == run_id
+                and self.process.is_alive()
+                and not self.run_done_event.is_set()
+            )
+
+    def terminate_run(self, run_id):
+        # a run that is done must not terminate the run that the worker was handed after it
+        with self._lock:
+            if self.run_id == run_id and not self.run_done_event.is_set():
+                self.termination_event.set()
+
+    def stop(self):
+        self.task_queue.put(None)
+
+
+class RunWorkerTerminationEvent:
+    """Stands in for the termination event of a run that was started in a run worker, which is
+    shared by the runs that the worker executes."""
+
+    def __init__(self, run_worker, run_id):
+        self._run_worker = check.inst_param(run_worker, "run_worker", RunWorker)
+        self._run_id = check.str_param(run_id, "run_id")
+        self._event = threading.Event()
+
+    def set(self):
+        self._event.set()
+        self._run_worker.terminate_run(self._run_id)
+
+    def is_set(self):
+        return self._event.is_set()
+
+
+class RunWorkerExecution:
+    """Stands in for the process of a run that was started in a run worker, which outlives the
+    run."""
+
+    def __init__(self, run_worker, run_id):
+        self._run_worker = check.inst_param(run_worker, "run_worker", RunWorker)
+        self._run_id = check.str_param(run_id, "run_id")
+        self.termination_event = RunWorkerTerminationEvent(run_worker, run_id)
+
+    def is_alive(self):
+        return self._run_worker.is_running(self._run_id)
+
+    @property
+    def exitcode(self):
+        return self._run_worker.process.exitcode
+
+
+class RunWorkerPool:
+    """Keeps ``size`` idle run workers ready to start runs in.
+
+    Args:
+        size (int): The number of idle run workers to keep.
+        loadable_target_origin (Optional[LoadableTargetOrigin]): The user code that run workers
+            import while they wait for a run.
+        max_runs_per_worker (Optional[int]): The number of runs after which a run worker is replaced
+            by a new one. Defaults to 100.
+        max_memory_mb (Optional[int]): The peak memory use, in megabytes, past which a run worker
+            is replaced by a new one once its current run is done. Not enforced on Windows.
+    """
+
+    def __init__(
+        self, size, loadable_target_origin=None, max_runs_per_worker=None, max_memory_mb=None,
+    ):
+        self._size = check.int_param(size, "size")
+        check.invariant(size > 0, "size must be greater than 0")
+        self._loadable_target_origin = check.opt_inst_param(
+            loadable_target_origin, "loadable_target_origin", LoadableTargetOrigin
+        )
+        self._max_runs_per_worker = check.opt_int_param(
+            max_runs_per_worker, "max_runs_per_worker", DEFAULT_MAX_RUNS_PER_RUN_WORKER
+        )
+        check.invariant(self._max_runs_per_worker > 0, "max_runs_per_worker must be greater than 0")
+        self._max_memory_mb = check.opt_int_param(max_memory_mb, "max_memory_mb")
+
+        self._lock = threading.Lock()
+        self._idle_workers = deque()
+        self._busy_workers = []
+        self._is_shut_down = False
+
+        self._run_start_count = 0
+        self._last_run_start_latency = None
+        self._max_run_start_latency = None
+        self._total_run_start_latency = 0.0
+
+        self.replenish()
+
+    def _start_worker(self):
+        worker = RunWorker(
+            self._loadable_target_origin, self._max_runs_per_worker, self._max_memory_mb
+        )
+        # a new worker can take a run as soon as it has started
+        worker.run_done_event.set()
+        return worker
+
+    # Assumes the lock is being held
+    def _return_finished_workers(self):
+        busy_workers = []
+        for worker in self._busy_workers:
+            if worker.can_start_run:
+                self._idle_workers.append(worker)
+            elif worker.process.is_alive():
+                busy_workers.append(worker)
+            else:
+                worker.process.join()
+        self._busy_workers = busy_workers
+
+    def replenish(self):
+        """Returns the run workers that finished their run to the idle workers, drops the workers
+        that retired or died, and starts new workers until there are ``size`` idle ones."""
+        with self._lock:
+            if self._is_shut_down:
+                return
+
+            self._return_finished_workers()
+            self._idle_workers = deque(
+                worker for worker in self._idle_workers if worker.process.is_alive()
+            )
+            while len(self._idle_workers) < self._size:
+                self._idle_workers.append(self._start_worker())
+
+    def start_run(self, run_id, serialized_execute_run_args, recon_pipeline, run_start_time):
+        """Starts a run in an idle run worker, or in a new worker if none are idle, and returns
+        the worker."""
+        check.str_param(run_id, "run_id")
+        check.str_param(serialized_execute_run_args, "serialized_execute_run_args")
+        check.float_param(run_start_time, "run_start_time")
+
+        with self._lock:
+            check.invariant(not self._is_shut_down, "Tried to start a run after shutting down")
+
+            if not self._idle_workers:
+                self._return_finished_workers()
+
+            worker = None
+            while self._idle_workers and not worker:
+                idle_worker = self._idle_workers.popleft()
+                if idle_worker.can_start_run:
+                    worker = idle_worker
+                else:
+                    self._busy_workers.append(idle_worker)
+
+            if not worker:
+                worker = self._start_worker()
+
+            worker.start_run(run_id, serialized_execute_run_args, recon_pipeline, run_start_time)
+            self._busy_workers.append(worker)
+            return worker
+
+    def record_run_start_latency(self, latency):
+        check.float_param(latency, "latency")
+        with self._lock:
+            self._run_start_count += 1
+            self._last_run_start_latency = latency
+            self._max_run_start_latency = max(self._max_run_start_latency or 0.0, latency)
+            self._total_run_start_latency += latency
+
+    @property
+    def run_start_count(self):
+        """int: The number of runs that started in the pool."""
+        return self._run_start_count
+
+    @property
+    def last_run_start_latency(self):
+        """Optional[float]: How long the latest run took to start, in seconds."""
+        return self._last_run_start_latency
+
+    @property
+    def max_run_start_latency(self):
+        """Optional[float]: How long the slowest run took to start, in seconds."""
+        return self._max_run_start_latency
+
+    @property
+    def mean_run_start_latency(self):
+        """Optional[float]: How long the runs took to start on average, in seconds."""
+        if not self._run_start_count:
+            return None
+        return self._total_run_start_latency / self._run_start_count
+
+    def shutdown(self):
+        """Stops the idle run workers, and the busy ones once their run is done."""
+        with self._lock:
+            self._is_shut_down = True
+            idle_workers = list(self._idle_workers)
+            self._idle_workers = deque()
+            for worker in idle_workers + self._busy_workers:
+                worker.stop()
+
+        for worker in idle_workers:
+            worker.process.join(RUN_WORKER_SHUTDOWN_TIMEOUT)
+            if worker.process.is_alive():
+                worker.process.terminate()
@@ -1,3 +1,4 @@
+import hashlib
 import math
 import os
 import queue
@@ -16,7 +17,11 @@
     repository_def_from_target_def,
 )
 from dagster.core.host_representation import ExternalPipelineOrigin, ExternalRepositoryOrigin
-from dagster.core.host_representation.external_data import external_repository_data_from_def
+from dagster.core.host_representation.external_data import (
+    ExternalRepositoryData,
+    external_repository_data_from_def,
+    external_repository_index_data_from_repository_data,
+)
 from dagster.core.instance import DagsterInstance
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster.serdes import (
@@ -50,6 +55,7 @@
     get_partition_tags,
     start_run_in_subprocess,
 )
+from .run_worker_pool import RunWorkerExecution, RunWorkerPool
 from .types import (
     CanCancelExecutionRequest,
     CanCancelExecutionResult,
@@ -75,7 +81,7 @@
 
 CLEANUP_TICK = 0.5
 
-STREAMING_EXTERNAL_REPOSITORY_CHUNK_SIZE = 4000000
+STREAMING_CHUNK_SIZE = 4000000
 
 
 class CouldNotBindGrpcServerToAddress(Exception):
@@ -163,6 +169,76 @@ def build_code_pointers_by_repo_name(loadable_target_origin, loadable_repository
     return repository_code_pointer_dict
 
 
+def _chunks(serialized_data):
+    num_chunks = int(math.ceil(float(len(serialized_data)) / STREAMING_CHUNK_SIZE))
+
+    for i in range(num_chunks):
+        start_index = i * STREAMING_CHUNK_SIZE
+        end_index = min((i + 1) * STREAMING_CHUNK_SIZE, len(serialized_data))
+        yield serialized_data[start_index:end_index]
+
+
+class ExternalRepositorySnapshots:
+    """The serialized external repository data of a repository, its snapshot id, and the serialized
+    index and pipeline data that clients may fetch instead, each computed when it is first needed.
+    """
+
+    def __init__(self, external_repository_data):
+        self._external_repository_data = check.inst_param(
+            external_repository_data, "external_repository_data", ExternalRepositoryData
+        )
+        self._lock = threading.Lock()
+
+        self._serialized_external_repository_data = None
+        self._snapshot_id = None
+        self._serialized_external_repository_index_data = None
+        self._serialized_external_pipeline_datas = {}
+
+    @property
+    def serialized_external_repository_data(self):
+        with self._lock:
+            if self._serialized_external_repository_data is None:
+                self._serialized_external_repository_data = serialize_dagster_namedtuple(
+                    self._external_repository_data
+                )
+            return self._serialized_external_repository_data
+
+    @property
+    def snapshot_id(self):
+        """The hash of the serialized external repository data, which identifies the index and the
+        pipeline data too."""
+        serialized_external_repository_data = self.serialized_external_repository_data
+        with self._lock:
+            if self._snapshot_id is None:
+                self._snapshot_id = hashlib.sha1(
+                    serialized_external_repository_data.encode()
+                ).hexdigest()
+            return self._snapshot_id
+
+    @property
+    def serialized_external_repository_index_data(self):
+        with self._lock:
+            if self._serialized_external_repository_index_data is None:
+                self._serialized_external_repository_index_data = serialize_dagster_namedtuple(
+                    external_repository_index_data_from_repository_data(
+                        self._external_repository_data
+                    )
+                )
+            return self._serialized_external_repository_index_data
+
+    def get_serialized_external_pipeline_data(self, pipeline_name):
+        check.str_param(pipeline_name, "pipeline_name")
+
+        with self._lock:
+            if pipeline_name not in self._serialized_external_pipeline_datas:
+                self._serialized_external_pipeline_datas[
+                    pipeline_name
+                ] = serialize_dagster_namedtuple(
+                    self._external_repository_data.get_external_pipeline_data(pipeline_name)
+                )
+            return self._serialized_external_pipeline_datas[pipeline_name]
+
+
 class DagsterApiServer(DagsterApiServicer):
     # The loadable_target_origin is currently Noneable to support instaniating a server.
     # This helps us test the ping methods, and incrementally migrate each method to
@@ -175,12 +251,16 @@ def __init__(
         heartbeat_timeout=30,
         lazy_load_user_code=False,
         fixed_server_id=None,
+        run_worker_pool_size=0,
+        max_runs_per_run_worker=None,
+        run_worker_max_memory_mb=None,
     ):
         super(DagsterApiServer, self).__init__()
 
         check.bool_param(heartbeat, "heartbeat")
         check.int_param(heartbeat_timeout, "heartbeat_timeout")
         check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
+        check.int_param(run_worker_pool_size, "run_worker_pool_size")
 
         self._server_termination_event = check.inst_param(
             server_termination_event, "server_termination_event", seven.ThreadingEventType
@@ -208,9 +288,30 @@ def __init__(
         self._repository_symbols_and_code_pointers = LazyRepositorySymbolsAndCodePointers(
             loadable_target_origin
         )
+
+        # The code of the server does not change while it is running, so the external repository
+        # data of each repository, and the serialized snapshots that clients fetch, are computed
+        # once.
+        # Dict[str, ExternalRepositorySnapshots]
+        self._external_repository_snapshots = {}
+        self._external_repository_snapshots_lock = threading.Lock()
+
         if not lazy_load_user_code:
             self._repository_symbols_and_code_pointers.load()
 
+        # Runs are started in warm run workers from the pool if it is enabled, and in a new
+        # process each otherwise
+        self._run_worker_pool = (
+            RunWorkerPool(
+                run_worker_pool_size,
+                loadable_target_origin=loadable_target_origin,
+                max_runs_per_worker=max_runs_per_run_worker,
+                max_memory_mb=run_worker_max_memory_mb,
+            )
+            if run_worker_pool_size > 0
+            else None
+        )
+
         self.__last_heartbeat_time = time.time()
         if heartbeat:
             self.__heartbeat_thread = threading.Thread(
@@ -230,6 +331,12 @@ def cleanup(self):
         if self.__heartbeat_thread:
             self.__heartbeat_thread.join()
         self.__cleanup_thread.join()
+        if self._run_worker_pool:
+            self._run_worker_pool.shutdown()
+
+    @property
+    def run_worker_pool(self):
+        return self._run_worker_pool
 
     def _heartbeat_thread(self, heartbeat_timeout):
         while True:
@@ -248,6 +355,9 @@ def _cleanup_thread(self):
 
             self._check_for_orphaned_runs()
 
+            if self._run_worker_pool:
+                self._run_worker_pool.replenish()
+
     def _check_for_orphaned_runs(self):
         with self._execution_lock:
             runs_to_clear = []
@@ -440,45 +550,89 @@ def ExternalPipelineSubsetSnapshot(self, request, _context):
             )
         )
 
-    def _get_serialized_external_repository_data(self, request):
-        repository_origin = deserialize_json_to_dagster_namedtuple(
-            request.serialized_repository_python_origin
-        )
-
+    def _get_external_repository_snapshots(self, repository_origin):
         check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
-        recon_repo = self._recon_repository_from_origin(repository_origin)
-        return serialize_dagster_namedtuple(
-            external_repository_data_from_def(recon_repo.get_definition())
+
+        with self._external_repository_snapshots_lock:
+            if repository_origin.repository_name not in self._external_repository_snapshots:
+                recon_repo = self._recon_repository_from_origin(repository_origin)
+                self._external_repository_snapshots[
+                    repository_origin.repository_name
+                ] = ExternalRepositorySnapshots(
+                    external_repository_data_from_def(recon_repo.get_definition())
+                )
+
+            return self._external_repository_snapshots[repository_origin.repository_name]
+
+    def _get_external_repository_snapshots_for_request(self, request):
+        return self._get_external_repository_snapshots(
+            deserialize_json_to_dagster_namedtuple(request.serialized_repository_python_origin)
         )
 
     def ExternalRepository(self, request, _context):
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        snapshots = self._get_external_repository_snapshots_for_request(request)
+
+        if request.known_snapshot_id == snapshots.snapshot_id:
+            return api_pb2.ExternalRepositoryReply(
+                snapshot_id=snapshots.snapshot_id, not_modified=True
+            )
+
         return api_pb2.ExternalRepositoryReply(
-            serialized_external_repository_data=serialized_external_repository_data,
+            serialized_external_repository_data=snapshots.serialized_external_repository_data,
+            snapshot_id=snapshots.snapshot_id,
         )
 
     def StreamingExternalRepository(self, request, _context):
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
-
-        num_chunks = int(
-            math.ceil(
-                float(len(serialized_external_repository_data))
-                / STREAMING_EXTERNAL_REPOSITORY_CHUNK_SIZE
-            )
-        )
+        snapshots = self._get_external_repository_snapshots_for_request(request)
 
-        for i in range(num_chunks):
-            start_index = i * STREAMING_EXTERNAL_REPOSITORY_CHUNK_SIZE
-            end_index = min(
-                (i + 1) * STREAMING_EXTERNAL_REPOSITORY_CHUNK_SIZE,
-                len(serialized_external_repository_data),
+        if request.known_snapshot_id == snapshots.snapshot_id:
+            yield api_pb2.StreamingExternalRepositoryEvent(
+                sequence_number=0, snapshot_id=snapshots.snapshot_id, not_modified=True
             )
+            return
 
+        for i, chunk in enumerate(_chunks(snapshots.serialized_external_repository_data)):
             yield api_pb2.StreamingExternalRepositoryEvent(
                 sequence_number=i,
-                serialized_external_repository_chunk=serialized_external_repository_data[
-                    start_index:end_index
-                ],
+                serialized_external_repository_chunk=chunk,
+                snapshot_id=snapshots.snapshot_id,
+            )
+
+    def ExternalRepositoryIndex(self, request, _context):
+        snapshots = self._get_external_repository_snapshots_for_request(request)
+
+        if request.known_snapshot_id == snapshots.snapshot_id:
+            return api_pb2.ExternalRepositoryIndexReply(
+                snapshot_id=snapshots.snapshot_id, not_modified=True
+            )
+
+        return api_pb2.ExternalRepositoryIndexReply(
+            serialized_external_repository_index_data=snapshots.serialized_external_repository_index_data,
+            snapshot_id=snapshots.snapshot_id,
+        )
+
+    def StreamingExternalPipelineSnapshot(self, request, _context):
+        external_pipeline_origin = deserialize_json_to_dagster_namedtuple(
+            request.serialized_external_pipeline_origin
+        )
+
+        check.inst_param(
+            external_pipeline_origin, "external_pipeline_origin", ExternalPipelineOrigin
+        )
+
+        snapshots = self._get_external_repository_snapshots(
+            external_pipeline_origin.external_repository_origin
+        )
+
+        for i, chunk in enumerate(
+            _chunks(
+                snapshots.get_serialized_external_pipeline_data(
+                    external_pipeline_origin.pipeline_name
+                )
+            )
+        ):
+            yield api_pb2.StreamingExternalPipelineSnapshotEvent(
+                sequence_number=i, serialized_external_pipeline_data_chunk=chunk,
             )
 
     def ExternalScheduleExecution(self, request, _context):
@@ -587,6 +741,8 @@ def CanCancelExecution(self, request, _context):
         )
 
     def StartRun(self, request, _context):
+        run_start_time = time.time()
+
         if self._shutdown_once_executions_finish_event.is_set():
             return api_pb2.StartRunReply(
                 serialized_start_run_result=serialize_dagster_namedtuple(
@@ -619,36 +775,54 @@ def StartRun(self, request, _context):
                 )
             )
 
-        event_queue = multiprocessing.Queue()
-        termination_event = multiprocessing.Event()
-        execution_process = multiprocessing.Process(
-            target=start_run_in_subprocess,
-            args=[
-                request.serialized_execute_run_args,
-                recon_pipeline,
-                event_queue,
-                termination_event,
-            ],
-        )
-
-        with self._execution_lock:
-            execution_process.start()
-            self._executions[run_id] = (
-                execution_process,
-                execute_run_args.instance_ref,
+        if self._run_worker_pool:
+            with self._execution_lock:
+                run_worker = self._run_worker_pool.start_run(
+                    run_id, request.serialized_execute_run_args, recon_pipeline, run_start_time
+                )
+                # the worker executes other runs after this one, so the run is tracked by an
+                # execution of its own rather than by the worker
+                execution_process = RunWorkerExecution(run_worker, run_id)
+                event_queue = run_worker.status_queue
+                self._executions[run_id] = (
+                    execution_process,
+                    execute_run_args.instance_ref,
+                )
+                self._termination_events[run_id] = execution_process.termination_event
+        else:
+            event_queue = multiprocessing.Queue()
+            termination_event = multiprocessing.Event()
+            execution_process = multiprocessing.Process(
+                target=start_run_in_subprocess,
+                args=[
+                    request.serialized_execute_run_args,
+                    recon_pipeline,
+                    event_queue,
+                    termination_event,
+                    run_start_time,
+                ],
             )
-            self._termination_events[run_id] = termination_event
+
+            with self._execution_lock:
+                execution_process.start()
+                self._executions[run_id] = (
+                    execution_process,
+                    execute_run_args.instance_ref,
+                )
+                self._termination_events[run_id] = termination_event
 
         success = None
         message = None
         serializable_error_info = None
 
         while success is None:
-            time.sleep(EVENT_QUEUE_POLL_INTERVAL)
-            # We use `get_nowait()` instead of `get()` so that we can handle the case where the
-            # execution process has died unexpectedly -- `get()` would hang forever in that case
+            # We wait with a timeout instead of blocking on `get()` so that we can handle the case
+            # where the execution process has died unexpectedly -- `get()` would hang forever in
+            # that case
             try:
-                dagster_event_or_ipc_error_message_or_done = event_queue.get_nowait()
+                dagster_event_or_ipc_error_message_or_done = event_queue.get(
+                    timeout=EVENT_QUEUE_POLL_INTERVAL
+                )
             except queue.Empty:
                 if not execution_process.is_alive():
                     # subprocess died unexpectedly
@@ -681,6 +855,8 @@ def StartRun(self, request, _context):
         if not success:
             with self._execution_lock:
                 self._clear_run(run_id)
+        elif self._run_worker_pool:
+            self._run_worker_pool.record_run_start_latency(time.time() - run_start_time)
 
         return api_pb2.StartRunReply(
             serialized_start_run_result=serialize_dagster_namedtuple(
@@ -734,6 +910,9 @@ def __init__(
         lazy_load_user_code=False,
         ipc_output_file=None,
         fixed_server_id=None,
+        run_worker_pool_size=0,
+        max_runs_per_run_worker=None,
+        run_worker_max_memory_mb=None,
     ):
         check.opt_str_param(host, "host")
         check.opt_int_param(port, "port")
@@ -772,6 +951,9 @@ def __init__(
             heartbeat_timeout=heartbeat_timeout,
             lazy_load_user_code=lazy_load_user_code,
             fixed_server_id=fixed_server_id,
+            run_worker_pool_size=run_worker_pool_size,
+            max_runs_per_run_worker=max_runs_per_run_worker,
+            run_worker_max_memory_mb=run_worker_max_memory_mb,
         )
 
         # Create a health check servicer
@@ -885,6 +1067,9 @@ def open_server_process(
     heartbeat_timeout=30,
     lazy_load_user_code=False,
     fixed_server_id=None,
+    run_worker_pool_size=0,
+    max_runs_per_run_worker=None,
+    run_worker_max_memory_mb=None,
 ):
     check.invariant((port or socket) and not (port and socket), "Set only port or socket")
     check.opt_inst_param(loadable_target_origin, "loadable_target_origin", LoadableTargetOrigin)
@@ -911,6 +1096,21 @@ def open_server_process(
             + (["--lazy-load-user-code"] if lazy_load_user_code else [])
             + (["--ipc-output-file", output_file])
             + (["--fixed-server-id", fixed_server_id] if fixed_server_id else [])
+            + (
+                ["--run-worker-pool-size", str(run_worker_pool_size)]
+                if run_worker_pool_size
+                else []
+            )
+            + (
+                ["--max-runs-per-run-worker", str(max_runs_per_run_worker)]
+                if max_runs_per_run_worker
+                else []
+            )
+            + (
+                ["--run-worker-max-memory-mb", str(run_worker_max_memory_mb)]
+                if run_worker_max_memory_mb
+                else []
+            )
         )
 
         if loadable_target_origin:
@@ -936,6 +1136,9 @@ def open_server_process_on_dynamic_port(
     heartbeat_timeout=30,
     lazy_load_user_code=False,
     fixed_server_id=None,
+    run_worker_pool_size=0,
+    max_runs_per_run_worker=None,
+    run_worker_max_memory_mb=None,
 ):
     server_process = None
     retries = 0
@@ -951,6 +1154,9 @@ def open_server_process_on_dynamic_port(
                 heartbeat_timeout=heartbeat_timeout,
                 lazy_load_user_code=lazy_load_user_code,
                 fixed_server_id=fixed_server_id,
+                run_worker_pool_size=run_worker_pool_size,
+                max_runs_per_run_worker=max_runs_per_run_worker,
+                run_worker_max_memory_mb=run_worker_max_memory_mb,
             )
         except CouldNotBindGrpcServerToAddress:
             pass
@@ -981,6 +1187,9 @@ def __init__(
         heartbeat_timeout=30,
         lazy_load_user_code=False,
         fixed_server_id=None,
+        run_worker_pool_size=0,
+        max_runs_per_run_worker=None,
+        run_worker_max_memory_mb=None,
     ):
         self.port = None
         self.socket = None
@@ -995,6 +1204,9 @@ def __init__(
         check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
         check.bool_param(lazy_load_user_code, "lazy_load_user_code")
         check.opt_str_param(fixed_server_id, "fixed_server_id")
+        check.int_param(run_worker_pool_size, "run_worker_pool_size")
+        check.opt_int_param(max_runs_per_run_worker, "max_runs_per_run_worker")
+        check.opt_int_param(run_worker_max_memory_mb, "run_worker_max_memory_mb")
         check.invariant(
             max_workers > 1 if heartbeat else True,
             "max_workers must be greater than 1 if heartbeat is True",
@@ -1009,6 +1221,9 @@ def __init__(
                 heartbeat_timeout=heartbeat_timeout,
                 lazy_load_user_code=lazy_load_user_code,
                 fixed_server_id=fixed_server_id,
+                run_worker_pool_size=run_worker_pool_size,
+                max_runs_per_run_worker=max_runs_per_run_worker,
+                run_worker_max_memory_mb=run_worker_max_memory_mb,
             )
         else:
             self.socket = safe_tempfile_path_unmanaged()
@@ -1022,6 +1237,9 @@ def __init__(
                 heartbeat_timeout=heartbeat_timeout,
                 lazy_load_user_code=lazy_load_user_code,
                 fixed_server_id=fixed_server_id,
+                run_worker_pool_size=run_worker_pool_size,
+                max_runs_per_run_worker=max_runs_per_run_worker,
+                run_worker_max_memory_mb=run_worker_max_memory_mb,
             )
 
         if self.server_process is None:
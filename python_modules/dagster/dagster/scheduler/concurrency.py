@@ -0,0 +1,28 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from dagster import check
+
+
+def for_each_job_state(fn, job_states, max_concurrent=None, thread_name_prefix=""):
+    """Calls fn with each of the job states of the schedules or sensors of a daemon iteration, on up
+    to max_concurrent threads, so that one schedule or sensor that is slow to evaluate does not hold
+    up the others. Without max_concurrent, the job states are processed one at a time on the
+    calling thread.
+
+    fn is expected to handle and log its own errors.
+    """
+    check.callable_param(fn, "fn")
+    check.list_param(job_states, "job_states")
+    check.opt_int_param(max_concurrent, "max_concurrent")
+    check.str_param(thread_name_prefix, "thread_name_prefix")
+
+    if not max_concurrent or max_concurrent <= 1 or len(job_states) <= 1:
+        for job_state in job_states:
+            fn(job_state)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrent, len(job_states)), thread_name_prefix=thread_name_prefix
+    ) as executor:
+        for future in [executor.submit(fn, job_state) for job_state in job_states]:
+            future.result()
@@ -12,12 +12,14 @@
     ExternalScheduleExecutionErrorData,
     PipelineSelector,
     RepositoryLocation,
-    RepositoryLocationHandle,
+    RepositoryLocationCache,
+    repository_location_from_origin,
 )
 from dagster.core.instance import DagsterInstance
 from dagster.core.scheduler.job import JobState, JobStatus, JobTickData, JobTickStatus, JobType
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
 from dagster.core.storage.tags import SCHEDULED_EXECUTION_TIME_TAG, check_tags
+from dagster.scheduler.concurrency import for_each_job_state
 from dagster.utils import merge_dicts
 from dagster.utils.error import serializable_error_info_from_exc_info
 
@@ -61,9 +63,24 @@ def __exit__(self, exception_type, exception_value, traceback):
 _SCHEDULER_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S%z"
 
 
-def execute_scheduler_iteration(instance, logger, max_catchup_runs):
+def execute_scheduler_iteration(
+    instance,
+    logger,
+    max_catchup_runs,
+    location_cache=None,
+    max_concurrent=None,
+    evaluation_timeout=None,
+):
     end_datetime_utc = pendulum.now("UTC")
-    launch_scheduled_runs(instance, logger, end_datetime_utc, max_catchup_runs)
+    launch_scheduled_runs(
+        instance,
+        logger,
+        end_datetime_utc,
+        max_catchup_runs,
+        location_cache=location_cache,
+        max_concurrent=max_concurrent,
+        evaluation_timeout=evaluation_timeout,
+    )
 
 
 def launch_scheduled_runs(
@@ -72,7 +89,14 @@ def launch_scheduled_runs(
     end_datetime_utc,
     max_catchup_runs=_DEFAULT_MAX_CATCHUP_RUNS,
     debug_crash_flags=None,
+    location_cache=None,
+    max_concurrent=None,
+    evaluation_timeout=None,
 ):
+    check.opt_inst_param(location_cache, "location_cache", RepositoryLocationCache)
+    check.opt_int_param(max_concurrent, "max_concurrent")
+    check.opt_numeric_param(evaluation_timeout, "evaluation_timeout")
+
     schedules = [
         s
         for s in instance.all_stored_job_state(job_type=JobType.SCHEDULE)
@@ -89,13 +113,12 @@ def launch_scheduled_runs(
         )
     )
 
-    for schedule_state in schedules:
+    def _launch_for_schedule(schedule_state):
         try:
-            with RepositoryLocationHandle.create_from_repository_location_origin(
-                schedule_state.origin.external_repository_origin.repository_location_origin
-            ) as repo_location_handle:
-                repo_location = RepositoryLocation.from_handle(repo_location_handle)
-
+            with repository_location_from_origin(
+                schedule_state.origin.external_repository_origin.repository_location_origin,
+                location_cache,
+            ) as repo_location:
                 launch_scheduled_runs_for_schedule(
                     instance,
                     logger,
@@ -104,6 +127,7 @@ def launch_scheduled_runs(
                     end_datetime_utc,
                     max_catchup_runs,
                     (debug_crash_flags.get(schedule_state.job_name) if debug_crash_flags else None),
+                    evaluation_timeout=evaluation_timeout,
                 )
         except Exception:  # pylint: disable=broad-except
             logger.error(
@@ -113,6 +137,13 @@ def launch_scheduled_runs(
                 )
             )
 
+    for_each_job_state(
+        _launch_for_schedule,
+        schedules,
+        max_concurrent=max_concurrent,
+        thread_name_prefix="schedule",
+    )
+
 
 def launch_scheduled_runs_for_schedule(
     instance,
@@ -122,6 +153,7 @@ def launch_scheduled_runs_for_schedule(
     end_datetime_utc,
     max_catchup_runs,
     debug_crash_flags=None,
+    evaluation_timeout=None,
 ):
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(schedule_state, "schedule_state", JobState)
@@ -227,6 +259,7 @@ def launch_scheduled_runs_for_schedule(
                 schedule_time,
                 tick_holder,
                 debug_crash_flags,
+                evaluation_timeout,
             )
 
 
@@ -252,6 +285,7 @@ def _schedule_run_at_time(
     schedule_time,
     tick_holder,
     debug_crash_flags,
+    evaluation_timeout=None,
 ):
     schedule_name = external_schedule.name
 
@@ -314,6 +348,7 @@ def _schedule_run_at_time(
             external_schedule,
             external_pipeline,
             tick_holder,
+            evaluation_timeout,
         )
 
         _check_for_debug_crash(debug_crash_flags, "RUN_CREATED")
@@ -355,12 +390,14 @@ def _create_scheduler_run(
     external_schedule,
     external_pipeline,
     tick_holder,
+    evaluation_timeout=None,
 ):
     schedule_execution_data = repo_location.get_external_schedule_execution_data(
         instance=instance,
         repository_handle=external_repo.handle,
         schedule_name=external_schedule.name,
         scheduled_execution_time=schedule_time,
+        timeout=evaluation_timeout,
     )
 
     if isinstance(schedule_execution_data, ExternalScheduleExecutionErrorData):
@@ -10,8 +10,8 @@
 from dagster.core.host_representation import (
     ExternalPipeline,
     PipelineSelector,
-    RepositoryLocation,
-    RepositoryLocationHandle,
+    RepositoryLocationCache,
+    repository_location_from_origin,
 )
 from dagster.core.host_representation.external_data import (
     ExternalSensorExecutionData,
@@ -21,6 +21,7 @@
 from dagster.core.scheduler.job import JobStatus, JobTickData, JobTickStatus, SensorJobData
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
 from dagster.core.storage.tags import RUN_KEY_TAG, check_tags
+from dagster.scheduler.concurrency import for_each_job_state
 from dagster.utils import merge_dicts
 from dagster.utils.error import serializable_error_info_from_exc_info
 
@@ -88,8 +89,18 @@ def _check_for_debug_crash(debug_crash_flags, key):
     raise Exception("Process didn't terminate after sending crash signal")
 
 
-def execute_sensor_iteration(instance, logger, debug_crash_flags=None):
+def execute_sensor_iteration(
+    instance,
+    logger,
+    debug_crash_flags=None,
+    location_cache=None,
+    max_concurrent=None,
+    evaluation_timeout=None,
+):
     check.inst_param(instance, "instance", DagsterInstance)
+    check.opt_inst_param(location_cache, "location_cache", RepositoryLocationCache)
+    check.opt_int_param(max_concurrent, "max_concurrent")
+    check.opt_numeric_param(evaluation_timeout, "evaluation_timeout")
     sensor_jobs = [
         s
         for s in instance.all_stored_job_state(job_type=JobType.SENSOR)
@@ -104,63 +115,77 @@ def execute_sensor_iteration(instance, logger, debug_crash_flags=None):
         )
     )
 
-    for job_state in sensor_jobs:
-        sensor_debug_crash_flags = (
-            debug_crash_flags.get(job_state.job_name) if debug_crash_flags else None
-        )
-        try:
-            with RepositoryLocationHandle.create_from_repository_location_origin(
-                job_state.origin.external_repository_origin.repository_location_origin
-            ) as repo_location_handle:
-                repo_location = RepositoryLocation.from_handle(repo_location_handle)
-                repo_dict = repo_location.get_repositories()
-                check.invariant(
-                    len(repo_dict) == 1,
-                    "Reconstructed repository location should have exactly one repository",
-                )
-                external_repo = next(iter(repo_dict.values()))
-                if not external_repo.has_external_job(job_state.job_name):
-                    continue
-
-                now = pendulum.now()
-                latest_tick = instance.get_latest_job_tick(job_state.job_origin_id)
-                if not latest_tick or latest_tick.status in RECORDED_TICK_STATES:
-                    tick = instance.create_job_tick(
-                        JobTickData(
-                            job_origin_id=job_state.job_origin_id,
-                            job_name=job_state.job_name,
-                            job_type=JobType.SENSOR,
-                            status=JobTickStatus.STARTED,
-                            timestamp=now.timestamp(),
-                        )
-                    )
-                else:
-                    tick = latest_tick.with_status(
-                        JobTickStatus.STARTED, timestamp=now.timestamp(), run_key=None,
-                    )
-                    instance.update_job_tick(tick)
-
-                _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
-
-                external_sensor = external_repo.get_external_sensor(job_state.job_name)
-                with SensorLaunchContext(job_state, tick, instance, logger) as tick_context:
-                    _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
-                    _evaluate_sensor(
-                        tick_context,
-                        instance,
-                        repo_location,
-                        external_repo,
-                        external_sensor,
-                        job_state,
-                        sensor_debug_crash_flags,
+    for_each_job_state(
+        lambda job_state: _execute_sensor(
+            instance,
+            logger,
+            job_state,
+            location_cache,
+            evaluation_timeout,
+            debug_crash_flags.get(job_state.job_name) if debug_crash_flags else None,
+        ),
+        sensor_jobs,
+        max_concurrent=max_concurrent,
+        thread_name_prefix="sensor",
+    )
+
+
+def _execute_sensor(
+    instance, logger, job_state, location_cache, evaluation_timeout, sensor_debug_crash_flags
+):
+    try:
+        with repository_location_from_origin(
+            job_state.origin.external_repository_origin.repository_location_origin, location_cache,
+        ) as repo_location:
+            repo_dict = repo_location.get_repositories()
+            check.invariant(
+                len(repo_dict) == 1,
+                "Reconstructed repository location should have exactly one repository",
+            )
+            external_repo = next(iter(repo_dict.values()))
+            if not external_repo.has_external_job(job_state.job_name):
+                return
+
+            now = pendulum.now()
+            latest_tick = instance.get_latest_job_tick(job_state.job_origin_id)
+            if not latest_tick or latest_tick.status in RECORDED_TICK_STATES:
+                tick = instance.create_job_tick(
+                    JobTickData(
+                        job_origin_id=job_state.job_origin_id,
+                        job_name=job_state.job_name,
+                        job_type=JobType.SENSOR,
+                        status=JobTickStatus.STARTED,
+                        timestamp=now.timestamp(),
                     )
-        except Exception:  # pylint: disable=broad-except
-            logger.error(
-                "Sensor failed for {sensor_name} : {error_info}".format(
-                    sensor_name=job_state.job_name,
-                    error_info=serializable_error_info_from_exc_info(sys.exc_info()).to_string(),
                 )
+            else:
+                tick = latest_tick.with_status(
+                    JobTickStatus.STARTED, timestamp=now.timestamp(), run_key=None,
+                )
+                instance.update_job_tick(tick)
+
+            _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
+
+            external_sensor = external_repo.get_external_sensor(job_state.job_name)
+            with SensorLaunchContext(job_state, tick, instance, logger) as tick_context:
+                _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
+                _evaluate_sensor(
+                    tick_context,
+                    instance,
+                    repo_location,
+                    external_repo,
+                    external_sensor,
+                    job_state,
+                    sensor_debug_crash_flags,
+                    evaluation_timeout,
+                )
+    except Exception:  # pylint: disable=broad-except
+        logger.error(
+            "Sensor failed for {sensor_name} : {error_info}".format(
+                sensor_name=job_state.job_name,
+                error_info=serializable_error_info_from_exc_info(sys.exc_info()).to_string(),
             )
+        )
 
 
 def _evaluate_sensor(
@@ -171,6 +196,7 @@ def _evaluate_sensor(
     external_sensor,
     job_state,
     sensor_debug_crash_flags=None,
+    evaluation_timeout=None,
 ):
     sensor_runtime_data = repo_location.get_external_sensor_execution_data(
         instance,
@@ -179,6 +205,7 @@ def _evaluate_sensor(
         job_state.job_specific_data.last_completed_timestamp
         if job_state.job_specific_data
         else None,
+        timeout=evaluation_timeout,
     )
     if isinstance(sensor_runtime_data, ExternalSensorExecutionErrorData):
         context.logger.error(
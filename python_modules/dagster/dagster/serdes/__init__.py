@@ -13,9 +13,12 @@
 * This isn't meant to replace pickle in the conditions that pickle is reasonable to use
   (in memory, not human readable, etc) just handle the json case effectively.
 """
+import base64
+import binascii
 import hashlib
 import importlib
 import sys
+import zlib
 from abc import ABCMeta, abstractmethod, abstractproperty
 from collections import namedtuple
 from enum import Enum
@@ -292,6 +295,68 @@ def _deserialize_json_to_dagster_namedtuple(json_str, whitelist_map):
     return _unpack_value(seven.json.loads(json_str), whitelist_map=whitelist_map)
 
 
+# Prefix marking a value serialized by serialize_dagster_namedtuple_compressed. The version
+# identifies the preset dictionary used for compression, so that the dictionary can evolve while
+# values written with earlier versions remain readable. Serialized JSON always begins with "{", so
+# uncompressed values can never be mistaken for compressed ones.
+COMPRESSED_JSON_PREFIX = "zlib:1:"
+
+# Preset zlib dictionary of the keys and class envelopes repeated in every serialized event record,
+# so that compressing a single small record does not need to spell them out. zlib favors matches
+# towards the end of the dictionary, so the most common substrings come last.
+_COMPRESSION_DICTIONARY = (
+    '{"__class__": "StepMaterializationData", "materialization": {"__class__": '
+    '"AssetMaterialization", "asset_key": {"__class__": "AssetKey", "path": ["'
+    '{"__class__": "StepOutputData", "step_output_handle": {"__class__": "StepOutputHandle", '
+    '"output_name": "result", "step_key": "'
+    '{"__class__": "EngineEventData", "error": null, "marker_end": null, "marker_start": null, '
+    '"metadata_entries": [{"__class__": "EventMetadataEntry", "description": null, "entry_data": '
+    '{"__class__": "TextMetadataEntryData", "text": "'
+    '"type_check_data": {"__class__": "TypeCheckData", "description": null, "label": "result", '
+    '"metadata_entries": [], "success": true}, "version": null}'
+    '"event_type_value": "STEP_OUTPUT""event_type_value": "STEP_SUCCESS"'
+    '"event_type_value": "STEP_START""event_type_value": "ENGINE_EVENT"'
+    '"logging_tags": {"pipeline": "", "solid": "", "solid_definition": "", "step_key": ""}, '
+    '"pid": null, "pipeline_name": "", "solid_handle": {"__class__": "SolidHandle", "name": "", '
+    '"parent": null}, "step_key": "", "step_kind_value": "COMPUTE"}, "error_info": null, '
+    '"level": 10, "message": "", "pipeline_name": "", "run_id": "", "step_key": "", '
+    '"timestamp": 1600000000.000000, "user_message": "'
+    '{"__class__": "DagsterEventRecord", "dagster_event": {"__class__": "DagsterEvent", '
+    '"event_specific_data": '
+).encode("utf-8")
+
+
+def serialize_dagster_namedtuple_compressed(nt):
+    """Serializes a whitelisted namedtuple to a compressed, base64 encoded string, which takes a
+    fraction of the space of the JSON produced by serialize_dagster_namedtuple. Read back with
+    deserialize_dagster_namedtuple.
+    """
+    json_str = serialize_dagster_namedtuple(nt)
+    compressor = zlib.compressobj(zdict=_COMPRESSION_DICTIONARY)
+    compressed = compressor.compress(json_str.encode("utf-8")) + compressor.flush()
+    return COMPRESSED_JSON_PREFIX + base64.b64encode(compressed).decode("ascii")
+
+
+def deserialize_dagster_namedtuple(serialized_str):
+    """Deserializes a whitelisted namedtuple serialized with either serialize_dagster_namedtuple or
+    serialize_dagster_namedtuple_compressed.
+    """
+    check.str_param(serialized_str, "serialized_str")
+    if not serialized_str.startswith(COMPRESSED_JSON_PREFIX):
+        return deserialize_json_to_dagster_namedtuple(serialized_str)
+
+    try:
+        decompressor = zlib.decompressobj(zdict=_COMPRESSION_DICTIONARY)
+        json_bytes = decompressor.decompress(
+            base64.b64decode(serialized_str[len(COMPRESSED_JSON_PREFIX) :])
+        )
+        json_str = (json_bytes + decompressor.flush()).decode("utf-8")
+    except (binascii.Error, zlib.error, UnicodeDecodeError) as err:
+        check.failed("Could not decompress serialized value: {err}".format(err=err))
+
+    return deserialize_json_to_dagster_namedtuple(json_str)
+
+
 def default_to_storage_value(value, whitelist_map):
     base_dict = {key: _pack_value(value, whitelist_map) for key, value in value._asdict().items()}
     base_dict["__class__"] = value.__class__.__name__
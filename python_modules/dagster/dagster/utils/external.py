@@ -3,8 +3,8 @@
 from dagster import check
 from dagster.core.host_representation import (
     ExternalPipeline,
-    RepositoryLocation,
-    RepositoryLocationHandle,
+    RepositoryLocationCache,
+    repository_location_from_origin,
 )
 from dagster.core.host_representation.origin import ExternalPipelineOrigin
 from dagster.core.host_representation.selector import PipelineSelector
@@ -12,17 +12,17 @@
 
 
 @contextlib.contextmanager
-def external_pipeline_from_run(pipeline_run):
+def external_pipeline_from_run(pipeline_run, location_cache=None):
     check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+    check.opt_inst_param(location_cache, "location_cache", RepositoryLocationCache)
     external_pipeline_origin = check.inst(
         pipeline_run.external_pipeline_origin, ExternalPipelineOrigin
     )
 
-    with RepositoryLocationHandle.create_from_repository_location_origin(
-        external_pipeline_origin.external_repository_origin.repository_location_origin
-    ) as repo_location_handle:
-        repo_location = RepositoryLocation.from_handle(repo_location_handle)
-
+    with repository_location_from_origin(
+        external_pipeline_origin.external_repository_origin.repository_location_origin,
+        location_cache,
+    ) as repo_location:
         repo_dict = repo_location.get_repositories()
         check.invariant(
             len(repo_dict) == 1,
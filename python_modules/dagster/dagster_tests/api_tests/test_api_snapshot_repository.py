@@ -5,15 +5,20 @@
 import grpc
 import pytest
 from dagster import lambda_solid, pipeline, repository
+from dagster.api.snapshot_pipeline import sync_get_streaming_external_pipeline_data_grpc
 from dagster.api.snapshot_repository import (
     sync_get_external_repositories_grpc,
+    sync_get_external_repository_indices_grpc,
     sync_get_streaming_external_repositories_grpc,
 )
 from dagster.core.host_representation import (
+    ExternalPipelineOrigin,
     ExternalRepository,
+    ExternalRepositoryIndexData,
+    ExternalRepositoryOrigin,
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
-from dagster.core.host_representation.handle import RepositoryLocationHandle
+from dagster.core.host_representation.handle import RepositoryHandle, RepositoryLocationHandle
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
 
 from .utils import get_bar_repo_grpc_repository_location_handle
@@ -47,6 +52,149 @@ def test_streaming_external_repositories_api_grpc():
         assert external_repository.name == "bar_repo"
 
 
+def test_external_repository_not_modified_grpc():
+    with get_bar_repo_grpc_repository_location_handle() as repository_location_handle:
+        external_repository_origin = ExternalRepositoryOrigin(
+            repository_location_handle.origin, "bar_repo"
+        )
+
+        result = repository_location_handle.client.external_repository(
+            external_repository_origin=external_repository_origin
+        )
+        assert not result["not_modified"]
+        assert result["snapshot_id"]
+        assert result["external_repository_data"].name == "bar_repo"
+
+        # the server replies that the repository was not modified rather than sending it again
+        not_modified_result = repository_location_handle.client.external_repository(
+            external_repository_origin=external_repository_origin,
+            known_snapshot_id=result["snapshot_id"],
+        )
+        assert not_modified_result["not_modified"]
+        assert not_modified_result["snapshot_id"] == result["snapshot_id"]
+        assert not_modified_result["external_repository_data"] is None
+
+        stale_result = repository_location_handle.client.external_repository(
+            external_repository_origin=external_repository_origin, known_snapshot_id="stale",
+        )
+        assert not stale_result["not_modified"]
+        assert stale_result["external_repository_data"] == result["external_repository_data"]
+
+        chunks = list(
+            repository_location_handle.client.streaming_external_repository(
+                external_repository_origin=external_repository_origin,
+                known_snapshot_id=result["snapshot_id"],
+            )
+        )
+        assert len(chunks) == 1
+        assert chunks[0]["not_modified"]
+        assert not chunks[0]["serialized_external_repository_chunk"]
+
+
+def test_streaming_external_repositories_reuse_data_grpc():
+    with get_bar_repo_grpc_repository_location_handle() as repository_location_handle:
+        external_repository = sync_get_streaming_external_repositories_grpc(
+            repository_location_handle.client, repository_location_handle
+        )[0]
+
+        # the unchanged repository is not fetched again, and the data already fetched is kept
+        reloaded_external_repository = sync_get_streaming_external_repositories_grpc(
+            repository_location_handle.client, repository_location_handle
+        )[0]
+        assert (
+            reloaded_external_repository.external_repository_data
+            is external_repository.external_repository_data
+        )
+
+
+def test_external_repository_indices_grpc():
+    with get_bar_repo_grpc_repository_location_handle() as repository_location_handle:
+        external_repos = sync_get_external_repository_indices_grpc(
+            repository_location_handle.client, repository_location_handle
+        )
+
+        assert len(external_repos) == 1
+
+        external_repository = external_repos[0]
+        assert isinstance(external_repository.external_repository_data, ExternalRepositoryIndexData)
+        assert external_repository.name == "bar_repo"
+        assert external_repository.has_pipeline("foo")
+        assert not external_repository.has_pipeline("not_a_pipeline")
+        assert len(external_repository.get_external_schedules()) > 0
+        assert len(external_repository.get_external_sensors()) == 2
+
+        # the pipeline is fetched when it is first used, and kept
+        external_pipeline = external_repository.get_full_external_pipeline("foo")
+        assert external_pipeline.name == "foo"
+        assert (
+            external_repository.get_full_external_pipeline("foo").external_pipeline_data
+            is external_pipeline.external_pipeline_data
+        )
+
+        summary_data = next(
+            summary_data
+            for summary_data in external_repository.external_repository_data.external_pipeline_summary_datas
+            if summary_data.name == "foo"
+        )
+        assert summary_data.pipeline_snapshot_id == external_pipeline.computed_pipeline_snapshot_id
+
+        assert sorted(
+            external_pipeline.name
+            for external_pipeline in external_repository.get_all_external_pipelines()
+        ) == ["bar", "baz", "foo"]
+
+
+def test_external_repository_indices_stale_pipeline_grpc():
+    with get_bar_repo_grpc_repository_location_handle() as repository_location_handle:
+        external_repository_index_data = sync_get_external_repository_indices_grpc(
+            repository_location_handle.client, repository_location_handle
+        )[0].external_repository_data
+
+        # an index whose snapshot id no longer matches the pipeline that the server returns
+        stale_index_data = external_repository_index_data._replace(
+            external_pipeline_summary_datas=[
+                summary_data._replace(pipeline_snapshot_id="stale")
+                if summary_data.name == "foo"
+                else summary_data
+                for summary_data in external_repository_index_data.external_pipeline_summary_datas
+            ]
+        )
+
+        loaded_pipeline_names = []
+
+        def _load_external_pipeline_data(pipeline_name):
+            loaded_pipeline_names.append(pipeline_name)
+            return sync_get_streaming_external_pipeline_data_grpc(
+                repository_location_handle.client,
+                ExternalPipelineOrigin(external_repository.get_external_origin(), pipeline_name),
+            )
+
+        external_repository = ExternalRepository(
+            stale_index_data,
+            RepositoryHandle(
+                repository_name=stale_index_data.name,
+                repository_location_handle=repository_location_handle,
+            ),
+            external_pipeline_data_loader=_load_external_pipeline_data,
+        )
+
+        # the summaries are listed without fetching any pipeline
+        assert sorted(
+            summary_data.name
+            for summary_data in external_repository.get_external_pipeline_summaries()
+        ) == ["bar", "baz", "foo"]
+        assert external_repository.has_pipeline("foo")
+        assert loaded_pipeline_names == []
+
+        assert external_repository.get_full_external_pipeline("foo").name == "foo"
+        assert external_repository.get_full_external_pipeline("foo").name == "foo"
+        assert external_repository.get_full_external_pipeline("bar").name == "bar"
+        assert external_repository.get_full_external_pipeline("bar").name == "bar"
+
+        # the stale pipeline is fetched each time, the current one is kept
+        assert loaded_pipeline_names == ["foo", "foo", "bar"]
+
+
 @lambda_solid
 def do_something():
     return 1
@@ -108,3 +256,17 @@ def test_giant_external_repository_streaming_grpc():
 
         assert isinstance(external_repository, ExternalRepository)
         assert external_repository.name == "giant_repo"
+
+
+def test_giant_external_repository_indices_grpc():
+    with get_giant_repo_grpc_repository_location_handle() as repository_location_handle:
+        # the index is small, and the giant pipeline is streamed when it is used
+        external_repository = sync_get_external_repository_indices_grpc(
+            repository_location_handle.client, repository_location_handle
+        )[0]
+
+        assert external_repository.name == "giant_repo"
+        assert (
+            external_repository.get_full_external_pipeline("giant_pipeline").name
+            == "giant_pipeline"
+        )
@@ -0,0 +1,131 @@
+"""Measures the overhead of tracking progress through very large execution plans with
+``ActiveExecution``, by driving synthetic plans to completion without executing any step.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.active_execution_scheduling --num-steps 50000
+"""
+import time
+
+import click
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    MultiDependencyDefinition,
+    PipelineDefinition,
+    SolidInvocation,
+    lambda_solid,
+)
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.retries import Retries, RetryMode
+
+
+@lambda_solid
+def source():
+    return 1
+
+
+@lambda_solid(input_defs=[InputDefinition("num")])
+def transform(num):
+    return num
+
+
+@lambda_solid(input_defs=[InputDefinition("nums")])
+def combine(nums):
+    return nums
+
+
+def _wide_pipeline(num_steps):
+    """num_steps independent steps."""
+    return PipelineDefinition(
+        name="wide",
+        solid_defs=[source],
+        dependencies={
+            SolidInvocation("source", "source_{}".format(i)): {} for i in range(num_steps)
+        },
+    )
+
+
+def _fan_out_pipeline(num_steps):
+    """A single step fanning out to num_steps - 2 steps, which fan back in to a single step."""
+    width = num_steps - 2
+    dependencies = {SolidInvocation("source", "source"): {}}
+    for i in range(width):
+        dependencies[SolidInvocation("transform", "transform_{}".format(i))] = {
+            "num": DependencyDefinition("source")
+        }
+    dependencies[SolidInvocation("combine", "combine")] = {
+        "nums": MultiDependencyDefinition(
+            [DependencyDefinition("transform_{}".format(i)) for i in range(width)]
+        )
+    }
+    return PipelineDefinition(
+        name="fan_out", solid_defs=[source, transform, combine], dependencies=dependencies
+    )
+
+
+def _layered_pipeline(num_steps, width=100):
+    """Layers of width steps, each of which depends on two steps of the layer above."""
+    dependencies = {}
+    for i in range(num_steps):
+        layer, position = divmod(i, width)
+        if layer == 0:
+            dependencies[SolidInvocation("source", "step_{}".format(i))] = {}
+        else:
+            above = (layer - 1) * width
+            dependencies[SolidInvocation("combine", "step_{}".format(i))] = {
+                "nums": MultiDependencyDefinition(
+                    [
+                        DependencyDefinition("step_{}".format(above + position)),
+                        DependencyDefinition("step_{}".format(above + (position + 1) % width)),
+                    ]
+                )
+            }
+    return PipelineDefinition(
+        name="layered", solid_defs=[source, combine], dependencies=dependencies
+    )
+
+
+PLANS = {"wide": _wide_pipeline, "fan_out": _fan_out_pipeline, "layered": _layered_pipeline}
+
+
+def _drive_to_completion(execution_plan, max_concurrent):
+    """Vends steps max_concurrent at a time and marks them successful in order, returning the
+    number of steps completed."""
+    num_completed = 0
+    in_flight = []
+    with execution_plan.start(retries=Retries(RetryMode.DISABLED)) as active_execution:
+        while not active_execution.is_complete:
+            in_flight.extend(
+                step.key
+                for step in active_execution.get_steps_to_execute(
+                    limit=max_concurrent - len(in_flight)
+                )
+            )
+            active_execution.mark_success(in_flight.pop(0))
+            num_completed += 1
+    return num_completed
+
+
+@click.command()
+@click.option("--num-steps", type=click.INT, default=50000)
+@click.option("--max-concurrent", type=click.INT, default=16)
+@click.option("--plan", type=click.Choice(sorted(PLANS.keys())), multiple=True)
+def benchmark_active_execution_scheduling(num_steps, max_concurrent, plan):
+    for plan_name in plan or sorted(PLANS.keys()):
+        execution_plan = create_execution_plan(PLANS[plan_name](num_steps))
+
+        start = time.time()
+        num_completed = _drive_to_completion(execution_plan, max_concurrent)
+        elapsed = time.time() - start
+
+        assert num_completed == num_steps
+        click.echo(
+            "{plan_name} ({num_steps} steps): {elapsed:.2f}s, {rate:.0f} steps/sec".format(
+                plan_name=plan_name, num_steps=num_steps, elapsed=elapsed, rate=num_steps / elapsed,
+            )
+        )
+
+
+if __name__ == "__main__":
+    benchmark_active_execution_scheduling()  # pylint: disable=no-value-for-parameter
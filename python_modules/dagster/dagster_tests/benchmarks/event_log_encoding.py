@@ -0,0 +1,79 @@
+"""Compares the size and decode throughput of the JSON and compressed encodings of the event
+records stored in the event log.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.event_log_encoding --num-solids 20 --num-runs 10
+"""
+import time
+
+import click
+from dagster import AssetMaterialization, DagsterInstance, Output, execute_pipeline, pipeline, solid
+from dagster.serdes import (
+    deserialize_dagster_namedtuple,
+    serialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_compressed,
+)
+
+ENCODINGS = {
+    "json": serialize_dagster_namedtuple,
+    "compressed": serialize_dagster_namedtuple_compressed,
+}
+
+
+def _event_records(num_solids, num_runs):
+    @solid
+    def emit(_context, num):
+        yield AssetMaterialization(
+            asset_key="asset_{}".format(num), description="A materialization"
+        )
+        yield Output(num + 1)
+
+    @pipeline
+    def chain():
+        num = emit.alias("emit_0")()
+        for i in range(1, num_solids):
+            num = emit.alias("emit_{}".format(i))(num)
+
+    records = []
+    with DagsterInstance.ephemeral() as instance:
+        for _ in range(num_runs):
+            result = execute_pipeline(
+                chain,
+                run_config={"solids": {"emit_0": {"inputs": {"num": {"value": 0}}}}},
+                instance=instance,
+            )
+            records.extend(instance.all_logs(result.run_id))
+    return records
+
+
+@click.command()
+@click.option("--num-solids", type=click.INT, default=20)
+@click.option("--num-runs", type=click.INT, default=10)
+def benchmark_event_log_encoding(num_solids, num_runs):
+    records = _event_records(num_solids, num_runs)
+    click.echo("Encoding {num_records} event records".format(num_records=len(records)))
+
+    for encoding_name, serialize_fn in ENCODINGS.items():
+        start = time.time()
+        serialized = [serialize_fn(record) for record in records]
+        encode_elapsed = time.time() - start
+
+        start = time.time()
+        for serialized_str in serialized:
+            deserialize_dagster_namedtuple(serialized_str)
+        decode_elapsed = time.time() - start
+
+        click.echo(
+            "{encoding_name}: {bytes_per_event:.0f} bytes/event, "
+            "encode {encode_rate:.0f} events/sec, decode {decode_rate:.0f} events/sec".format(
+                encoding_name=encoding_name,
+                bytes_per_event=sum(len(value) for value in serialized) / len(serialized),
+                encode_rate=len(serialized) / encode_elapsed,
+                decode_rate=len(serialized) / decode_elapsed,
+            )
+        )
+
+
+if __name__ == "__main__":
+    benchmark_event_log_encoding()  # pylint: disable=no-value-for-parameter
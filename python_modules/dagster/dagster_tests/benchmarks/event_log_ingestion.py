@@ -0,0 +1,110 @@
+"""Measures event log ingestion throughput, comparing one ``store_event`` call per event against
+batched ``store_events`` calls.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.event_log_ingestion --num-events 20000 --batch-size 100
+"""
+import time
+from contextlib import contextmanager
+
+import click
+from dagster import seven
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord
+from dagster.core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    InMemoryEventLogStorage,
+    SqliteEventLogStorage,
+)
+
+
+@contextmanager
+def _in_memory_storage():
+    yield InMemoryEventLogStorage()
+
+
+@contextmanager
+def _sqlite_storage():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        yield SqliteEventLogStorage(tmpdir_path)
+
+
+@contextmanager
+def _consolidated_sqlite_storage():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        yield ConsolidatedSqliteEventLogStorage(tmpdir_path)
+
+
+STORAGES = {
+    "in_memory": _in_memory_storage,
+    "sqlite": _sqlite_storage,
+    "consolidated_sqlite": _consolidated_sqlite_storage,
+}
+
+
+def _event_records(run_id, num_events):
+    return [
+        DagsterEventRecord(
+            None,
+            "Message_{}".format(i),
+            "debug",
+            "",
+            run_id,
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                "nonce",
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+        for i in range(num_events)
+    ]
+
+
+def _events_per_second(storage_cm_fn, store_fn, num_events):
+    with storage_cm_fn() as storage:
+        events = _event_records("benchmark_run", num_events)
+        start = time.time()
+        store_fn(storage, events)
+        elapsed = time.time() - start
+        assert len(storage.get_logs_for_run("benchmark_run")) == num_events
+    return num_events / elapsed
+
+
+def _store_individually(storage, events):
+    for event in events:
+        storage.store_event(event)
+
+
+def _store_batched(batch_size):
+    def _store(storage, events):
+        for i in range(0, len(events), batch_size):
+            storage.store_events(events[i : i + batch_size])
+
+    return _store
+
+
+@click.command()
+@click.option("--num-events", type=click.INT, default=10000)
+@click.option("--batch-size", type=click.INT, default=100)
+@click.option("--storage", type=click.Choice(sorted(STORAGES.keys())), multiple=True)
+def benchmark_event_log_ingestion(num_events, batch_size, storage):
+    for storage_name in storage or sorted(STORAGES.keys()):
+        storage_cm_fn = STORAGES[storage_name]
+        individual = _events_per_second(storage_cm_fn, _store_individually, num_events)
+        batched = _events_per_second(storage_cm_fn, _store_batched(batch_size), num_events)
+        click.echo(
+            "{storage_name}: store_event {individual:.0f} events/sec, "
+            "store_events (batch size {batch_size}) {batched:.0f} events/sec ({ratio:.1f}x)".format(
+                storage_name=storage_name,
+                individual=individual,
+                batch_size=batch_size,
+                batched=batched,
+                ratio=batched / individual,
+            )
+        )
+
+
+if __name__ == "__main__":
+    benchmark_event_log_ingestion()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,133 @@
+"""Measures how long events sent by child processes take to be seen by the parent process, and how
+much CPU the parent burns waiting on them, as the number of concurrent children grows.
+
+Compares round-robin polling of one ``execute_child_process_command`` iterator per child, each of
+which blocks for up to ``TICK`` on its own child, against waiting on all the children at once with
+``wait_for_child_processes``, as the multiprocess executor does.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.multiprocess_event_latency --concurrency 1 --concurrency 8 --concurrency 32
+"""
+import random
+import time
+
+import click
+from dagster.core.executor.child_process_executor import (
+    PROCESS_DEAD_AND_QUEUE_EMPTY,
+    ChildProcess,
+    ChildProcessCommand,
+    ChildProcessEvent,
+    ChildProcessStartEvent,
+    execute_child_process_command,
+    wait_for_child_processes,
+)
+from dagster.seven import multiprocessing
+
+
+class SendTimestampsCommand(ChildProcessCommand):
+    def __init__(self, start_event, num_events, interval):
+        self.start_event = start_event
+        self.num_events = num_events
+        self.interval = interval
+
+    def execute(self):
+        # wait for every child to have started, so that the cost of spawning them is not measured
+        self.start_event.wait()
+        for _ in range(self.num_events):
+            # jitter the events so that the children do not all send them in lockstep
+            time.sleep(random.uniform(0, 2 * self.interval))
+            yield time.time()
+
+
+def _poll_iterators(commands, start_event):
+    latencies = []
+    num_started = 0
+    active_iters = [execute_child_process_command(command) for command in commands]
+    while active_iters:
+        for step_iter in list(active_iters):
+            try:
+                event = next(step_iter)
+            except StopIteration:
+                active_iters.remove(step_iter)
+                continue
+
+            if isinstance(event, float):
+                latencies.append(time.time() - event)
+            elif isinstance(event, ChildProcessStartEvent):
+                num_started += 1
+                if num_started == len(commands):
+                    start_event.set()
+    return latencies
+
+
+def _wait_on_children(commands, start_event):
+    latencies = []
+    num_started = 0
+    children = [ChildProcess(command) for command in commands]
+    exited = []
+    while children:
+        for child in wait_for_child_processes(children, timeout=0.1):
+            for event in child.read_events():
+                if isinstance(event, float):
+                    latencies.append(time.time() - event)
+                elif isinstance(event, ChildProcessStartEvent):
+                    num_started += 1
+                    if num_started == len(commands):
+                        start_event.set()
+                elif event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    child.close()
+                    children.remove(child)
+                    exited.append(child)
+                else:
+                    assert isinstance(event, ChildProcessEvent)
+
+    for child in exited:
+        child.join()
+    return latencies
+
+
+MODES = {"poll": _poll_iterators, "wait": _wait_on_children}
+
+
+def _measure(mode_fn, concurrency, num_events, interval):
+    start_event = multiprocessing.Event()
+    commands = [
+        SendTimestampsCommand(start_event, num_events, interval) for _ in range(concurrency)
+    ]
+    start_cpu = time.process_time()
+    start = time.time()
+    latencies = sorted(mode_fn(commands, start_event))
+    elapsed = time.time() - start
+    cpu = time.process_time() - start_cpu
+    assert len(latencies) == concurrency * num_events
+    return (
+        1000 * latencies[len(latencies) // 2],
+        1000 * latencies[int(len(latencies) * 0.99)],
+        100 * cpu / elapsed,
+    )
+
+
+@click.command()
+@click.option("--concurrency", type=click.INT, multiple=True)
+@click.option("--num-events", type=click.INT, default=20)
+@click.option("--interval", type=click.FLOAT, default=0.05)
+@click.option("--mode", type=click.Choice(sorted(MODES.keys())), multiple=True)
+def benchmark_multiprocess_event_latency(concurrency, num_events, interval, mode):
+    for num_children in concurrency or [1, 8, 32]:
+        for mode_name in mode or sorted(MODES.keys()):
+            p50, p99, cpu_percent = _measure(MODES[mode_name], num_children, num_events, interval)
+            click.echo(
+                "{num_children} children, {mode_name}: event latency p50 {p50:.1f}ms, "
+                "p99 {p99:.1f}ms, parent cpu {cpu_percent:.0f}%".format(
+                    num_children=num_children,
+                    mode_name=mode_name,
+                    p50=p50,
+                    p99=p99,
+                    cpu_percent=cpu_percent,
+                )
+            )
+
+
+if __name__ == "__main__":
+    benchmark_multiprocess_event_latency()  # pylint: disable=no-value-for-parameter
@@ -9,10 +9,23 @@
 snapshots['test_basic_solids_config 1'] = {
     'execution': {
         'in_process': {
-            'config': {'marker_to_close': '', 'retries': {'disabled': {}, 'enabled': {}}}
+            'config': {
+                'marker_to_close': '',
+                'release_intermediates': True,
+                'retries': {'disabled': {}, 'enabled': {}},
+            }
         },
         'multiprocess': {
-            'config': {'max_concurrent': 0, 'retries': {'disabled': {}, 'enabled': {}}}
+            'config': {
+                'capacity': {'cpu': 0.0, 'memory': 0.0},
+                'critical_path': {'num_runs': 0},
+                'fuse_steps': True,
+                'max_concurrent': 0,
+                'release_intermediates': True,
+                'retries': {'disabled': {}, 'enabled': {}},
+                'reuse_resources': True,
+                'worker_pool': True,
+            }
         },
     },
     'loggers': {'console': {'config': {'log_level': '', 'name': ''}}},
@@ -27,10 +40,23 @@
 snapshots['test_two_modes 2'] = {
     'execution': {
         'in_process': {
-            'config': {'marker_to_close': '', 'retries': {'disabled': {}, 'enabled': {}}}
+            'config': {
+                'marker_to_close': '',
+                'release_intermediates': True,
+                'retries': {'disabled': {}, 'enabled': {}},
+            }
         },
         'multiprocess': {
-            'config': {'max_concurrent': 0, 'retries': {'disabled': {}, 'enabled': {}}}
+            'config': {
+                'capacity': {'cpu': 0.0, 'memory': 0.0},
+                'critical_path': {'num_runs': 0},
+                'fuse_steps': True,
+                'max_concurrent': 0,
+                'release_intermediates': True,
+                'retries': {'disabled': {}, 'enabled': {}},
+                'reuse_resources': True,
+                'worker_pool': True,
+            }
         },
     },
     'loggers': {'console': {'config': {'log_level': '', 'name': ''}}},
@@ -45,10 +71,23 @@
 snapshots['test_two_modes 4'] = {
     'execution': {
         'in_process': {
-            'config': {'marker_to_close': '', 'retries': {'disabled': {}, 'enabled': {}}}
+            'config': {
+                'marker_to_close': '',
+                'release_intermediates': True,
+                'retries': {'disabled': {}, 'enabled': {}},
+            }
         },
         'multiprocess': {
-            'config': {'max_concurrent': 0, 'retries': {'disabled': {}, 'enabled': {}}}
+            'config': {
+                'capacity': {'cpu': 0.0, 'memory': 0.0},
+                'critical_path': {'num_runs': 0},
+                'fuse_steps': True,
+                'max_concurrent': 0,
+                'release_intermediates': True,
+                'retries': {'disabled': {}, 'enabled': {}},
+                'reuse_resources': True,
+                'worker_pool': True,
+            }
         },
     },
     'loggers': {'console': {'config': {'log_level': '', 'name': ''}}},
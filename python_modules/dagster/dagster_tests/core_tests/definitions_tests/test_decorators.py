@@ -1,6 +1,7 @@
 # encoding: utf-8
 # py27 compat
 
+import asyncio
 import re
 from datetime import datetime, time
 
@@ -114,6 +115,44 @@ def hello_world(_context):
     assert result.output_value()["foo"] == "bar"
 
 
+def test_async_solid():
+    @solid(output_defs=[OutputDefinition()])
+    async def hello_world(_context):
+        await asyncio.sleep(0.01)
+        return {"foo": "bar"}
+
+    result = execute_solid(hello_world)
+
+    assert result.success
+    assert result.output_value()["foo"] == "bar"
+
+
+def test_async_solid_yield():
+    @solid(output_defs=[OutputDefinition(name="foo"), OutputDefinition(name="bar")])
+    async def hello_world(_context):
+        await asyncio.sleep(0.01)
+        yield Output(value="foo", output_name="foo")
+        await asyncio.sleep(0.01)
+        yield Output(value="bar", output_name="bar")
+
+    result = execute_solid(hello_world)
+
+    assert result.success
+    assert result.output_values == {"foo": "foo", "bar": "bar"}
+
+
+def test_async_lambda_solid():
+    @lambda_solid
+    async def hello_world():
+        await asyncio.sleep(0.01)
+        return {"foo": "bar"}
+
+    result = execute_solid(hello_world)
+
+    assert result.success
+    assert result.output_value()["foo"] == "bar"
+
+
 def test_solid_with_explicit_empty_outputs():
     @solid(output_defs=[])
     def hello_world(_context):
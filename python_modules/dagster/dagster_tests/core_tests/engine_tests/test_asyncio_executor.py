@@ -0,0 +1,112 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from dagster import (
+    InputDefinition,
+    ModeDefinition,
+    Output,
+    OutputDefinition,
+    asyncio_executor,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    solid,
+)
+
+asyncio_mode = ModeDefinition(executor_defs=[asyncio_executor])
+
+
+def _asyncio_run_config(max_concurrent=0):
+    return {"execution": {"asyncio": {"config": {"max_concurrent": max_concurrent}}}}
+
+
+def test_async_and_sync_solids():
+    @lambda_solid
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return 2
+
+    @lambda_solid(input_defs=[InputDefinition("num")])
+    def add_three(num):
+        return num + 3
+
+    @solid(
+        input_defs=[InputDefinition("num")],
+        output_defs=[OutputDefinition(name="doubled"), OutputDefinition(name="tripled")],
+    )
+    async def multiply(_, num):
+        await asyncio.sleep(0.01)
+        yield Output(num * 2, "doubled")
+        yield Output(num * 3, "tripled")
+
+    @pipeline(mode_defs=[asyncio_mode])
+    def mixed_pipeline():
+        multiply(add_three(fetch()))
+
+    result = execute_pipeline(mixed_pipeline, run_config=_asyncio_run_config())
+    assert result.success
+    assert result.result_for_solid("multiply").output_values == {"doubled": 10, "tripled": 15}
+
+
+def test_async_steps_share_the_event_loop():
+    num_steps = 20
+    started = []
+    loop_threads = set()
+
+    def make_solid(i):
+        @solid(name="wait_{}".format(i))
+        async def wait(_):
+            loop_threads.add(threading.current_thread())
+            started.append(i)
+            # only completes once every step has started waiting at the same time
+            deadline = time.time() + 10
+            while len(started) < num_steps:
+                assert time.time() < deadline
+                await asyncio.sleep(0.01)
+            return asyncio.get_event_loop()
+
+        return wait
+
+    @pipeline(mode_defs=[asyncio_mode])
+    def concurrent_pipeline():
+        for i in range(num_steps):
+            make_solid(i)()
+
+    result = execute_pipeline(
+        concurrent_pipeline, run_config=_asyncio_run_config(max_concurrent=num_steps)
+    )
+    assert result.success
+
+    # the coroutines of all the steps ran on the one loop, on the main thread
+    assert loop_threads == {threading.main_thread()}
+    assert (
+        len({result.result_for_solid("wait_{}".format(i)).output_value() for i in range(num_steps)})
+        == 1
+    )
+
+
+def test_async_solid_failure():
+    @lambda_solid
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise Exception("boom")
+
+    @lambda_solid(input_defs=[InputDefinition("num")])
+    def downstream(num):
+        return num
+
+    @pipeline(mode_defs=[asyncio_mode])
+    def failing_pipeline():
+        downstream(fail())
+
+    result = execute_pipeline(
+        failing_pipeline, run_config=_asyncio_run_config(), raise_on_error=False
+    )
+    assert not result.success
+    assert not result.result_for_solid("fail").success
+    assert result.result_for_solid("downstream").skipped
+
+    with pytest.raises(Exception, match="boom"):
+        execute_pipeline(failing_pipeline, run_config=_asyncio_run_config())
@@ -3,6 +3,8 @@
 
 import pytest
 from dagster.core.executor.child_process_executor import (
+    PROCESS_DEAD_AND_QUEUE_EMPTY,
+    ChildProcess,
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessDoneEvent,
@@ -10,6 +12,7 @@
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
     execute_child_process_command,
+    wait_for_child_processes,
 )
 from dagster.utils import segfault
 
@@ -101,3 +104,61 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(LongRunningCommand()))
+
+
+class SleepThenYieldCommand(ChildProcessCommand):
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def execute(self):
+        time.sleep(self.seconds)
+        yield self.seconds
+
+
+def _read_until_dead(child):
+    events = []
+    while PROCESS_DEAD_AND_QUEUE_EMPTY not in events:
+        wait_for_child_processes([child], timeout=5)
+        events.extend(child.read_events())
+    child.join()
+    child.close()
+    return events
+
+
+def test_wait_for_child_processes():
+    slow = ChildProcess(SleepThenYieldCommand(60))
+    fast = ChildProcess(SleepThenYieldCommand(0))
+    try:
+        events = {slow.pid: [], fast.pid: []}
+        start = time.time()
+        while PROCESS_DEAD_AND_QUEUE_EMPTY not in events[fast.pid]:
+            for child in wait_for_child_processes([slow, fast], timeout=60):
+                events[child.pid].extend(child.read_events())
+
+        # woken up by the events of the fast child, rather than by the timeout
+        assert time.time() - start < 60
+
+        assert isinstance(events[fast.pid][0], ChildProcessStartEvent)
+        assert events[fast.pid][1:] == [
+            0,
+            ChildProcessDoneEvent(pid=fast.pid),
+            PROCESS_DEAD_AND_QUEUE_EMPTY,
+        ]
+        assert all(isinstance(event, ChildProcessStartEvent) for event in events[slow.pid])
+
+        fast.join()
+        fast.close()
+        assert fast.exit_code == 0
+    finally:
+        slow.terminate()
+        slow.join()
+        slow.close()
+
+
+def test_wait_for_crashed_child_process():
+    child = ChildProcess(CrashyCommand())
+    events = _read_until_dead(child)
+    assert isinstance(events[0], ChildProcessStartEvent)
+    assert events[-1] == PROCESS_DEAD_AND_QUEUE_EMPTY
+    assert not any(isinstance(event, ChildProcessDoneEvent) for event in events)
+    assert child.exit_code == 1
@@ -0,0 +1,194 @@
+import os
+
+from dagster import (
+    InputDefinition,
+    ModeDefinition,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    reconstructable,
+    reexecute_pipeline,
+    seven,
+)
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.storage.asset_store import fs_asset_store
+from dagster.core.storage.intermediate_storage import build_fs_intermediate_storage
+from dagster.core.test_utils import instance_for_test
+
+
+@lambda_solid
+def emit():
+    return list(range(1000))
+
+
+@lambda_solid(input_defs=[InputDefinition("nums")])
+def double(nums):
+    return [num * 2 for num in nums]
+
+
+@lambda_solid(input_defs=[InputDefinition("nums")])
+def triple(nums):
+    return [num * 3 for num in nums]
+
+
+@lambda_solid(input_defs=[InputDefinition("left"), InputDefinition("right")])
+def total(left, right):
+    return sum(left) + sum(right)
+
+
+@lambda_solid(input_defs=[InputDefinition("nums")])
+def fail(nums):
+    raise Exception("boom")
+
+
+@pipeline
+def fan_in_pipeline():
+    nums = emit()
+    total(double(nums), triple(nums))
+
+
+@pipeline
+def failure_pipeline():
+    fail(double(emit()))
+
+
+def _run_config(executor="in_process", storage="filesystem"):
+    run_config = {"execution": {executor: {"config": {"release_intermediates": True}}}}
+    if storage:
+        run_config["intermediate_storage"] = {storage: {}}
+    return run_config
+
+
+def _stored_outputs(instance, run_id, step_keys):
+    intermediate_storage = build_fs_intermediate_storage(instance.intermediates_directory, run_id)
+    return {
+        step_key
+        for step_key in step_keys
+        if intermediate_storage.has_intermediate(None, StepOutputHandle(step_key))
+    }
+
+
+def _summary(result):
+    (event,) = [
+        event
+        for event in result.event_list
+        if event.is_engine_event and event.message.startswith("Released")
+    ]
+    return {
+        entry.label: entry.entry_data.value for entry in event.engine_event_data.metadata_entries
+    }
+
+
+FAN_IN_STEP_KEYS = ["emit.compute", "double.compute", "triple.compute", "total.compute"]
+
+
+def test_release_intermediates_in_process():
+    with instance_for_test() as instance:
+        result = execute_pipeline(fan_in_pipeline, run_config=_run_config(), instance=instance)
+        assert result.success
+
+        # only the output no step consumes is kept
+        assert _stored_outputs(instance, result.run_id, FAN_IN_STEP_KEYS) == {"total.compute"}
+
+        summary = _summary(result)
+        assert summary["Intermediates released"] == 3
+        assert summary["Bytes released"] > 0
+        assert summary["Peak bytes held"] < summary["Peak bytes held without releasing"]
+
+
+def test_release_intermediates_in_memory():
+    result = execute_pipeline(fan_in_pipeline, run_config=_run_config(storage="in_memory"))
+    assert result.success
+
+    summary = _summary(result)
+    assert summary["Intermediates released"] == 3
+    assert summary["Peak bytes held"] < summary["Peak bytes held without releasing"]
+
+
+def test_release_intermediates_multiprocess():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(fan_in_pipeline),
+            run_config=_run_config(executor="multiprocess"),
+            instance=instance,
+        )
+        assert result.success
+
+        assert _stored_outputs(instance, result.run_id, FAN_IN_STEP_KEYS) == {"total.compute"}
+        assert _summary(result)["Intermediates released"] == 3
+
+
+def test_keep_intermediates_by_default():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            fan_in_pipeline,
+            run_config={"intermediate_storage": {"filesystem": {}}},
+            instance=instance,
+        )
+        assert result.success
+
+        assert _stored_outputs(instance, result.run_id, FAN_IN_STEP_KEYS) == set(FAN_IN_STEP_KEYS)
+
+
+def test_keep_inputs_of_failed_step():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            failure_pipeline, run_config=_run_config(), instance=instance, raise_on_error=False
+        )
+        assert not result.success
+
+        # the input of the failed step is kept to re-execute from the failure
+        assert _stored_outputs(
+            instance, result.run_id, ["emit.compute", "double.compute", "fail.compute"]
+        ) == {"double.compute"}
+
+        reexecution_result = reexecute_pipeline(
+            failure_pipeline,
+            result.run_id,
+            run_config=_run_config(),
+            step_selection=["fail.compute"],
+            instance=instance,
+            raise_on_error=False,
+        )
+        # the step executes on the kept input, rather than being skipped
+        assert [
+            event.step_key for event in reexecution_result.step_event_list if event.is_step_failure
+        ] == ["fail.compute"]
+
+
+def test_keep_outputs_for_steps_not_executed():
+    with instance_for_test() as instance:
+        result = execute_pipeline(fan_in_pipeline, run_config=_run_config(), instance=instance)
+        assert result.success
+
+        reexecution_result = reexecute_pipeline(
+            fan_in_pipeline,
+            result.run_id,
+            run_config=_run_config(),
+            step_selection=["emit.compute", "double.compute"],
+            instance=instance,
+        )
+        assert reexecution_result.success
+
+        # triple.compute and total.compute consume the outputs but are not executed
+        assert _stored_outputs(
+            instance, reexecution_result.run_id, ["emit.compute", "double.compute"]
+        ) == {"emit.compute", "double.compute"}
+
+
+def test_keep_outputs_handled_by_asset_store():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        asset_store = fs_asset_store.configured({"base_dir": tmpdir_path})
+
+        @pipeline(mode_defs=[ModeDefinition(resource_defs={"asset_store": asset_store})])
+        def asset_store_pipeline():
+            nums = emit()
+            total(double(nums), triple(nums))
+
+        with instance_for_test() as instance:
+            result = execute_pipeline(
+                asset_store_pipeline, run_config=_run_config(storage=None), instance=instance
+            )
+            assert result.success
+            assert _summary(result)["Intermediates released"] == 0
+            assert len(os.listdir(os.path.join(tmpdir_path, result.run_id))) == 4
@@ -8,15 +8,18 @@
     Failure,
     Field,
     InputDefinition,
+    ModeDefinition,
     Nothing,
     Output,
     OutputDefinition,
     PresetDefinition,
     String,
+    check,
     execute_pipeline,
     lambda_solid,
     pipeline,
     reconstructable,
+    resource,
     solid,
 )
 from dagster.core.instance import DagsterInstance
@@ -433,3 +436,266 @@ def test_crash_hard_multiprocessing():
         #     ).data
         #     is None
         # )
+
+
+@resource(config_schema={"path": str})
+def init_counting_resource(init_context):
+    with open(init_context.resource_config["path"], "a") as fd:
+        fd.write("{}\n".format(os.getpid()))
+    return os.getpid()
+
+
+@solid(required_resource_keys={"counter"})
+def get_pid(context):
+    return os.getpid()
+
+
+@solid(required_resource_keys={"counter"}, input_defs=[InputDefinition("prev_pid")])
+def get_next_pid(context, prev_pid):  # pylint: disable=unused-argument
+    return os.getpid()
+
+
+@pipeline(mode_defs=[ModeDefinition(resource_defs={"counter": init_counting_resource})])
+def pid_chain_pipeline():
+    get_next_pid(get_next_pid(get_pid()))
+
+
+def _pid_chain_run_config(path, **executor_config):
+    return {
+        "execution": {"multiprocess": {"config": executor_config}},
+        "storage": {"filesystem": {}},
+        "resources": {"counter": {"config": {"path": path}}},
+    }
+
+
+def _read_worker_resource_inits(path):
+    # the parent process also initializes resources, to set up the run and to load outputs
+    with open(path) as fd:
+        return [line for line in fd.read().splitlines() if line and int(line) != os.getpid()]
+
+
+def test_worker_pool_multiprocessing():
+    with instance_for_test() as instance:
+        with safe_tempfile_path() as path:
+            result = execute_pipeline(
+                reconstructable(pid_chain_pipeline),
+                run_config=_pid_chain_run_config(path, max_concurrent=1, worker_pool=True),
+                instance=instance,
+            )
+            assert result.success
+
+            pids = {
+                result.output_for_solid(solid_name)
+                for solid_name in ["get_pid", "get_next_pid", "get_next_pid_2"]
+            }
+            # every step was handed to the same warm worker process
+            assert len(pids) == 1
+            assert os.getpid() not in pids
+
+            # resources are initialized once per step unless reuse_resources is set
+            assert len(_read_worker_resource_inits(path)) == 3
+
+
+def test_worker_pool_reuse_resources_multiprocessing():
+    with instance_for_test() as instance:
+        with safe_tempfile_path() as path:
+            result = execute_pipeline(
+                reconstructable(pid_chain_pipeline),
+                run_config=_pid_chain_run_config(
+                    path, max_concurrent=1, worker_pool=True, reuse_resources=True
+                ),
+                instance=instance,
+            )
+            assert result.success
+            assert result.output_for_solid("get_next_pid_2") == result.output_for_solid("get_pid")
+            assert len(_read_worker_resource_inits(path)) == 1
+
+
+def test_reuse_resources_requires_worker_pool():
+    with instance_for_test() as instance:
+        with safe_tempfile_path() as path:
+            with pytest.raises(check.CheckError, match="reuse_resources"):
+                execute_pipeline(
+                    reconstructable(pid_chain_pipeline),
+                    run_config=_pid_chain_run_config(path, reuse_resources=True),
+                    instance=instance,
+                )
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_worker_pool_multiprocessing():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(sys_exit_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"worker_pool": True}}},
+                "storage": {"filesystem": {}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        failure_data = result.result_for_solid("sys_exit").failure_data
+        assert failure_data
+        assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
+@solid(tags={"dagster/memory": "600"})
+def memory_heavy(_):
+    pass
+
+
+@solid(tags={"dagster/cpu": "0.5"})
+def tiny(_):
+    pass
+
+
+@pipeline
+def memory_heavy_pipeline():
+    for i in range(3):
+        memory_heavy.alias("memory_heavy_{}".format(i))()
+        tiny.alias("tiny_{}".format(i))()
+
+
+def test_capacity_multiprocessing():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(memory_heavy_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {"max_concurrent": 6, "capacity": {"cpu": 4, "memory": 1000}}
+                    }
+                },
+                "storage": {"filesystem": {}},
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        utilization = [
+            {
+                entry.label: entry.entry_data.value
+                for entry in event.event_specific_data.metadata_entries
+            }
+            for event in result.event_list
+            if event.is_engine_event and event.message.startswith("Multiprocess executor: cpu")
+        ]
+        assert utilization
+        # the memory heavy steps never run together, while the tiny steps run alongside them
+        assert max(entry["memory_in_use"] for entry in utilization) == 600
+        assert max(entry["cpu_in_use"] for entry in utilization) <= 4
+        assert max(entry["steps_in_flight"] for entry in utilization) > 1
+
+
+def test_fused_steps_multiprocessing():
+    with instance_for_test() as instance:
+        with safe_tempfile_path() as path:
+            result = execute_pipeline(
+                reconstructable(pid_chain_pipeline),
+                run_config=_pid_chain_run_config(path, fuse_steps=True),
+                instance=instance,
+            )
+            assert result.success
+
+            # the chain was executed in a single child process, with an event for every step
+            pids = {
+                result.output_for_solid(solid_name)
+                for solid_name in ["get_pid", "get_next_pid", "get_next_pid_2"]
+            }
+            assert len(pids) == 1
+            assert os.getpid() not in pids
+            assert {
+                event.step_key for event in result.step_event_list if event.is_step_success
+            } == {"get_pid.compute", "get_next_pid.compute", "get_next_pid_2.compute",}
+
+            # the outputs were handed over in memory, and still written to the filesystem
+            input_loads = [
+                event.message
+                for event in result.step_event_list
+                if event.event_type_value == "OBJECT_STORE_OPERATION"
+                and event.event_specific_data.op == "GET_OBJECT"
+            ]
+            assert (
+                input_loads
+                == ["Retrieved intermediate object for input prev_pid in memory object store."] * 2
+            )
+            assert result.output_for_solid("get_next_pid") in pids
+
+
+def test_fused_steps_worker_pool_multiprocessing():
+    with instance_for_test() as instance:
+        with safe_tempfile_path() as path:
+            result = execute_pipeline(
+                reconstructable(pid_chain_pipeline),
+                run_config=_pid_chain_run_config(
+                    path, worker_pool=True, reuse_resources=True, fuse_steps=True
+                ),
+                instance=instance,
+            )
+            assert result.success
+            assert result.output_for_solid("get_next_pid_2") == result.output_for_solid("get_pid")
+            assert len(_read_worker_resource_inits(path)) == 1
+
+
+@lambda_solid
+def emit_one():
+    return 1
+
+
+@lambda_solid(input_defs=[InputDefinition("num")])
+def fail_on_one(num):
+    if num == 1:
+        raise Exception("bad num")
+    return num
+
+
+@solid(input_defs=[InputDefinition("num")], tags={"dagster/fuse": "false"})
+def unfused_pid(_, num):  # pylint: disable=unused-argument
+    return os.getpid()
+
+
+@lambda_solid(input_defs=[InputDefinition("num")])
+def fused_pid(num):  # pylint: disable=unused-argument
+    return os.getpid()
+
+
+@pipeline
+def fused_failure_pipeline():
+    fused_pid.alias("downstream_of_failure")(fail_on_one(emit_one()))
+
+
+@pipeline
+def fuse_tag_pipeline():
+    fused_pid(unfused_pid(emit_one()))
+
+
+def test_failure_in_fused_steps_multiprocessing():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(fused_failure_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"fuse_steps": True}}},
+                "storage": {"filesystem": {}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        assert result.result_for_solid("emit_one").success
+        assert not result.result_for_solid("fail_on_one").success
+        assert not result.result_for_solid("downstream_of_failure").step_events
+
+
+def test_fuse_tag_multiprocessing():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(fuse_tag_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"fuse_steps": True}}},
+                "storage": {"filesystem": {}},
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.output_for_solid("unfused_pid") != result.output_for_solid("fused_pid")
@@ -0,0 +1,190 @@
+import threading
+
+import pytest
+from dagster import (
+    InputDefinition,
+    ModeDefinition,
+    Output,
+    OutputDefinition,
+    RetryRequested,
+    execute_pipeline,
+    lambda_solid,
+    multithread_executor,
+    pipeline,
+    resource,
+    solid,
+)
+
+multithread_mode = ModeDefinition(executor_defs=[multithread_executor])
+
+
+def _multithread_run_config(max_concurrent=0):
+    return {"execution": {"multithread": {"config": {"max_concurrent": max_concurrent}}}}
+
+
+def define_diamond_pipeline():
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(input_defs=[InputDefinition("num")])
+    def add_three(num):
+        return num + 3
+
+    @lambda_solid(input_defs=[InputDefinition("num")])
+    def mult_three(num):
+        return num * 3
+
+    @lambda_solid(input_defs=[InputDefinition("left"), InputDefinition("right")])
+    def adder(left, right):
+        return left + right
+
+    @pipeline(mode_defs=[multithread_mode])
+    def diamond_pipeline():
+        two = return_two()
+        adder(left=add_three(two), right=mult_three(two))
+
+    return diamond_pipeline
+
+
+def test_diamond_multithread_execution():
+    # outputs are passed in memory, so neither persistent storage nor a persistent instance is needed
+    result = execute_pipeline(define_diamond_pipeline(), run_config=_multithread_run_config())
+    assert result.success
+    assert result.result_for_solid("adder").output_value() == 11
+
+
+def test_steps_execute_concurrently():
+    num_steps = 4
+    barrier = threading.Barrier(num_steps, timeout=10)
+    resource_inits = []
+
+    @resource
+    def shared_resource(_):
+        resource_inits.append(threading.current_thread())
+        return object()
+
+    def make_solid(i):
+        @solid(name="wait_{}".format(i), required_resource_keys={"shared"})
+        def wait(context):
+            # only passes once every step is waiting at the barrier at the same time
+            barrier.wait()
+            return id(context.resources.shared)
+
+        return wait
+
+    @pipeline(
+        mode_defs=[
+            ModeDefinition(
+                executor_defs=[multithread_executor], resource_defs={"shared": shared_resource}
+            )
+        ]
+    )
+    def concurrent_pipeline():
+        for i in range(num_steps):
+            make_solid(i)()
+
+    result = execute_pipeline(
+        concurrent_pipeline, run_config=_multithread_run_config(max_concurrent=num_steps)
+    )
+    assert result.success
+
+    # the steps share the resources of the run
+    assert len(resource_inits) == 1
+    assert (
+        len({result.result_for_solid("wait_{}".format(i)).output_value() for i in range(num_steps)})
+        == 1
+    )
+
+
+def test_not_thread_safe_steps_execute_alone_on_main_thread():
+    lock = threading.Lock()
+    running = []
+    observed = {}
+
+    def make_solid(name, tags=None):
+        @solid(name=name, tags=tags)
+        def track(_):
+            with lock:
+                running.append(name)
+                observed[name] = (list(running), threading.current_thread())
+            try:
+                # give the other steps a chance to start
+                threading.Event().wait(0.2)
+            finally:
+                with lock:
+                    running.remove(name)
+
+        return track
+
+    @pipeline(mode_defs=[multithread_mode])
+    def mixed_pipeline():
+        for i in range(3):
+            make_solid("safe_{}".format(i))()
+        make_solid("unsafe", tags={"dagster/thread_safe": "false"})()
+
+    result = execute_pipeline(mixed_pipeline, run_config=_multithread_run_config(max_concurrent=4))
+    assert result.success
+
+    unsafe_running, unsafe_thread = observed["unsafe"]
+    assert unsafe_running == ["unsafe"]
+    assert unsafe_thread is threading.main_thread()
+
+    for i in range(3):
+        _, thread = observed["safe_{}".format(i)]
+        assert thread is not threading.main_thread()
+
+
+def define_failing_pipeline():
+    @lambda_solid
+    def fail():
+        raise Exception("boom")
+
+    @lambda_solid(input_defs=[InputDefinition("num")])
+    def downstream(num):
+        return num
+
+    @lambda_solid
+    def unrelated():
+        return 1
+
+    @pipeline(mode_defs=[multithread_mode])
+    def failing_pipeline():
+        downstream(fail())
+        unrelated()
+
+    return failing_pipeline
+
+
+def test_multithread_failure():
+    result = execute_pipeline(
+        define_failing_pipeline(), run_config=_multithread_run_config(), raise_on_error=False
+    )
+    assert not result.success
+    assert not result.result_for_solid("fail").success
+    assert result.result_for_solid("downstream").skipped
+    assert result.result_for_solid("unrelated").output_value() == 1
+
+
+def test_multithread_failure_raises_on_main_thread():
+    with pytest.raises(Exception, match="boom"):
+        execute_pipeline(define_failing_pipeline(), run_config=_multithread_run_config())
+
+
+def test_multithread_retries():
+    attempts = []
+
+    @solid(output_defs=[OutputDefinition(int)])
+    def flaky(_):
+        attempts.append(threading.current_thread())
+        if len(attempts) < 3:
+            raise RetryRequested(max_retries=2)
+        yield Output(len(attempts))
+
+    @pipeline(mode_defs=[multithread_mode])
+    def retry_pipeline():
+        flaky()
+
+    result = execute_pipeline(retry_pipeline, run_config=_multithread_run_config())
+    assert result.success
+    assert result.result_for_solid("flaky").output_value() == 3
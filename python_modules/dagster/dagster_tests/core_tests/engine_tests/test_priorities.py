@@ -1,3 +1,5 @@
+import time
+
 from dagster import execute_pipeline, pipeline, reconstructable, solid
 from dagster.core.test_utils import instance_for_test
 
@@ -51,3 +53,48 @@ def test_priorities_mp():
         assert [
             str(event.solid_handle) for event in result.step_event_list if event.is_step_success
         ] == ["high", "high_2", "none", "none_2", "low", "low_2"]
+
+
+@solid
+def a_short(_):
+    pass
+
+
+@solid
+def b_long(_):
+    time.sleep(0.2)
+
+
+@solid
+def b_long_tail(_, _b_long):
+    time.sleep(0.2)
+
+
+@pipeline
+def critical_path_test():
+    a_short()
+    b_long_tail(b_long())
+
+
+def test_critical_path_mp():
+    with instance_for_test() as instance:
+        pipe = reconstructable(critical_path_test)
+        run_config = {
+            "execution": {"multiprocess": {"config": {"max_concurrent": 1}}},
+            "storage": {"filesystem": {}},
+        }
+
+        # without history, ready steps of the same priority are started in order of their keys
+        result = execute_pipeline(pipe, run_config, instance=instance)
+        assert result.success
+        assert [
+            str(event.solid_handle) for event in result.step_event_list if event.is_step_start
+        ] == ["a_short", "b_long", "b_long_tail"]
+
+        # with history, the steps on the longest path to the end of the plan are started first
+        run_config["execution"]["multiprocess"]["config"]["critical_path"] = {"num_runs": 5}
+        result = execute_pipeline(pipe, run_config, instance=instance)
+        assert result.success
+        assert [
+            str(event.solid_handle) for event in result.step_event_list if event.is_step_start
+        ] == ["b_long", "b_long_tail", "a_short"]
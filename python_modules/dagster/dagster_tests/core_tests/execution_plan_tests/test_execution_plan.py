@@ -3,9 +3,13 @@
 from dagster.core.errors import (
     DagsterIncompleteExecutionPlanError,
     DagsterInvalidConfigError,
+    DagsterInvariantViolationError,
     DagsterUnknownStepStateError,
 )
 from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.plan.capacity import StepCapacity
+from dagster.core.execution.plan.critical_path import CriticalPathPriority
+from dagster.core.execution.plan.fusion import StepFusion
 from dagster.core.execution.retries import Retries, RetryMode
 
 from ..engine_tests.test_multiprocessing import define_diamond_pipeline
@@ -293,6 +297,73 @@ def priorities():
         _ = [active_execution.mark_skipped(step.key) for step in steps]
 
 
+def test_priorities_of_steps_becoming_executable():
+    @solid
+    def root(_):
+        pass
+
+    @solid(tags={"dagster/priority": 1})
+    def low(_, _root):
+        pass
+
+    @solid(tags={"dagster/priority": 5})
+    def high(_, _root):
+        pass
+
+    @solid
+    def unrelated(_):
+        pass
+
+    @pipeline
+    def priorities():
+        root_output = root()
+        low(root_output)
+        high(root_output)
+        unrelated()
+
+    plan = create_execution_plan(priorities)
+    with plan.start(Retries(RetryMode.DISABLED)) as active_execution:
+        steps = active_execution.get_steps_to_execute(limit=1)
+        assert [step.key for step in steps] == ["root.compute"]
+
+        active_execution.mark_success("root.compute")
+
+        # steps that became executable later are still ordered by priority
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == [
+            "high.compute",
+            "low.compute",
+            "unrelated.compute",
+        ]
+        _ = [active_execution.mark_success(step.key) for step in steps]
+
+        assert active_execution.is_complete
+
+
+def test_abandon_with_deps_in_flight():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    with plan.start(retries=Retries(RetryMode.DISABLED)) as active_execution:
+        active_execution.mark_success(active_execution.get_steps_to_execute()[0].key)
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["add_three.compute", "mult_three.compute"]
+
+        active_execution.mark_failed("add_three.compute")
+
+        # the downstream step is abandoned without waiting on mult_three
+        steps = active_execution.get_steps_to_abandon()
+        assert [step.key for step in steps] == ["adder.compute"]
+        active_execution.mark_abandoned("adder.compute")
+
+        assert not active_execution.is_complete
+
+        active_execution.mark_success("mult_three.compute")
+
+        assert active_execution.get_steps_to_execute() == []
+        assert active_execution.is_complete
+
+
 def test_executor_not_created_for_execute_plan():
     instance = DagsterInstance.ephemeral()
     pipe = define_diamond_pipeline()
@@ -341,3 +412,254 @@ def test_lost_steps():
                 steps_to_abandon = active_execution.get_steps_to_abandon()
 
             assert active_execution.is_complete
+
+
+def test_steps_packed_into_capacity():
+    @solid(tags={"dagster/priority": 3, "dagster/cpu": 4, "dagster/memory": 1000})
+    def big(_):
+        pass
+
+    @solid(tags={"dagster/priority": 2, "dagster/cpu": 4})
+    def big_2(_):
+        pass
+
+    @solid(tags={"dagster/priority": 1})
+    def small(_):
+        pass
+
+    @solid(tags={"dagster/cpu": 16})
+    def huge(_):
+        pass
+
+    @pipeline
+    def sized():
+        big()
+        big_2()
+        small()
+        huge()
+
+    plan = create_execution_plan(sized)
+    capacity = StepCapacity(cpu=6, memory=2000)
+    with plan.start(Retries(RetryMode.DISABLED), capacity=capacity) as active_execution:
+        # big_2 does not fit next to big, so the lower priority small step is started
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["big.compute", "small.compute"]
+        assert capacity.cpu_in_use == 5
+        assert capacity.memory_in_use == 1000
+
+        assert active_execution.get_steps_to_execute() == []
+
+        active_execution.mark_success("big.compute")
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["big_2.compute"]
+
+        active_execution.mark_success("small.compute")
+        active_execution.mark_failed("big_2.compute")
+        assert capacity.num_steps == 0
+
+        # a step needing more than the whole capacity runs once nothing else is
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["huge.compute"]
+        active_execution.mark_success("huge.compute")
+
+        assert active_execution.is_complete
+
+
+def test_invalid_capacity_tag():
+    @solid(tags={"dagster/memory": "lots"})
+    def greedy(_):
+        pass
+
+    @pipeline
+    def invalid():
+        greedy()
+
+    plan = create_execution_plan(invalid)
+    with pytest.raises(DagsterInvariantViolationError, match="dagster/memory"):
+        plan.start(Retries(RetryMode.DISABLED), capacity=StepCapacity(memory=1000))
+
+
+def test_fused_linear_chains():
+    @solid
+    def emit(_):
+        return 1
+
+    @solid
+    def passthrough(_, num):
+        return num
+
+    @solid(tags={"dagster/fuse": "false"})
+    def unfused(_, num):
+        return num
+
+    @solid
+    def add(_, left, right):
+        return left + right
+
+    @pipeline
+    def chains():
+        # emit -> passthrough -> passthrough_2 is fused, the fan-out of passthrough_3 and the fan-in
+        # of add are not, and the edge in to unfused is turned off by its tag
+        left = passthrough.alias("passthrough_2")(passthrough(emit()))
+        right = passthrough.alias("passthrough_3")(emit.alias("emit_2")())
+        add(left, right)
+        unfused(right)
+
+    plan = create_execution_plan(chains)
+    fusion = StepFusion(plan, enabled=True)
+    assert fusion.unit_for("emit.compute") == [
+        "emit.compute",
+        "passthrough.compute",
+        "passthrough_2.compute",
+    ]
+    assert fusion.unit_for("emit_2.compute") == ["emit_2.compute", "passthrough_3.compute"]
+    assert fusion.unit_for("add.compute") == ["add.compute"]
+    assert fusion.unit_for("unfused.compute") == ["unfused.compute"]
+    assert not fusion.is_continuation("add.compute")
+    assert not fusion.is_continuation("unfused.compute")
+
+    # steps are only fused when enabled by config
+    assert StepFusion(plan).unit_for("emit.compute") == ["emit.compute"]
+
+    # nor across the groups of the steps
+    grouped_fusion = StepFusion(
+        plan, enabled=True, group_fn=lambda step: step.key == "passthrough_2.compute"
+    )
+    assert grouped_fusion.unit_for("emit.compute") == ["emit.compute", "passthrough.compute"]
+    assert grouped_fusion.unit_for("passthrough_2.compute") == ["passthrough_2.compute"]
+
+    with plan.start(Retries(RetryMode.DISABLED), fusion=fusion) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["emit.compute", "emit_2.compute"]
+        assert active_execution.unit_for(steps[0]) == [
+            "emit.compute",
+            "passthrough.compute",
+            "passthrough_2.compute",
+        ]
+
+        # the steps continuing a unit are in flight as soon as the step before them completes,
+        # rather than handed out again
+        active_execution.mark_success("emit.compute")
+        active_execution.mark_skipped("emit_2.compute")
+        assert active_execution.get_steps_to_execute() == []
+        assert active_execution.is_in_flight("passthrough.compute")
+        assert active_execution.is_in_flight("passthrough_3.compute")
+
+        active_execution.mark_success("passthrough.compute")
+        active_execution.mark_success("passthrough_2.compute")
+        active_execution.mark_skipped("passthrough_3.compute")
+        steps = active_execution.get_steps_to_skip()
+        assert {step.key for step in steps} == {"add.compute", "unfused.compute"}
+        for step in steps:
+            active_execution.mark_skipped(step.key)
+
+        assert active_execution.is_complete
+
+
+def test_fuse_tag_does_not_enable_fusion():
+    @solid
+    def emit(_):
+        return 1
+
+    @solid(tags={"dagster/fuse": "true"})
+    def passthrough(_, num):
+        return num
+
+    @pipeline
+    def chain():
+        passthrough(emit())
+
+    plan = create_execution_plan(chain)
+    assert StepFusion(plan).unit_for("emit.compute") == ["emit.compute"]
+    assert not StepFusion(plan).is_continuation("passthrough.compute")
+    assert StepFusion(plan, enabled=True).unit_for("emit.compute") == [
+        "emit.compute",
+        "passthrough.compute",
+    ]
+
+
+def test_invalid_fuse_tag():
+    @solid(tags={"dagster/fuse": "sometimes"})
+    def indecisive(_):
+        pass
+
+    @pipeline
+    def invalid():
+        indecisive()
+
+    plan = create_execution_plan(invalid)
+    with pytest.raises(DagsterInvariantViolationError, match="dagster/fuse"):
+        StepFusion(plan)
+
+
+def test_critical_path_priority():
+    @solid
+    def root(_):
+        pass
+
+    @solid
+    def quick(_, _root):
+        pass
+
+    @solid
+    def slow(_, _root):
+        pass
+
+    @solid
+    def slow_tail(_, _slow):
+        pass
+
+    @solid(tags={"dagster/priority": 1})
+    def urgent(_):
+        pass
+
+    @solid
+    def unknown(_):
+        pass
+
+    @pipeline
+    def critical_path_pipeline():
+        root_result = root()
+        quick(root_result)
+        slow_tail(slow(root_result))
+        urgent()
+        unknown()
+
+    plan = create_execution_plan(critical_path_pipeline)
+    critical_path = CriticalPathPriority(
+        plan,
+        {
+            "root.compute": 1.0,
+            "quick.compute": 1.0,
+            "slow.compute": 5.0,
+            "slow_tail.compute": 3.0,
+            "urgent.compute": 2.0,
+        },
+    )
+
+    assert critical_path.num_steps_with_history == 5
+    assert critical_path.critical_path_length("slow_tail.compute") == 3.0
+    assert critical_path.critical_path_length("slow.compute") == 8.0
+    assert critical_path.critical_path_length("root.compute") == 9.0
+    # steps without history are expected to take the mean duration
+    assert critical_path.critical_path_length("unknown.compute") == 2.4
+
+    with plan.start(
+        Retries(RetryMode.DISABLED), sort_key_fn=critical_path.sort_key_fn()
+    ) as active_execution:
+        # the dagster/priority tag takes precedence over the critical path
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["urgent.compute", "root.compute", "unknown.compute"]
+        for step in steps:
+            active_execution.mark_success(step.key)
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["slow.compute", "quick.compute"]
+        for step in steps:
+            active_execution.mark_success(step.key)
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["slow_tail.compute"]
+        active_execution.mark_success("slow_tail.compute")
+
+        assert active_execution.is_complete
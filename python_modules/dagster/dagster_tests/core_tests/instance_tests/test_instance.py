@@ -1,4 +1,5 @@
 import re
+import time
 
 import pytest
 from dagster import PipelineDefinition, check, execute_pipeline, pipeline, solid
@@ -10,6 +11,9 @@
     create_pipeline_snapshot_id,
     snapshot_from_execution_plan,
 )
+from dagster.core.storage.pipeline_run import PipelineRunsFilter
+from dagster.core.storage.runs import CachedRunStorage
+from dagster.core.storage.runs.schema import RunsTable
 from dagster.core.test_utils import (
     create_run_for_test,
     environ,
@@ -180,3 +184,117 @@ def test_dagster_home_not_dir():
             ),
         ):
             _dagster_home()
+
+
+def test_buffered_event_log_writes():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    with instance_for_test(
+        overrides={"event_log_buffer": {"max_events": 1000, "flush_interval_seconds": 60.0}}
+    ) as instance:
+        stored_batches = []
+        store_events = instance._event_storage.store_events  # pylint: disable=protected-access
+
+        def _store_events(events):
+            stored_batches.append(len(events))
+            return store_events(events)
+
+        instance._event_storage.store_events = _store_events  # pylint: disable=protected-access
+
+        result = execute_pipeline(noop_pipeline, instance=instance)
+        assert result.success
+
+        # step events are written in batches, delimited by the pipeline start and success events
+        assert stored_batches
+        assert any(batch_size > 1 for batch_size in stored_batches)
+
+        run = instance.get_run_by_id(result.run_id)
+        assert run.is_finished
+        all_logs = instance.all_logs(result.run_id)
+        assert all_logs[-1].dagster_event.event_type_value == "PIPELINE_SUCCESS"
+        assert len(all_logs) == len(result.event_list) + sum(
+            1 for event in all_logs if not event.is_dagster_event
+        )
+
+
+def test_buffered_event_log_flush_timer():
+    with instance_for_test(
+        overrides={"event_log_buffer": {"max_events": 1000, "flush_interval_seconds": 0.1}}
+    ) as instance:
+        pipeline_run = create_run_for_test(instance, pipeline_name="foo_pipeline")
+        instance.report_engine_event("quiet step", pipeline_run)
+
+        event_storage = instance._event_storage  # pylint: disable=protected-access
+        start_time = time.time()
+        while not event_storage.get_logs_for_run(pipeline_run.run_id):
+            assert time.time() - start_time < 5
+            time.sleep(0.05)
+
+        assert len(event_storage.get_logs_for_run(pipeline_run.run_id)) == 1
+
+
+def test_run_storage_cache():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    with instance_for_test() as instance:
+        assert not isinstance(
+            instance._run_storage, CachedRunStorage  # pylint: disable=protected-access
+        )
+
+    with instance_for_test(
+        overrides={"run_storage_cache": {"enabled": True, "max_entries": 10, "ttl_seconds": 60.0}}
+    ) as instance:
+        run_storage = instance._run_storage  # pylint: disable=protected-access
+        assert isinstance(run_storage, CachedRunStorage)
+
+        result = execute_pipeline(noop_pipeline, instance=instance)
+        assert result.success
+
+        # the run is read through the cache, and reflects the status written by the run
+        assert instance.get_run_by_id(result.run_id).is_success
+        assert instance.get_run_by_id(result.run_id).is_success
+        assert run_storage.get_cache_stats().hits >= 1
+
+
+def test_reindex_run_start_end_times():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(noop_pipeline, instance=instance)
+        assert result.success
+        stats = instance.get_run_stats(result.run_id)
+
+        # simulate a run stored before run storage recorded the start and end times of runs
+        run_storage = instance._run_storage  # pylint: disable=protected-access
+        with run_storage.connect() as conn:
+            conn.execute(
+                RunsTable.update().values(  # pylint: disable=no-value-for-parameter
+                    start_time=None, end_time=None
+                )
+            )
+        assert instance.get_runs_count(PipelineRunsFilter(ended_after=0)) == 0
+
+        instance.reindex()
+
+        [run] = instance.get_runs(PipelineRunsFilter(started_after=0, ended_after=0))
+        assert run.run_id == result.run_id
+        assert instance.get_runs_count(PipelineRunsFilter(started_before=stats.start_time)) == 0
+        assert instance.get_runs_count(PipelineRunsFilter(ended_after=stats.end_time)) == 0
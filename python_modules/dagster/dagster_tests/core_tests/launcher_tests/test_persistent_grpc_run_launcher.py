@@ -1,8 +1,10 @@
 import sys
 import time
+from contextlib import contextmanager
 
 import pytest
 from dagster import file_relative_path, seven
+from dagster.core.definitions.reconstructable import ReconstructableRepository
 from dagster.core.errors import DagsterLaunchFailedError
 from dagster.core.host_representation import (
     GrpcServerRepositoryLocationOrigin,
@@ -14,9 +16,13 @@
 from dagster.core.storage.tags import GRPC_INFO_TAG
 from dagster.core.test_utils import instance_for_test, poll_for_finished_run, poll_for_step_start
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.grpc.run_worker_pool import RunWorkerExecution, RunWorkerPool
 from dagster.grpc.server import GrpcServerProcess
+from dagster.grpc.types import ExecuteExternalPipelineArgs
+from dagster.serdes import serialize_dagster_namedtuple
 from dagster.utils import find_free_port, merge_dicts
 from dagster_tests.core_tests.launcher_tests.test_default_run_launcher import (
+    get_external_pipeline_from_grpc_server_repository,
     math_diamond,
     sleepy_pipeline,
     slow_pipeline,
@@ -183,3 +189,183 @@ def test_server_down():
             assert launcher.terminate(pipeline_run.run_id)
 
         server_process.wait()
+
+
+def _get_run_process_metadata(instance, run_id):
+    started_event = next(
+        event
+        for event in instance.all_logs(run_id)
+        if event.dagster_event
+        and event.dagster_event.is_engine_event
+        and "Started process for pipeline" in event.message
+    )
+    return {
+        entry.label: entry.entry_data
+        for entry in started_event.dagster_event.engine_event_data.metadata_entries
+    }
+
+
+@contextmanager
+def _run_worker_pool_repository_location(server_process):
+    with server_process.create_ephemeral_client() as api_client:
+        yield GrpcServerRepositoryLocation(
+            RepositoryLocationHandle.create_from_repository_location_origin(
+                GrpcServerRepositoryLocationOrigin(
+                    location_name="test",
+                    port=api_client.port,
+                    socket=api_client.socket,
+                    host=api_client.host,
+                )
+            )
+        )
+
+
+def test_run_worker_pool():
+    with instance_for_test() as instance:
+        loadable_target_origin = LoadableTargetOrigin(
+            executable_path=sys.executable,
+            attribute="nope",
+            python_file=file_relative_path(__file__, "test_default_run_launcher.py"),
+        )
+        server_process = GrpcServerProcess(
+            loadable_target_origin=loadable_target_origin,
+            max_workers=4,
+            run_worker_pool_size=1,
+            max_runs_per_run_worker=2,
+        )
+        with _run_worker_pool_repository_location(server_process) as repository_location:
+            external_pipeline = repository_location.get_repository(
+                "nope"
+            ).get_full_external_pipeline("math_diamond")
+
+            pids = []
+            for _ in range(6):
+                pipeline_run = instance.create_run_for_pipeline(
+                    pipeline_def=math_diamond, run_config=None
+                )
+                instance.launch_run(pipeline_run.run_id, external_pipeline)
+                assert (
+                    poll_for_finished_run(instance, pipeline_run.run_id).status
+                    == PipelineRunStatus.SUCCESS
+                )
+
+                metadata = _get_run_process_metadata(instance, pipeline_run.run_id)
+                assert metadata["run_start_latency"].value >= 0
+                pids.append(metadata["pid"].text)
+
+            # workers are reused, and replaced after two runs
+            assert len(set(pids)) < len(pids)
+            assert all(pids.count(pid) <= 2 for pid in pids)
+
+        server_process.wait()
+
+
+def test_terminate_run_in_run_worker_pool():
+    with instance_for_test() as instance:
+        loadable_target_origin = LoadableTargetOrigin(
+            executable_path=sys.executable,
+            attribute="nope",
+            python_file=file_relative_path(__file__, "test_default_run_launcher.py"),
+        )
+        server_process = GrpcServerProcess(
+            loadable_target_origin=loadable_target_origin, max_workers=4, run_worker_pool_size=1,
+        )
+        with _run_worker_pool_repository_location(server_process) as repository_location:
+            repository = repository_location.get_repository("nope")
+
+            pipeline_run = instance.create_run_for_pipeline(
+                pipeline_def=sleepy_pipeline, run_config=None
+            )
+            instance.launch_run(
+                pipeline_run.run_id, repository.get_full_external_pipeline("sleepy_pipeline")
+            )
+            poll_for_step_start(instance, pipeline_run.run_id)
+
+            launcher = instance.run_launcher
+            assert launcher.can_terminate(pipeline_run.run_id)
+            assert launcher.terminate(pipeline_run.run_id)
+            assert (
+                poll_for_finished_run(instance, pipeline_run.run_id).status
+                == PipelineRunStatus.FAILURE
+            )
+            terminated_pid = _get_run_process_metadata(instance, pipeline_run.run_id)["pid"].text
+
+            # the worker of the terminated run is not reused
+            next_pipeline_run = instance.create_run_for_pipeline(
+                pipeline_def=math_diamond, run_config=None
+            )
+            instance.launch_run(
+                next_pipeline_run.run_id, repository.get_full_external_pipeline("math_diamond")
+            )
+            assert (
+                poll_for_finished_run(instance, next_pipeline_run.run_id).status
+                == PipelineRunStatus.SUCCESS
+            )
+            assert (
+                _get_run_process_metadata(instance, next_pipeline_run.run_id)["pid"].text
+                != terminated_pid
+            )
+
+        server_process.wait()
+
+
+def _start_run_in_run_worker_pool(run_worker_pool, instance, pipeline_def):
+    pipeline_run = instance.create_run_for_pipeline(pipeline_def=pipeline_def, run_config=None)
+    with get_external_pipeline_from_grpc_server_repository(pipeline_def.name) as external_pipeline:
+        serialized_execute_run_args = serialize_dagster_namedtuple(
+            ExecuteExternalPipelineArgs(
+                pipeline_origin=external_pipeline.get_external_origin(),
+                pipeline_run_id=pipeline_run.run_id,
+                instance_ref=instance.get_ref(),
+            )
+        )
+    recon_pipeline = ReconstructableRepository.for_file(
+        file_relative_path(__file__, "test_default_run_launcher.py"), "nope"
+    ).get_reconstructable_pipeline(pipeline_def.name)
+
+    run_worker = run_worker_pool.start_run(
+        pipeline_run.run_id, serialized_execute_run_args, recon_pipeline, time.time()
+    )
+    return pipeline_run, run_worker, RunWorkerExecution(run_worker, pipeline_run.run_id)
+
+
+def test_run_worker_reused_before_run_is_cleared():
+    with instance_for_test() as instance:
+        run_worker_pool = RunWorkerPool(1)
+        try:
+            pipeline_run, run_worker, execution = _start_run_in_run_worker_pool(
+                run_worker_pool, instance, math_diamond
+            )
+            assert run_worker.run_done_event.wait(60)
+            assert (
+                poll_for_finished_run(instance, pipeline_run.run_id).status
+                == PipelineRunStatus.SUCCESS
+            )
+
+            # the worker takes the next run while the finished run is still tracked
+            next_pipeline_run, next_run_worker, next_execution = _start_run_in_run_worker_pool(
+                run_worker_pool, instance, sleepy_pipeline
+            )
+            assert next_run_worker is run_worker
+            poll_for_step_start(instance, next_pipeline_run.run_id)
+
+            assert not execution.is_alive()
+            assert next_execution.is_alive()
+
+            # cancelling the finished run leaves the next one running
+            execution.termination_event.set()
+            assert execution.termination_event.is_set()
+            assert not next_execution.termination_event.is_set()
+            assert not run_worker.termination_event.is_set()
+            assert next_execution.is_alive()
+
+            next_execution.termination_event.set()
+            assert (
+                poll_for_finished_run(instance, next_pipeline_run.run_id).status
+                == PipelineRunStatus.FAILURE
+            )
+            # the worker of a terminated run retires
+            run_worker.process.join(60)
+            assert not next_execution.is_alive()
+        finally:
+            run_worker_pool.shutdown()
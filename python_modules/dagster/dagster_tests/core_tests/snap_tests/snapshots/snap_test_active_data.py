@@ -231,7 +231,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+            "Selector.499dbfa01f2e71004d7e357060bc4120b0f9b5b7": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -239,24 +239,24 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+                  "default_value_as_json_str": "{\\"config\\": {\\"release_intermediates\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
                   "description": null,
                   "is_required": false,
                   "name": "in_process",
-                  "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+                  "type_key": "Shape.e206e2946084e22c02320c4acba579d05140780c"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+                  "default_value_as_json_str": "{\\"config\\": {\\"fuse_steps\\": false, \\"max_concurrent\\": 0, \\"release_intermediates\\": false, \\"retries\\": {\\"enabled\\": {}}, \\"reuse_resources\\": false, \\"worker_pool\\": false}}",
                   "description": null,
                   "is_required": false,
                   "name": "multiprocess",
-                  "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+                  "type_key": "Shape.2ca905778f495164108a66365f5e0391d4a0648e"
                 }
               ],
               "given_name": null,
-              "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+              "key": "Selector.499dbfa01f2e71004d7e357060bc4120b0f9b5b7",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
@@ -564,6 +564,29 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.2ca905778f495164108a66365f5e0391d4a0648e": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"fuse_steps\\": false, \\"max_concurrent\\": 0, \\"release_intermediates\\": false, \\"retries\\": {\\"enabled\\": {}}, \\"reuse_resources\\": false, \\"worker_pool\\": false}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "config",
+                  "type_key": "Shape.c1d624ff4be74b435f358212f72f7966f6a476f1"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.2ca905778f495164108a66365f5e0391d4a0648e",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -633,6 +656,79 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.5795d7929c13b008da6f55850e03a7db9bffa06e": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "marker_to_close",
+                  "type_key": "String"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "false",
+                  "description": null,
+                  "is_required": false,
+                  "name": "release_intermediates",
+                  "type_key": "Bool"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.5795d7929c13b008da6f55850e03a7db9bffa06e",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.585e73785159af67cb66ba996ec56d61d9fe6dab": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "cpu",
+                  "type_key": "Float"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "memory",
+                  "type_key": "Float"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.585e73785159af67cb66ba996ec56d61d9fe6dab",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -656,7 +752,30 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.6811763b21837fa90300427f32281dcf8566e1b1": {
+            "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "outputs",
+                  "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.690b2b575b78661a5106d4719fc700081bc4d9a4": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -668,7 +787,7 @@
                   "description": null,
                   "is_required": false,
                   "name": "execution",
-                  "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
+                  "type_key": "Selector.499dbfa01f2e71004d7e357060bc4120b0f9b5b7"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
@@ -717,30 +836,30 @@
                 }
               ],
               "given_name": null,
-              "key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1",
+              "key": "Shape.690b2b575b78661a5106d4719fc700081bc4d9a4",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2": {
+            "Shape.6b18fffecd97cae288266ff1a86f5a63f90f5bec": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
-                  "description": null,
+                  "default_provided": true,
+                  "default_value_as_json_str": "10",
+                  "description": "The number of most recent successful runs of the pipeline to take the durations of the steps from.",
                   "is_required": false,
-                  "name": "outputs",
-                  "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+                  "name": "num_runs",
+                  "type_key": "Int"
                 }
               ],
               "given_name": null,
-              "key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2",
+              "key": "Shape.6b18fffecd97cae288266ff1a86f5a63f90f5bec",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -770,7 +889,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+            "Shape.c1d624ff4be74b435f358212f72f7966f6a476f1": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -781,32 +900,27 @@
                   "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "marker_to_close",
-                  "type_key": "String"
+                  "name": "capacity",
+                  "type_key": "Shape.585e73785159af67cb66ba996ec56d61d9fe6dab"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Start the steps with the longest path of historical durations to the end of the plan first.",
+                  "is_required": false,
+                  "name": "critical_path",
+                  "type_key": "Shape.6b18fffecd97cae288266ff1a86f5a63f90f5bec"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "default_value_as_json_str": "false",
                   "description": null,
                   "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
+                  "name": "fuse_steps",
+                  "type_key": "Bool"
+                },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
@@ -816,6 +930,15 @@
                   "name": "max_concurrent",
                   "type_key": "Int"
                 },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "false",
+                  "description": null,
+                  "is_required": false,
+                  "name": "release_intermediates",
+                  "type_key": "Bool"
+                },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
@@ -824,33 +947,28 @@
                   "is_required": false,
                   "name": "retries",
                   "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
+                },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+                  "default_value_as_json_str": "false",
                   "description": null,
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+                  "name": "reuse_resources",
+                  "type_key": "Bool"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "false",
+                  "description": null,
+                  "is_required": false,
+                  "name": "worker_pool",
+                  "type_key": "Bool"
                 }
               ],
               "given_name": null,
-              "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+              "key": "Shape.c1d624ff4be74b435f358212f72f7966f6a476f1",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -870,30 +988,30 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed": {
+            "Shape.e206e2946084e22c02320c4acba579d05140780c": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"release_intermediates\\": false, \\"retries\\": {\\"enabled\\": {}}}",
                   "description": null,
                   "is_required": false,
-                  "name": "base_dir",
-                  "type_key": "String"
+                  "name": "config",
+                  "type_key": "Shape.5795d7929c13b008da6f55850e03a7db9bffa06e"
                 }
               ],
               "given_name": null,
-              "key": "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed",
+              "key": "Shape.e206e2946084e22c02320c4acba579d05140780c",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+            "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -904,35 +1022,35 @@
                   "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "console",
-                  "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+                  "name": "base_dir",
+                  "type_key": "String"
                 }
               ],
               "given_name": null,
-              "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+              "key": "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
+            "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
+                  "name": "console",
+                  "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
                 }
               ],
               "given_name": null,
-              "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
+              "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -1088,7 +1206,7 @@
                 "name": "asset_store"
               }
             ],
-            "root_config_key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1"
+            "root_config_key": "Shape.690b2b575b78661a5106d4719fc700081bc4d9a4"
           },
           {
             "__class__": "ModeDefSnap",
@@ -1118,7 +1236,7 @@
                 "name": "asset_store"
               }
             ],
-            "root_config_key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1"
+            "root_config_key": "Shape.690b2b575b78661a5106d4719fc700081bc4d9a4"
           }
         ],
         "name": "a_pipeline",
@@ -1366,7 +1484,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+        "Selector.499dbfa01f2e71004d7e357060bc4120b0f9b5b7": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1374,24 +1492,24 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+              "default_value_as_json_str": "{\\"config\\": {\\"release_intermediates\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
               "description": null,
               "is_required": false,
               "name": "in_process",
-              "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+              "type_key": "Shape.e206e2946084e22c02320c4acba579d05140780c"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+              "default_value_as_json_str": "{\\"config\\": {\\"fuse_steps\\": false, \\"max_concurrent\\": 0, \\"release_intermediates\\": false, \\"retries\\": {\\"enabled\\": {}}, \\"reuse_resources\\": false, \\"worker_pool\\": false}}",
               "description": null,
               "is_required": false,
               "name": "multiprocess",
-              "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+              "type_key": "Shape.2ca905778f495164108a66365f5e0391d4a0648e"
             }
           ],
           "given_name": null,
-          "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+          "key": "Selector.499dbfa01f2e71004d7e357060bc4120b0f9b5b7",
           "kind": {
             "__enum__": "ConfigTypeKind.SELECTOR"
           },
@@ -1699,6 +1817,29 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.2ca905778f495164108a66365f5e0391d4a0648e": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"fuse_steps\\": false, \\"max_concurrent\\": 0, \\"release_intermediates\\": false, \\"retries\\": {\\"enabled\\": {}}, \\"reuse_resources\\": false, \\"worker_pool\\": false}",
+              "description": null,
+              "is_required": false,
+              "name": "config",
+              "type_key": "Shape.c1d624ff4be74b435f358212f72f7966f6a476f1"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.2ca905778f495164108a66365f5e0391d4a0648e",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -1768,6 +1909,79 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.5795d7929c13b008da6f55850e03a7db9bffa06e": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "marker_to_close",
+              "type_key": "String"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "false",
+              "description": null,
+              "is_required": false,
+              "name": "release_intermediates",
+              "type_key": "Bool"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.5795d7929c13b008da6f55850e03a7db9bffa06e",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.585e73785159af67cb66ba996ec56d61d9fe6dab": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "cpu",
+              "type_key": "Float"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "memory",
+              "type_key": "Float"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.585e73785159af67cb66ba996ec56d61d9fe6dab",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -1791,7 +2005,30 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.6811763b21837fa90300427f32281dcf8566e1b1": {
+        "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "outputs",
+              "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.690b2b575b78661a5106d4719fc700081bc4d9a4": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1803,7 +2040,7 @@
               "description": null,
               "is_required": false,
               "name": "execution",
-              "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
+              "type_key": "Selector.499dbfa01f2e71004d7e357060bc4120b0f9b5b7"
             },
             {
               "__class__": "ConfigFieldSnap",
@@ -1852,30 +2089,30 @@
             }
           ],
           "given_name": null,
-          "key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1",
+          "key": "Shape.690b2b575b78661a5106d4719fc700081bc4d9a4",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2": {
+        "Shape.6b18fffecd97cae288266ff1a86f5a63f90f5bec": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": null,
+              "default_provided": true,
+              "default_value_as_json_str": "10",
+              "description": "The number of most recent successful runs of the pipeline to take the durations of the steps from.",
               "is_required": false,
-              "name": "outputs",
-              "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+              "name": "num_runs",
+              "type_key": "Int"
             }
           ],
           "given_name": null,
-          "key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2",
+          "key": "Shape.6b18fffecd97cae288266ff1a86f5a63f90f5bec",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -1905,7 +2142,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+        "Shape.c1d624ff4be74b435f358212f72f7966f6a476f1": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1916,32 +2153,27 @@
               "default_value_as_json_str": null,
               "description": null,
               "is_required": false,
-              "name": "marker_to_close",
-              "type_key": "String"
+              "name": "capacity",
+              "type_key": "Shape.585e73785159af67cb66ba996ec56d61d9fe6dab"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Start the steps with the longest path of historical durations to the end of the plan first.",
+              "is_required": false,
+              "name": "critical_path",
+              "type_key": "Shape.6b18fffecd97cae288266ff1a86f5a63f90f5bec"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "default_value_as_json_str": "false",
               "description": null,
               "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
+              "name": "fuse_steps",
+              "type_key": "Bool"
+            },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
@@ -1951,6 +2183,15 @@
               "name": "max_concurrent",
               "type_key": "Int"
             },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "false",
+              "description": null,
+              "is_required": false,
+              "name": "release_intermediates",
+              "type_key": "Bool"
+            },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
@@ -1959,33 +2200,28 @@
               "is_required": false,
               "name": "retries",
               "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
+            },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+              "default_value_as_json_str": "false",
               "description": null,
               "is_required": false,
-              "name": "config",
-              "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+              "name": "reuse_resources",
+              "type_key": "Bool"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "false",
+              "description": null,
+              "is_required": false,
+              "name": "worker_pool",
+              "type_key": "Bool"
             }
           ],
           "given_name": null,
-          "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+          "key": "Shape.c1d624ff4be74b435f358212f72f7966f6a476f1",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -2005,30 +2241,30 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed": {
+        "Shape.e206e2946084e22c02320c4acba579d05140780c": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"release_intermediates\\": false, \\"retries\\": {\\"enabled\\": {}}}",
               "description": null,
               "is_required": false,
-              "name": "base_dir",
-              "type_key": "String"
+              "name": "config",
+              "type_key": "Shape.5795d7929c13b008da6f55850e03a7db9bffa06e"
             }
           ],
           "given_name": null,
-          "key": "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed",
+          "key": "Shape.e206e2946084e22c02320c4acba579d05140780c",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+        "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -2039,35 +2275,35 @@
               "default_value_as_json_str": null,
               "description": null,
               "is_required": false,
-              "name": "console",
-              "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+              "name": "base_dir",
+              "type_key": "String"
             }
           ],
           "given_name": null,
-          "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+          "key": "Shape.e26e0c525e2d2c66b5a06f4cfdd053de6d44e3ed",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
+        "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+              "default_provided": false,
+              "default_value_as_json_str": null,
               "description": null,
               "is_required": false,
-              "name": "config",
-              "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
+              "name": "console",
+              "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
             }
           ],
           "given_name": null,
-          "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
+          "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -2223,7 +2459,7 @@
             "name": "asset_store"
           }
         ],
-        "root_config_key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1"
+        "root_config_key": "Shape.690b2b575b78661a5106d4719fc700081bc4d9a4"
       },
       {
         "__class__": "ModeDefSnap",
@@ -2253,7 +2489,7 @@
             "name": "asset_store"
           }
         ],
-        "root_config_key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1"
+        "root_config_key": "Shape.690b2b575b78661a5106d4719fc700081bc4d9a4"
       }
     ],
     "name": "a_pipeline",
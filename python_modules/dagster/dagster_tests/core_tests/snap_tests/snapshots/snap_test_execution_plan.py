@@ -9,7 +9,7 @@
 snapshots['test_create_noop_execution_plan 1'] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "1c2b11984311606d105ccf19239e31d825bd5ba7",
+  "pipeline_snapshot_id": "c13bd7a7f62606bf574eb9d523efb8d43cd7b590",
   "step_keys_to_execute": [
     "noop_solid.compute"
   ],
@@ -37,7 +37,7 @@
 snapshots['test_create_execution_plan_with_dep 1'] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "af05e14a8928208d6363b28f80cc83fdfbea77f0",
+  "pipeline_snapshot_id": "22b7d1b51fbdef28b36363d7ac302396f4357cef",
   "step_keys_to_execute": [
     "solid_one.compute",
     "solid_two.compute"
@@ -96,7 +96,7 @@
 snapshots['test_create_with_composite 1'] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "739dfb75e745ab7cfb5783b98894084e1472576d",
+  "pipeline_snapshot_id": "c8653463d8d9a01831eb0cfbd5c98c132202cbd6",
   "step_keys_to_execute": [
     "comp_1.return_one.compute",
     "comp_1.add_one.compute",
@@ -247,7 +247,7 @@
 snapshots['test_create_noop_execution_plan_with_tags 1'] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "7d0ade1cd11078c1295e2f39be57eeb800e69de8",
+  "pipeline_snapshot_id": "1d014f3706674eb4796d8bb71b043cd8fc9f6c65",
   "step_keys_to_execute": [
     "noop_solid.compute"
   ],
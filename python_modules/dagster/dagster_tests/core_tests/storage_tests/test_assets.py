@@ -2,6 +2,7 @@
 from contextlib import contextmanager
 
 import pytest
+import sqlalchemy as db
 from dagster import (
     AssetKey,
     AssetMaterialization,
@@ -21,10 +22,12 @@
 from dagster.core.launcher.sync_in_memory_run_launcher import SyncInMemoryRunLauncher
 from dagster.core.run_coordinator import DefaultRunCoordinator
 from dagster.core.storage.event_log import (
+    AssetKeyTable,
     ConsolidatedSqliteEventLogStorage,
     InMemoryEventLogStorage,
 )
 from dagster.core.storage.event_log.migration import migrate_asset_key_data
+from dagster.core.storage.event_log.sql_event_log import SECONDARY_INDEX_ASSET_LAST_MATERIALIZATION
 from dagster.core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster.core.storage.root import LocalArtifactStorage
 from dagster.core.storage.runs import InMemoryRunStorage
@@ -231,6 +234,87 @@ def test_asset_secondary_index(asset_aware_context):
         assert len(asset_keys) == 1
 
 
+@asset_test
+def test_latest_materializations(asset_aware_context):
+    with asset_aware_context() as ctx:
+        instance, event_log_storage = ctx
+        one = execute_pipeline(pipeline_one, instance=instance)
+        two = execute_pipeline(pipeline_two, instance=instance)
+
+        asset_1 = AssetKey("asset_1")
+        asset_3 = AssetKey(["path", "to", "asset_3"])
+        bogus = AssetKey(["path", "to", "bogus", "asset"])
+        latest = event_log_storage.get_latest_materializations([asset_1, asset_3, bogus])
+        assert set(latest.keys()) == set([asset_1, asset_3, bogus])
+        assert latest[asset_1].run_id == two.run_id
+        assert latest[asset_1].dagster_event.asset_key == asset_1
+        assert latest[asset_3].run_id == two.run_id
+        assert latest[bogus] is None
+
+        # the latest materializations fall back to those of the remaining runs
+        event_log_storage.delete_events(two.run_id)
+        latest = event_log_storage.get_latest_materializations([asset_1, asset_3])
+        assert latest[asset_1].run_id == one.run_id
+        assert latest[asset_3] is None
+
+
+def test_latest_materializations_reindex():
+    src_dir = file_relative_path(__file__, "compat_tests/snapshot_0_9_16_asset_key_structure")
+    with copy_directory(src_dir) as test_dir:
+        asset_storage = ConsolidatedSqliteEventLogStorage(test_dir)
+        asset_key = AssetKey(["dashboards", "cost_dashboard"])
+        assert not asset_storage.has_secondary_index(SECONDARY_INDEX_ASSET_LAST_MATERIALIZATION)
+
+        # read out of the event log until the asset key table is migrated and backfilled
+        latest = asset_storage.get_latest_materializations([asset_key])
+        assert latest[asset_key].dagster_event.asset_key == asset_key
+        legacy_run_id = latest[asset_key].run_id
+
+        asset_storage.upgrade()
+        asset_storage.reindex()
+        assert asset_storage.has_secondary_index(SECONDARY_INDEX_ASSET_LAST_MATERIALIZATION)
+        latest = asset_storage.get_latest_materializations([asset_key])
+        assert latest[asset_key].run_id == legacy_run_id
+
+        asset_storage.store_event(_materialization_event_record("fake_run_id", asset_key))
+        latest = asset_storage.get_latest_materializations([asset_key])
+        assert latest[asset_key].run_id == "fake_run_id"
+
+
+def test_latest_materializations_written_by_storage_started_before_reindex():
+    src_dir = file_relative_path(__file__, "compat_tests/snapshot_0_9_16_asset_key_structure")
+    with copy_directory(src_dir) as test_dir:
+        asset_key = AssetKey(["dashboards", "cost_dashboard"])
+
+        # a long-lived writer, e.g. dagit or the daemon, started before the migration
+        writer_storage = ConsolidatedSqliteEventLogStorage(test_dir)
+        assert not writer_storage.has_secondary_index(SECONDARY_INDEX_ASSET_LAST_MATERIALIZATION)
+
+        migrating_storage = ConsolidatedSqliteEventLogStorage(test_dir)
+        migrating_storage.upgrade()
+
+        # once the columns exist, they are written whether or not they have been backfilled
+        writer_storage.store_event(_materialization_event_record("before_reindex", asset_key))
+        with migrating_storage.connect() as conn:
+            assert (
+                conn.execute(
+                    db.select([AssetKeyTable.c.last_run_id]).where(
+                        AssetKeyTable.c.asset_key == asset_key.to_string()
+                    )
+                ).scalar()
+                == "before_reindex"
+            )
+
+        migrating_storage.reindex()
+        assert writer_storage.has_secondary_index(SECONDARY_INDEX_ASSET_LAST_MATERIALIZATION)
+        latest = migrating_storage.get_latest_materializations([asset_key])
+        assert latest[asset_key].run_id == "before_reindex"
+
+        writer_storage.store_event(_materialization_event_record("after_reindex", asset_key))
+        latest = migrating_storage.get_latest_materializations([asset_key])
+        assert latest[asset_key].run_id == "after_reindex"
+
+
 def test_asset_key_structure():
     src_dir = file_relative_path(__file__, "compat_tests/snapshot_0_9_16_asset_key_structure")
     with copy_directory(src_dir) as test_dir:
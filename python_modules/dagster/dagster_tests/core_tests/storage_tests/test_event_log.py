@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 import time
 import traceback
 from contextlib import contextmanager
@@ -7,7 +8,7 @@
 import pytest
 import sqlalchemy
 from dagster import seven
-from dagster.core.definitions import AssetMaterialization, ExpectationResult
+from dagster.core.definitions import AssetKey, AssetMaterialization, ExpectationResult
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.events import (
     DagsterEvent,
@@ -16,16 +17,26 @@
     StepExpectationResultData,
     StepMaterializationData,
 )
-from dagster.core.events.log import DagsterEventRecord
+from dagster.core.events.log import DagsterEventRecord, LogMessageRecord
 from dagster.core.execution.plan.objects import StepFailureData, StepSuccessData
 from dagster.core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
+    EventLogRetentionPolicy,
     InMemoryEventLogStorage,
+    RunStatsTable,
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
     SqliteEventLogStorage,
+    StepStatsTable,
+)
+from dagster.core.storage.event_log.schema import SecondaryIndexMigrationTable
+from dagster.core.storage.event_log.sql_event_log import SECONDARY_INDEX_RUN_STATS
+from dagster.core.storage.event_log.sqlite.sqlite_event_log import (
+    MAX_CACHED_RUN_ENGINES,
+    SQLITE_BUSY_TIMEOUT_MS,
 )
 from dagster.core.storage.sql import create_engine
+from dagster.serdes import COMPRESSED_JSON_PREFIX
 from dagster.seven import multiprocessing
 
 
@@ -209,6 +220,161 @@ def evt(name):
         assert len(storage.get_logs_for_run("foo", 2)) == 0
 
 
+@event_storage_test
+def test_event_log_storage_store_events_batch(event_storage_factory_cm_fn):
+    def evt(name, run_id):
+        return DagsterEventRecord(
+            None,
+            name,
+            "debug",
+            "",
+            run_id,
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                "nonce",
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+
+    with event_storage_factory_cm_fn() as storage:
+        storage.store_events(
+            [
+                evt("Message_0", "foo"),
+                evt("Message_1", "bar"),
+                evt("Message_2", "foo"),
+                evt("Message_3", "foo"),
+            ]
+        )
+        storage.store_events([])
+
+        assert [event.message for event in storage.get_logs_for_run("foo")] == [
+            "Message_0",
+            "Message_2",
+            "Message_3",
+        ]
+        assert [event.message for event in storage.get_logs_for_run("bar")] == ["Message_1"]
+        assert len(storage.get_logs_for_run("foo", 0)) == 2
+
+
+@pytest.mark.parametrize(
+    "storage_cls", [SqliteEventLogStorage, ConsolidatedSqliteEventLogStorage],
+)
+def test_event_log_storage_compressed_events(storage_cls):
+    def evt(name):
+        return DagsterEventRecord(
+            None,
+            name,
+            "debug",
+            "",
+            "foo",
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                "nonce",
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        # rows written before compression was enabled are read back alongside compressed rows
+        storage_cls(tmpdir_path).store_event(evt("Message_0"))
+
+        storage = storage_cls(tmpdir_path, compress_events=True)
+        storage.store_event(evt("Message_1"))
+        storage.store_events([evt("Message_2"), evt("Message_3")])
+
+        with storage.connect("foo") as conn:
+            serialized_events = [
+                row[0]
+                for row in conn.execute(
+                    sqlalchemy.select([SqlEventLogStorageTable.c.event]).order_by(
+                        SqlEventLogStorageTable.c.id.asc()
+                    )
+                ).fetchall()
+            ]
+        assert not serialized_events[0].startswith(COMPRESSED_JSON_PREFIX)
+        assert all(event.startswith(COMPRESSED_JSON_PREFIX) for event in serialized_events[1:])
+
+        assert [event.message for event in storage.get_logs_for_run("foo")] == [
+            "Message_0",
+            "Message_1",
+            "Message_2",
+            "Message_3",
+        ]
+
+
+@event_storage_test
+def test_event_log_storage_filtered_logs(event_storage_factory_cm_fn):
+    run_id = "foo"
+    with event_storage_factory_cm_fn() as storage:
+        storage.store_events(_stats_records(run_id=run_id))
+        # events of another run are interleaved, and never returned
+        storage.store_events(_stats_records(run_id="bar"))
+        all_logs = list(storage.get_logs_for_run(run_id))
+
+        step_starts = list(storage.get_logs_for_run(run_id, of_type=DagsterEventType.STEP_START))
+        assert [event.dagster_event.step_key for event in step_starts] == ["A", "B", "C", "D"]
+
+        d_logs = storage.get_logs_for_run(run_id, step_key="D")
+        assert len(d_logs) == 7
+        assert all(event.dagster_event.step_key == "D" for event in d_logs)
+
+        d_materializations = storage.get_logs_for_run(
+            run_id, of_type=DagsterEventType.STEP_MATERIALIZATION, step_key="D"
+        )
+        assert len(d_materializations) == 3
+
+        # the cursor indexes into the filtered logs
+        assert (
+            list(storage.get_logs_for_run(run_id, cursor=1, of_type=DagsterEventType.STEP_START))
+            == step_starts[2:]
+        )
+
+        assert list(storage.get_logs_for_run(run_id, limit=3)) == all_logs[:3]
+        assert list(storage.get_logs_for_run(run_id, cursor=2, limit=3)) == all_logs[3:6]
+        assert list(storage.get_logs_for_run(run_id, cursor=len(all_logs) - 2, limit=3)) == [
+            all_logs[-1]
+        ]
+
+
+@event_storage_test
+def test_event_log_storage_event_records_after_record_id(event_storage_factory_cm_fn):
+    run_id = "foo"
+    with event_storage_factory_cm_fn() as storage:
+        storage.store_events(_stats_records(run_id=run_id))
+        storage.store_events(_stats_records(run_id="bar"))
+        storage.store_events(_stats_records(run_id=run_id))
+        all_logs = list(storage.get_logs_for_run(run_id))
+
+        # page through the run's logs by the id of the last record seen
+        paged_logs = []
+        after_record_id = None
+        while True:
+            records = storage.get_event_records_for_run(
+                run_id, after_record_id=after_record_id, limit=4
+            )
+            if not records:
+                break
+            assert [record_id for record_id, _ in records] == sorted(
+                record_id for record_id, _ in records
+            )
+            paged_logs.extend(event for _, event in records)
+            after_record_id = records[-1][0]
+        assert paged_logs == all_logs
+
+        d_records = storage.get_event_records_for_run(run_id, step_key="D")
+        assert [event for _, event in d_records] == list(
+            storage.get_logs_for_run(run_id, step_key="D")
+        )
+        assert [
+            event
+            for _, event in storage.get_event_records_for_run(
+                run_id, after_record_id=d_records[2][0], step_key="D"
+            )
+        ] == [event for _, event in d_records[3:]]
+
+
 @event_storage_test
 def test_event_log_delete(event_storage_factory_cm_fn):
     with event_storage_factory_cm_fn() as storage:
@@ -312,6 +478,44 @@ def test_concurrent_sqlite_event_log_connections():
         assert not excs, excs
 
 
+def test_sqlite_event_log_connection_reuse():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+
+        with storage.connect("foo") as conn:
+            assert conn.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous;").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA busy_timeout;").fetchone()[0] == SQLITE_BUSY_TIMEOUT_MS
+            dbapi_connection = conn.connection.connection
+
+        with storage.connect("foo") as conn:
+            assert conn.connection.connection is dbapi_connection
+
+        # the databases of different runs are locked independently
+        with storage.connect("foo"):
+            thread = threading.Thread(
+                target=storage.store_event, args=(_log_message_record("bar", time.time(), "hi"),)
+            )
+            thread.start()
+            thread.join(5)
+            assert not thread.is_alive()
+        assert len(storage.get_logs_for_run("bar")) == 1
+
+        # only the most recently used runs hold on to their connections
+        for i in range(MAX_CACHED_RUN_ENGINES):
+            storage.store_event(_log_message_record("run_{}".format(i), time.time(), "hi"))
+        assert (
+            len(storage._run_engines) == MAX_CACHED_RUN_ENGINES
+        )  # pylint: disable=protected-access
+
+        with storage.connect("foo") as conn:
+            assert conn.connection.connection is not dbapi_connection
+        assert len(storage.get_logs_for_run("run_0")) == 1
+
+        storage.dispose()
+        assert not storage._run_engines  # pylint: disable=protected-access
+
+
 @event_storage_test
 def test_event_log_step_stats(event_storage_factory_cm_fn):
     # When an event log doesn't have a PIPELINE_START or PIPELINE_SUCCESS | PIPELINE_FAILURE event,
@@ -348,6 +552,88 @@ def test_event_log_step_stats(event_storage_factory_cm_fn):
         assert len(d_stats.expectation_results) == 2
 
 
+@pytest.mark.parametrize(
+    "event_storage_factory_cm_fn",
+    [create_sqlite_run_event_logstorage, create_consolidated_sqlite_run_event_log_storage],
+)
+def test_event_log_stats_summary_reindex(event_storage_factory_cm_fn):
+    run_id = "foo"
+    with event_storage_factory_cm_fn() as storage:
+        # new databases maintain the summary tables from the first stored event
+        assert storage.has_secondary_index(SECONDARY_INDEX_RUN_STATS, run_id)
+
+        storage.store_events(
+            _stats_records(run_id=run_id)
+            + [_event_record(run_id, None, time.time(), DagsterEventType.PIPELINE_SUCCESS)]
+        )
+        run_stats = storage.get_stats_for_run(run_id)
+        step_stats = storage.get_step_stats_for_run(run_id)
+        assert run_stats.steps_succeeded == 2
+        assert run_stats.steps_failed == 1
+        assert run_stats.materializations == 3
+        assert run_stats.expectations == 2
+        assert len(storage.get_step_stats_for_run(run_id, step_keys=["A", "D"])) == 2
+
+        # simulate a database written before the summary tables were maintained
+        with storage.connect(run_id) as conn:
+            conn.execute(RunStatsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(StepStatsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(
+                SecondaryIndexMigrationTable.delete()
+            )  # pylint: disable=no-value-for-parameter
+        storage._secondary_index_cache.clear()  # pylint: disable=protected-access
+        assert not storage.has_secondary_index(SECONDARY_INDEX_RUN_STATS, run_id)
+
+        # stats are aggregated from the event log until the summary tables are backfilled
+        assert storage.get_stats_for_run(run_id) == run_stats
+        assert sorted(storage.get_step_stats_for_run(run_id)) == sorted(step_stats)
+
+        storage.reindex()
+        assert storage.has_secondary_index(SECONDARY_INDEX_RUN_STATS, run_id)
+        assert storage.get_stats_for_run(run_id) == run_stats
+        assert storage.get_step_stats_for_run(run_id) == step_stats
+
+        storage.delete_events(run_id)
+        assert storage.get_stats_for_run(run_id).steps_succeeded == 0
+        assert storage.get_step_stats_for_run(run_id) == []
+
+
+def test_event_log_stats_summary_reindex_skips_unfinished_runs():
+    run_id = "foo"
+    with create_sqlite_run_event_logstorage() as storage:
+        storage.store_events(_stats_records(run_id=run_id))
+        run_stats = storage.get_stats_for_run(run_id)
+
+        # simulate a database written before the summary tables were maintained
+        with storage.connect(run_id) as conn:
+            conn.execute(RunStatsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(StepStatsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(
+                SecondaryIndexMigrationTable.delete()
+            )  # pylint: disable=no-value-for-parameter
+        storage._secondary_index_cache.clear()  # pylint: disable=protected-access
+
+        # a run that may still be storing events is not rebuilt, and keeps reading its stats from
+        # the event log
+        assert not storage.rebuild_run_stats(run_id)
+        storage.reindex()
+        assert not storage.has_secondary_index(SECONDARY_INDEX_RUN_STATS, run_id)
+        with storage.connect(run_id) as conn:
+            assert not conn.execute(RunStatsTable.select()).fetchall()
+        assert storage.get_stats_for_run(run_id) == run_stats
+
+        end_time = time.time()
+        storage.store_event(
+            _event_record(run_id, None, end_time, DagsterEventType.PIPELINE_SUCCESS)
+        )
+        storage.reindex()
+        assert storage.has_secondary_index(SECONDARY_INDEX_RUN_STATS, run_id)
+        run_stats = storage.get_stats_for_run(run_id)
+        assert run_stats.steps_succeeded == 2
+        assert run_stats.materializations == 3
+        assert run_stats.end_time == pytest.approx(end_time)
+
+
 def _stats_records(run_id):
     now = time.time()
     return [
@@ -436,19 +722,145 @@ def test_secondary_index():
         # Only consolidated_sqlite, postgres storage support secondary indexes
         assert not storage.has_secondary_index("A")
         assert not storage.has_secondary_index("B")
-        assert "A" in storage._secondary_index_cache  # pylint: disable=protected-access
-        assert "B" in storage._secondary_index_cache  # pylint: disable=protected-access
-        storage.enable_secondary_index("A")
+        # an index that is not enabled may be enabled by another process, so it is not cached
         assert "A" not in storage._secondary_index_cache  # pylint: disable=protected-access
-        assert "B" in storage._secondary_index_cache  # pylint: disable=protected-access
-        assert storage.has_secondary_index("A")
+        assert "B" not in storage._secondary_index_cache  # pylint: disable=protected-access
+        storage.enable_secondary_index("A")
         assert "A" in storage._secondary_index_cache  # pylint: disable=protected-access
-        assert "B" in storage._secondary_index_cache  # pylint: disable=protected-access
+        assert "B" not in storage._secondary_index_cache  # pylint: disable=protected-access
+        assert storage.has_secondary_index("A")
         assert not storage.has_secondary_index("B")
+
+        # another storage on the same database sees the index that was enabled after it started
+        other_storage = ConsolidatedSqliteEventLogStorage(
+            storage._base_dir
+        )  # pylint: disable=protected-access
+        assert not other_storage.has_secondary_index("B")
         storage.enable_secondary_index("B")
-        assert "A" in storage._secondary_index_cache  # pylint: disable=protected-access
-        assert "B" not in storage._secondary_index_cache  # pylint: disable=protected-access
+        assert other_storage.has_secondary_index("B")
+        assert "B" in other_storage._secondary_index_cache  # pylint: disable=protected-access
         assert storage.has_secondary_index("A")
         assert storage.has_secondary_index("B")
-        assert "A" in storage._secondary_index_cache  # pylint: disable=protected-access
-        assert "B" in storage._secondary_index_cache  # pylint: disable=protected-access
+
+
+def _log_message_record(run_id, timestamp, message):
+    return LogMessageRecord(None, message, "debug", message, run_id, timestamp)
+
+
+@pytest.mark.parametrize(
+    "event_storage_factory_cm_fn",
+    [create_sqlite_run_event_logstorage, create_consolidated_sqlite_run_event_log_storage],
+)
+def test_event_log_retention(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        now = time.time()
+        ten_days_ago = now - 10 * 24 * 60 * 60
+
+        # a run that finished ten days ago, with log messages after its run end event, so that
+        # the run end event is deleted in an earlier batch than the run's last events
+        old_records = [
+            record._replace(timestamp=record.timestamp - 10 * 24 * 60 * 60)
+            for record in _stats_records(run_id="old")
+        ]
+        old_records += [
+            _event_record("old", None, ten_days_ago, DagsterEventType.PIPELINE_SUCCESS),
+            _log_message_record("old", ten_days_ago, "after"),
+            _log_message_record("old", ten_days_ago, "after"),
+        ]
+        storage.store_events(old_records)
+        old_stats = storage.get_stats_for_run("old")
+
+        # a run that started ten days ago and is still running
+        stale_running_records = [
+            _event_record("stale_running", None, ten_days_ago, DagsterEventType.PIPELINE_START)
+        ] + [
+            _event_record("stale_running", "A", ten_days_ago, DagsterEventType.STEP_START)
+            for _ in range(4)
+        ]
+        storage.store_events(stale_running_records)
+        storage.store_events(
+            [_event_record("stale_running", "B", now, DagsterEventType.STEP_START)]
+        )
+
+        # a finished run and a running run, each with more log messages than the policy allows
+        storage.store_events(
+            [_log_message_record("finished", now, str(i)) for i in range(5)]
+            + [_event_record("finished", None, now, DagsterEventType.PIPELINE_SUCCESS)]
+        )
+        storage.store_events([_log_message_record("running", now, str(i)) for i in range(5)])
+
+        policy = EventLogRetentionPolicy(max_age_seconds=24 * 60 * 60, max_log_messages_per_run=2)
+
+        # retention is enforced in bounded batches
+        batches = []
+        while True:
+            deleted = storage.delete_expired_events(policy, limit=5)
+            batches.append(deleted)
+            if deleted < 5:
+                break
+        assert all(deleted <= 5 for deleted in batches)
+        assert sum(batches) == len(old_records) + 3
+        assert storage.delete_expired_events(policy, limit=5) == 0
+        storage.compact()
+
+        assert storage.get_logs_for_run("old") == []
+        # the summary tables outlive the events
+        assert storage.get_stats_for_run("old") == old_stats
+
+        # the most recent log messages of the finished run are kept
+        finished_logs = storage.get_logs_for_run("finished")
+        assert [event.message for event in finished_logs if not event.is_dagster_event] == [
+            "3",
+            "4",
+        ]
+        assert finished_logs[-1].dagster_event.event_type == DagsterEventType.PIPELINE_SUCCESS
+        assert len(storage.get_logs_for_run("running")) == 5
+
+        # the events of a run that has not finished are kept, however old
+        assert [
+            event.dagster_event.event_type for event in storage.get_logs_for_run("stale_running")
+        ] == [DagsterEventType.PIPELINE_START] + [DagsterEventType.STEP_START] * 5
+
+        if storage.is_asset_aware:
+            summary = storage.get_asset_materialization_summary(AssetKey("mat_2"))
+            assert summary.materialization_count == 1
+            assert summary.first_timestamp == summary.last_timestamp
+            assert summary.first_timestamp < ten_days_ago
+            assert summary.last_materialization.dagster_event.asset_key == AssetKey("mat_2")
+            assert storage.get_asset_materialization_summary(AssetKey("unknown")) is None
+
+            storage.wipe_asset(AssetKey("mat_2"))
+            assert storage.get_asset_materialization_summary(AssetKey("mat_2")) is None
+
+
+def test_sqlite_event_log_retention_resumes_between_batches():
+    with create_sqlite_run_event_logstorage() as storage:
+        ten_days_ago = time.time() - 10 * 24 * 60 * 60
+        for run_id in ["a", "b", "c"]:
+            storage.store_events(
+                [_log_message_record(run_id, ten_days_ago, str(i)) for i in range(2)]
+                + [_event_record(run_id, None, ten_days_ago, DagsterEventType.PIPELINE_SUCCESS)]
+            )
+
+        visited_run_ids = []
+        delete_expired_events = storage._delete_expired_events  # pylint: disable=protected-access
+
+        def _delete_expired_events(retention_policy, limit, run_id=None):
+            visited_run_ids.append(run_id)
+            return delete_expired_events(retention_policy, limit, run_id=run_id)
+
+        storage._delete_expired_events = _delete_expired_events  # pylint: disable=protected-access
+
+        policy = EventLogRetentionPolicy(max_age_seconds=24 * 60 * 60)
+
+        # each batch starts from the run that the previous batch stopped in
+        assert storage.delete_expired_events(policy, limit=4) == 4
+        assert visited_run_ids == ["a", "b"]
+        assert storage.delete_expired_events(policy, limit=4) == 4
+        assert visited_run_ids == ["a", "b", "b", "c"]
+        assert storage.delete_expired_events(policy, limit=4) == 1
+        assert visited_run_ids == ["a", "b", "b", "c", "c"]
+
+        # once the pass over the runs is complete, the next one starts from the first run
+        assert storage.delete_expired_events(policy, limit=4) == 0
+        assert visited_run_ids == ["a", "b", "b", "c", "c", "a", "b", "c"]
@@ -7,7 +7,7 @@
     intermediate_storage,
     pipeline,
 )
-from dagster.core.storage.object_store import InMemoryObjectStore
+from dagster.core.storage.object_store import MAX_SIZED_VALUES, InMemoryObjectStore
 from dagster.core.storage.system_storage import build_intermediate_storage_from_object_store
 
 
@@ -103,3 +103,18 @@ def _resource_req_pass_pipeline():
         "Resource 'yup' is required by intermediate storage 'storage_with_req', but "
         "is not provided by mode 'default'."
     )
+
+
+def test_in_memory_object_size():
+    object_store = InMemoryObjectStore()
+    assert object_store.get_object_size("missing") is None
+
+    object_store.set_object("empty", [])
+    object_store.set_object("values", [str(i) * 1000 for i in range(100)])
+    # the values a container holds are counted, rather than only the container
+    assert (
+        object_store.get_object_size("values") > 100 * 1000 > object_store.get_object_size("empty")
+    )
+
+    object_store.set_object("large", list(range(MAX_SIZED_VALUES + 1)))
+    assert object_store.get_object_size("large") is None
@@ -1,8 +1,17 @@
+import time
 from contextlib import contextmanager
 
 import pytest
 from dagster import seven
-from dagster.core.storage.runs import InMemoryRunStorage, SqliteRunStorage
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from dagster.core.storage.runs import (
+    CachedRunStorage,
+    InMemoryRunStorage,
+    RunStorageCacheStats,
+    SqliteRunStorage,
+)
+from dagster.core.utils import make_new_run_id
 from dagster_tests.core_tests.storage_tests.utils.run_storage import TestRunStorage
 
 
@@ -36,3 +45,190 @@ class TestInMemoryImplementation(TestRunStorage):
     def run_storage(self, request):
         with request.param() as s:
             yield s
+
+
+@contextmanager
+def create_cached_sqlite_run_storage():
+    with create_sqlite_run_storage() as storage:
+        yield CachedRunStorage(storage)
+
+
+class TestCachedImplementation(TestRunStorage):
+    __test__ = True
+
+    @pytest.fixture(name="storage", params=[create_cached_sqlite_run_storage])
+    def run_storage(self, request):
+        with request.param() as s:
+            yield s
+
+
+def _make_run(run_id):
+    return PipelineRun(pipeline_name="some_pipeline", run_id=run_id)
+
+
+def _pipeline_event(event_type):
+    return DagsterEvent(event_type_value=event_type.value, pipeline_name="some_pipeline")
+
+
+def test_cached_run_storage_hits_and_misses():
+    storage = CachedRunStorage(InMemoryRunStorage())
+    run_id = make_new_run_id()
+    storage.add_run(_make_run(run_id))
+
+    assert storage.get_run_by_id(run_id).run_id == run_id
+    assert storage.get_run_by_id(run_id).run_id == run_id
+    assert len(storage.get_runs()) == 1
+    assert len(storage.get_runs()) == 1
+    assert storage.get_runs_count() == 1
+    assert storage.get_runs(PipelineRunsFilter(run_ids=[run_id]))[0].run_id == run_id
+
+    assert storage.get_cache_stats() == RunStorageCacheStats(hits=2, misses=4, entries=4)
+
+    # cached lists are copied, so mutating a result does not corrupt the cache
+    storage.get_runs().pop()
+    assert len(storage.get_runs()) == 1
+
+
+def test_cached_run_storage_invalidation():
+    storage = CachedRunStorage(InMemoryRunStorage())
+    run_id = make_new_run_id()
+    other_run_id = make_new_run_id()
+    storage.add_run(_make_run(run_id))
+    storage.add_run(_make_run(other_run_id))
+
+    assert storage.get_run_by_id(run_id).status == PipelineRunStatus.NOT_STARTED
+    assert storage.get_run_by_id(other_run_id).status == PipelineRunStatus.NOT_STARTED
+    assert storage.get_runs_count(PipelineRunsFilter(statuses=[PipelineRunStatus.STARTED])) == 0
+
+    # events that do not change the run status leave the cache alone
+    storage.handle_run_event(run_id, _pipeline_event(DagsterEventType.PIPELINE_INIT_FAILURE))
+    assert storage.get_cache_stats().entries == 3
+
+    storage.handle_run_event(run_id, _pipeline_event(DagsterEventType.PIPELINE_START))
+    assert storage.get_cache_stats().entries == 1
+    assert storage.get_run_by_id(run_id).status == PipelineRunStatus.STARTED
+    assert storage.get_runs_count(PipelineRunsFilter(statuses=[PipelineRunStatus.STARTED])) == 1
+
+    # runs other than the updated one stay cached
+    hits = storage.get_cache_stats().hits
+    storage.get_run_by_id(other_run_id)
+    assert storage.get_cache_stats().hits == hits + 1
+
+    storage.add_run_tags(run_id, {"foo": "bar"})
+    assert storage.get_run_by_id(run_id).tags == {"foo": "bar"}
+    assert len(storage.get_runs(PipelineRunsFilter(tags={"foo": "bar"}))) == 1
+
+    storage.delete_run(run_id)
+    assert storage.get_run_by_id(run_id) is None
+    assert storage.get_runs_count() == 1
+
+    storage.wipe()
+    assert storage.get_run_by_id(other_run_id) is None
+    assert storage.get_runs_count() == 0
+
+
+def test_cached_run_storage_precise_invalidation():
+    storage = CachedRunStorage(InMemoryRunStorage())
+    run_id = make_new_run_id()
+    other_run_id = make_new_run_id()
+    storage.add_run(_make_run(run_id))
+    storage.add_run(_make_run(other_run_id))
+
+    started_filter = PipelineRunsFilter(statuses=[PipelineRunStatus.STARTED])
+    assert len(storage.get_runs()) == 2
+    assert storage.get_runs_count() == 2
+    assert storage.get_runs(PipelineRunsFilter(run_ids=[other_run_id]))[0].run_id == other_run_id
+    assert storage.get_runs_count(started_filter) == 0
+    assert storage.get_runs(started_filter) == []
+
+    # a status change evicts the queries containing the run, or that the run enters, but leaves
+    # the queries that it neither appears in nor enters or leaves
+    storage.handle_run_event(run_id, _pipeline_event(DagsterEventType.PIPELINE_START))
+    hits = storage.get_cache_stats().hits
+    assert storage.get_runs_count() == 2
+    assert storage.get_runs(PipelineRunsFilter(run_ids=[other_run_id]))[0].run_id == other_run_id
+    assert storage.get_cache_stats().hits == hits + 2
+
+    assert storage.get_runs_count(started_filter) == 1
+    assert [run.run_id for run in storage.get_runs(started_filter)] == [run_id]
+    assert [run.status for run in storage.get_runs()] == [
+        PipelineRunStatus.NOT_STARTED,
+        PipelineRunStatus.STARTED,
+    ]
+    assert storage.get_cache_stats().hits == hits + 2
+
+    # the run leaves the started queries once it succeeds
+    storage.handle_run_event(run_id, _pipeline_event(DagsterEventType.PIPELINE_SUCCESS))
+    assert storage.get_runs_count(started_filter) == 0
+    assert storage.get_runs(started_filter) == []
+
+    # tags are matched against the cached filters as well
+    tag_filter = PipelineRunsFilter(tags={"foo": "bar"})
+    assert storage.get_runs_count(tag_filter) == 0
+    storage.add_run_tags(other_run_id, {"foo": "bar"})
+    assert storage.get_runs_count(tag_filter) == 1
+
+
+class _WriteDuringFetchRunStorage(InMemoryRunStorage):
+    """Run storage that makes a write, as another thread would, while a run is being read."""
+
+    def __init__(self):
+        self.write_during_fetch = None
+        super(_WriteDuringFetchRunStorage, self).__init__()
+
+    def get_run_by_id(self, run_id):
+        run = super(_WriteDuringFetchRunStorage, self).get_run_by_id(run_id)
+        write_fn, self.write_during_fetch = self.write_during_fetch, None
+        if write_fn:
+            write_fn()
+        return run
+
+    def get_runs_count(self, filters=None):
+        count = super(_WriteDuringFetchRunStorage, self).get_runs_count(filters)
+        write_fn, self.write_during_fetch = self.write_during_fetch, None
+        if write_fn:
+            write_fn()
+        return count
+
+
+def test_cached_run_storage_write_during_fetch():
+    wrapped = _WriteDuringFetchRunStorage()
+    storage = CachedRunStorage(wrapped)
+    run_id = make_new_run_id()
+    storage.add_run(_make_run(run_id))
+
+    # a run read before a write, and returned after it, is not cached
+    wrapped.write_during_fetch = lambda: storage.handle_run_event(
+        run_id, _pipeline_event(DagsterEventType.PIPELINE_START)
+    )
+    assert storage.get_run_by_id(run_id).status == PipelineRunStatus.NOT_STARTED
+    assert storage.get_run_by_id(run_id).status == PipelineRunStatus.STARTED
+
+    # nor is a query result
+    wrapped.write_during_fetch = lambda: storage.add_run(_make_run(make_new_run_id()))
+    assert storage.get_runs_count() == 1
+    assert storage.get_runs_count() == 2
+
+    # a fetch that is not interrupted by a write is cached
+    hits = storage.get_cache_stats().hits
+    assert storage.get_runs_count() == 2
+    assert storage.get_run_by_id(run_id).status == PipelineRunStatus.STARTED
+    assert storage.get_cache_stats().hits == hits + 2
+
+
+def test_cached_run_storage_bounds():
+    storage = CachedRunStorage(InMemoryRunStorage(), max_entries=2, ttl_seconds=0.5)
+    run_ids = [make_new_run_id() for _ in range(3)]
+    for run_id in run_ids:
+        storage.add_run(_make_run(run_id))
+        storage.get_run_by_id(run_id)
+
+    # the least recently used run was evicted
+    assert storage.get_cache_stats().entries == 2
+    misses = storage.get_cache_stats().misses
+    storage.get_run_by_id(run_ids[0])
+    assert storage.get_cache_stats().misses == misses + 1
+
+    time.sleep(0.6)
+    storage.get_run_by_id(run_ids[0])
+    assert storage.get_cache_stats().misses == misses + 2
@@ -1,6 +1,9 @@
+import time
+
 import pytest
 from dagster.core.definitions import PipelineDefinition
 from dagster.core.errors import DagsterRunAlreadyExists, DagsterSnapshotDoesNotExist
+from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.snap import create_pipeline_snapshot_id
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
 from dagster.core.storage.tags import PARENT_RUN_ID_TAG, ROOT_RUN_ID_TAG
@@ -876,3 +879,64 @@ def test_fetch_run_groups_ordering(self, storage):
 
         assert first_root_run.run_id in run_groups
         assert second_root_run.run_id not in run_groups
+
+    def test_start_end_times_from_event_timestamps(self, storage):
+        def _pipeline_event(event_type):
+            return DagsterEvent(event_type_value=event_type.value, pipeline_name="some_pipeline")
+
+        run_id = make_new_run_id()
+        storage.add_run(TestRunStorage.build_run(run_id=run_id, pipeline_name="some_pipeline"))
+
+        # the times of the events are recorded, not the times at which they are written
+        start_time = time.time() - 100
+        storage.handle_run_event(
+            run_id, _pipeline_event(DagsterEventType.PIPELINE_START), start_time
+        )
+        storage.handle_run_event(
+            run_id, _pipeline_event(DagsterEventType.PIPELINE_SUCCESS), start_time + 10
+        )
+
+        assert storage.get_runs_count(PipelineRunsFilter(started_before=start_time + 1)) == 1
+        assert storage.get_runs_count(PipelineRunsFilter(started_after=start_time + 1)) == 0
+        assert storage.get_runs_count(PipelineRunsFilter(ended_before=start_time + 11)) == 1
+        assert storage.get_runs_count(PipelineRunsFilter(ended_after=start_time + 11)) == 0
+
+    def test_fetch_by_time_range(self, storage):
+        def _pipeline_event(event_type):
+            return DagsterEvent(event_type_value=event_type.value, pipeline_name="some_pipeline")
+
+        not_started, running, succeeded, failed = [make_new_run_id() for _ in range(4)]
+        for run_id in [not_started, running, succeeded, failed]:
+            storage.add_run(TestRunStorage.build_run(run_id=run_id, pipeline_name="some_pipeline"))
+
+        before_start = time.time()
+        for run_id in [running, succeeded, failed]:
+            storage.handle_run_event(run_id, _pipeline_event(DagsterEventType.PIPELINE_START))
+        storage.handle_run_event(succeeded, _pipeline_event(DagsterEventType.PIPELINE_SUCCESS))
+        storage.handle_run_event(failed, _pipeline_event(DagsterEventType.PIPELINE_FAILURE))
+        after_end = time.time() + 1
+
+        assert {
+            run.run_id for run in storage.get_runs(PipelineRunsFilter(started_after=before_start))
+        } == {running, succeeded, failed}
+        assert (
+            storage.get_runs_count(
+                PipelineRunsFilter(started_after=before_start, started_before=after_end)
+            )
+            == 3
+        )
+        assert storage.get_runs_count(PipelineRunsFilter(started_before=before_start)) == 0
+        assert {
+            run.run_id for run in storage.get_runs(PipelineRunsFilter(ended_after=before_start))
+        } == {succeeded, failed}
+        assert [
+            run.run_id
+            for run in storage.get_runs(
+                PipelineRunsFilter(
+                    statuses=[PipelineRunStatus.FAILURE],
+                    ended_after=before_start,
+                    ended_before=after_end,
+                )
+            )
+        ] == [failed]
+        assert storage.get_runs_count(PipelineRunsFilter(ended_after=after_end)) == 0
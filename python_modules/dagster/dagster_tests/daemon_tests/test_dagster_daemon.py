@@ -1,6 +1,7 @@
 import datetime
 import logging
 import re
+import time
 
 import pendulum
 import pytest
@@ -120,3 +121,51 @@ def test_different_intervals(caplog):
 
         assert run_daemon.last_iteration_time == next_time
         assert _run_coordinator_ran(caplog)
+
+
+def test_daemon_metrics():
+    with instance_for_test(
+        overrides={
+            "scheduler": {"module": "dagster.core.scheduler", "class": "DagsterDaemonScheduler",},
+        }
+    ) as instance:
+        with DagsterDaemonController(instance) as controller:
+            scheduler_daemon = controller.get_daemon(SchedulerDaemon.__name__)
+            assert scheduler_daemon.iteration_count == 0
+            assert scheduler_daemon.mean_iteration_duration is None
+
+            controller.run_iteration(pendulum.now("UTC"))
+
+            metrics = controller.daemon_metrics()[SchedulerDaemon.__name__]
+            assert metrics["iteration_count"] == 1
+            assert metrics["last_iteration_duration"] >= 0
+            assert metrics["mean_iteration_duration"] == metrics["last_iteration_duration"]
+            assert metrics["max_iteration_duration"] == metrics["last_iteration_duration"]
+
+
+def test_daemon_threads(caplog):
+    with instance_for_test(
+        overrides={
+            "scheduler": {"module": "dagster.core.scheduler", "class": "DagsterDaemonScheduler",},
+            "run_coordinator": {
+                "module": "dagster.core.run_coordinator.queued_run_coordinator",
+                "class": "QueuedRunCoordinator",
+            },
+        }
+    ) as instance:
+        with DagsterDaemonController(instance) as controller:
+            controller.start_daemon_threads()
+
+            start_time = time.time()
+            while not all(daemon.iteration_count for daemon in controller.daemons):
+                if time.time() - start_time > 30:
+                    raise Exception("Timed out waiting for the daemons to run")
+                time.sleep(0.5)
+
+        assert _scheduler_ran(caplog)
+        assert _run_coordinator_ran(caplog)
+
+        # the threads are stopped when the controller exits
+        iteration_counts = [daemon.iteration_count for daemon in controller.daemons]
+        time.sleep(1)
+        assert [daemon.iteration_count for daemon in controller.daemons] == iteration_counts
@@ -0,0 +1,111 @@
+import mock
+from dagster import execute_pipeline, pipeline, solid
+from dagster.core.test_utils import instance_for_test
+from dagster.daemon.controller import DagsterDaemonController
+from dagster.daemon.event_log_retention import EventLogRetentionDaemon
+
+
+@solid
+def chatty_solid(context):
+    for i in range(5):
+        context.log.info("message {}".format(i))
+
+
+@pipeline
+def chatty_pipeline():
+    chatty_solid()
+
+
+def _log_messages(instance, run_id):
+    return [event for event in instance.all_logs(run_id) if not event.is_dagster_event]
+
+
+def test_retention_daemon_instance():
+    with instance_for_test() as instance:
+        controller = DagsterDaemonController(instance)
+        assert not controller.get_daemon(EventLogRetentionDaemon.__name__)
+
+    with instance_for_test(
+        overrides={"event_log_retention": {"max_age_days": 30.0, "interval_seconds": 60}}
+    ) as instance:
+        controller = DagsterDaemonController(instance)
+        retention_daemon = controller.get_daemon(EventLogRetentionDaemon.__name__)
+        assert retention_daemon
+        assert retention_daemon.interval_seconds == 60
+
+
+def test_retention_daemon_reclaims_rows():
+    with instance_for_test(
+        overrides={
+            "event_log_retention": {
+                "max_log_messages_per_run": 1,
+                "batch_size": 2,
+                "max_batches_per_iteration": 100,
+            }
+        }
+    ) as instance:
+        result = execute_pipeline(chatty_pipeline, instance=instance)
+        assert result.success
+        n_log_messages = len(_log_messages(instance, result.run_id))
+        assert n_log_messages >= 5
+        n_events = len(instance.all_logs(result.run_id))
+
+        controller = DagsterDaemonController(instance)
+        retention_daemon = controller.get_daemon(EventLogRetentionDaemon.__name__)
+        retention_daemon.run_iteration()
+
+        assert retention_daemon.last_iteration_rows_reclaimed == n_log_messages - 1
+        assert len(_log_messages(instance, result.run_id)) == 1
+        assert len(instance.all_logs(result.run_id)) == n_events - (n_log_messages - 1)
+
+        retention_daemon.run_iteration()
+        assert retention_daemon.last_iteration_rows_reclaimed == 0
+        assert retention_daemon.rows_reclaimed == n_log_messages - 1
+
+
+def test_retention_daemon_compacts_once_enough_rows_are_reclaimed():
+    with instance_for_test(
+        overrides={
+            "event_log_retention": {
+                "max_log_messages_per_run": 1,
+                "compact_min_rows": 6,
+                "compact_interval_seconds": 24 * 60 * 60,
+            }
+        }
+    ) as instance:
+        retention_daemon = DagsterDaemonController(instance).get_daemon(
+            EventLogRetentionDaemon.__name__
+        )
+
+        with mock.patch.object(instance, "compact_event_log") as compact_event_log:
+            execute_pipeline(chatty_pipeline, instance=instance)
+            retention_daemon.run_iteration()
+            assert 0 < retention_daemon.last_iteration_rows_reclaimed < 6
+            assert not compact_event_log.called
+
+            execute_pipeline(chatty_pipeline, instance=instance)
+            retention_daemon.run_iteration()
+            assert retention_daemon.rows_reclaimed >= 6
+            assert compact_event_log.call_count == 1
+
+            # nothing was reclaimed, so there is nothing to compact
+            retention_daemon.run_iteration()
+            assert retention_daemon.last_iteration_rows_reclaimed == 0
+            assert compact_event_log.call_count == 1
+
+
+def test_retention_daemon_compacts_on_an_interval():
+    with instance_for_test(
+        overrides={
+            "event_log_retention": {"max_log_messages_per_run": 1, "compact_interval_seconds": 0}
+        }
+    ) as instance:
+        retention_daemon = DagsterDaemonController(instance).get_daemon(
+            EventLogRetentionDaemon.__name__
+        )
+
+        with mock.patch.object(instance, "compact_event_log") as compact_event_log:
+            execute_pipeline(chatty_pipeline, instance=instance)
+            retention_daemon.run_iteration()
+            assert retention_daemon.last_iteration_rows_reclaimed > 0
+            assert compact_event_log.call_count == 1
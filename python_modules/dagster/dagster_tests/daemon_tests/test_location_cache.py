@@ -0,0 +1,127 @@
+import sys
+import threading
+
+import mock
+import pendulum
+from dagster import file_relative_path
+from dagster.core.host_representation import (
+    ManagedGrpcPythonEnvRepositoryLocationOrigin,
+    RepositoryLocation,
+    RepositoryLocationCache,
+    repository_location_from_origin,
+)
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+
+
+def _bar_repo_origin(location_name="bar_repo_location"):
+    return ManagedGrpcPythonEnvRepositoryLocationOrigin(
+        loadable_target_origin=LoadableTargetOrigin(
+            executable_path=sys.executable,
+            python_file=file_relative_path(__file__, "../api_tests/api_tests_repo.py"),
+            attribute="bar_repo",
+        ),
+        location_name=location_name,
+    )
+
+
+def test_reuse_location():
+    freeze_datetime = pendulum.datetime(2020, 1, 1)
+    with RepositoryLocationCache(max_age_seconds=60, managed_max_age_seconds=600) as location_cache:
+        with pendulum.test(freeze_datetime):
+            location = location_cache.get_location(_bar_repo_origin())
+            assert location.has_repository("bar_repo")
+
+        # the origin is equal rather than identical to the cached one, as when it is deserialized
+        # from the job state of each schedule and sensor
+        with pendulum.test(freeze_datetime.add(seconds=30)):
+            assert location_cache.get_location(_bar_repo_origin()) is location
+            location_cache.cleanup_idle()
+            assert not location.location_handle.is_cleaned_up
+
+        # a location served by a managed gRPC server is not restarted at the age that locations
+        # loading their code in process are reloaded at
+        with pendulum.test(freeze_datetime.add(seconds=61)):
+            assert location_cache.get_location(_bar_repo_origin()) is location
+
+        # the location is reloaded to pick up changes to its code, and the replaced handle shut down
+        # once it is no longer in use
+        with pendulum.test(freeze_datetime.add(seconds=601)):
+            reloaded_location = location_cache.get_location(_bar_repo_origin())
+            assert reloaded_location is not location
+            assert not location.location_handle.is_cleaned_up
+            location_cache.cleanup_idle()
+            assert location.location_handle.is_cleaned_up
+            assert not reloaded_location.location_handle.is_cleaned_up
+
+    assert reloaded_location.location_handle.is_cleaned_up
+
+
+def test_cleanup_idle_location():
+    freeze_datetime = pendulum.datetime(2020, 1, 1)
+    with RepositoryLocationCache(idle_timeout_seconds=120) as location_cache:
+        with pendulum.test(freeze_datetime):
+            location = location_cache.get_location(_bar_repo_origin())
+
+        with pendulum.test(freeze_datetime.add(seconds=120)):
+            location_cache.cleanup_idle()
+            assert location.location_handle.is_cleaned_up
+            assert location_cache.get_location(_bar_repo_origin()) is not location
+
+
+def test_reload_unreachable_location():
+    with RepositoryLocationCache() as location_cache:
+        location = location_cache.get_location(_bar_repo_origin())
+        location.location_handle.cleanup()
+
+        reloaded_location = location_cache.get_location(_bar_repo_origin())
+        assert reloaded_location is not location
+        assert reloaded_location.has_repository("bar_repo")
+
+
+def test_slow_location_does_not_block_other_locations():
+    with RepositoryLocationCache() as location_cache:
+        location = location_cache.get_location(_bar_repo_origin())
+
+        from_handle = RepositoryLocation.from_handle
+        loading = threading.Event()
+        finish_loading = threading.Event()
+
+        def _slow_from_handle(handle):
+            loading.set()
+            finish_loading.wait()
+            return from_handle(handle)
+
+        slow_locations = []
+        with mock.patch.object(RepositoryLocation, "from_handle", side_effect=_slow_from_handle):
+            thread = threading.Thread(
+                target=lambda: slow_locations.append(
+                    location_cache.get_location(_bar_repo_origin("slow_location"))
+                )
+            )
+            thread.start()
+            try:
+                assert loading.wait(timeout=30)
+
+                # the cached location is served while the other location is loading
+                cached_locations = []
+                lookup_thread = threading.Thread(
+                    target=lambda: cached_locations.append(
+                        location_cache.get_location(_bar_repo_origin())
+                    )
+                )
+                lookup_thread.start()
+                lookup_thread.join(timeout=30)
+                assert cached_locations == [location]
+                assert not slow_locations
+            finally:
+                finish_loading.set()
+                thread.join()
+
+        assert slow_locations[0].has_repository("bar_repo")
+
+
+def test_location_without_cache():
+    with repository_location_from_origin(_bar_repo_origin()) as location:
+        assert location.has_repository("bar_repo")
+
+    assert location.location_handle.is_cleaned_up
@@ -13,12 +13,17 @@
     _unpack_value,
     _whitelist_for_persistence,
     _whitelist_for_serdes,
+    COMPRESSED_JSON_PREFIX,
     default_to_storage_value,
+    deserialize_dagster_namedtuple,
     deserialize_json_to_dagster_namedtuple,
     deserialize_value,
+    serialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_compressed,
     serialize_value,
 )
 from dagster.utils import compose
+from dagster.utils.error import SerializableErrorInfo
 
 
 def test_deserialize_value_ok():
@@ -379,3 +384,18 @@ def __new__(cls, a, b, c):
     assert isinstance(alphabet, SubstituteAlphabet)
     assert not isinstance(alphabet.c, DeprecatedAlphabet)
     assert isinstance(alphabet.c, SubstituteAlphabet)
+
+
+def test_compressed_serialization():
+    value = SerializableErrorInfo("a message", ["a", "stack"], "SomeError")
+
+    json_str = serialize_dagster_namedtuple(value)
+    compressed = serialize_dagster_namedtuple_compressed(value)
+    assert compressed.startswith(COMPRESSED_JSON_PREFIX)
+
+    # both encodings are read back transparently
+    assert deserialize_dagster_namedtuple(compressed) == value
+    assert deserialize_dagster_namedtuple(json_str) == value
+
+    with pytest.raises(CheckError, match="Could not decompress serialized value"):
+        deserialize_dagster_namedtuple(COMPRESSED_JSON_PREFIX + "not compressed")
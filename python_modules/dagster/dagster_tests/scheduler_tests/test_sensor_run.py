@@ -12,6 +12,7 @@
 from dagster.core.host_representation import (
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
     RepositoryLocation,
+    RepositoryLocationCache,
     RepositoryLocationHandle,
 )
 from dagster.core.scheduler.job import JobState, JobStatus, JobTickStatus
@@ -55,9 +56,22 @@ def error_sensor(context):
     raise Exception("womp womp")
 
 
+@sensor(pipeline_name="the_pipeline")
+def slow_sensor(_context):
+    time.sleep(3)
+    return RunRequest(run_key=None, run_config={}, tags={})
+
+
 @repository
 def the_repo():
-    return [the_pipeline, simple_sensor, error_sensor, always_on_sensor, run_key_sensor]
+    return [
+        the_pipeline,
+        simple_sensor,
+        error_sensor,
+        always_on_sensor,
+        run_key_sensor,
+        slow_sensor,
+    ]
 
 
 @contextmanager
@@ -314,3 +328,88 @@ def test_launch_once(external_repo_context, capfd):
                 "Found existing run for sensor run_key_sensor with run_key `only_once`, skipping."
                 in captured.out
             )
+
+
+@pytest.mark.parametrize("external_repo_context", repos())
+def test_launch_once_with_location_cache(external_repo_context):
+    freeze_datetime = pendulum.datetime(
+        year=2019, month=2, day=27, hour=23, minute=59, second=59,
+    ).in_tz("US/Central")
+    with instance_with_sensors(external_repo_context) as (instance, external_repo):
+        with pendulum.test(freeze_datetime):
+            with RepositoryLocationCache() as location_cache:
+                external_sensor = external_repo.get_external_sensor("run_key_sensor")
+                external_origin = external_sensor.get_external_origin()
+                instance.add_job_state(JobState(external_origin, JobType.SENSOR, JobStatus.RUNNING))
+
+                execute_sensor_iteration(
+                    instance,
+                    get_default_daemon_logger("SensorDaemon"),
+                    location_cache=location_cache,
+                )
+                wait_for_all_runs_to_start(instance)
+                assert instance.get_runs_count() == 1
+
+                repo_location_origin = (
+                    external_origin.external_repository_origin.repository_location_origin
+                )
+                repo_location = location_cache.get_location(repo_location_origin)
+
+                # the second iteration evaluates the sensor on the location loaded by the first
+                execute_sensor_iteration(
+                    instance,
+                    get_default_daemon_logger("SensorDaemon"),
+                    location_cache=location_cache,
+                )
+                assert instance.get_runs_count() == 1
+                ticks = instance.get_job_ticks(external_sensor.get_external_origin_id())
+                assert len(ticks) == 2
+                assert ticks[0].status == JobTickStatus.SKIPPED
+
+                assert location_cache.get_location(repo_location_origin) is repo_location
+
+
+@pytest.mark.parametrize("external_repo_context", repos())
+def test_slow_sensor_timeout(external_repo_context):
+    freeze_datetime = pendulum.datetime(
+        year=2019, month=2, day=27, hour=23, minute=59, second=59,
+    ).in_tz("US/Central")
+    with instance_with_sensors(external_repo_context) as (instance, external_repo):
+        with pendulum.test(freeze_datetime):
+            slow_external_sensor = external_repo.get_external_sensor("slow_sensor")
+            instance.add_job_state(
+                JobState(
+                    slow_external_sensor.get_external_origin(), JobType.SENSOR, JobStatus.RUNNING
+                )
+            )
+            external_sensor = external_repo.get_external_sensor("always_on_sensor")
+            instance.add_job_state(
+                JobState(external_sensor.get_external_origin(), JobType.SENSOR, JobStatus.RUNNING)
+            )
+
+            # the slow sensor times out, without holding up the other sensor
+            execute_sensor_iteration(
+                instance,
+                get_default_daemon_logger("SensorDaemon"),
+                max_concurrent=2,
+                evaluation_timeout=1,
+            )
+            wait_for_all_runs_to_start(instance)
+
+            assert instance.get_runs_count() == 1
+            run = instance.get_runs()[0]
+            ticks = instance.get_job_ticks(external_sensor.get_external_origin_id())
+            assert len(ticks) == 1
+            validate_tick(
+                ticks[0], external_sensor, freeze_datetime, JobTickStatus.SUCCESS, run.run_id
+            )
+
+            slow_ticks = instance.get_job_ticks(slow_external_sensor.get_external_origin_id())
+            assert len(slow_ticks) == 1
+            validate_tick(
+                slow_ticks[0],
+                slow_external_sensor,
+                freeze_datetime,
+                JobTickStatus.FAILURE,
+                expected_error="did not complete within 1 seconds",
+            )
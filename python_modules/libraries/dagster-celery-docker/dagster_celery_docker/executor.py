@@ -176,14 +176,14 @@ def app_args(self):
         }
 
 
-def _submit_task_docker(app, pipeline_context, step, queue, priority):
+def _submit_task_docker(app, pipeline_context, step, queue, priority, step_keys):
     task = create_docker_task(app)
 
     recon_repo = pipeline_context.pipeline.get_reconstructable_repository()
 
     task_signature = task.si(
         instance_ref_dict=pipeline_context.instance.get_ref().to_dict(),
-        step_keys=[step.key],
+        step_keys=step_keys,
         run_config=pipeline_context.pipeline_run.run_config,
         mode=pipeline_context.pipeline_run.mode,
         repo_name=recon_repo.get_definition().name,
@@ -209,7 +209,7 @@ def app_args(self):
         }
 
 
-def _submit_task_k8s_job(app, pipeline_context, step, queue, priority):
+def _submit_task_k8s_job(app, pipeline_context, step, queue, priority, step_keys):
     user_defined_k8s_config = get_user_defined_k8s_config(step.tags)
 
     task = create_k8s_job_task(app)
@@ -218,7 +218,7 @@ def _submit_task_k8s_job(app, pipeline_context, step, queue, priority):
 
     task_signature = task.si(
         instance_ref_dict=pipeline_context.instance.get_ref().to_dict(),
-        step_keys=[step.key],
+        step_keys=step_keys,
         run_config=pipeline_context.pipeline_run.run_config,
         mode=pipeline_context.pipeline_run.mode,
         repo_name=recon_repo.get_definition().name,
@@ -1,11 +1,14 @@
+import os
 import sys
 import time
 
 from celery.exceptions import TaskRevokedError
 from dagster import check
 from dagster.core.errors import DagsterSubprocessError
-from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.critical_path import CriticalPathPriority
+from dagster.core.execution.plan.fusion import StepFusion
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.serdes import deserialize_json_to_dagster_namedtuple
 from dagster.utils.error import serializable_error_info_from_exc_info
@@ -23,11 +26,32 @@
 DELEGATE_MARKER = "celery_queue_wait"
 
 
-def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_fn):
+def core_celery_execution_loop(
+    pipeline_context,
+    execution_plan,
+    step_execution_fn,
+    critical_path_config=None,
+    fuse_steps=False,
+    stream_events=False,
+):
+    """Submits the steps of a plan as celery tasks and processes their events.
+
+    Args:
+        step_execution_fn (Callable): Submits the task executing a list of step keys, starting with
+            a ready step, and returns its ``celery.AsyncResult``.
+        fuse_steps (bool): Whether to submit each linear chain of steps on the same queue as a
+            single task.
+        stream_events (bool): Whether the tasks write their events to the event log of the run as
+            they execute, rather than returning them in their result. The events are then read from
+            the event log as the tasks progress.
+    """
 
     check.inst_param(pipeline_context, "pipeline_context", SystemPipelineExecutionContext)
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.callable_param(step_execution_fn, "step_execution_fn")
+    check.opt_dict_param(critical_path_config, "critical_path_config")
+    check.bool_param(fuse_steps, "fuse_steps")
+    check.bool_param(stream_events, "stream_events")
 
     executor = pipeline_context.executor
 
@@ -44,16 +68,25 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
         -1 * int(step.tags.get(DAGSTER_CELERY_STEP_PRIORITY_TAG, task_default_priority))
         + -1 * _get_run_priority(pipeline_context)
     )
+    critical_path = CriticalPathPriority.from_config(
+        pipeline_context, execution_plan, critical_path_config
+    )
+    if critical_path:
+        priority_for_step = critical_path.sort_key_fn(priority_for_step)
     priority_for_key = lambda step_key: (
         priority_for_step(execution_plan.get_step_by_key(step_key))
     )
     _warn_on_priority_misuse(pipeline_context, execution_plan)
 
     step_results = {}  # Dict[ExecutionStep, celery.AsyncResult]
+    units = {}  # step key -> keys of the steps its task executes, starting with it
     step_errors = {}
+    event_log_tail = _EventLogTail(pipeline_context) if stream_events else None
 
     with execution_plan.start(
-        retries=pipeline_context.executor.retries, sort_key_fn=priority_for_step,
+        retries=pipeline_context.executor.retries,
+        sort_key_fn=priority_for_step,
+        fusion=StepFusion(execution_plan, enabled=fuse_steps, group_fn=_queue_for_step),
     ) as active_execution:
 
         stopping = False
@@ -68,7 +101,8 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                 stopping = True
                 for key, result in step_results.items():
                     result.revoke()
-                    active_execution.mark_interrupted(key)
+                    for unit_key in units[key]:
+                        active_execution.mark_interrupted(unit_key)
             results_to_pop = []
             for step_key, result in sorted(
                 step_results.items(), key=lambda x: priority_for_key(x[0])
@@ -100,10 +134,20 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
 
                     results_to_pop.append(step_key)
 
+            if event_log_tail:
+                # a task is only ready once all of its events are written, so reading the event log
+                # after checking which tasks are ready picks up every event of those tasks
+                for event in event_log_tail.read_events(
+                    [unit_key for key in step_results for unit_key in units[key]]
+                ):
+                    yield event
+                    active_execution.handle_event(event)
+
             for step_key in results_to_pop:
                 if step_key in step_results:
                     del step_results[step_key]
-                    active_execution.verify_complete(pipeline_context, step_key)
+                    for unit_key in units.pop(step_key):
+                        active_execution.verify_complete(pipeline_context, unit_key)
 
             # process skips from failures or uncovered inputs
             for event in active_execution.plan_events_iterator(pipeline_context):
@@ -120,11 +164,12 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
             # case has m >> n to exhibit this behavior in the absence of this sort step.
             for step in active_execution.get_steps_to_execute():
                 try:
-                    queue = step.tags.get(DAGSTER_CELERY_QUEUE_TAG, task_default_queue)
+                    queue = _queue_for_step(step)
+                    units[step.key] = active_execution.unit_for(step)
                     yield DagsterEvent.engine_event(
                         pipeline_context,
-                        'Submitting celery task for step "{step_key}" to queue "{queue}".'.format(
-                            step_key=step.key, queue=queue
+                        'Submitting celery task for {steps} to queue "{queue}".'.format(
+                            steps=_describe_steps(units[step.key]), queue=queue
                         ),
                         EngineEventData(marker_start=DELEGATE_MARKER),
                         step_key=step.key,
@@ -135,7 +180,7 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
 
                     # Submit the Celery tasks
                     step_results[step.key] = step_execution_fn(
-                        app, pipeline_context, step, queue, priority
+                        app, pipeline_context, step, queue, priority, units[step.key]
                     )
 
                 except Exception:
@@ -164,6 +209,55 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
             )
 
 
+def _queue_for_step(step):
+    return step.tags.get(DAGSTER_CELERY_QUEUE_TAG, task_default_queue)
+
+
+def _describe_steps(step_keys):
+    if len(step_keys) == 1:
+        return 'step "{}"'.format(step_keys[0])
+    return "steps {}".format(", ".join('"{}"'.format(step_key) for step_key in step_keys))
+
+
+class _EventLogTail:
+    """Reads the events of the steps executing in celery tasks from the event log of the run, as
+    the workers write them.
+
+    Each step is tailed by the id of the last record read for it. Workers commit concurrently, so
+    the records of different steps can be committed out of id order, but the records of a single
+    step are written in order by the one worker executing it, and are all written by the time its
+    task is ready. Tailing each step separately therefore neither skips nor repeats a record.
+    """
+
+    def __init__(self, pipeline_context):
+        self._instance = pipeline_context.instance
+        self._run_id = pipeline_context.run_id
+        self._last_record_ids = {}
+
+    def read_events(self, step_keys):
+        for step_key in step_keys:
+            records = self._instance.event_records_after(
+                self._run_id,
+                after_record_id=self._last_record_ids.get(step_key),
+                step_key=step_key,
+            )
+            if not records:
+                continue
+
+            self._last_record_ids[step_key] = records[-1][0]
+
+            for _, record in records:
+                if not record.is_dagster_event:
+                    continue
+
+                # the engine events of this process are yielded as they are created
+                event = record.dagster_event
+                if event.event_type == DagsterEventType.ENGINE_EVENT and event.pid == os.getpid():
+                    continue
+
+                yield event
+
+
 def _get_step_priority(context, step):
     """Step priority is (currently) set as the overall pipeline run priority plus the individual
     step priority.
@@ -1,6 +1,10 @@
-from dagster import Executor, Field, Noneable, Permissive, StringSource, check, executor
-from dagster.core.definitions.executor import check_cross_process_constraints
+from dagster import Bool, Executor, Field, Noneable, Permissive, StringSource, check, executor
+from dagster.core.definitions.executor import (
+    check_cross_process_constraints,
+    get_critical_path_config,
+)
 from dagster.core.execution.retries import Retries, RetryMode, get_retries_config
+from dagster.utils import merge_dicts
 
 from .config import DEFAULT_CONFIG, dict_wrapper
 from .defaults import broker_url, result_backend
@@ -33,7 +37,21 @@
 }
 
 
-@executor(name="celery", config_schema=CELERY_CONFIG)
+@executor(
+    name="celery",
+    config_schema=merge_dicts(
+        CELERY_CONFIG,
+        {
+            "critical_path": get_critical_path_config(),
+            "fuse_steps": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description="Submit each linear chain of steps on the same queue as one task.",
+            ),
+        },
+    ),
+)
 def celery_executor(init_context):
     """Celery-based executor.
 
@@ -78,6 +96,17 @@ def celery_enabled_pipeline():
               config_source: # Dict[str, Any]: Any additional parameters to pass to the
                   #...       # Celery workers. This dict will be passed as the `config_source`
                   #...       # argument of celery.Celery().
+              critical_path: # Optional: submit the steps with the longest critical path first
+                num_runs: 10 # Optional[int]: The recent successful runs to take durations from
+              fuse_steps: false # Optional[bool]: Submit linear chains of steps as single tasks
+
+    Setting ``fuse_steps`` to ``true`` submits each linear chain of steps on the same queue -- where
+    a step is the only step depending on the one before it, and depends on no other step -- as a
+    single task, handing the outputs along the chain over in memory on the worker. Tagging a solid
+    with ``dagster/fuse`` set to ``"false"`` keeps its steps out of fused chains.
+
+    The workers write the events of the steps to the event log of the run as they execute, and the
+    executor reads them from there as the tasks progress.
 
     Note that the YAML you provide here must align with the configuration with which the Celery
     workers on which you hope to run were started. If, for example, you point the executor at a
@@ -92,10 +121,12 @@ def celery_enabled_pipeline():
         config_source=init_context.executor_config.get("config_source"),
         include=init_context.executor_config.get("include"),
         retries=Retries.from_config(init_context.executor_config["retries"]),
+        critical_path=init_context.executor_config.get("critical_path"),
+        fuse_steps=init_context.executor_config.get("fuse_steps", False),
     )
 
 
-def _submit_task(app, pipeline_context, step, queue, priority):
+def _submit_task(app, pipeline_context, step, queue, priority, step_keys):
     from .tasks import create_task
 
     task = create_task(app)
@@ -104,7 +135,7 @@ def _submit_task(app, pipeline_context, step, queue, priority):
         instance_ref_dict=pipeline_context.instance.get_ref().to_dict(),
         executable_dict=pipeline_context.pipeline.to_dict(),
         run_id=pipeline_context.pipeline_run.run_id,
-        step_keys=[step.key],
+        step_keys=step_keys,
         retries_dict=pipeline_context.executor.retries.for_inner_plan().to_config(),
     )
     return task_signature.apply_async(
@@ -114,7 +145,14 @@ def _submit_task(app, pipeline_context, step, queue, priority):
 
 class CeleryExecutor(Executor):
     def __init__(
-        self, retries, broker=None, backend=None, include=None, config_source=None,
+        self,
+        retries,
+        broker=None,
+        backend=None,
+        include=None,
+        config_source=None,
+        critical_path=None,
+        fuse_steps=False,
     ):
         self.broker = check.opt_str_param(broker, "broker", default=broker_url)
         self.backend = check.opt_str_param(backend, "backend", default=result_backend)
@@ -123,6 +161,8 @@ def __init__(
             dict(DEFAULT_CONFIG, **check.opt_dict_param(config_source, "config_source"))
         )
         self._retries = check.inst_param(retries, "retries", Retries)
+        self.critical_path_config = check.opt_dict_param(critical_path, "critical_path")
+        self.fuse_steps = check.bool_param(fuse_steps, "fuse_steps")
 
     @property
     def retries(self):
@@ -132,7 +172,12 @@ def execute(self, pipeline_context, execution_plan):
         from .core_execution_loop import core_celery_execution_loop
 
         return core_celery_execution_loop(
-            pipeline_context, execution_plan, step_execution_fn=_submit_task
+            pipeline_context,
+            execution_plan,
+            step_execution_fn=_submit_task,
+            critical_path_config=self.critical_path_config,
+            fuse_steps=self.fuse_steps,
+            stream_events=True,
         )
 
     @staticmethod
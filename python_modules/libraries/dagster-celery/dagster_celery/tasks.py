@@ -1,14 +1,72 @@
-from dagster import DagsterInstance, EventMetadataEntry, check
+import hashlib
+from collections import OrderedDict
+
+from dagster import DagsterInstance, EventMetadataEntry, check, seven
 from dagster.core.definitions.reconstructable import ReconstructablePipeline
 from dagster.core.events import EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.api import (
+    create_execution_plan,
+    execute_fused_plan_iterator,
+    execute_plan_iterator,
+)
 from dagster.core.execution.retries import Retries
 from dagster.core.instance import InstanceRef
-from dagster.serdes import serialize_dagster_namedtuple
 
 from .core_execution_loop import DELEGATE_MARKER
 from .executor import CeleryExecutor
 
+# The number of execution plans a worker process keeps, for the runs it most recently executed steps
+# of
+EXECUTION_PLAN_CACHE_SIZE = 32
+
+_instances = {}  # serialized instance ref -> DagsterInstance
+_execution_plans = OrderedDict()  # cache key -> (ReconstructablePipeline, ExecutionPlan)
+
+
+def _get_instance(instance_ref_dict):
+    key = seven.json.dumps(instance_ref_dict, sort_keys=True)
+    if key not in _instances:
+        _instances[key] = DagsterInstance.from_ref(InstanceRef.from_dict(instance_ref_dict))
+    return _instances[key]
+
+
+def _run_config_hash(run_config):
+    return hashlib.sha1(seven.json.dumps(run_config, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _get_execution_plan(executable_dict, pipeline_run):
+    """The execution plan of a run, reused across the tasks of the runs of the same pipeline
+    snapshot and run config executed by this worker process."""
+    key = (
+        pipeline_run.pipeline_snapshot_id,
+        _run_config_hash(pipeline_run.run_config),
+        pipeline_run.mode,
+        tuple(pipeline_run.step_keys_to_execute or []),
+        seven.json.dumps(executable_dict, sort_keys=True),
+    )
+
+    if key in _execution_plans:
+        _execution_plans.move_to_end(key)
+        return _execution_plans[key][1]
+
+    # without a snapshot of the pipeline, its definition may have changed since it was cached
+    cacheable = pipeline_run.pipeline_snapshot_id is not None
+
+    pipeline = ReconstructablePipeline.from_dict(executable_dict)
+    execution_plan = create_execution_plan(
+        pipeline,
+        pipeline_run.run_config,
+        mode=pipeline_run.mode,
+        step_keys_to_execute=pipeline_run.step_keys_to_execute,
+    )
+
+    if cacheable:
+        _execution_plans[key] = (pipeline, execution_plan)
+    while len(_execution_plans) > EXECUTION_PLAN_CACHE_SIZE:
+        _execution_plans.popitem(last=False)
+
+    return execution_plan
+
 
 def create_task(celery_app, **task_kwargs):
     @celery_app.task(bind=True, name="execute_plan", **task_kwargs)
@@ -19,9 +77,7 @@ def _execute_plan(self, instance_ref_dict, executable_dict, run_id, step_keys, r
         check.list_param(step_keys, "step_keys", of_type=str)
         check.dict_param(retries_dict, "retries_dict")
 
-        instance_ref = InstanceRef.from_dict(instance_ref_dict)
-        instance = DagsterInstance.from_ref(instance_ref)
-        pipeline = ReconstructablePipeline.from_dict(executable_dict)
+        instance = _get_instance(instance_ref_dict)
         retries = Retries.from_config(retries_dict)
 
         pipeline_run = instance.get_run_by_id(run_id)
@@ -29,14 +85,11 @@ def _execute_plan(self, instance_ref_dict, executable_dict, run_id, step_keys, r
 
         step_keys_str = ", ".join(step_keys)
 
-        execution_plan = create_execution_plan(
-            pipeline,
-            pipeline_run.run_config,
-            mode=pipeline_run.mode,
-            step_keys_to_execute=pipeline_run.step_keys_to_execute,
-        ).build_subset_plan(step_keys)
+        execution_plan = _get_execution_plan(executable_dict, pipeline_run).build_subset_plan(
+            step_keys
+        )
 
-        engine_event = instance.report_engine_event(
+        instance.report_engine_event(
             "Executing steps {} in celery worker".format(step_keys_str),
             pipeline_run,
             EngineEventData(
@@ -47,20 +100,28 @@ def _execute_plan(self, instance_ref_dict, executable_dict, run_id, step_keys, r
                 marker_end=DELEGATE_MARKER,
             ),
             CeleryExecutor,
-            step_key=execution_plan.step_key_for_single_step_plans(),
+            step_key=step_keys[0],
         )
 
-        events = [engine_event]
-        for step_event in execute_plan_iterator(
-            execution_plan,
-            pipeline_run=pipeline_run,
-            run_config=pipeline_run.run_config,
-            instance=instance,
-            retries=retries,
-        ):
-            events.append(step_event)
-
-        serialized_events = [serialize_dagster_namedtuple(event) for event in events]
-        return serialized_events
+        # the steps of a task are a linear chain, whose outputs are handed over in memory
+        plan_iterator = execute_fused_plan_iterator if len(step_keys) > 1 else execute_plan_iterator
+
+        # the events are written to the event log of the run as they are created, from which the
+        # executor reads them, rather than being returned once all of the steps are done
+        try:
+            for _ in plan_iterator(
+                execution_plan,
+                pipeline_run=pipeline_run,
+                run_config=pipeline_run.run_config,
+                instance=instance,
+                retries=retries,
+            ):
+                pass
+        finally:
+            # the instance outlives the task, so write any buffered events before the task is
+            # reported ready, after which the executor expects to find all of them
+            instance.flush_event_buffer()
+
+        return []
 
     return _execute_plan
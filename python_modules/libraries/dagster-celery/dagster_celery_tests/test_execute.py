@@ -219,6 +219,35 @@ def test_execute_eagerly_serial_on_celery():
         assert len(events_of_type(result, "STEP_SUCCESS")) == 2
 
 
+def test_execute_eagerly_fused_serial_on_celery():
+    with seven.TemporaryDirectory() as tempdir:
+        run_config = {
+            "storage": {"filesystem": {"config": {"base_dir": tempdir}}},
+            "execution": {
+                "celery": {
+                    "config": {"config_source": {"task_always_eager": True}, "fuse_steps": True}
+                }
+            },
+        }
+        with execute_pipeline_on_celery(
+            "test_serial_pipeline", run_config=run_config, tempdir=tempdir
+        ) as result:
+            assert result.result_for_solid("simple").output_value() == 1
+            assert result.result_for_solid("add_one").output_value() == 2
+            assert len(events_of_type(result, "STEP_START")) == 2
+            assert len(events_of_type(result, "STEP_SUCCESS")) == 2
+
+            # both steps are submitted as one task
+            assert [
+                event.message
+                for event in events_of_type(result, "ENGINE_EVENT")
+                if event.message.startswith("Submitting celery task")
+            ] == [
+                'Submitting celery task for steps "simple.compute", "add_one.compute" to queue '
+                '"dagster".'
+            ]
+
+
 def test_execute_eagerly_diamond_pipeline_on_celery():
     with execute_eagerly_on_celery("test_diamond_pipeline") as result:
         assert result.result_for_solid("emit_values").output_values == {
@@ -53,6 +53,29 @@ def test_execute_on_dask_local():
             assert result.result_for_solid("simple").output_value() == 1
 
 
+def test_execute_on_dask_local_critical_path():
+    with seven.TemporaryDirectory() as tempdir:
+        with instance_for_test_tempdir(tempdir) as instance:
+            run_config = {
+                "storage": {"filesystem": {"config": {"base_dir": tempdir}}},
+                "execution": {
+                    "dask": {
+                        "config": {
+                            "cluster": {"local": {"timeout": 30}},
+                            "critical_path": {"num_runs": 5},
+                        }
+                    }
+                },
+            }
+
+            # the first run has no history to prioritize steps from
+            for _ in range(2):
+                result = execute_pipeline(
+                    reconstructable(dask_engine_pipeline), run_config=run_config, instance=instance,
+                )
+                assert result.result_for_solid("simple").output_value() == 1
+
+
 def dask_composite_pipeline():
     return nesting_composite_pipeline(
         6, 2, mode_defs=[ModeDefinition(executor_defs=default_executors + [dask_executor])]
@@ -1,9 +1,9 @@
 import threading
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 import psycopg2
 import sqlalchemy as db
-from dagster import check
+from dagster import Field, check
 from dagster.core.events.log import EventRecord
 from dagster.core.storage.event_log import (
     AssetAwareSqlEventLogStorage,
@@ -15,7 +15,7 @@
 from dagster.serdes import (
     ConfigurableClass,
     ConfigurableClassData,
-    deserialize_json_to_dagster_namedtuple,
+    deserialize_dagster_namedtuple,
 )
 
 from ..pynotify import await_pg_notifications
@@ -42,11 +42,15 @@ class PostgresEventLogStorage(AssetAwareSqlEventLogStorage, ConfigurableClass):
     Note that the fields in this config are :py:class:`~dagster.StringSource` and
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
 
+    Set the optional ``compress_events`` field of ``postgres_db`` to store events in a compressed
+    encoding, which takes a fraction of the disk space of the default JSON encoding.
+
     """
 
-    def __init__(self, postgres_url, inst_data=None):
+    def __init__(self, postgres_url, inst_data=None, compress_events=False):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
+        self._compress_events = check.bool_param(compress_events, "compress_events")
         self._disposed = False
 
         self._event_watcher = PostgresEventWatcher(self.postgres_url)
@@ -55,7 +59,7 @@ def __init__(self, postgres_url, inst_data=None):
         self._engine = create_engine(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db.pool.NullPool
         )
-        self._secondary_index_cache = {}
+        self._secondary_index_cache = set()
 
         with self.connect() as conn:
             SqlEventLogStorageMetadata.create_all(conn)
@@ -77,14 +81,22 @@ def upgrade(self):
     def inst_data(self):
         return self._inst_data
 
+    @property
+    def compress_events(self):
+        return self._compress_events
+
     @classmethod
     def config_type(cls):
-        return pg_config()
+        return pg_config(
+            db_fields={"compress_events": Field(bool, is_required=False, default_value=False)}
+        )
 
     @staticmethod
     def from_config_value(inst_data, config_value):
         return PostgresEventLogStorage(
-            inst_data=inst_data, postgres_url=pg_url_from_config(config_value)
+            inst_data=inst_data,
+            postgres_url=pg_url_from_config(config_value),
+            compress_events=config_value.get("postgres_db", {}).get("compress_events", False),
         )
 
     @staticmethod
@@ -114,32 +126,90 @@ def store_event(self, event):
             )
             if event.is_dagster_event and event.dagster_event.asset_key:
                 self.store_asset_key(conn, event)
+            self.store_run_stats(conn, event)
+
+    def store_events(self, events):
+        """Store a batch of events with a single multi-row insert, followed by a single round-trip
+        issuing the notifications for every stored row.
+
+        Args:
+            events (List[EventRecord]): The events to store, in the order they were emitted.
+        """
+        check.list_param(events, "events", of_type=EventRecord)
+        if not events:
+            return
+
+        with self.connect() as conn:
+            result_proxy = conn.execute(
+                SqlEventLogStorageTable.insert()  # pylint: disable=no-value-for-parameter
+                .values([self.prepare_event_row(event) for event in events])
+                .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+            )
+            rows = result_proxy.fetchall()
+            result_proxy.close()
+            conn.execute(
+                " ".join(["""NOTIFY {channel}, %s;""".format(channel=CHANNEL_NAME)] * len(rows)),
+                tuple(run_id + "_" + str(record_id) for run_id, record_id in rows),
+            )
+
+            self._store_asset_keys(conn, events)
+
+            self.store_run_stats_for_events(conn, events)
 
     def store_asset_key(self, conn, event):
         check.inst_param(event, "event", EventRecord)
-        if not event.is_dagster_event or not event.dagster_event.asset_key:
+        self._store_asset_keys(conn, [event])
+
+    def _store_asset_keys(self, conn, events):
+        # the last materialization of each asset in the batch is its latest
+        latest_materializations = {}
+        for event in events:
+            if event.is_dagster_event and event.dagster_event.asset_key:
+                latest_materializations[event.dagster_event.asset_key.to_string()] = event
+        if not latest_materializations:
+            return
+
+        if not self.has_asset_key_last_materialization_columns(conn):
+            # the latest materializations are tracked once the asset key table has been migrated
+            conn.execute(
+                db.dialects.postgresql.insert(AssetKeyTable)
+                .values(
+                    [dict(asset_key=asset_key) for asset_key in sorted(latest_materializations)]
+                )
+                .on_conflict_do_nothing(index_elements=[AssetKeyTable.c.asset_key])
+            )
             return
 
         conn.execute(
-            db.dialects.postgresql.insert(AssetKeyTable)
-            .values(asset_key=event.dagster_event.asset_key.to_string())
-            .on_conflict_do_nothing(index_elements=[AssetKeyTable.c.asset_key])
+            _upsert_asset_keys(
+                [
+                    dict(asset_key=asset_key, **self.prepare_asset_key_row(event))
+                    for asset_key, event in sorted(latest_materializations.items())
+                ]
+            )
         )
 
     def connect(self, run_id=None):
         return create_pg_connection(self._engine, __file__, "event log")
 
+    def compact(self):
+        # autovacuum reclaims space in the background, but vacuum the event log eagerly after
+        # retention deletes a large number of rows, refreshing the planner statistics as it goes
+        with self.connect() as conn:
+            conn.execute("VACUUM ANALYZE {table}".format(table=SqlEventLogStorageTable.name))
+
     def has_secondary_index(self, name, run_id=None):
+        # an index is never disabled once enabled, but may be enabled by another process, so only
+        # enabled indexes are cached
         if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                PostgresEventLogStorage, self
-            ).has_secondary_index(name, run_id)
-        return self._secondary_index_cache[name]
+            if not super(PostgresEventLogStorage, self).has_secondary_index(name, run_id):
+                return False
+            self._secondary_index_cache.add(name)
+        return True
 
     def enable_secondary_index(self, name, run_id=None):
         super(PostgresEventLogStorage, self).enable_secondary_index(name)
-        if name in self._secondary_index_cache:
-            del self._secondary_index_cache[name]
+        self._secondary_index_cache.add(name)
 
     def watch(self, run_id, start_cursor, callback):
         self._event_watcher.watch_run(run_id, start_cursor, callback)
@@ -182,46 +252,89 @@ def dispose(self):
 TERMINATE_EVENT_LOOP = "TERMINATE_EVENT_LOOP"
 
 
+def _upsert_asset_keys(rows):
+    """Inserts asset key rows, updating the latest materialization of the keys that already exist
+    unless they have a more recent one."""
+    statement = db.dialects.postgresql.insert(AssetKeyTable).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[AssetKeyTable.c.asset_key],
+        set_=dict(
+            last_materialization=statement.excluded.last_materialization,
+            last_materialization_timestamp=statement.excluded.last_materialization_timestamp,
+            last_run_id=statement.excluded.last_run_id,
+        ),
+        where=db.or_(
+            AssetKeyTable.c.last_materialization_timestamp == None,
+            AssetKeyTable.c.last_materialization_timestamp
+            <= statement.excluded.last_materialization_timestamp,
+        ),
+    )
+
+
 def watcher_thread(conn_string, run_id_dict, handlers_dict, dict_lock, watcher_thread_exit):
+    # A single pooled connection is held for the lifetime of the thread and used to fetch the
+    # events for every notification, rather than connecting to the database once per event
+    engine = create_engine(
+        conn_string, isolation_level="AUTOCOMMIT", pool_size=1, max_overflow=0, pool_pre_ping=True,
+    )
 
     try:
-        for notif in await_pg_notifications(
+        for notifications in await_pg_notifications(
             conn_string,
             channels=[CHANNEL_NAME],
             timeout=POLLING_CADENCE,
             yield_on_timeout=True,
             exit_event=watcher_thread_exit,
+            yield_batches=True,
         ):
-            if notif is None:
+            if notifications is None:
                 if watcher_thread_exit.is_set():
                     break
-            else:
-                run_id, index_str = notif.payload.split("_")
+                continue
+
+            # coalesce every notification received in this poll into a single query per run
+            indices_by_run_id = OrderedDict()
+            for notif in notifications:
+                run_id, index_str = notif.payload.rsplit("_", 1)
                 if run_id not in run_id_dict:
                     continue
+                indices_by_run_id.setdefault(run_id, []).append(int(index_str))
 
-                index = int(index_str)
+            for run_id, indices in indices_by_run_id.items():
                 with dict_lock:
-                    handlers = handlers_dict.get(run_id, [])
+                    handlers = list(handlers_dict.get(run_id, []))
 
-                engine = create_engine(
-                    conn_string, isolation_level="AUTOCOMMIT", poolclass=db.pool.NullPool
-                )
-                try:
-                    res = engine.execute(
-                        db.select([SqlEventLogStorageTable.c.event]).where(
-                            SqlEventLogStorageTable.c.id == index
-                        ),
-                    )
-                    dagster_event = deserialize_json_to_dagster_namedtuple(res.fetchone()[0])
-                finally:
-                    engine.dispose()
-
-                for (cursor, callback) in handlers:
-                    if index >= cursor:
-                        callback(dagster_event)
+                if not handlers:
+                    continue
+
+                for index, dagster_event in fetch_events_by_index(engine, run_id, indices):
+                    for (cursor, callback) in handlers:
+                        if index >= cursor:
+                            callback(dagster_event)
     except psycopg2.OperationalError:
         pass
+    finally:
+        engine.dispose()
+
+
+def fetch_events_by_index(engine, run_id, indices):
+    """Fetches the events of a run with the given storage ids, ordered by storage id.
+
+    Returns:
+        List[Tuple[int, EventRecord]]: The storage id and deserialized event for each row.
+    """
+    check.str_param(run_id, "run_id")
+    check.list_param(indices, "indices", of_type=int)
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.id.in_(indices))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        ).fetchall()
+
+    return [(index, deserialize_dagster_namedtuple(json_str)) for (index, json_str) in rows]
 
 
 class PostgresEventWatcher:
@@ -78,6 +78,7 @@ def await_pg_notifications(
     yield_on_timeout=False,
     handle_signals=None,
     exit_event=None,
+    yield_batches=False,
 ):
     """Subscribe to PostgreSQL notifications, and handle them
     in infinite-loop style.
@@ -86,12 +87,15 @@ def await_pg_notifications(
     If you've enabled 'yield_on_timeout', yields None on timeout.
     If you've enabled 'handle_keyboardinterrupt', yields False on
     interrupt.
+    If you've enabled 'yield_batches', yields the list of all notifications
+    received in a single poll of the connection instead of each one.
     """
 
     check.str_param(conn_string, "conn_string")
     channels = None if channels is None else check.list_param(channels, "channels", of_type=str)
     check.float_param(timeout, "timeout")
     check.bool_param(yield_on_timeout, "yield_on_timeout")
+    check.bool_param(yield_batches, "yield_batches")
 
     conn = get_conn(conn_string)
 
@@ -127,10 +131,14 @@ def await_pg_notifications(
 
                     notify_list = []
                     while conn.notifies:
-                        notify_list.append(conn.notifies.pop())
-
-                    for notif in notify_list:
-                        yield notif
+                        notify_list.append(conn.notifies.pop(0))
+
+                    if yield_batches:
+                        if notify_list:
+                            yield notify_list
+                    else:
+                        for notif in notify_list:
+                            yield notif
 
             except select.error as e:
                 e_num, _e_message = e  # pylint: disable=unpacking-non-sequence
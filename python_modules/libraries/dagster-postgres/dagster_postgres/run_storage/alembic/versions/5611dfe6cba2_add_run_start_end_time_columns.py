@@ -0,0 +1,58 @@
+"""add run start_time, end_time columns and indexes
+
+Revision ID: 5611dfe6cba2
+Revises: 9b8a8b41d5b1
+Create Date: 2026-10-18 14:20:53.871406
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from dagster.core.storage.migration.utils import get_inspector, has_column, has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = "5611dfe6cba2"
+down_revision = "9b8a8b41d5b1"
+branch_labels = None
+depends_on = None
+
+RUNS_INDEXES = {
+    "idx_run_status_id": ["status", "id"],
+    "idx_run_start_time": ["start_time"],
+    "idx_run_end_time": ["end_time"],
+    "idx_run_update_timestamp": ["update_timestamp"],
+}
+
+
+def upgrade():
+    if not has_table("runs"):
+        return
+
+    if not has_column("runs", "start_time"):
+        op.add_column("runs", sa.Column("start_time", sa.Float))
+
+    if not has_column("runs", "end_time"):
+        op.add_column("runs", sa.Column("end_time", sa.Float))
+
+    indices = [x.get("name") for x in get_inspector().get_indexes("runs")]
+    for index_name, columns in RUNS_INDEXES.items():
+        if not index_name in indices:
+            op.create_index(index_name, "runs", columns, unique=False)
+
+
+def downgrade():
+    if not has_table("runs"):
+        return
+
+    indices = [x.get("name") for x in get_inspector().get_indexes("runs")]
+    for index_name in RUNS_INDEXES:
+        if index_name in indices:
+            op.drop_index(index_name, "runs")
+
+    if has_column("runs", "start_time"):
+        op.drop_column("runs", "start_time")
+
+    if has_column("runs", "end_time"):
+        op.drop_column("runs", "end_time")
@@ -0,0 +1,44 @@
+"""add asset key last materialization columns
+
+Revision ID: d8d1cba9a2f0
+Revises: c8cc703bffd1
+Create Date: 2026-10-18 16:11:05.318207
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from dagster.core.storage.migration.utils import has_column, has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = "d8d1cba9a2f0"
+down_revision = "c8cc703bffd1"
+branch_labels = None
+depends_on = None
+
+LAST_MATERIALIZATION_COLUMNS = [
+    ("last_materialization", sa.Text),
+    ("last_materialization_timestamp", sa.types.TIMESTAMP),
+    ("last_run_id", sa.String(255)),
+]
+
+
+def upgrade():
+    if not has_table("asset_keys"):
+        return
+
+    for column_name, column_type in LAST_MATERIALIZATION_COLUMNS:
+        if not has_column("asset_keys", column_name):
+            op.add_column("asset_keys", sa.Column(column_name, column_type))
+
+
+def downgrade():
+    if not has_table("asset_keys"):
+        return
+
+    with op.batch_alter_table("asset_keys") as batch_op:
+        for column_name, _ in LAST_MATERIALIZATION_COLUMNS:
+            if has_column("asset_keys", column_name):
+                batch_op.drop_column(column_name)
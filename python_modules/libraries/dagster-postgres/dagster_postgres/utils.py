@@ -8,6 +8,7 @@
 from dagster import Field, IntSource, Selector, StringSource, check
 from dagster.core.storage.sql import get_alembic_config, handle_schema_errors
 from dagster.seven import quote_plus as urlquote
+from dagster.utils import merge_dicts
 
 
 class DagsterPostgresException(Exception):
@@ -20,18 +21,26 @@ def get_conn(conn_string):
     return conn
 
 
-def pg_config():
+def pg_db_config():
+    return {
+        "username": StringSource,
+        "password": StringSource,
+        "hostname": StringSource,
+        "db_name": StringSource,
+        "port": Field(IntSource, is_required=False, default_value=5432),
+    }
+
+
+def pg_config(db_fields=None):
+    """The config selecting the database to connect to, either by url or by its connection fields.
+
+    Args:
+        db_fields (Optional[Dict[str, Field]]): Fields configuring the storage, accepted alongside
+            the connection fields of ``postgres_db``.
+    """
+    check.opt_dict_param(db_fields, "db_fields", key_type=str)
     return Selector(
-        {
-            "postgres_url": str,
-            "postgres_db": {
-                "username": StringSource,
-                "password": StringSource,
-                "hostname": StringSource,
-                "db_name": StringSource,
-                "port": Field(IntSource, is_required=False, default_value=5432),
-            },
-        }
+        {"postgres_url": str, "postgres_db": merge_dicts(pg_db_config(), db_fields or {})}
     )
 
 
@@ -39,7 +48,14 @@ def pg_url_from_config(config_value):
     if config_value.get("postgres_url"):
         return config_value["postgres_url"]
 
-    return get_conn_string(**config_value["postgres_db"])
+    db_config = config_value["postgres_db"]
+    return get_conn_string(
+        username=db_config["username"],
+        password=db_config["password"],
+        hostname=db_config["hostname"],
+        db_name=db_config["db_name"],
+        port=db_config["port"],
+    )
 
 
 def get_conn_string(username, password, hostname, db_name, port="5432"):
@@ -22,12 +22,14 @@
 from dagster.core.events.log import DagsterEventRecord, construct_event_logger
 from dagster.core.execution.api import execute_run
 from dagster.core.execution.stats import StepEventStatus
+from dagster.core.storage.event_log import EventLogRetentionPolicy
 from dagster.core.storage.event_log.migration import migrate_asset_key_data
 from dagster.core.test_utils import instance_for_test
 from dagster.core.utils import make_new_run_id
 from dagster.loggers import colored_console_logger
 from dagster.serdes import deserialize_json_to_dagster_namedtuple
 from dagster_postgres.event_log import PostgresEventLogStorage
+from dagster_postgres.event_log.event_log import fetch_events_by_index
 from dagster_postgres.utils import get_conn
 
 TEST_TIMEOUT = 5
@@ -380,6 +382,40 @@ def _solids():
         del event_log_storage
 
 
+def test_listen_notify_coalesced_batch(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    run_id = make_new_run_id()
+    event_list = []
+    event_log_storage.event_watcher.watch_run(run_id, 0, event_list.append)
+
+    try:
+        events, _ = synthesize_events(_solids, run_id=run_id)
+        # the notifications for a batched write arrive together and are fetched in one query
+        with mock.patch(
+            "dagster_postgres.event_log.event_log.fetch_events_by_index",
+            wraps=fetch_events_by_index,
+        ) as fetch_mock:
+            event_log_storage.store_events(events)
+
+            start = time.time()
+            while len(event_list) < len(events) and time.time() - start < TEST_TIMEOUT:
+                pass
+
+        assert len(event_list) == len(events)
+        assert [event.message for event in event_list] == [event.message for event in events]
+        assert fetch_mock.call_count < len(events)
+    finally:
+        del event_log_storage
+
+
 def test_load_from_config(hostname):
     url_cfg = """
       event_log_storage:
@@ -413,6 +449,46 @@ def test_load_from_config(hostname):
             from_explicit = explicit_instance._event_storage
 
             assert from_url.postgres_url == from_explicit.postgres_url
+            assert not from_url.compress_events
+
+
+def test_compressed_events(hostname, conn_string):
+    compressed_cfg = """
+      event_log_storage:
+        module: dagster_postgres.event_log
+        class: PostgresEventLogStorage
+        config:
+            postgres_db:
+              username: test
+              password: test
+              hostname: {hostname}
+              db_name: test
+              compress_events: true
+    """.format(
+        hostname=hostname
+    )
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    # rows written with the JSON encoding are read back alongside compressed rows
+    PostgresEventLogStorage.create_clean_storage(conn_string)
+    events, _ = synthesize_events(_solids)
+    run_id = events[0].run_id
+    PostgresEventLogStorage(conn_string).store_events(events[:2])
+
+    # pylint: disable=protected-access
+    with instance_for_test(overrides=yaml.safe_load(compressed_cfg)) as instance:
+        event_log_storage = instance._event_storage
+        assert event_log_storage.compress_events
+        event_log_storage.store_events(events[2:])
+
+        out_events = event_log_storage.get_logs_for_run(run_id)
+        assert [event.message for event in out_events] == [event.message for event in events]
 
 
 def test_asset_materialization(conn_string):
@@ -473,7 +549,7 @@ def _solids():
         "dagster.core.storage.event_log.sql_event_log.logging.warning", side_effect=mock_log,
     ):
         with mock.patch(
-            "dagster.core.storage.event_log.sql_event_log.deserialize_json_to_dagster_namedtuple",
+            "dagster.core.storage.event_log.sql_event_log.deserialize_dagster_namedtuple",
             return_value="not_an_event_record",
         ):
 
@@ -486,7 +562,7 @@ def _solids():
         _logs = []  # reset logs
 
         with mock.patch(
-            "dagster.core.storage.event_log.sql_event_log.deserialize_json_to_dagster_namedtuple",
+            "dagster.core.storage.event_log.sql_event_log.deserialize_dagster_namedtuple",
             side_effect=seven.JSONDecodeError("error", "", 0),
         ):
             assert asset_key in set(event_log_storage.get_all_asset_keys())
@@ -538,6 +614,51 @@ def _two():
     assert asset_key_two in set(asset_keys)
 
 
+def test_latest_materializations(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    asset_key_one = AssetKey(["one"])
+    asset_key_two = AssetKey(["two"])
+
+    @solid
+    def materialize_one(_):
+        yield AssetMaterialization(asset_key=asset_key_one)
+        yield Output(1)
+
+    @solid
+    def materialize_both(_):
+        yield AssetMaterialization(asset_key=asset_key_one)
+        yield AssetMaterialization(asset_key=asset_key_two)
+        yield Output(1)
+
+    def _one():
+        materialize_one()
+
+    def _both():
+        materialize_both()
+
+    events_one, result_one = synthesize_events(_one)
+    event_log_storage.store_events(events_one)
+
+    # backfills the latest materializations of the assets already in the event log
+    event_log_storage.reindex(force=True)
+
+    events_both, result_both = synthesize_events(_both)
+    event_log_storage.store_events(events_both)
+
+    latest = event_log_storage.get_latest_materializations(
+        [asset_key_one, asset_key_two, AssetKey(["bogus"])]
+    )
+    assert latest[asset_key_one].run_id == result_both.run_id
+    assert latest[asset_key_two].run_id == result_both.run_id
+    assert latest[AssetKey(["bogus"])] is None
+
+    event_log_storage.delete_events(result_both.run_id)
+    latest = event_log_storage.get_latest_materializations([asset_key_one, asset_key_two])
+    assert latest[asset_key_one].run_id == result_one.run_id
+    assert latest[asset_key_two] is None
+
+
 @solid
 def should_succeed(context):
     context.log.info("succeed")
@@ -595,3 +716,42 @@ def _one():
     assert step_stats[0].status == StepEventStatus.FAILURE
     assert step_stats[0].end_time > step_stats[0].start_time
     assert step_stats[0].attempts == 4
+
+
+def test_event_log_retention(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    asset_key = AssetKey(["path", "to", "retained_asset"])
+
+    @solid
+    def materialize_one(_):
+        yield AssetMaterialization(asset_key=asset_key)
+        yield Output(1)
+
+    def _solids():
+        materialize_one()
+
+    ten_days = 10 * 24 * 60 * 60
+    events, result = synthesize_events(_solids)
+    for event in events:
+        event_log_storage.store_event(event._replace(timestamp=event.timestamp - ten_days))
+
+    stats = event_log_storage.get_stats_for_run(result.run_id)
+    policy = EventLogRetentionPolicy(max_age_seconds=24 * 60 * 60)
+
+    deleted = 0
+    while True:
+        batch = event_log_storage.delete_expired_events(policy, limit=5)
+        assert batch <= 5
+        deleted += batch
+        if batch < 5:
+            break
+    event_log_storage.compact()
+
+    assert deleted == len(events)
+    assert event_log_storage.get_logs_for_run(result.run_id) == []
+    assert event_log_storage.get_stats_for_run(result.run_id) == stats
+
+    summary = event_log_storage.get_asset_materialization_summary(asset_key)
+    assert summary.materialization_count == 1
+    assert summary.last_materialization.dagster_event.asset_key == asset_key